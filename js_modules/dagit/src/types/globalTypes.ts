@@ -83,7 +83,10 @@ export interface PipelineRunsFilter {
   pipeline?: string | null;
   tagKey?: string | null;
   tagValue?: string | null;
+  tags?: ExecutionTag[] | null;
   status?: PipelineRunStatus | null;
+  createdAfter?: number | null;
+  createdBefore?: number | null;
 }
 
 export interface ReexecutionConfig {
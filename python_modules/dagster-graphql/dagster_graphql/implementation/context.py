@@ -1,7 +1,9 @@
 from dagster import ExecutionTargetHandle, check
 from dagster.core.instance import DagsterInstance
 
+from .execution_plan_cache import ExecutionPlanCache
 from .pipeline_execution_manager import PipelineExecutionManager
+from .pipeline_run_storage import PipelineRunEventWatchers
 from .reloader import Reloader
 
 
@@ -14,6 +16,8 @@ class DagsterGraphQLContext(object):
             execution_manager, 'pipeline_execution_manager', PipelineExecutionManager
         )
         self.version = version
+        self.execution_plan_cache = ExecutionPlanCache()
+        self.pipeline_run_event_watchers = PipelineRunEventWatchers(self.instance)
         self.repository_definition = self.get_handle().build_repository_definition()
 
         self.scheduler_handle = self.get_handle().build_scheduler_handle(
@@ -256,14 +256,13 @@ def get_pipeline_run_observable(graphene_info, run_id, after=None):
     if not isinstance(pipeline, DauphinPipeline):
         return Observable.empty()  # pylint: disable=no-member
 
-    execution_plan = create_execution_plan(
-        pipeline.get_dagster_pipeline(), run.environment_dict, RunConfig(mode=run.mode)
+    execution_plan = graphene_info.context.execution_plan_cache.get_execution_plan(
+        pipeline.get_dagster_pipeline(), run.environment_dict, run.mode
     )
+    watcher = graphene_info.context.pipeline_run_event_watchers.get_watcher(run_id)
 
     # pylint: disable=E1101
-    return Observable.create(
-        PipelineRunObservableSubscribe(instance, run_id, after_cursor=after)
-    ).map(
+    return Observable.create(PipelineRunObservableSubscribe(watcher, after_cursor=after)).map(
         lambda events: graphene_info.schema.type_named('PipelineRunLogsSubscriptionSuccess')(
             runId=run_id,
             messages=[
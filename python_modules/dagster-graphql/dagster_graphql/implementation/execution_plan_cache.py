@@ -0,0 +1,61 @@
+import threading
+from collections import OrderedDict
+
+from dagster import PipelineDefinition, RunConfig, check, seven
+from dagster.core.execution.api import create_execution_plan
+
+DEFAULT_MAX_SIZE = 128
+
+
+class ExecutionPlanCache(object):
+    '''A least recently used cache of the execution plans of pipeline runs, keyed by the pipeline
+    (and solid subset), the environment dict and the mode.
+
+    Building an execution plan validates the whole environment dict against the pipeline, so this
+    spares rebuilding the same plan for every view of a run.
+    '''
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        self._max_size = check.int_param(max_size, 'max_size')
+        self._lock = threading.Lock()
+        self._plans = OrderedDict()
+
+    def get_execution_plan(self, pipeline_def, environment_dict, mode=None):
+        check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition)
+        check.opt_dict_param(environment_dict, 'environment_dict')
+        check.opt_str_param(mode, 'mode')
+
+        key = _cache_key(pipeline_def, environment_dict, mode)
+        if key is None:
+            return create_execution_plan(pipeline_def, environment_dict, RunConfig(mode=mode))
+
+        with self._lock:
+            if key in self._plans:
+                execution_plan = self._plans.pop(key)
+                self._plans[key] = execution_plan
+                return execution_plan
+
+        execution_plan = create_execution_plan(pipeline_def, environment_dict, RunConfig(mode=mode))
+
+        with self._lock:
+            self._plans[key] = execution_plan
+            while len(self._plans) > self._max_size:
+                self._plans.popitem(last=False)
+
+        return execution_plan
+
+
+def _cache_key(pipeline_def, environment_dict, mode):
+    solid_subset = pipeline_def.selector.solid_subset if pipeline_def.selector else None
+    try:
+        environment_key = seven.json.dumps(environment_dict, sort_keys=True)
+    except TypeError:
+        # Not worth caching plans for environment dicts that can't be serialized
+        return None
+
+    return (
+        pipeline_def.name,
+        tuple(sorted(solid_subset)) if solid_subset is not None else None,
+        environment_key,
+        mode,
+    )
@@ -2,8 +2,10 @@ from graphql.execution.base import ResolveInfo
 
 from dagster import RunConfig, check
 from dagster.core.definitions import create_environment_schema
-from dagster.core.definitions.pipeline import ExecutionSelector, PipelineRunsFilter
+from dagster.core.definitions.pipeline import ExecutionSelector
 from dagster.core.execution.api import create_execution_plan
+from dagster.core.instance import DagsterInstance
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunsFilter
 from dagster.core.types.evaluator import evaluate_config
 
 from .fetch_pipelines import (
@@ -53,6 +55,36 @@ def get_run(graphene_info, run_id):
         return graphene_info.schema.type_named('PipelineRun')(run)
 
 
+class RunStatsLoader(object):
+    '''Loads the stats of a list of runs in a single batch, the first time any of them is asked
+    for, rather than once per run.'''
+
+    def __init__(self, instance, run_ids):
+        self._instance = check.inst_param(instance, 'instance', DagsterInstance)
+        self._run_ids = check.list_param(run_ids, 'run_ids', of_type=str)
+        self._stats = None
+
+    def get_stats(self, run_id):
+        check.str_param(run_id, 'run_id')
+
+        if self._stats is None:
+            self._stats = self._instance.get_run_stats_for_runs(self._run_ids)
+
+        if run_id not in self._stats:
+            return self._instance.get_run_stats(run_id)
+        return self._stats[run_id]
+
+
+def get_dauphin_runs(graphene_info, runs):
+    runs = check.list_param(list(runs), 'runs', of_type=PipelineRun)
+
+    stats_loader = RunStatsLoader(graphene_info.context.instance, [run.run_id for run in runs])
+    return [
+        graphene_info.schema.type_named('PipelineRun')(run, stats_loader=stats_loader)
+        for run in runs
+    ]
+
+
 def get_run_tags(graphene_info):
     instance = graphene_info.context.instance
     return [
@@ -66,25 +98,8 @@ def get_runs(graphene_info, filters, cursor=None, limit=None):
     check.opt_str_param(cursor, 'cursor')
     check.opt_int_param(limit, 'limit')
 
-    instance = graphene_info.context.instance
-    runs = []
-
-    if filters.run_id:
-        run = instance.get_run_by_id(filters.run_id)
-        if run:
-            runs = [run]
-    elif filters.pipeline:
-        runs = instance.get_runs_with_pipeline_name(filters.pipeline, cursor=cursor, limit=limit)
-    elif filters.tag_key:
-        runs = instance.get_runs_with_matching_tag(
-            filters.tag_key, filters.tag_value, cursor=cursor, limit=limit
-        )
-    elif filters.status:
-        runs = instance.get_runs_with_status(filters.status, cursor=cursor, limit=limit)
-    else:
-        runs = instance.all_runs(cursor=cursor, limit=limit)
-
-    return [graphene_info.schema.type_named('PipelineRun')(run) for run in runs]
+    runs = graphene_info.context.instance.get_runs(filters, cursor=cursor, limit=limit)
+    return get_dauphin_runs(graphene_info, runs)
 
 
 @capture_dauphin_error
@@ -1,19 +1,136 @@
-class PipelineRunObservableSubscribe(object):
-    def __init__(self, instance, run_id, after_cursor=None):
-        self.instance = instance
-        self.run_id = run_id
-        self.observer = None
-        self.after_cursor = after_cursor if after_cursor is not None else -1
+import threading
 
-    def __call__(self, observer):
-        self.observer = observer
+from dagster import check
+from dagster.core.instance import DagsterInstance
+
+DEFAULT_BATCH_INTERVAL = 0.05
+'''The interval over which new events are coalesced before being pushed to subscribers -- 50ms.'''
+
+
+class PipelineRunEventWatcher(object):
+    '''Watches the event log of a run on behalf of every subscription to it.
+
+    Subscribers first receive the events already logged after their cursor. New events are then
+    coalesced into batches over batch_interval seconds, and each batch is pushed to all of the
+    subscribers at once.
+    '''
+
+    def __init__(self, instance, run_id, batch_interval=DEFAULT_BATCH_INTERVAL, on_unwatched=None):
+        self.instance = check.inst_param(instance, 'instance', DagsterInstance)
+        self.run_id = check.str_param(run_id, 'run_id')
+        self._batch_interval = check.float_param(batch_interval, 'batch_interval')
+        self._on_unwatched = check.opt_callable_param(on_unwatched, 'on_unwatched')
+
+        # Events are delivered under the lock, so each subscriber sees them in order
+        self._lock = threading.RLock()
+        # Cursor of the last event each subscriber has received, keyed by the observer
+        self._cursors = {}
+        self._handler = None
+        self._cursor = None
+        self._pending = []
+        self._flush_timer = None
+
+    @property
+    def num_subscribers(self):
+        return len(self._cursors)
+
+    def subscribe(self, observer, after_cursor=None):
+        '''Pushes lists of events to observer.on_next, starting after after_cursor. Returns a
+        function to call to unsubscribe.'''
+        after_cursor = after_cursor if after_cursor is not None else -1
+
+        with self._lock:
+            events = self.instance.logs_after(self.run_id, after_cursor)
+            if events:
+                observer.on_next(events)
+
+            cursor = len(events) + int(after_cursor)
+            self._cursors[observer] = cursor
+
+            if self._handler is None:
+                self._cursor = cursor
+                self._handler = self.instance.watch_event_logs(
+                    self.run_id, cursor, self.handle_new_event
+                )
+
+        return lambda: self.unsubscribe(observer)
+
+    def unsubscribe(self, observer):
+        with self._lock:
+            self._cursors.pop(observer, None)
+            if self._cursors or self._handler is None:
+                return
 
-        events = self.instance.logs_after(self.run_id, self.after_cursor)
-        if events:
-            self.observer.on_next(events)
+            self.instance.end_watch_event_logs(self.run_id, self._handler)
+            self._handler = None
+            self._pending = []
+            if self._flush_timer:
+                self._flush_timer.cancel()
+                self._flush_timer = None
 
-        cursor = len(events) + int(self.after_cursor)
-        self.instance.watch_event_logs(self.run_id, cursor, self.handle_new_event)
+        if self._on_unwatched:
+            self._on_unwatched(self)
 
     def handle_new_event(self, new_event):
-        self.observer.on_next([new_event])
+        with self._lock:
+            if self._handler is None:
+                return
+
+            self._cursor += 1
+            self._pending.append((self._cursor, new_event))
+
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self._batch_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self):
+        with self._lock:
+            self._flush_timer = None
+            pending, self._pending = self._pending, []
+            if not pending:
+                return
+
+            for observer, cursor in list(self._cursors.items()):
+                # Skip any events a subscriber already received when it subscribed
+                events = [event for event_cursor, event in pending if event_cursor > cursor]
+                if events:
+                    observer.on_next(events)
+                    self._cursors[observer] = pending[-1][0]
+
+
+class PipelineRunEventWatchers(object):
+    '''Shares a single PipelineRunEventWatcher between all of the subscriptions to a run.'''
+
+    def __init__(self, instance, batch_interval=DEFAULT_BATCH_INTERVAL):
+        self.instance = check.inst_param(instance, 'instance', DagsterInstance)
+        self._batch_interval = check.float_param(batch_interval, 'batch_interval')
+        self._lock = threading.Lock()
+        self._watchers = {}
+
+    def get_watcher(self, run_id):
+        check.str_param(run_id, 'run_id')
+
+        with self._lock:
+            if run_id not in self._watchers:
+                self._watchers[run_id] = PipelineRunEventWatcher(
+                    self.instance,
+                    run_id,
+                    batch_interval=self._batch_interval,
+                    on_unwatched=self._remove_watcher,
+                )
+            return self._watchers[run_id]
+
+    def _remove_watcher(self, watcher):
+        with self._lock:
+            if self._watchers.get(watcher.run_id) is watcher and not watcher.num_subscribers:
+                del self._watchers[watcher.run_id]
+
+
+class PipelineRunObservableSubscribe(object):
+    def __init__(self, watcher, after_cursor=None):
+        self.watcher = check.inst_param(watcher, 'watcher', PipelineRunEventWatcher)
+        self.after_cursor = check.opt_int_param(after_cursor, 'after_cursor')
+
+    def __call__(self, observer):
+        return self.watcher.subscribe(observer, self.after_cursor)
@@ -33,10 +33,10 @@ from dagster_graphql.implementation.fetch_types import get_config_type, get_runt
 from dagster_graphql.implementation.utils import UserFacingGraphQLError
 
 from dagster import check
-from dagster.core.definitions.pipeline import ExecutionSelector, PipelineRunsFilter
+from dagster.core.definitions.pipeline import ExecutionSelector
 from dagster.core.instance import DagsterFeatures, DagsterInstance
 from dagster.core.storage.compute_log_manager import ComputeIOType
-from dagster.core.storage.pipeline_run import PipelineRunStatus
+from dagster.core.storage.pipeline_run import PipelineRunStatus, PipelineRunsFilter
 
 from .config_types import to_dauphin_config_type
 from .run_schedule import (
@@ -151,18 +151,19 @@ class DauphinQuery(dauphin.ObjectType):
         return get_pipelines_or_raise(graphene_info)
 
     def resolve_pipelineRunsOrError(self, graphene_info, **kwargs):
-        filters = kwargs['filter'].to_selector()
-        provided = [
-            i for i in [filters.run_id, filters.pipeline, filters.tag_key, filters.status] if i
-        ]
-
-        if len(provided) > 1:
+        dauphin_filter = kwargs['filter']
+        if bool(dauphin_filter.tagKey) != bool(dauphin_filter.tagValue):
             return graphene_info.schema.type_named('InvalidPipelineRunsFilterError')(
-                message="You may only provide one of the filter options."
+                message="You must provide both tagKey and tagValue, or neither."
             )
 
         return graphene_info.schema.type_named('PipelineRuns')(
-            results=get_runs(graphene_info, filters, kwargs.get('cursor'), kwargs.get('limit'))
+            results=get_runs(
+                graphene_info,
+                dauphin_filter.to_selector(),
+                kwargs.get('cursor'),
+                kwargs.get('limit'),
+            )
         )
 
     def resolve_pipelineRunOrError(self, graphene_info, runId):
@@ -528,26 +529,35 @@ class DauphinPipelineRunsFilter(dauphin.InputObjectType):
     class Meta:
         name = 'PipelineRunsFilter'
         description = '''This type represents a filter on pipeline runs.
-        Currently, you may only pass one of the filter options.'''
+        Runs must match all of the filter options that are provided. createdAfter and
+        createdBefore are unix timestamps.'''
 
-    # Currently you may choose one of the following
     runId = dauphin.Field(dauphin.String)
     pipeline = dauphin.Field(dauphin.String)
     tagKey = dauphin.Field(dauphin.String)
     tagValue = dauphin.Field(dauphin.String)
+    tags = dauphin.List(dauphin.NonNull(DauphinExecutionTag))
     status = dauphin.Field(DauphinPipelineRunStatus)
+    createdAfter = dauphin.Field(dauphin.Float)
+    createdBefore = dauphin.Field(dauphin.Float)
 
     def to_selector(self):
         if self.status:
             status = PipelineRunStatus[self.status]
         else:
             status = None
+
+        tags = {tag['key']: tag['value'] for tag in self.tags or []}
+        if self.tagKey:
+            tags[self.tagKey] = self.tagValue
+
         return PipelineRunsFilter(
             run_id=self.runId,
             pipeline=self.pipeline,
-            tag_key=self.tagKey,
-            tag_value=self.tagValue,
             status=status,
+            tags=tags,
+            created_after=self.createdAfter,
+            created_before=self.createdBefore,
         )
 
 
@@ -1,5 +1,6 @@
 import yaml
 from dagster_graphql import dauphin
+from dagster_graphql.implementation.fetch_runs import get_dauphin_runs
 from dagster_graphql.implementation.fetch_schedules import get_dagster_schedule_def
 from dagster_graphql.implementation.utils import UserFacingGraphQLError, capture_dauphin_error
 from dagster_graphql.schema.errors import DauphinSchedulerNotDefinedError
@@ -92,12 +93,12 @@ class DauphinRunningSchedule(dauphin.ObjectType):
         return scheduler.log_path_for_schedule(self._schedule.name)
 
     def resolve_runs(self, graphene_info):
-        return [
-            graphene_info.schema.type_named('PipelineRun')(r)
-            for r in graphene_info.context.instance.get_runs_with_matching_tag(
+        return get_dauphin_runs(
+            graphene_info,
+            graphene_info.context.instance.get_runs_with_matching_tag(
                 "dagster/schedule_id", self._schedule.schedule_id
-            )
-        ]
+            ),
+        )
 
 
 class DauphinScheduler(dauphin.ObjectType):
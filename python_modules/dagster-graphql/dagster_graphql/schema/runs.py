@@ -5,8 +5,9 @@ import logging
 import yaml
 from dagster_graphql import dauphin
 from dagster_graphql.implementation.fetch_pipelines import get_pipeline_reference_or_raise
+from dagster_graphql.implementation.fetch_runs import RunStatsLoader
 
-from dagster import RunConfig, check, seven
+from dagster import check, seven
 from dagster.core.definitions.events import (
     EventMetadataEntry,
     JsonMetadataEntryData,
@@ -17,7 +18,6 @@ from dagster.core.definitions.events import (
 )
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventRecord
-from dagster.core.execution.api import create_execution_plan
 from dagster.core.execution.plan.objects import StepFailureData
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.storage.compute_log_manager import ComputeIOType, ComputeLogFileData
@@ -71,7 +71,19 @@ class DauphinPipelineRun(dauphin.ObjectType):
     status = dauphin.NonNull('PipelineRunStatus')
     pipeline = dauphin.NonNull('PipelineReference')
     stats = dauphin.NonNull('PipelineRunStatsSnapshot')
-    logs = dauphin.NonNull('LogMessageConnection')
+    logs = dauphin.Field(
+        dauphin.NonNull('LogMessageConnection'),
+        first=dauphin.Argument(dauphin.Int),
+        after=dauphin.Argument('Cursor'),
+        last=dauphin.Argument(dauphin.Int),
+        before=dauphin.Argument('Cursor'),
+        levels=dauphin.Argument(dauphin.List(dauphin.NonNull('LogLevel'))),
+        stepKeys=dauphin.Argument(dauphin.List(dauphin.NonNull(dauphin.String))),
+        description='''
+        The events logged by the run. first and after page forward from the start of the log,
+        last and before page backward from its end. Without any arguments, every event is returned.
+        ''',
+    )
     computeLogs = dauphin.Field(
         dauphin.NonNull('ComputeLogs'),
         stepKey=dauphin.Argument(dauphin.NonNull(dauphin.String)),
@@ -86,20 +98,42 @@ class DauphinPipelineRun(dauphin.ObjectType):
     tags = dauphin.non_null_list('PipelineTag')
     canCancel = dauphin.NonNull(dauphin.Boolean)
 
-    def __init__(self, pipeline_run):
+    def __init__(self, pipeline_run, stats_loader=None):
         super(DauphinPipelineRun, self).__init__(
             runId=pipeline_run.run_id, status=pipeline_run.status, mode=pipeline_run.mode
         )
         self._pipeline_run = check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        self._stats_loader = check.opt_inst_param(stats_loader, 'stats_loader', RunStatsLoader)
 
     def resolve_pipeline(self, graphene_info):
         return get_pipeline_reference_or_raise(graphene_info, self._pipeline_run.selector)
 
-    def resolve_logs(self, graphene_info):
-        return graphene_info.schema.type_named('LogMessageConnection')(self._pipeline_run)
+    def resolve_logs(
+        self,
+        graphene_info,
+        first=None,
+        after=None,
+        last=None,
+        before=None,
+        levels=None,
+        stepKeys=None,
+    ):
+        return graphene_info.schema.type_named('LogMessageConnection')(
+            self._pipeline_run,
+            first=first,
+            after=after,
+            last=last,
+            before=before,
+            levels=levels,
+            step_keys=stepKeys,
+        )
 
     def resolve_stats(self, graphene_info):
-        stats = graphene_info.context.instance.get_run_stats(self.run_id)
+        run_id = self._pipeline_run.run_id
+        if self._stats_loader:
+            stats = self._stats_loader.get_stats(run_id)
+        else:
+            stats = graphene_info.context.instance.get_run_stats(run_id)
         return graphene_info.schema.type_named('PipelineRunStatsSnapshot')(stats)
 
     def resolve_computeLogs(self, graphene_info, stepKey):
@@ -108,10 +142,10 @@ class DauphinPipelineRun(dauphin.ObjectType):
     def resolve_executionPlan(self, graphene_info):
         pipeline = self.resolve_pipeline(graphene_info)
         if isinstance(pipeline, DauphinPipeline):
-            execution_plan = create_execution_plan(
+            execution_plan = graphene_info.context.execution_plan_cache.get_execution_plan(
                 pipeline.get_dagster_pipeline(),
                 self._pipeline_run.environment_dict,
-                RunConfig(mode=self._pipeline_run.mode),
+                self._pipeline_run.mode,
             )
             return graphene_info.schema.type_named('ExecutionPlan')(pipeline, execution_plan)
         else:
@@ -233,38 +267,106 @@ class DauphinLogMessageConnection(dauphin.ObjectType):
     nodes = dauphin.non_null_list('PipelineRunEvent')
     pageInfo = dauphin.NonNull('PageInfo')
 
-    def __init__(self, pipeline_run):
+    def __init__(
+        self,
+        pipeline_run,
+        first=None,
+        after=None,
+        last=None,
+        before=None,
+        levels=None,
+        step_keys=None,
+    ):
         self._pipeline_run = check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        self._first = check.opt_int_param(first, 'first')
+        self._after = check.opt_int_param(after, 'after')
+        self._last = check.opt_int_param(last, 'last')
+        self._before = check.opt_int_param(before, 'before')
+        self._levels = check.opt_nullable_list_param(levels, 'levels', of_type=str)
+        self._step_keys = check.opt_nullable_list_param(step_keys, 'step_keys', of_type=str)
+        check.invariant(
+            first is None or last is None, 'Only one of first and last may be passed to logs'
+        )
+        self._window = None
+
+    @property
+    def _from_end(self):
+        return self._last is not None
+
+    @property
+    def _limit(self):
+        return self._last if self._from_end else self._first
+
+    def _logs_window(self, instance, after_cursor=None, before_cursor=None, limit=None):
+        return instance.logs_window(
+            self._pipeline_run.run_id,
+            after_cursor=after_cursor if after_cursor is not None else -1,
+            before_cursor=before_cursor,
+            limit=limit,
+            from_end=self._from_end,
+            step_keys=self._step_keys,
+            levels=self._levels,
+        )
+
+    def _get_window(self, instance):
+        if self._window is not None:
+            return self._window
+
+        # Fetch one more event than asked for to find out whether there is another page
+        limit = self._limit + 1 if self._limit is not None else None
+        window = self._logs_window(instance, self._after, self._before, limit)
+
+        has_more = limit is not None and len(window) == limit
+        if has_more:
+            window = window[1:] if self._from_end else window[:-1]
+
+        if self._from_end:
+            has_previous_page = has_more
+            has_next_page = self._before is not None and bool(
+                self._logs_window(instance, after_cursor=self._before - 1, limit=1)
+            )
+        else:
+            has_next_page = has_more
+            has_previous_page = self._after is not None and bool(
+                self._logs_window(instance, before_cursor=self._after + 1, limit=1)
+            )
+
+        self._window = (window, has_next_page, has_previous_page)
+        return self._window
 
     def resolve_nodes(self, graphene_info):
+        window, _, _ = self._get_window(graphene_info.context.instance)
+        if not window:
+            return []
+
         pipeline = get_pipeline_reference_or_raise(graphene_info, self._pipeline_run.selector)
 
         if isinstance(pipeline, DauphinPipeline):
-            execution_plan = create_execution_plan(
+            execution_plan = graphene_info.context.execution_plan_cache.get_execution_plan(
                 pipeline.get_dagster_pipeline(),
                 self._pipeline_run.environment_dict,
-                RunConfig(mode=self._pipeline_run.mode),
+                self._pipeline_run.mode,
             )
         else:
             pipeline = None
             execution_plan = None
 
         return [
-            from_event_record(graphene_info, log, pipeline, execution_plan)
-            for log in graphene_info.context.instance.all_logs(self._pipeline_run.run_id)
+            from_event_record(graphene_info, log, pipeline, execution_plan) for _, log in window
         ]
 
     def resolve_pageInfo(self, graphene_info):
-        count = len(graphene_info.context.instance.all_logs(self._pipeline_run.run_id))
-        lastCursor = None
-        if count > 0:
-            lastCursor = str(count - 1)
+        instance = graphene_info.context.instance
+        window, has_next_page, has_previous_page = self._get_window(instance)
         return graphene_info.schema.type_named('PageInfo')(
-            lastCursor=lastCursor,
-            hasNextPage=None,
-            hasPreviousPage=None,
-            count=count,
-            totalCount=count,
+            firstCursor=window[0][0] if window else None,
+            lastCursor=window[-1][0] if window else None,
+            hasNextPage=has_next_page,
+            hasPreviousPage=has_previous_page,
+            count=len(window),
+            totalCount=instance.logs_count(
+                self._pipeline_run.run_id, step_keys=self._step_keys, levels=self._levels
+            ),
         )
 
 
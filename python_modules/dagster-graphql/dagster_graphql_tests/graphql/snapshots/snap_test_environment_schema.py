@@ -120,6 +120,9 @@ snapshots['test_successful_enviroment_schema 1'] = {
             {
                 'name': None
             },
+            {
+                'name': None
+            },
             {
                 'name': 'Any'
             },
@@ -103,6 +103,9 @@ snapshots['test_query_multi_mode 1'] = {
             {
                 'name': None
             },
+            {
+                'name': None
+            },
             {
                 'name': 'Float'
             },
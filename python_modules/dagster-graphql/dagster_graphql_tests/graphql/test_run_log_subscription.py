@@ -0,0 +1,128 @@
+import time
+import uuid
+
+from dagster_graphql.implementation.execution_plan_cache import ExecutionPlanCache
+from dagster_graphql.implementation.pipeline_run_storage import PipelineRunEventWatchers
+
+from dagster.core.events.log import LogMessageRecord
+from dagster.core.instance import DagsterInstance
+from dagster.utils import script_relative_path
+
+from .setup import define_repository
+
+
+def _log_record(run_id, message):
+    return LogMessageRecord(
+        error_info=None,
+        message=message,
+        level='INFO',
+        user_message=message,
+        run_id=run_id,
+        timestamp=time.time(),
+    )
+
+
+class _CapturingObserver(object):
+    def __init__(self):
+        self.batches = []
+
+    def on_next(self, events):
+        self.batches.append(events)
+
+    @property
+    def messages(self):
+        return [event.message for batch in self.batches for event in batch]
+
+
+def _wait_for(condition, timeout=5.0):
+    start = time.time()
+    while not condition() and time.time() - start < timeout:
+        time.sleep(0.01)
+    assert condition()
+
+
+def test_execution_plan_cache():
+    pipeline_def = define_repository().get_pipeline('csv_hello_world')
+    environment_dict = {
+        'solids': {'sum_solid': {'inputs': {'num': script_relative_path('../data/num.csv')}}},
+        'storage': {'filesystem': {}},
+    }
+    cache = ExecutionPlanCache(max_size=2)
+
+    execution_plan = cache.get_execution_plan(pipeline_def, environment_dict, 'default')
+    assert execution_plan.get_step_by_key('sum_solid.compute')
+    assert (
+        cache.get_execution_plan(
+            pipeline_def, dict(reversed(list(environment_dict.items()))), 'default'
+        )
+        is execution_plan
+    )
+
+    in_memory_plan = cache.get_execution_plan(
+        pipeline_def, dict(environment_dict, storage={'in_memory': {}}), 'default'
+    )
+    assert in_memory_plan is not execution_plan
+
+    # least recently used plans are evicted
+    cache.get_execution_plan(pipeline_def, environment_dict, None)
+    assert (
+        cache.get_execution_plan(
+            pipeline_def, dict(environment_dict, storage={'in_memory': {}}), 'default'
+        )
+        is in_memory_plan
+    )
+    assert cache.get_execution_plan(pipeline_def, environment_dict, 'default') is not execution_plan
+
+
+def test_run_event_watcher_batches_events_for_all_subscribers():
+    instance = DagsterInstance.local_temp()
+    run_id = str(uuid.uuid4())
+    for i in range(3):
+        instance.handle_new_event(_log_record(run_id, 'before {i}'.format(i=i)))
+    instance.flush_event_logs(run_id)
+
+    watchers = PipelineRunEventWatchers(instance, batch_interval=0.1)
+    watcher = watchers.get_watcher(run_id)
+    assert watchers.get_watcher(run_id) is watcher
+
+    first, second = _CapturingObserver(), _CapturingObserver()
+    unsubscribe_first = watcher.subscribe(first)
+    unsubscribe_second = watcher.subscribe(second, after_cursor=1)
+    assert first.messages == ['before 0', 'before 1', 'before 2']
+    assert second.messages == ['before 2']
+
+    # simulate the watch picking up new events faster than the batch interval
+    for i in range(100):
+        watcher.handle_new_event(_log_record(run_id, 'after {i}'.format(i=i)))
+
+    _wait_for(lambda: len(first.batches) == 2 and len(second.batches) == 2)
+    expected = ['after {i}'.format(i=i) for i in range(100)]
+    assert first.batches[1] == second.batches[1]
+    assert [event.message for event in first.batches[1]] == expected
+
+    unsubscribe_first()
+    assert watchers.get_watcher(run_id) is watcher
+    unsubscribe_second()
+    assert watchers.get_watcher(run_id) is not watcher
+
+
+def test_run_event_watcher_watches_event_log():
+    instance = DagsterInstance.local_temp()
+    run_id = str(uuid.uuid4())
+    instance.handle_new_event(_log_record(run_id, 'before'))
+    instance.flush_event_logs(run_id)
+
+    watcher = PipelineRunEventWatchers(instance).get_watcher(run_id)
+    observers = [_CapturingObserver() for _ in range(3)]
+    unsubscribes = [watcher.subscribe(observer) for observer in observers]
+
+    for i in range(10):
+        instance.handle_new_event(_log_record(run_id, 'after {i}'.format(i=i)))
+    instance.flush_event_logs(run_id)
+
+    expected = ['before'] + ['after {i}'.format(i=i) for i in range(10)]
+    for observer in observers:
+        _wait_for(lambda observer=observer: observer.messages == expected)
+
+    for unsubscribe in unsubscribes:
+        unsubscribe()
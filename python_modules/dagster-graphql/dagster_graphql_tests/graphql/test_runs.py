@@ -4,6 +4,7 @@ from dagster_graphql.test.utils import execute_dagster_graphql
 
 from dagster.core.instance import DagsterInstance
 
+from .execution_queries import START_PIPELINE_EXECUTION_QUERY
 from .utils import define_context, sync_execute_get_run_log_data
 
 RUNS_QUERY = '''
@@ -136,3 +137,230 @@ def test_get_runs_over_graphql():
         read_context, DELETE_RUN_MUTATION, variables={'runId': run_id_two}
     )
     assert result.data['deletePipelineRun']['__typename'] == 'PipelineRunNotFoundError'
+
+
+RUN_LOGS_QUERY = '''
+query RunLogsQuery($runId: ID!, $first: Int, $after: Cursor, $last: Int, $before: Cursor,
+    $levels: [LogLevel!], $stepKeys: [String!]) {
+  pipelineRunOrError(runId: $runId) {
+    ... on PipelineRun {
+      logs(first: $first, after: $after, last: $last, before: $before, levels: $levels,
+          stepKeys: $stepKeys) {
+        nodes {
+          __typename
+          ... on MessageEvent {
+            level
+            step { key }
+          }
+        }
+        pageInfo {
+          firstCursor
+          lastCursor
+          hasNextPage
+          hasPreviousPage
+          count
+          totalCount
+        }
+      }
+    }
+  }
+}
+'''
+
+
+def test_get_run_logs_paginated_over_graphql():
+    payload = sync_execute_get_run_log_data(
+        {
+            'executionParams': {
+                'selector': {'name': 'multi_mode_with_resources'},
+                'mode': 'add_mode',
+                'environmentConfigData': {'resources': {'op': {'config': 2}}},
+            }
+        }
+    )
+    run_id = payload['runId']
+    typenames = [msg['__typename'] for msg in payload['messages']]
+    num_events = len(typenames)
+    assert num_events > 4
+
+    read_context = define_context(instance=DagsterInstance.local_temp())
+
+    def _get_logs(**variables):
+        result = execute_dagster_graphql(
+            read_context, RUN_LOGS_QUERY, variables=dict(variables, runId=run_id)
+        )
+        assert not result.errors
+        return result.data['pipelineRunOrError']['logs']
+
+    # the tail window
+    logs = _get_logs(last=2)
+    assert [log['__typename'] for log in logs['nodes']] == typenames[-2:]
+    assert logs['pageInfo'] == {
+        'firstCursor': num_events - 2,
+        'lastCursor': num_events - 1,
+        'hasNextPage': False,
+        'hasPreviousPage': True,
+        'count': 2,
+        'totalCount': num_events,
+    }
+
+    # paging backwards from the tail window
+    logs = _get_logs(last=2, before=logs['pageInfo']['firstCursor'])
+    assert [log['__typename'] for log in logs['nodes']] == typenames[-4:-2]
+    assert logs['pageInfo']['hasNextPage']
+    assert logs['pageInfo']['hasPreviousPage']
+
+    # paging forwards from the start
+    logs = _get_logs(first=3)
+    assert [log['__typename'] for log in logs['nodes']] == typenames[:3]
+    assert logs['pageInfo']['lastCursor'] == 2
+    assert logs['pageInfo']['hasNextPage']
+    assert not logs['pageInfo']['hasPreviousPage']
+
+    logs = _get_logs(first=num_events, after=2)
+    assert [log['__typename'] for log in logs['nodes']] == typenames[3:]
+    assert not logs['pageInfo']['hasNextPage']
+    assert logs['pageInfo']['hasPreviousPage']
+
+    # no arguments returns every event
+    logs = _get_logs()
+    assert [log['__typename'] for log in logs['nodes']] == typenames
+    assert logs['pageInfo']['count'] == num_events
+
+    step_keys = [log['step']['key'] for log in logs['nodes'] if log.get('step')]
+    assert step_keys
+    logs = _get_logs(stepKeys=[step_keys[0]])
+    assert logs['nodes']
+    assert all(log['step']['key'] == step_keys[0] for log in logs['nodes'])
+    assert logs['pageInfo']['totalCount'] == step_keys.count(step_keys[0])
+
+    logs = _get_logs(levels=['DEBUG'])
+    assert all(log['level'] == 'DEBUG' for log in logs['nodes'])
+    assert logs['pageInfo']['totalCount'] == len(logs['nodes'])
+
+
+RUNS_STATS_QUERY = '''
+query PipelineRunsStatsQuery($name: String!) {
+  pipeline(params: { name: $name }) {
+    ... on Pipeline {
+      runs {
+        runId
+        stats {
+          runId
+          stepsSucceeded
+          stepsFailed
+          startTime
+          endTime
+        }
+      }
+    }
+  }
+}
+'''
+
+
+def test_get_runs_stats_over_graphql():
+    run_ids = [
+        sync_execute_get_run_log_data(
+            {
+                'executionParams': {
+                    'selector': {'name': 'multi_mode_with_resources'},
+                    'mode': 'add_mode',
+                    'environmentConfigData': {'resources': {'op': {'config': config}}},
+                }
+            }
+        )['runId']
+        for config in [2, 3]
+    ]
+
+    read_context = define_context(instance=DagsterInstance.local_temp())
+
+    # The stats of all the runs are loaded together
+    batches = []
+    get_run_stats_for_runs = read_context.instance.get_run_stats_for_runs
+
+    def _get_run_stats_for_runs(batch_run_ids):
+        batches.append(batch_run_ids)
+        return get_run_stats_for_runs(batch_run_ids)
+
+    read_context.instance.get_run_stats_for_runs = _get_run_stats_for_runs
+
+    result = execute_dagster_graphql(
+        read_context, RUNS_STATS_QUERY, variables={'name': 'multi_mode_with_resources'}
+    )
+    assert not result.errors
+
+    runs = {run['runId']: run for run in result.data['pipeline']['runs']}
+    for run_id in run_ids:
+        stats = runs[run_id]['stats']
+        assert stats['runId'] == run_id
+        assert stats['stepsSucceeded'] > 0
+        assert stats['stepsFailed'] == 0
+        assert stats['startTime'] <= stats['endTime']
+
+    assert len(batches) == 1
+    assert set(run_ids) <= set(batches[0])
+
+
+FILTERED_RUNS_QUERY = '''
+query FilteredRunsQuery($filter: PipelineRunsFilter!) {
+  pipelineRunsOrError(filter: $filter) {
+    __typename
+    ... on PipelineRuns {
+      results {
+        runId
+      }
+    }
+    ... on InvalidPipelineRunsFilterError {
+      message
+    }
+  }
+}
+'''
+
+
+def test_get_runs_with_filters_over_graphql():
+    instance = DagsterInstance.ephemeral()
+    context = define_context(instance=instance)
+
+    def _start_run(config, tags):
+        result = execute_dagster_graphql(
+            context,
+            START_PIPELINE_EXECUTION_QUERY,
+            variables={
+                'executionParams': {
+                    'selector': {'name': 'multi_mode_with_resources'},
+                    'mode': 'add_mode',
+                    'environmentConfigData': {'resources': {'op': {'config': config}}},
+                    'executionMetadata': {
+                        'tags': [{'key': key, 'value': value} for key, value in tags.items()]
+                    },
+                }
+            },
+        )
+        return result.data['startPipelineExecution']['run']['runId']
+
+    prod_run_id = _start_run(2, {'env': 'prod', 'team': 'data'})
+    _start_run(3, {'env': 'dev', 'team': 'data'})
+
+    result = execute_dagster_graphql(
+        context,
+        FILTERED_RUNS_QUERY,
+        variables={
+            'filter': {
+                'pipeline': 'multi_mode_with_resources',
+                'tagKey': 'team',
+                'tagValue': 'data',
+                'tags': [{'key': 'env', 'value': 'prod'}],
+                'createdAfter': 0,
+            }
+        },
+    )
+    assert not result.errors
+    assert result.data['pipelineRunsOrError']['__typename'] == 'PipelineRuns'
+    assert [run['runId'] for run in result.data['pipelineRunsOrError']['results']] == [prod_run_id]
+
+    result = execute_dagster_graphql(
+        context, FILTERED_RUNS_QUERY, variables={'filter': {'tagKey': 'env'}}
+    )
+    assert result.data['pipelineRunsOrError']['__typename'] == 'InvalidPipelineRunsFilterError'
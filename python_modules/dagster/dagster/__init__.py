@@ -83,6 +83,7 @@ from dagster.core.types.config import ConfigScalar, ConfigType, Enum, EnumValue
 from dagster.core.types.decorator import as_dagster_type, dagster_type
 from dagster.core.types.marshal import SerializationStrategy
 from dagster.core.types.runtime import RuntimeType, define_python_dagster_type
+from dagster.core.types.type_check_policy import TypeCheckPolicy
 from dagster.utils import file_relative_path
 from dagster.utils.test import execute_solid, execute_solids_within_pipeline
 
@@ -134,6 +135,7 @@ __all__ = [
     'RunConfig',
     'SolidExecutionResult',
     'SystemStorageData',
+    'TypeCheckPolicy',
     # Errors
     'DagsterExecutionStepExecutionError',
     'DagsterExecutionStepNotFoundError',
@@ -9,6 +9,12 @@ from dagster import DagsterInvariantViolationError, check
 from dagster.cli.load_handle import handle_for_repo_cli_args
 from dagster.core.instance import DagsterInstance, _is_dagster_home_set
 from dagster.core.scheduler import ScheduleStatus
+from dagster.core.scheduler.daemon import (
+    DEFAULT_MAX_CONCURRENT_RUNS,
+    DaemonScheduler,
+    SchedulerDaemon,
+    is_croniter_available,
+)
 from dagster.utils import DEFAULT_REPOSITORY_YAML_FILENAME
 
 
@@ -21,6 +27,7 @@ def create_schedule_cli_group():
     group.add_command(schedule_stop_command)
     group.add_command(schedule_restart_command)
     group.add_command(schedule_wipe_command)
+    group.add_command(schedule_daemon_command)
     return group
 
 
@@ -427,3 +434,75 @@ def execute_wipe_command(cli_args, print_fn):
         print_fn("Wiped all schedules and schedule cron jobs")
     else:
         click.echo('Exiting without deleting all schedules and schedule cron jobs')
+
+
+@click.command(
+    name='daemon',
+    help='Run the schedules of a repository from a single long-running process. The repository '
+    'is loaded once, and the runs of every running schedule are launched from this process, each '
+    'in a child process, when they are due. Use with a repository whose scheduler is the DaemonScheduler. {warning}'.format(
+        warning=REPO_TARGET_WARNING
+    ),
+)
+@click.option(
+    '--max-concurrent-runs',
+    type=click.INT,
+    default=DEFAULT_MAX_CONCURRENT_RUNS,
+    help='The most scheduled runs to execute at once.',
+)
+@repository_target_argument
+def schedule_daemon_command(max_concurrent_runs, **kwargs):
+    return execute_daemon_command(max_concurrent_runs, kwargs, click.echo)
+
+
+def execute_daemon_command(max_concurrent_runs, cli_args, print_fn, stop_event=None):
+    if not _is_dagster_home_set():
+        raise click.UsageError(dagster_home_error_message_for_command('dagster schedule daemon'))
+
+    if not is_croniter_available():
+        raise click.UsageError(
+            'The croniter package is required to run the scheduler daemon. Install it with '
+            '`pip install dagster[scheduler]`.'
+        )
+
+    if max_concurrent_runs < 1:
+        raise click.UsageError('--max-concurrent-runs must be at least 1')
+
+    handle = handle_for_repo_cli_args(cli_args)
+    repository = handle.build_repository_definition()
+
+    instance = DagsterInstance.get()
+    scheduler_handle = handle.build_scheduler_handle(artifacts_dir=instance.schedules_directory())
+    if not scheduler_handle:
+        print_fn("Scheduler not defined for repository {name}".format(name=repository.name))
+        return
+
+    if not isinstance(scheduler_handle.get_scheduler(), DaemonScheduler):
+        print_fn(
+            click.style(
+                'Warning: the scheduler for repository {name} is not the DaemonScheduler. '
+                'Schedules it also runs by other means will be launched twice.'.format(
+                    name=repository.name
+                ),
+                fg='yellow',
+            )
+        )
+
+    daemon = SchedulerDaemon(
+        instance,
+        handle,
+        scheduler_handle,
+        instance.schedules_directory(),
+        max_concurrent_runs=max_concurrent_runs,
+        print_fn=print_fn,
+    )
+
+    print_fn(
+        'Running schedules for repository {name}. Press Ctrl+C to stop.'.format(
+            name=repository.name
+        )
+    )
+    try:
+        daemon.run(stop_event)
+    except KeyboardInterrupt:
+        print_fn('Stopped running schedules')
@@ -38,26 +38,16 @@ def _create_adjacency_lists(solids, dep_structure):
     check.list_param(solids, 'solids', Solid)
     check.inst_param(dep_structure, 'dep_structure', DependencyStructure)
 
-    visit_dict = {s.name: False for s in solids}
     forward_edges = {s.name: set() for s in solids}
     backward_edges = {s.name: set() for s in solids}
 
-    def visit(solid_name):
-        if visit_dict[solid_name]:
-            return
-
-        visit_dict[solid_name] = True
-
-        for output_handle in dep_structure.deps_of_solid(solid_name):
+    for s in solids:
+        for output_handle in dep_structure.deps_of_solid(s.name):
             forward_node = output_handle.solid.name
-            backward_node = solid_name
+            backward_node = s.name
             if forward_node in forward_edges:
                 forward_edges[forward_node].add(backward_node)
                 backward_edges[backward_node].add(forward_node)
-                visit(forward_node)
-
-    for s in solids:
-        visit(s.name)
 
     return (forward_edges, backward_edges)
 
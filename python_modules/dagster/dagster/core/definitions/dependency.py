@@ -325,6 +325,24 @@ class DependencyStructure(object):
     def __init__(self, handle_dict):
         self._handle_dict = check.inst_param(handle_dict, 'handle_dict', InputToOutputHandleDict)
 
+        # The (input handle, output handle) pairs of each solid, by the name of the solid with the
+        # input and by the name of the solid with the output
+        self._deps_by_solid_name = defaultdict(list)
+        self._depended_by_by_solid_name = defaultdict(list)
+        for input_handle, output_handle_or_list in self._handle_dict.items():
+            if isinstance(output_handle_or_list, list):
+                output_handles = output_handle_or_list
+            else:
+                output_handles = [output_handle_or_list]
+
+            for output_handle in output_handles:
+                self._deps_by_solid_name[input_handle.solid.name].append(
+                    (input_handle, output_handle)
+                )
+                self._depended_by_by_solid_name[output_handle.solid.name].append(
+                    (input_handle, output_handle)
+                )
+
     def deps_of_solid(self, solid_name):
         check.str_param(solid_name, 'solid_name')
 
@@ -338,25 +356,13 @@ class DependencyStructure(object):
         return result
 
     def __gen_deps_of_solid(self, solid_name):
-        for input_handle, output_handle_or_list in self._handle_dict.items():
-            if input_handle.solid.name == solid_name:
-                if isinstance(output_handle_or_list, list):
-                    for output_handle in output_handle_or_list:
-                        yield (input_handle, output_handle)
-                else:
-                    yield (input_handle, output_handle_or_list)
+        return iter(self._deps_by_solid_name.get(solid_name, []))
 
     def depended_by_of_solid(self, solid_name):
         check.str_param(solid_name, 'solid_name')
         result = defaultdict(list)
-        for input_handle, output_handle_or_list in self._handle_dict.items():
-            if isinstance(output_handle_or_list, list):
-                for output_handle in output_handle_or_list:
-                    if output_handle.solid.name == solid_name:
-                        result[output_handle].append(input_handle)
-            else:
-                if output_handle_or_list.solid.name == solid_name:
-                    result[output_handle_or_list].append(input_handle)
+        for input_handle, output_handle in self._depended_by_by_solid_name.get(solid_name, []):
+            result[output_handle].append(input_handle)
 
         return result
 
@@ -52,7 +52,16 @@ class EnvironmentSchema(
 
 def create_environment_schema(pipeline_def, mode=None):
     check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition)
-    mode = check.opt_str_param(mode, 'mode', default=pipeline_def.get_default_mode_name())
+    check.opt_str_param(mode, 'mode')
+    return pipeline_def.get_environment_schema(mode)
+
+
+def build_environment_schema(pipeline_def, mode):
+    '''Builds the EnvironmentSchema of a pipeline in a mode. Use create_environment_schema or
+    PipelineDefinition.get_environment_schema, which only build the schema of each mode once.
+    '''
+    check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition)
+    check.str_param(mode, 'mode')
     mode_definition = pipeline_def.get_mode_definition(mode)
 
     environment_cls = define_environment_cls(
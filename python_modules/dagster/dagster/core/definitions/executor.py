@@ -1,6 +1,10 @@
 from dagster import check
-from dagster.core.execution.config import InProcessExecutorConfig, MultiprocessExecutorConfig
-from dagster.core.types import Field, Int
+from dagster.core.execution.config import (
+    InProcessExecutorConfig,
+    MultiprocessExecutorConfig,
+    WorkerPoolConfig,
+)
+from dagster.core.types import Bool, Field, Int
 from dagster.core.types.field_utils import check_user_facing_opt_field_param
 
 from .config import resolve_config_field
@@ -86,7 +90,32 @@ def in_process_executor(init_context):
 
 
 @executor(
-    name='multiprocess', config={'max_concurrent': Field(Int, is_optional=True, default_value=0)}
+    name='multiprocess',
+    config={
+        'max_concurrent': Field(Int, is_optional=True, default_value=0),
+        'worker_pool': Field(
+            Bool,
+            is_optional=True,
+            default_value=False,
+            description='Execute steps in a pool of max_concurrent long-lived worker processes, '
+            'each of which loads the pipeline once, instead of in a new process per step.',
+        ),
+        'max_steps_per_worker': Field(
+            Int,
+            is_optional=True,
+            default_value=0,
+            description='If using a worker pool, replace a worker with a fresh process after it '
+            'has executed this many steps. 0 means never.',
+        ),
+        'max_worker_memory_growth_mb': Field(
+            Int,
+            is_optional=True,
+            default_value=0,
+            description='If using a worker pool, replace a worker with a fresh process once its '
+            'peak memory has grown by more than this many megabytes since its first step. '
+            '0 means never.',
+        ),
+    },
 )
 def multiprocess_executor(init_context):
     from dagster.core.definitions.handle import ExecutionTargetHandle
@@ -95,8 +124,19 @@ def multiprocess_executor(init_context):
     check.inst_param(init_context, 'init_context', InitExecutorContext)
 
     handle, _ = ExecutionTargetHandle.get_handle(init_context.pipeline_def)
+
+    executor_config = init_context.executor_config
+    worker_pool = (
+        WorkerPoolConfig(
+            max_steps_per_worker=executor_config['max_steps_per_worker'] or None,
+            max_memory_growth_mb=executor_config['max_worker_memory_growth_mb'] or None,
+        )
+        if executor_config['worker_pool']
+        else None
+    )
+
     return MultiprocessExecutorConfig(
-        handle=handle, max_concurrent=init_context.executor_config['max_concurrent']
+        handle=handle, max_concurrent=executor_config['max_concurrent'], worker_pool=worker_pool
     )
 
 
@@ -153,6 +153,9 @@ class PipelineDefinition(IContainSolids, object):
             selector, 'selector', ExecutionSelector, ExecutionSelector(self._name)
         )
 
+        # Environment schemas by mode, built the first time each is asked for
+        self._environment_schemas = {}
+
     @property
     def name(self):
         return self._name
@@ -214,6 +217,21 @@ class PipelineDefinition(IContainSolids, object):
 
         return mode_def
 
+    def get_environment_schema(self, mode=None):
+        '''Returns the EnvironmentSchema of the pipeline in the given mode, or in the default mode
+        if none is given.
+
+        Pipeline definitions are immutable, so the schema of each mode is only built once.
+        '''
+        mode = check.opt_str_param(mode, 'mode', default=self.get_default_mode_name())
+        if mode not in self._environment_schemas:
+            # Deferred import to avoid a circular import
+            from .environment_schema import build_environment_schema
+
+            self._environment_schemas[mode] = build_environment_schema(self, mode)
+
+        return self._environment_schemas[mode]
+
     @property
     def available_modes(self):
         return [mode_def.name for mode_def in self._mode_definitions]
@@ -486,18 +504,3 @@ class ExecutionSelector(namedtuple('_ExecutionSelector', 'name solid_subset')):
             if solid_subset is None
             else check.list_param(solid_subset, 'solid_subset', of_type=str),
         )
-
-
-@whitelist_for_serdes
-class PipelineRunsFilter(
-    namedtuple('_PipelineRunsFilter', 'run_id tag_key tag_value pipeline status')
-):
-    def __new__(cls, run_id=None, pipeline=None, status=None, tag_key=None, tag_value=None):
-        return super(PipelineRunsFilter, cls).__new__(
-            cls,
-            run_id=check.opt_str_param(run_id, 'run_id'),
-            tag_key=check.opt_str_param(tag_key, 'tag_key'),
-            tag_value=check.opt_str_param(tag_value, 'tag_value'),
-            pipeline=check.opt_str_param(pipeline, 'pipeline'),
-            status=status,
-        )
@@ -1,8 +1,8 @@
 '''Facilities for running arbitrary commands in child processes.'''
 
-import multiprocessing
 import os
 import sys
+import time
 from abc import ABCMeta, abstractmethod
 from collections import namedtuple
 
@@ -12,25 +12,50 @@ from dagster import check
 from dagster.utils import get_multiprocessing_context
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
+try:
+    from multiprocessing.connection import wait as wait_for_connections
+except ImportError:
+    wait_for_connections = None
+
 ChildProcessStartEvent = namedtuple('ChildProcessStartEvent', 'pid')
 ChildProcessDoneEvent = namedtuple('ChildProcessDoneEvent', 'pid')
 ChildProcessSystemErrorEvent = namedtuple('ChildProcessSystemErrorEvent', 'pid error_info')
 
-ChildProcessEvents = (ChildProcessStartEvent, ChildProcessDoneEvent, ChildProcessSystemErrorEvent)
+ChildProcessWorkerTaskDoneEvent = namedtuple('ChildProcessWorkerTaskDoneEvent', 'pid task recycle')
+
+ChildProcessEvents = (
+    ChildProcessStartEvent,
+    ChildProcessDoneEvent,
+    ChildProcessSystemErrorEvent,
+    ChildProcessWorkerTaskDoneEvent,
+)
 
 
 class ChildProcessCommand(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
     '''Inherit from this class in order to use this library.
-    
+
     The object must be picklable; instantiate it and pass it to _execute_command_in_child_process.'''
 
     @abstractmethod
     def execute(self):
-        ''' This method is invoked in the child process.
-        
+        '''This method is invoked in the child process.
+
         Yields a sequence of events to be handled by _execute_command_in_child_process.'''
 
 
+class ChildProcessWorkerCommand(six.with_metaclass(ABCMeta)):  # pylint: disable=no-init
+    '''Inherit from this class to run a sequence of tasks in long-lived worker processes.
+
+    The object must be picklable; it is sent to each worker process once, so any state it builds
+    up while executing tasks (e.g. loaded definitions) is reused for subsequent tasks.'''
+
+    @abstractmethod
+    def execute(self, task):
+        '''This method is invoked in the worker process, once per task.
+
+        Yields a sequence of events to be handled by the ChildProcessWorkerPool.'''
+
+
 class ChildProcessException(Exception):
     '''Thrown when an uncaught exception is raised in the child process.'''
 
@@ -44,61 +69,213 @@ class ChildProcessException(Exception):
 class ChildProcessCrashException(Exception):
     '''Thrown when the child process crashes.'''
 
+    def __init__(self, *args, **kwargs):
+        super(ChildProcessCrashException, self).__init__(*args)
+        self.pid = check.opt_int_param(kwargs.pop('pid', None), 'pid')
+        self.exit_code = check.opt_int_param(kwargs.pop('exit_code', None), 'exit_code')
+
 
-def _execute_command_in_child_process(queue, command):
+def _execute_command_in_child_process(event_conn, command):
     '''Wraps the execution of a ChildProcessCommand.
-    
-    Handles errors and communicates across a queue with the parent process.'''
+
+    Handles errors and communicates across a pipe with the parent process.'''
 
     check.inst_param(command, 'command', ChildProcessCommand)
 
     pid = os.getpid()
-    queue.put(ChildProcessStartEvent(pid=pid))
+    event_conn.send(ChildProcessStartEvent(pid=pid))
     try:
         for step_event in command.execute():
-            queue.put(step_event)
-        queue.put(ChildProcessDoneEvent(pid=pid))
+            event_conn.send(step_event)
+        event_conn.send(ChildProcessDoneEvent(pid=pid))
     except Exception:  # pylint: disable=broad-except
-        queue.put(
+        event_conn.send(
             ChildProcessSystemErrorEvent(
                 pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
             )
         )
     finally:
-        queue.close()
+        event_conn.close()
 
 
 TICK = 20.0 * 1.0 / 1000.0
-'''The minimum interval at which to check for child process liveness -- default 20ms.'''
+'''The interval at which to check for child process liveness where the platform can not wait on
+process and connection handles -- default 20ms.'''
 
 PROCESS_DEAD_AND_QUEUE_EMPTY = 'PROCESS_DEAD_AND_QUEUE_EMPTY'
 '''Sentinel value.'''
 
 
-def _poll_for_event(process, queue):
+def _start_process(multiprocessing_context, target, args):
+    '''Starts a process calling target with a connection to send events over, followed by args.
+
+    Returns the process and the connection its events are received on.'''
+    event_conn, child_event_conn = multiprocessing_context.Pipe(duplex=False)
+    process = multiprocessing_context.Process(target=target, args=(child_event_conn,) + args)
+    process.start()
+    # Only the child writes to the pipe, so that reads see the end of it once the child has exited
+    child_event_conn.close()
+    return process, event_conn
+
+
+def _wait_for_events(processes_and_conns, timeout=None):
+    '''Blocks until an event can be read from one of the connections or one of the processes has
+    exited, or until timeout seconds have elapsed (or indefinitely if timeout is None).
+
+    Waits on all of the connections and process sentinels at once, so the parent process doesn't
+    spend any CPU while its children are busy and picks up events as soon as they are produced.'''
+    processes_and_conns = list(processes_and_conns)
+    if not processes_and_conns:
+        return
+
+    if wait_for_connections is None:
+        # Python 2 can't wait on several handles at once, fall back to polling every TICK
+        time.sleep(TICK if timeout is None else min(TICK, timeout))
+        return
+
+    handles = []
+    for process, event_conn in processes_and_conns:
+        handles.extend([event_conn, process.sentinel])
+    wait_for_connections(handles, timeout)
+
+
+def _receive_event(event_conn):
     try:
-        return queue.get(block=True, timeout=TICK)
-    except multiprocessing.queues.Empty:
-        if not process.is_alive():
-            # There is a possibility that after the last queue.get the
-            # process created another event and then died. In that case
-            # we want to continue draining the queue.
-            try:
-                return queue.get(block=False)
-            except multiprocessing.queues.Empty:
-                # If the queue empty we know that there are no more events
-                # and that the process has died.
-                return PROCESS_DEAD_AND_QUEUE_EMPTY
+        if event_conn.poll():
+            return event_conn.recv()
+    except EOFError:
+        # The child has exited, and every event it sent has been received
+        return PROCESS_DEAD_AND_QUEUE_EMPTY
 
     return None
 
 
+def _poll_for_event(process, event_conn):
+    '''Reads the next event from event_conn without blocking, returning None if there isn't one yet
+    and PROCESS_DEAD_AND_QUEUE_EMPTY if there will never be one.'''
+    event = _receive_event(event_conn)
+    if event is None and not process.is_alive():
+        # The process may have sent another event before it exited, in which case we want to
+        # continue draining the pipe
+        event = _receive_event(event_conn)
+        return PROCESS_DEAD_AND_QUEUE_EMPTY if event is None else event
+
+    return event
+
+
+def _child_process_exception(event):
+    return ChildProcessException(
+        'Uncaught exception in process {pid} with message "{message}" and error info '
+        '{error_info}'.format(
+            pid=event.pid, message=event.error_info.message, error_info=event.error_info
+        ),
+        error_info=event.error_info,
+    )
+
+
+def _child_process_crash_exception(process):
+    # The process has stopped sending events, wait for it to exit to collect its exit code
+    process.join()
+    return ChildProcessCrashException(
+        'Process {pid} exited unexpectedly with exit code {exit_code}'.format(
+            pid=process.pid, exit_code=process.exitcode
+        ),
+        pid=process.pid,
+        exit_code=process.exitcode,
+    )
+
+
+class ChildProcessCommandMultiplexer(object):
+    '''Executes ChildProcessCommands, each in a new process, and waits for the events yielded by
+    all of them at once.
+
+    Args:
+        return_process_events(Optional[bool]): Set this flag to yield the control events
+            (ChildProcessEvents) back to the caller of poll, in addition to any non-control
+            events. (default: False)
+    '''
+
+    def __init__(self, return_process_events=False):
+        self._return_process_events = check.bool_param(
+            return_process_events, 'return_process_events'
+        )
+        self._multiprocessing_context = get_multiprocessing_context()
+        self._running = {}
+        self._exiting = []
+
+    @property
+    def num_running(self):
+        return len(self._running)
+
+    def start(self, key, command):
+        '''Starts executing command in a new process. The events it yields are tagged with key.'''
+        check.inst_param(command, 'command', ChildProcessCommand)
+        check.invariant(key not in self._running, 'Command {key} already running'.format(key=key))
+
+        self._running[key] = _start_process(
+            self._multiprocessing_context, _execute_command_in_child_process, (command,)
+        )
+
+    def poll(self, timeout=None):
+        '''Waits until at least one of the running commands has yielded an event or exited, or until
+        timeout seconds have elapsed, then yields (key, event) tuples for every event received.
+
+        (key, None) is yielded once the command started with key has completed.
+
+        Warning: if a child process is in an infinite loop, this will wait indefinitely unless a
+        timeout is given.'''
+        self._reap_exited()
+
+        _wait_for_events(self._running.values(), timeout)
+
+        for key, (process, event_conn) in list(self._running.items()):
+            while True:
+                event = _poll_for_event(process, event_conn)
+
+                # child process is busy executing, move on to the next one
+                if event is None:
+                    break
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    del self._running[key]
+                    raise _child_process_crash_exception(process)
+
+                # If we are configured to return process events by the caller,
+                # yield that event to the caller
+                if self._return_process_events and isinstance(event, ChildProcessEvents):
+                    yield key, event
+
+                if isinstance(event, ChildProcessDoneEvent):
+                    # The process may take a little while to exit, don't block on it
+                    del self._running[key]
+                    self._exiting.append(process)
+                    yield key, None
+                    break
+                elif isinstance(event, ChildProcessSystemErrorEvent):
+                    del self._running[key]
+                    self._exiting.append(process)
+                    raise _child_process_exception(event)
+                elif not isinstance(event, ChildProcessEvents):
+                    yield key, event
+
+    def _reap_exited(self):
+        self._exiting = [process for process in self._exiting if process.is_alive()]
+
+    def join(self):
+        '''Waits for the processes of completed commands to exit.'''
+        while self._exiting:
+            self._exiting.pop().join()
+
+
 def execute_child_process_command(command, return_process_events=False):
     '''Execute a ChildProcessCommand in a new process.
 
     This function starts a new process whose execution target is a ChildProcessCommand wrapped by
-    _execute_command_in_child_process; polls the queue for events yielded by the child process
-    until the process dies and the queue is empty.
+    _execute_command_in_child_process; polls the pipe for events yielded by the child process
+    until the process dies and the pipe is empty.
+
+    To execute several commands concurrently, use a ChildProcessCommandMultiplexer, which waits on
+    all of the child processes at once.
 
     Args:
         command (ChildProcessCommand): The command to execute in the child process.
@@ -113,47 +290,246 @@ def execute_child_process_command(command, return_process_events=False):
     check.inst_param(command, 'command', ChildProcessCommand)
     check.bool_param(return_process_events, 'return_process_events')
 
-    multiprocessing_context = get_multiprocessing_context()
-    queue = multiprocessing_context.Queue()
-
-    process = multiprocessing_context.Process(
-        target=_execute_command_in_child_process, args=(queue, command)
-    )
-
-    process.start()
-
-    completed_properly = False
+    multiplexer = ChildProcessCommandMultiplexer(return_process_events=return_process_events)
+    multiplexer.start(None, command)
 
-    while not completed_properly:
-        event = _poll_for_event(process, queue)
+    while multiplexer.num_running:
+        received_event = False
+        for _, event in multiplexer.poll(timeout=TICK):
+            received_event = True
+            if event is not None:
+                yield event
 
         # child process is busy executing, yield so we (the parent) can continue
         # other work such as checking other child_process_commands
-        if event is None:
+        if not received_event:
             yield None
 
-        if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
-            break
-
-        # If we are configured to return process events by the caller,
-        # yield that event to the caller
-        if return_process_events and isinstance(event, ChildProcessEvents):
-            yield event
-
-        if isinstance(event, ChildProcessDoneEvent):
-            completed_properly = True
-        elif isinstance(event, ChildProcessSystemErrorEvent):
-            raise ChildProcessException(
-                'Uncaught exception in process {pid} with message "{message}" and error info {error_info}'.format(
-                    pid=event.pid, message=event.error_info.message, error_info=event.error_info
-                ),
-                error_info=event.error_info,
+    multiplexer.join()
+
+
+def _peak_memory_mb():
+    '''The peak resident set size of the current process in megabytes, or None if it can't be
+    determined on this platform.'''
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return max_rss / (1024.0 * 1024.0) if sys.platform == 'darwin' else max_rss / 1024.0
+
+
+def _execute_tasks_in_worker_process(
+    event_conn, task_queue, command, max_tasks, max_memory_growth_mb
+):
+    '''Wraps the execution of a ChildProcessWorkerCommand.
+
+    Executes tasks received over task_queue until it receives None, or until the worker should be
+    recycled, communicating events back to the parent process over event_conn.'''
+
+    check.inst_param(command, 'command', ChildProcessWorkerCommand)
+
+    pid = os.getpid()
+    event_conn.send(ChildProcessStartEvent(pid=pid))
+    try:
+        tasks_executed = 0
+        baseline_memory_mb = None
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+
+            for event in command.execute(task):
+                event_conn.send(event)
+            tasks_executed += 1
+
+            # Measure memory growth from the end of the first task, which is when the command
+            # has finished warming up its caches
+            peak_memory_mb = _peak_memory_mb()
+            if baseline_memory_mb is None:
+                baseline_memory_mb = peak_memory_mb
+
+            recycle = bool(max_tasks and tasks_executed >= max_tasks) or bool(
+                max_memory_growth_mb
+                and peak_memory_mb is not None
+                and peak_memory_mb - baseline_memory_mb > max_memory_growth_mb
             )
-        elif not isinstance(event, ChildProcessEvents):
-            yield event
+            event_conn.send(ChildProcessWorkerTaskDoneEvent(pid=pid, task=task, recycle=recycle))
+            if recycle:
+                break
 
-    if not completed_properly:
-        # TODO Gather up stderr and the process exit code
-        raise ChildProcessCrashException()
+        event_conn.send(ChildProcessDoneEvent(pid=pid))
+    except Exception:  # pylint: disable=broad-except
+        event_conn.send(
+            ChildProcessSystemErrorEvent(
+                pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
+            )
+        )
+    finally:
+        event_conn.close()
+
+
+class _ChildProcessWorker(object):
+    def __init__(self, process, task_queue, event_conn):
+        self.process = process
+        self.task_queue = task_queue
+        self.event_conn = event_conn
+        self.task = None
+
+    @property
+    def is_busy(self):
+        return self.task is not None
+
+    def dispatch(self, task):
+        check.invariant(not self.is_busy, 'Worker is already executing a task')
+        self.task = task
+        self.task_queue.put(task)
+
+    def stop(self):
+        '''Asks an idle worker to exit and waits for it to do so.'''
+        self.task_queue.put(None)
+        self.join()
+
+    def join(self):
+        # Drain the pipe first: a process blocked sending an event can't exit
+        while True:
+            _wait_for_events([(self.process, self.event_conn)])
+            event = _poll_for_event(self.process, self.event_conn)
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY or isinstance(
+                event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)
+            ):
+                break
+        self.process.join()
+
+
+class ChildProcessWorkerPool(object):
+    '''Executes tasks with a ChildProcessWorkerCommand across a bounded set of long-lived worker
+    processes, starting them on demand.
 
-    process.join()
+    Args:
+        command (ChildProcessWorkerCommand): The command to execute each task with.
+        size (int): The maximum number of worker processes, and so of concurrently executing tasks.
+        max_tasks_per_worker (Optional[int]): Replace a worker with a fresh process after it has
+            executed this many tasks. (default: None, never)
+        max_memory_growth_mb (Optional[int]): Replace a worker with a fresh process once its peak
+            memory has grown by more than this many megabytes since its first task completed. Only
+            supported on platforms providing the resource module. (default: None, never)
+    '''
+
+    def __init__(self, command, size, max_tasks_per_worker=None, max_memory_growth_mb=None):
+        self._command = check.inst_param(command, 'command', ChildProcessWorkerCommand)
+        self._size = check.int_param(size, 'size')
+        check.param_invariant(self._size > 0, 'size', 'Must be a positive integer')
+        self._max_tasks_per_worker = check.opt_int_param(
+            max_tasks_per_worker, 'max_tasks_per_worker'
+        )
+        self._max_memory_growth_mb = check.opt_int_param(
+            max_memory_growth_mb, 'max_memory_growth_mb'
+        )
+        self._workers = []
+        self._multiprocessing_context = get_multiprocessing_context()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.shutdown()
+        else:
+            self.terminate()
+
+    def _start_worker(self):
+        task_queue = self._multiprocessing_context.Queue()
+        process, event_conn = _start_process(
+            self._multiprocessing_context,
+            _execute_tasks_in_worker_process,
+            (task_queue, self._command, self._max_tasks_per_worker, self._max_memory_growth_mb),
+        )
+        worker = _ChildProcessWorker(process, task_queue, event_conn)
+        self._workers.append(worker)
+        return worker
+
+    def _idle_worker(self):
+        for worker in self._workers:
+            if not worker.is_busy:
+                return worker
+        check.invariant(len(self._workers) < self._size, 'No idle worker available')
+        return self._start_worker()
+
+    @property
+    def num_busy(self):
+        return sum(1 for worker in self._workers if worker.is_busy)
+
+    @property
+    def has_capacity(self):
+        return self.num_busy < self._size
+
+    def submit(self, task):
+        '''Dispatches a task to an idle worker, starting a new worker if needed.'''
+        check.invariant(self.has_capacity, 'All workers are busy')
+        self._idle_worker().dispatch(task)
+
+    def poll(self, timeout=None):
+        '''Waits until at least one busy worker has yielded an event or exited, or until timeout
+        seconds have elapsed, then yields the events received.
+
+        A ChildProcessWorkerTaskDoneEvent is yielded once a task has completed and its worker is
+        free to receive another one.'''
+        busy_workers = [worker for worker in self._workers if worker.is_busy]
+        _wait_for_events([(worker.process, worker.event_conn) for worker in busy_workers], timeout)
+
+        for worker in busy_workers:
+            while worker.is_busy:
+                event = _poll_for_event(worker.process, worker.event_conn)
+
+                if event is None:
+                    break
+
+                if isinstance(event, ChildProcessStartEvent):
+                    continue
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY or isinstance(
+                    event, ChildProcessDoneEvent
+                ):
+                    raise _child_process_crash_exception(worker.process)
+
+                if isinstance(event, ChildProcessSystemErrorEvent):
+                    raise _child_process_exception(event)
+
+                if isinstance(event, ChildProcessWorkerTaskDoneEvent):
+                    worker.task = None
+                    if event.recycle:
+                        worker.join()
+                        self._workers.remove(worker)
+
+                yield event
+
+    def execute(self, tasks):
+        '''Executes the given tasks, yielding the events they produce as they arrive.
+
+        Warning: if a task is in an infinite loop, this will also infinitely loop.'''
+        pending = list(reversed(tasks))
+
+        while pending or self.num_busy:
+            while pending and self.has_capacity:
+                self.submit(pending.pop())
+
+            for event in self.poll():
+                if not isinstance(event, ChildProcessWorkerTaskDoneEvent):
+                    yield event
+
+    def shutdown(self):
+        '''Stops all worker processes once they have finished their current task.'''
+        while self._workers:
+            worker = self._workers.pop()
+            check.invariant(not worker.is_busy, 'Can not shut down a pool with tasks in flight')
+            worker.stop()
+
+    def terminate(self):
+        '''Kills all worker processes immediately.'''
+        while self._workers:
+            worker = self._workers.pop()
+            worker.process.terminate()
+            worker.process.join()
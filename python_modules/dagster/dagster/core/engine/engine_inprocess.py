@@ -29,6 +29,7 @@ from dagster.core.execution.plan.objects import (
     UserFailureData,
 )
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.storage.intermediates_manager import IntermediatesReferenceCounter
 from dagster.core.storage.object_store import ObjectStoreOperation
 from dagster.utils.error import serializable_error_info_from_exc_info
 from dagster.utils.timing import format_duration, time_execution_scope
@@ -64,9 +65,11 @@ class InProcessEngine(IEngine):  # pylint: disable=no-init
 
             step_levels = execution_plan.topological_step_levels()
 
-            # It would be good to implement a reference tracking algorithm here to
-            # garbage collect results that are no longer needed by any steps
-            # https://github.com/dagster-io/dagster/issues/811
+            # Release intermediates once no remaining step needs them
+            intermediates_reference_counter = IntermediatesReferenceCounter(
+                pipeline_context.intermediates_manager, execution_plan, step_keys_to_execute
+            )
+
             for step_level in step_levels:
                 for step in step_level:
                     if step_key_set and step.key not in step_key_set:
@@ -91,6 +94,7 @@ class InProcessEngine(IEngine):  # pylint: disable=no-init
                             )
                             failed_or_skipped_steps.add(step.key)
                             yield DagsterEvent.step_skipped_event(step_context)
+                            intermediates_reference_counter.step_completed(pipeline_context, step)
                             continue
 
                         uncovered_inputs = pipeline_context.intermediates_manager.uncovered_inputs(
@@ -111,6 +115,7 @@ class InProcessEngine(IEngine):  # pylint: disable=no-init
                             )
                             failed_or_skipped_steps.add(step.key)
                             yield DagsterEvent.step_skipped_event(step_context)
+                            intermediates_reference_counter.step_completed(pipeline_context, step)
                             continue
 
                         for step_event in check.generator(
@@ -122,6 +127,8 @@ class InProcessEngine(IEngine):  # pylint: disable=no-init
 
                             yield step_event
 
+                        intermediates_reference_counter.step_completed(pipeline_context, step)
+
         yield DagsterEvent.engine_event(
             pipeline_context,
             'Finished steps in process (pid: {pid}) in {duration_ms}'.format(
@@ -332,8 +339,8 @@ def _step_output_error_checked_user_event_sequence(step_context, user_event_sequ
                 )
 
 
-def _do_type_check(runtime_type, value):
-    type_check = runtime_type.type_check(value)
+def _do_type_check(runtime_type, value, policy):
+    type_check = runtime_type.type_check_with_policy(value, policy)
     if type_check is not None and not isinstance(type_check, TypeCheck):
         raise DagsterInvariantViolationError(
             (
@@ -398,7 +405,9 @@ def _type_checked_event_sequence_for_input(step_context, input_name, input_value
             yield _create_step_input_event(
                 step_context,
                 input_name,
-                type_check=_do_type_check(step_input.runtime_type, input_value),
+                type_check=_do_type_check(
+                    step_input.runtime_type, input_value, step_context.run_config.type_check_policy
+                ),
                 success=True,
             )
     except Exception as failure:  # pylint: disable=broad-except
@@ -451,7 +460,11 @@ def _type_checked_step_output_event_sequence(step_context, output):
             yield _create_step_output_event(
                 step_context,
                 output,
-                type_check=_do_type_check(step_output.runtime_type, output.value),
+                type_check=_do_type_check(
+                    step_output.runtime_type,
+                    output.value,
+                    step_context.run_config.type_check_policy,
+                ),
                 success=True,
             )
     except Exception as failure:  # pylint: disable=broad-except
@@ -1,4 +1,6 @@
 import os
+from collections import defaultdict, deque
+from contextlib import contextmanager
 
 from dagster import check
 from dagster.core.events import DagsterEvent, EngineEventData
@@ -7,10 +9,18 @@ from dagster.core.execution.config import MultiprocessExecutorConfig, RunConfig
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.instance import DagsterInstance
+from dagster.core.storage.intermediates_manager import IntermediatesReferenceCounter
 from dagster.utils.timing import format_duration, time_execution_scope
 
-from .child_process_executor import ChildProcessCommand, execute_child_process_command
+from .child_process_executor import (
+    ChildProcessCommand,
+    ChildProcessCommandMultiplexer,
+    ChildProcessWorkerCommand,
+    ChildProcessWorkerPool,
+    ChildProcessWorkerTaskDoneEvent,
+)
 from .engine_base import IEngine
+from .engine_inprocess import _assert_missing_inputs_optional
 
 
 class InProcessExecutorChildProcessCommand(ChildProcessCommand):
@@ -31,17 +41,74 @@ class InProcessExecutorChildProcessCommand(ChildProcessCommand):
         environment_dict = dict(self.environment_dict, execution={'in_process': {}})
         execution_plan = create_execution_plan(pipeline_def, environment_dict, run_config)
 
-        for step_event in execute_plan_iterator(
-            execution_plan,
-            environment_dict,
-            run_config,
-            step_keys_to_execute=[self.step_key],
-            instance=DagsterInstance.from_ref(self.instance_ref),
-        ):
-            yield step_event
+        instance = DagsterInstance.from_ref(self.instance_ref)
+        try:
+            for step_event in execute_plan_iterator(
+                execution_plan,
+                environment_dict,
+                run_config,
+                step_keys_to_execute=[self.step_key],
+                instance=instance,
+            ):
+                yield step_event
+        finally:
+            # Make sure any buffered events are written before this process exits
+            instance.flush_event_logs(run_config.run_id)
 
 
-def execute_step_out_of_process(step_context, step):
+class InProcessExecutorChildProcessWorkerCommand(ChildProcessWorkerCommand):
+    '''Executes steps in a long-lived worker process. The pipeline definition, execution plan and
+    instance are built on the first step and reused for every subsequent one.'''
+
+    def __init__(self, environment_dict, run_config, executor_config, instance_ref):
+        self.environment_dict = environment_dict
+        self.executor_config = executor_config
+        self.run_config = run_config
+        self.instance_ref = instance_ref
+
+        self._worker_state = None
+
+    def __getstate__(self):
+        # Only the configuration crosses the process boundary, the worker state is built there
+        return dict(self.__dict__, _worker_state=None)
+
+    def _get_worker_state(self):
+        if self._worker_state is None:
+            check.inst(self.executor_config, MultiprocessExecutorConfig)
+            pipeline_def = self.executor_config.handle.build_pipeline_definition()
+
+            run_config = self.run_config.with_tags(pid=str(os.getpid()))
+
+            environment_dict = dict(self.environment_dict, execution={'in_process': {}})
+            execution_plan = create_execution_plan(pipeline_def, environment_dict, run_config)
+
+            self._worker_state = (
+                environment_dict,
+                run_config,
+                execution_plan,
+                DagsterInstance.from_ref(self.instance_ref),
+            )
+
+        return self._worker_state
+
+    def execute(self, task):
+        step_key = check.str_param(task, 'task')
+        environment_dict, run_config, execution_plan, instance = self._get_worker_state()
+
+        try:
+            for step_event in execute_plan_iterator(
+                execution_plan,
+                environment_dict,
+                run_config,
+                step_keys_to_execute=[step_key],
+                instance=instance,
+            ):
+                yield step_event
+        finally:
+            instance.flush_event_logs(run_config.run_id)
+
+
+def _child_process_command_for_step(step_context, step):
     child_run_id = step_context.run_config.run_id
 
     child_run_config = RunConfig(
@@ -49,8 +116,9 @@ def execute_step_out_of_process(step_context, step):
         tags=step_context.run_config.tags,
         step_keys_to_execute=step_context.run_config.step_keys_to_execute,
         mode=step_context.run_config.mode,
+        type_check_policy=step_context.run_config.type_check_policy,
     )
-    command = InProcessExecutorChildProcessCommand(
+    return InProcessExecutorChildProcessCommand(
         step_context.environment_dict,
         child_run_config,
         step_context.executor_config,
@@ -58,43 +126,105 @@ def execute_step_out_of_process(step_context, step):
         step_context.instance.get_ref(),
     )
 
-    for event_or_none in execute_child_process_command(command):
-        yield event_or_none
 
+class _ProcessPerStepExecutor(object):
+    '''Executes each step in a new child process, with at most limit steps running concurrently.'''
+
+    def __init__(self, limit):
+        self._limit = check.int_param(limit, 'limit')
+        self._multiplexer = ChildProcessCommandMultiplexer()
+
+    @property
+    def has_capacity(self):
+        return self._multiplexer.num_running < self._limit
+
+    @property
+    def is_idle(self):
+        return not self._multiplexer.num_running
+
+    def launch(self, step_context):
+        step = step_context.step
+        self._multiplexer.start(step.key, _child_process_command_for_step(step_context, step))
+
+    def poll(self):
+        '''Waits for events from the executing steps, yielding (step_key, event) tuples. The event is
+        None once the step has finished executing.'''
+        return self._multiplexer.poll()
+
+    def join(self):
+        self._multiplexer.join()
+
+
+class _WorkerPoolStepExecutor(object):
+    '''Executes steps in a ChildProcessWorkerPool of long-lived worker processes.'''
+
+    def __init__(self, pool):
+        self._pool = check.inst_param(pool, 'pool', ChildProcessWorkerPool)
+
+    @property
+    def has_capacity(self):
+        return self._pool.has_capacity
 
-def bounded_parallel_executor(step_contexts, limit):
-    pending_execution = list(step_contexts)
-    active_iters = {}
+    @property
+    def is_idle(self):
+        return not self._pool.num_busy
 
-    while pending_execution or active_iters:
-        while len(active_iters) < limit and pending_execution:
-            step_context = pending_execution.pop()
-            step = step_context.step
-            active_iters[step.key] = execute_step_out_of_process(step_context, step)
+    def launch(self, step_context):
+        self._pool.submit(step_context.step.key)
 
-        empty_iters = []
-        for key, step_iter in active_iters.items():
-            try:
-                event_or_none = next(step_iter)
-                if event_or_none is None:
-                    continue
-                yield event_or_none
-            except StopIteration:
-                empty_iters.append(key)
+    def poll(self):
+        for event in self._pool.poll():
+            if isinstance(event, ChildProcessWorkerTaskDoneEvent):
+                yield event.task, None
+            else:
+                yield event.step_key, event
 
-        for key in empty_iters:
-            del active_iters[key]
+
+@contextmanager
+def _step_executor(pipeline_context, limit):
+    '''Yields an executor running steps out of process with at most limit steps running
+    concurrently, either in a process per step or in a pool of worker processes.'''
+    worker_pool_config = pipeline_context.executor_config.worker_pool
+    if worker_pool_config is None:
+        step_executor = _ProcessPerStepExecutor(limit)
+        try:
+            yield step_executor
+        finally:
+            step_executor.join()
+        return
+
+    command = InProcessExecutorChildProcessWorkerCommand(
+        pipeline_context.environment_dict,
+        RunConfig(
+            run_id=pipeline_context.run_config.run_id,
+            tags=pipeline_context.run_config.tags,
+            step_keys_to_execute=pipeline_context.run_config.step_keys_to_execute,
+            mode=pipeline_context.run_config.mode,
+            type_check_policy=pipeline_context.run_config.type_check_policy,
+        ),
+        pipeline_context.executor_config,
+        pipeline_context.instance.get_ref(),
+    )
+
+    with ChildProcessWorkerPool(
+        command,
+        limit,
+        max_tasks_per_worker=worker_pool_config.max_steps_per_worker,
+        max_memory_growth_mb=worker_pool_config.max_memory_growth_mb,
+    ) as pool:
+        yield _WorkerPoolStepExecutor(pool)
 
 
 class MultiprocessEngine(IEngine):  # pylint: disable=no-init
+    '''Executes each step out of process as soon as all of the steps it depends on have completed,
+    rather than level by level, so a slow step only holds back the steps downstream of it.'''
+
     @staticmethod
     def execute(pipeline_context, execution_plan, step_keys_to_execute=None):
         check.inst_param(pipeline_context, 'pipeline_context', SystemPipelineExecutionContext)
         check.inst_param(execution_plan, 'execution_plan', ExecutionPlan)
         check.opt_list_param(step_keys_to_execute, 'step_keys_to_execute', of_type=str)
 
-        step_levels = execution_plan.topological_step_levels()
-
         intermediates_manager = pipeline_context.intermediates_manager
 
         limit = pipeline_context.executor_config.max_concurrent
@@ -111,35 +241,116 @@ class MultiprocessEngine(IEngine):  # pylint: disable=no-init
             ),
         )
 
-        # It would be good to implement a reference tracking algorithm here so we could
-        # garbage collection results that are no longer needed by any steps
-        # https://github.com/dagster-io/dagster/issues/811
-        with time_execution_scope() as timer_result:
-            for step_level in step_levels:
-                step_contexts_to_execute = []
-                for step in step_level:
-                    if step_key_set and step.key not in step_key_set:
-                        continue
+        step_keys = [
+            step.key
+            for step in execution_plan.topological_steps()
+            if not step_key_set or step.key in step_key_set
+        ]
+
+        # Upstream steps that are not being executed are treated as already complete; whether
+        # their outputs exist is checked once the step is otherwise ready to execute.
+        waiting_on = {
+            step_key: execution_plan.deps[step_key].intersection(step_keys)
+            for step_key in step_keys
+        }
+        downstream_keys = defaultdict(list)
+        for step_key in step_keys:
+            for upstream_key in waiting_on[step_key]:
+                downstream_keys[upstream_key].append(step_key)
+
+        # Steps whose upstream steps have all completed, awaiting a check that they can execute
+        unblocked_keys = deque(step_key for step_key in step_keys if not waiting_on[step_key])
+        # Steps ready to execute, awaiting capacity in the step executor
+        ready_step_contexts = deque()
+        failed_or_skipped_steps = set()
+        # Outputs yielded by the steps executing in child processes
+        step_output_handles = defaultdict(list)
+
+        # Release intermediates once no remaining step needs them
+        intermediates_reference_counter = IntermediatesReferenceCounter(
+            intermediates_manager, execution_plan, step_keys_to_execute
+        )
+
+        def _complete(step_key):
+            # Let the intermediates manager know about the outputs set by the child process, so
+            # checking that the inputs of downstream steps are covered doesn't hit storage
+            for step_output_handle in step_output_handles.pop(step_key, []):
+                if step_key not in failed_or_skipped_steps:
+                    intermediates_manager.record_intermediate(pipeline_context, step_output_handle)
+
+            intermediates_reference_counter.step_completed(
+                pipeline_context, execution_plan.get_step_by_key(step_key)
+            )
+            for downstream_key in downstream_keys[step_key]:
+                waiting_on[downstream_key].discard(step_key)
+                if not waiting_on[downstream_key]:
+                    unblocked_keys.append(downstream_key)
 
+        with time_execution_scope() as timer_result, _step_executor(
+            pipeline_context, limit
+        ) as step_executor:
+            while unblocked_keys or ready_step_contexts or not step_executor.is_idle:
+                while unblocked_keys:
+                    step = execution_plan.get_step_by_key(unblocked_keys.popleft())
                     step_context = pipeline_context.for_step(step)
 
-                    if not intermediates_manager.all_inputs_covered(step_context, step):
-                        uncovered_inputs = intermediates_manager.uncovered_inputs(
-                            step_context, step
+                    failed_inputs = []
+                    for step_input in step.step_inputs:
+                        failed_inputs.extend(
+                            failed_or_skipped_steps.intersection(step_input.dependency_keys)
                         )
-                        step_context.log.error(
+
+                    if failed_inputs:
+                        step_context.log.info(
+                            (
+                                'Dependencies for step {step} failed: {failed_inputs}. Not executing.'
+                            ).format(step=step.key, failed_inputs=failed_inputs)
+                        )
+                        failed_or_skipped_steps.add(step.key)
+                        yield DagsterEvent.step_skipped_event(step_context)
+                        _complete(step.key)
+                        continue
+
+                    uncovered_inputs = intermediates_manager.uncovered_inputs(step_context, step)
+                    if uncovered_inputs:
+                        # In partial pipeline execution, we may end up here without having
+                        # validated the missing dependent outputs were optional
+                        _assert_missing_inputs_optional(uncovered_inputs, execution_plan, step.key)
+
+                        step_context.log.info(
                             (
-                                'Not all inputs covered for {step}. Not executing.'
-                                'Output missing for inputs: {uncovered_inputs}'
+                                'Not all inputs covered for {step}. Not executing. Output missing for '
+                                'inputs: {uncovered_inputs}'
                             ).format(uncovered_inputs=uncovered_inputs, step=step.key)
                         )
+                        failed_or_skipped_steps.add(step.key)
+                        yield DagsterEvent.step_skipped_event(step_context)
+                        _complete(step.key)
                         continue
 
-                    step_contexts_to_execute.append(step_context)
+                    ready_step_contexts.append(step_context)
+
+                while ready_step_contexts and step_executor.has_capacity:
+                    step_executor.launch(ready_step_contexts.popleft())
+
+                completed_keys = []
+                for step_key, step_event in step_executor.poll():
+                    if step_event is None:
+                        completed_keys.append(step_key)
+                        continue
+
+                    if step_event.is_step_failure:
+                        failed_or_skipped_steps.add(step_key)
+                    elif step_event.is_successful_output:
+                        step_output_handles[step_key].append(
+                            step_event.event_specific_data.step_output_handle
+                        )
 
-                for step_event in bounded_parallel_executor(step_contexts_to_execute, limit):
                     yield step_event
 
+                for step_key in completed_keys:
+                    _complete(step_key)
+
         yield DagsterEvent.engine_event(
             pipeline_context,
             'Multiprocess engine: parent process exiting after {duration} (pid: {pid})'.format(
@@ -379,15 +379,18 @@ def execute_plan(
     run_config = check_run_config_param(run_config, execution_plan.pipeline_def)
     check.opt_list_param(step_keys_to_execute, 'step_keys_to_execute', of_type=str)
 
-    return list(
-        execute_plan_iterator(
-            execution_plan=execution_plan,
-            environment_dict=environment_dict,
-            run_config=run_config,
-            step_keys_to_execute=step_keys_to_execute,
-            instance=instance,
+    try:
+        return list(
+            execute_plan_iterator(
+                execution_plan=execution_plan,
+                environment_dict=environment_dict,
+                run_config=run_config,
+                step_keys_to_execute=step_keys_to_execute,
+                instance=instance,
+            )
         )
-    )
+    finally:
+        instance.flush_event_logs(run_config.run_id)
 
 
 def _setup_reexecution(run_config, pipeline_context, execution_plan):
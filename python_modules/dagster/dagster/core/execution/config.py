@@ -8,6 +8,7 @@ import six
 from dagster import check
 from dagster.core.errors import DagsterUnmetExecutorRequirementsError
 from dagster.core.serdes import whitelist_for_serdes
+from dagster.core.types.type_check_policy import TypeCheckPolicy
 from dagster.core.utils import make_new_run_id
 from dagster.utils import merge_dicts
 
@@ -15,7 +16,9 @@ EXECUTION_TIME_KEY = 'execution_epoch_time'
 
 
 class RunConfig(
-    namedtuple('_RunConfig', 'run_id tags reexecution_config step_keys_to_execute mode')
+    namedtuple(
+        '_RunConfig', 'run_id tags reexecution_config step_keys_to_execute mode type_check_policy'
+    )
 ):
     '''
     Configuration that controls the details of how Dagster will execute a pipeline.
@@ -29,10 +32,18 @@ class RunConfig(
         step_keys_to_execute (Optional[list[str]]): The subset of steps from a pipeline to execute
             this run.
         mode (Optional[str]): The name of the mode in which to execute the pipeline.
+        type_check_policy (Optional[TypeCheckPolicy]): How thoroughly to type check the inputs and
+            outputs of steps. Defaults to checking every element of lists.
     '''
 
     def __new__(
-        cls, run_id=None, tags=None, reexecution_config=None, step_keys_to_execute=None, mode=None
+        cls,
+        run_id=None,
+        tags=None,
+        reexecution_config=None,
+        step_keys_to_execute=None,
+        mode=None,
+        type_check_policy=None,
     ):
 
         check.opt_list_param(step_keys_to_execute, 'step_keys_to_execute', of_type=str)
@@ -53,6 +64,9 @@ class RunConfig(
             ),
             step_keys_to_execute=step_keys_to_execute,
             mode=check.opt_str_param(mode, 'mode'),
+            type_check_policy=check.opt_inst_param(
+                type_check_policy, 'type_check_policy', TypeCheckPolicy, TypeCheckPolicy.full()
+            ),
         )
 
     def with_tags(self, **new_tags):
@@ -83,8 +97,31 @@ class InProcessExecutorConfig(ExecutorConfig):
         return InProcessEngine
 
 
+class WorkerPoolConfig(
+    namedtuple('_WorkerPoolConfig', 'max_steps_per_worker max_memory_growth_mb')
+):
+    '''
+    Configuration for running the steps of a multiprocess execution in a pool of long-lived worker
+    processes, each of which loads the pipeline and builds the execution plan only once.
+
+    Args:
+        max_steps_per_worker (Optional[int]): Replace a worker with a fresh process after it has
+            executed this many steps. (default: None, never)
+        max_memory_growth_mb (Optional[int]): Replace a worker with a fresh process once its peak
+            memory has grown by more than this many megabytes since its first step completed.
+            (default: None, never)
+    '''
+
+    def __new__(cls, max_steps_per_worker=None, max_memory_growth_mb=None):
+        return super(WorkerPoolConfig, cls).__new__(
+            cls,
+            max_steps_per_worker=check.opt_int_param(max_steps_per_worker, 'max_steps_per_worker'),
+            max_memory_growth_mb=check.opt_int_param(max_memory_growth_mb, 'max_memory_growth_mb'),
+        )
+
+
 class MultiprocessExecutorConfig(ExecutorConfig):
-    def __init__(self, handle, max_concurrent=None):
+    def __init__(self, handle, max_concurrent=None, worker_pool=None):
         from dagster import ExecutionTargetHandle
 
         # TODO: These gnomic process boundary/execution target handle exceptions should link to
@@ -100,6 +137,7 @@ class MultiprocessExecutorConfig(ExecutorConfig):
 
         max_concurrent = max_concurrent if max_concurrent else multiprocessing.cpu_count()
         self.max_concurrent = check.int_param(max_concurrent, 'max_concurrent')
+        self.worker_pool = check.opt_inst_param(worker_pool, 'worker_pool', WorkerPoolConfig)
 
     def check_requirements(self, instance, system_storage_def):
         check_persistent_storage_requirement(system_storage_def)
@@ -1,4 +1,4 @@
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 
 from dagster import check
 from dagster.core.definitions import (
@@ -245,18 +245,37 @@ def get_step_input(
 
 
 class ExecutionPlan(
-    namedtuple('_ExecutionPlan', 'pipeline_def step_dict deps steps artifacts_persisted')
+    namedtuple(
+        '_ExecutionPlan',
+        'pipeline_def step_dict deps steps artifacts_persisted step_key_levels step_consumers '
+        'output_consumers critical_path_lengths',
+    )
 ):
+    '''The steps of a pipeline run and the dependencies between them.
+
+    Plans are immutable, so the topological levels of the steps, the consumers of each step and
+    step output, and the critical path lengths of the steps are computed once when the plan is
+    built.
+    '''
+
     def __new__(cls, pipeline_def, step_dict, deps, artifacts_persisted):
+        check.dict_param(step_dict, 'step_dict', key_type=str, value_type=ExecutionStep)
+        check.dict_param(deps, 'deps', key_type=str, value_type=set)
+
+        step_key_levels = toposort(deps)
+        step_consumers, output_consumers = _consumer_indexes(step_dict)
+
         return super(ExecutionPlan, cls).__new__(
             cls,
             pipeline_def=check.inst_param(pipeline_def, 'pipeline_def', PipelineDefinition),
-            step_dict=check.dict_param(
-                step_dict, 'step_dict', key_type=str, value_type=ExecutionStep
-            ),
-            deps=check.dict_param(deps, 'deps', key_type=str, value_type=set),
+            step_dict=step_dict,
+            deps=deps,
             steps=list(step_dict.values()),
             artifacts_persisted=check.bool_param(artifacts_persisted, 'artifacts_persisted'),
+            step_key_levels=step_key_levels,
+            step_consumers=step_consumers,
+            output_consumers=output_consumers,
+            critical_path_lengths=_critical_path_lengths(step_key_levels, step_consumers),
         )
 
     def get_step_output(self, step_output_handle):
@@ -272,14 +291,56 @@ class ExecutionPlan(
         check.str_param(key, 'key')
         return self.step_dict[key]
 
+    def get_step_consumers(self, key):
+        '''Returns the keys of the steps with an input from an output of the step.
+
+        Returns:
+            Tuple[str]
+        '''
+        check.str_param(key, 'key')
+        return self.step_consumers.get(key, ())
+
+    def get_output_consumers(self, step_output_handle):
+        '''Returns the step inputs that consume a step output, as (step key, input name) pairs.
+
+        Returns:
+            Tuple[Tuple[str, str]]
+        '''
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+        return self.output_consumers.get(step_output_handle, ())
+
+    def get_critical_path_length(self, key):
+        '''Returns the number of steps on the longest chain of dependent steps that starts with the
+        step, including the step itself.
+        '''
+        check.str_param(key, 'key')
+        return self.critical_path_lengths[key]
+
+    def get_consumer_counts(self, step_keys_to_execute=None):
+        '''Returns the number of steps consuming each step output, only counting the steps in
+        step_keys_to_execute if it is given.
+
+        Returns:
+            Dict[StepOutputHandle, int]
+        '''
+        check.opt_list_param(step_keys_to_execute, 'step_keys_to_execute', of_type=str)
+        step_key_set = None if step_keys_to_execute is None else set(step_keys_to_execute)
+
+        consumer_counts = {}
+        for step_output_handle, consumers in self.output_consumers.items():
+            consumer_keys = set(step_key for step_key, _ in consumers)
+            if step_key_set is not None:
+                consumer_keys &= step_key_set
+            if consumer_keys:
+                consumer_counts[step_output_handle] = len(consumer_keys)
+
+        return consumer_counts
+
     def topological_steps(self):
-        return [step for step_level in self.topological_step_levels() for step in step_level]
+        return [self.step_dict[step_key] for level in self.step_key_levels for step_key in level]
 
     def topological_step_levels(self):
-        return [
-            [self.step_dict[step_key] for step_key in sorted(step_key_level)]
-            for step_key_level in toposort(self.deps)
-        ]
+        return [[self.step_dict[step_key] for step_key in level] for level in self.step_key_levels]
 
     @staticmethod
     def build(pipeline_def, environment_config, mode_definition):
@@ -298,3 +359,28 @@ class ExecutionPlan(
 
         # Finally, we build and return the execution plan
         return plan_builder.build()
+
+
+def _consumer_indexes(step_dict):
+    step_consumers = defaultdict(set)
+    output_consumers = defaultdict(list)
+    for step in step_dict.values():
+        for step_input in step.step_inputs:
+            for source_handle in step_input.source_handles:
+                step_consumers[source_handle.step_key].add(step.key)
+                output_consumers[source_handle].append((step.key, step_input.name))
+
+    return (
+        {key: tuple(sorted(consumers)) for key, consumers in step_consumers.items()},
+        {handle: tuple(sorted(consumers)) for handle, consumers in output_consumers.items()},
+    )
+
+
+def _critical_path_lengths(step_key_levels, step_consumers):
+    critical_path_lengths = {}
+    for level in reversed(step_key_levels):
+        for key in level:
+            critical_path_lengths[key] = 1 + max(
+                [critical_path_lengths[consumer] for consumer in step_consumers.get(key, ())] or [0]
+            )
+    return critical_path_lengths
@@ -4,35 +4,48 @@ from dagster.core.events.log import EventRecord
 from dagster.core.storage.pipeline_run import PipelineRunStatsSnapshot
 
 
+def build_empty_stats(run_id):
+    check.str_param(run_id, 'run_id')
+    return PipelineRunStatsSnapshot(run_id, 0, 0, 0, 0, None, None)
+
+
+def update_stats_from_event(stats, event):
+    '''Returns the stats of a run updated with one more of its events.
+
+    Folding this over the events of a run gives the same stats as build_stats_from_events, so
+    storages can keep the stats of each run up to date as events are stored.
+    '''
+    check.inst_param(stats, 'stats', PipelineRunStatsSnapshot)
+    check.inst_param(event, 'event', EventRecord)
+
+    if not event.is_dagster_event:
+        return stats
+
+    event_type = event.dagster_event.event_type
+    if event_type == DagsterEventType.PIPELINE_START:
+        return stats._replace(start_time=event.timestamp)
+    if event_type == DagsterEventType.STEP_FAILURE:
+        return stats._replace(steps_failed=stats.steps_failed + 1)
+    if event_type == DagsterEventType.STEP_SUCCESS:
+        return stats._replace(steps_succeeded=stats.steps_succeeded + 1)
+    if event_type == DagsterEventType.STEP_MATERIALIZATION:
+        return stats._replace(materializations=stats.materializations + 1)
+    if event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
+        return stats._replace(expectations=stats.expectations + 1)
+    if (
+        event_type == DagsterEventType.PIPELINE_SUCCESS
+        or event_type == DagsterEventType.PIPELINE_FAILURE
+    ):
+        return stats._replace(end_time=event.timestamp)
+
+    return stats
+
+
 def build_stats_from_events(run_id, records):
     check.list_param(records, 'records', of_type=EventRecord)
 
-    steps_succeeded = 0
-    steps_failed = 0
-    materializations = 0
-    expectations = 0
-    start_time = None
-    end_time = None
-
+    stats = build_empty_stats(run_id)
     for event in records:
-        if not event.is_dagster_event:
-            continue
-        if event.dagster_event.event_type == DagsterEventType.PIPELINE_START:
-            start_time = event.timestamp
-        if event.dagster_event.event_type == DagsterEventType.STEP_FAILURE:
-            steps_failed += 1
-        if event.dagster_event.event_type == DagsterEventType.STEP_SUCCESS:
-            steps_succeeded += 1
-        if event.dagster_event.event_type == DagsterEventType.STEP_MATERIALIZATION:
-            materializations += 1
-        if event.dagster_event.event_type == DagsterEventType.STEP_EXPECTATION_RESULT:
-            expectations += 1
-        if (
-            event.dagster_event.event_type == DagsterEventType.PIPELINE_SUCCESS
-            or event.dagster_event.event_type == DagsterEventType.PIPELINE_FAILURE
-        ):
-            end_time = event.timestamp
-
-    return PipelineRunStatsSnapshot(
-        run_id, steps_succeeded, steps_failed, materializations, expectations, start_time, end_time
-    )
+        stats = update_stats_from_event(stats, event)
+
+    return stats
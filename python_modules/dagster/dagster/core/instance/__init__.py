@@ -236,6 +236,9 @@ class DagsterInstance:
     def get_run_stats(self, run_id):
         return self._event_storage.get_stats_for_run(run_id)
 
+    def get_run_stats_for_runs(self, run_ids):
+        return self._event_storage.get_stats_for_runs(run_ids)
+
     def get_run_tags(self):
         return self._run_storage.get_run_tags()
 
@@ -262,6 +265,9 @@ class DagsterInstance:
     def add_run(self, pipeline_run):
         return self._run_storage.add_run(pipeline_run)
 
+    def add_runs(self, pipeline_runs):
+        return self._run_storage.add_runs(pipeline_runs)
+
     def handle_run_event(self, run_id, event):
         return self._run_storage.handle_run_event(run_id, event)
 
@@ -271,6 +277,9 @@ class DagsterInstance:
     def all_runs(self, cursor=None, limit=None):
         return self._run_storage.all_runs(cursor, limit)
 
+    def get_runs(self, filters=None, cursor=None, limit=None):
+        return self._run_storage.get_runs(filters, cursor, limit)
+
     def get_runs_with_pipeline_name(self, pipeline_name, cursor=None, limit=None):
         return self._run_storage.get_runs_with_pipeline_name(pipeline_name, cursor, limit)
 
@@ -296,6 +305,41 @@ class DagsterInstance:
     def all_logs(self, run_id):
         return self._event_storage.get_logs_for_run(run_id)
 
+    def filtered_logs(self, run_id, cursor=-1, step_keys=None, event_types=None, levels=None):
+        return self._event_storage.get_filtered_logs_for_run(
+            run_id, cursor=cursor, step_keys=step_keys, event_types=event_types, levels=levels
+        )
+
+    def logs_window(
+        self,
+        run_id,
+        after_cursor=-1,
+        before_cursor=None,
+        limit=None,
+        from_end=False,
+        step_keys=None,
+        event_types=None,
+        levels=None,
+    ):
+        return self._event_storage.get_logs_window_for_run(
+            run_id,
+            after_cursor=after_cursor,
+            before_cursor=before_cursor,
+            limit=limit,
+            from_end=from_end,
+            step_keys=step_keys,
+            event_types=event_types,
+            levels=levels,
+        )
+
+    def logs_count(self, run_id, step_keys=None, event_types=None, levels=None):
+        return self._event_storage.get_logs_count_for_run(
+            run_id, step_keys=step_keys, event_types=event_types, levels=levels
+        )
+
+    def flush_event_logs(self, run_id=None):
+        self._event_storage.flush(run_id)
+
     def can_watch_events(self):
         from dagster.core.storage.event_log import WatchableEventLogStorage
 
@@ -310,6 +354,15 @@ class DagsterInstance:
         )
         return self._event_storage.watch(run_id, cursor, cb)
 
+    def end_watch_event_logs(self, run_id, handler):
+        from dagster.core.storage.event_log import WatchableEventLogStorage
+
+        check.invariant(
+            isinstance(self._event_storage, WatchableEventLogStorage),
+            'In order to call end_watch_event_logs the event_storage must be watchable',
+        )
+        return self._event_storage.end_watch(run_id, handler)
+
     # event subscriptions
 
     def get_logger(self):
@@ -107,6 +107,30 @@ def coerce_valid_log_level(log_level):
     return PYTHON_LOGGING_LEVELS_MAPPING[log_level]
 
 
+def _is_enabled_for(logger_, level):
+    '''Whether a message logged at level through logger_ could be emitted by any handler.
+
+    Mirrors the checks made by the Python logging machinery before a record is handed to the
+    handlers: the effective level of the logger, and the levels of the handlers the record would
+    propagate to. Loggers without any handlers are left to decide for themselves.'''
+    if not logger_.isEnabledFor(level):
+        return False
+
+    has_handlers = False
+    current = logger_
+    while current:
+        for handler in current.handlers:
+            if level >= handler.level:
+                return True
+            has_handlers = True
+
+        if not current.propagate:
+            break
+        current = current.parent
+
+    return not has_handlers
+
+
 class DagsterLogManager(namedtuple('_DagsterLogManager', 'run_id logging_tags loggers')):
     '''Centralized dispatch for logging through the execution context.
 
@@ -204,9 +228,17 @@ class DagsterLogManager(namedtuple('_DagsterLogManager', 'run_id logging_tags lo
 
         level = coerce_valid_log_level(level)
 
+        # Preparing the message is much more expensive than the Python logging machinery dropping
+        # it, so skip it altogether when no logger would emit a message at this level. The logger
+        # of the instance stores every message of a run, so in a run this only skips messages
+        # when the instance isn't among the loggers.
+        loggers = [logger_ for logger_ in self.loggers if _is_enabled_for(logger_, level)]
+        if not loggers:
+            return
+
         message, extra = self._prepare_message(orig_message, message_props)
 
-        for logger_ in self.loggers:
+        for logger_ in loggers:
             logger_.log(level, message, extra=extra)
 
     def debug(self, msg, **kwargs):
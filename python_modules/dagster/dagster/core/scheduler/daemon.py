@@ -0,0 +1,400 @@
+import io
+import os
+import threading
+import time
+import traceback
+from datetime import datetime
+
+import six
+from six.moves import queue
+
+from dagster import check
+from dagster.core.definitions.handle import ExecutionTargetHandle
+from dagster.core.engine.child_process_executor import (
+    ChildProcessCommand,
+    execute_child_process_command,
+)
+from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.execution.api import execute_pipeline
+from dagster.core.execution.config import RunConfig
+from dagster.core.instance import DagsterInstance
+from dagster.core.utils import make_new_run_id
+
+from .scheduler import Schedule, ScheduleStatus, Scheduler, SchedulerHandle
+from .storage import FilesystemScheduleStorage, ScheduleStorage
+
+try:
+    from croniter import croniter
+except ImportError:
+    croniter = None
+
+DEFAULT_MAX_CONCURRENT_RUNS = 4
+
+SCHEDULE_ID_TAG = 'dagster/schedule_id'
+SCHEDULE_NAME_TAG = 'dagster/schedule_name'
+
+
+def is_croniter_available():
+    return croniter is not None
+
+
+def _check_croniter_available():
+    check.invariant(
+        is_croniter_available(),
+        'The croniter package is required to run the scheduler daemon. Install it with '
+        '`pip install dagster[scheduler]`.',
+    )
+
+
+def _next_tick_time(cron_schedule, after):
+    '''The timestamp of the first time after the timestamp after when cron_schedule is due.
+
+    Like cron, and the SystemCronScheduler, cron schedules are evaluated in the local time of the
+    host rather than in UTC.
+    '''
+    next_tick = croniter(cron_schedule, datetime.fromtimestamp(after)).get_next(datetime)
+    return time.mktime(next_tick.timetuple())
+
+
+def _log_file_path(artifacts_dir, schedule):
+    return os.path.join(artifacts_dir, '{}_{}.log'.format(schedule.name, schedule.schedule_id))
+
+
+class DaemonScheduler(Scheduler):
+    '''Scheduler for schedules that are run by `dagster schedule daemon`.
+
+    Starting and stopping a schedule only changes its status in the schedule storage, which the
+    daemon reads on every tick. Unlike the SystemCronScheduler, nothing is installed to run the
+    schedule outside of the daemon.
+    '''
+
+    def __init__(self, artifacts_dir, schedule_storage):
+        check.inst_param(schedule_storage, 'schedule_storage', ScheduleStorage)
+        check.str_param(artifacts_dir, 'artifacts_dir')
+        self._storage = schedule_storage
+        self._artifacts_dir = artifacts_dir
+
+    def all_schedules(self, status=None):
+        return self._storage.all_schedules(status)
+
+    def get_schedule_by_name(self, name):
+        return self._storage.get_schedule_by_name(name)
+
+    def start_schedule(self, schedule_name):
+        schedule = self.get_schedule_by_name(schedule_name)
+        if not schedule:
+            raise DagsterInvariantViolationError(
+                'You have attempted to start schedule {name}, but it does not exist.'.format(
+                    name=schedule_name
+                )
+            )
+
+        if schedule.status == ScheduleStatus.RUNNING:
+            raise DagsterInvariantViolationError(
+                'You have attempted to start schedule {name}, but it is already running'.format(
+                    name=schedule_name
+                )
+            )
+
+        self._storage.update_schedule(schedule.with_status(ScheduleStatus.RUNNING))
+        return schedule
+
+    def stop_schedule(self, schedule_name):
+        schedule = self.get_schedule_by_name(schedule_name)
+        if not schedule:
+            raise DagsterInvariantViolationError(
+                'You have attempted to stop schedule {name}, but was never initialized.'
+                'Use `schedule up` to initialize schedules'.format(name=schedule_name)
+            )
+
+        if schedule.status == ScheduleStatus.STOPPED:
+            raise DagsterInvariantViolationError(
+                'You have attempted to stop schedule {name}, but it is already stopped'.format(
+                    name=schedule_name
+                )
+            )
+
+        stopped_schedule = schedule.with_status(ScheduleStatus.STOPPED)
+        self._storage.update_schedule(stopped_schedule)
+        return stopped_schedule
+
+    def end_schedule(self, schedule_name):
+        schedule = self.get_schedule_by_name(schedule_name)
+        if not schedule:
+            raise DagsterInvariantViolationError(
+                'You have attempted to end schedule {name}, but it is not running.'.format(
+                    name=schedule_name
+                )
+            )
+
+        self._storage.delete_schedule(schedule)
+        return schedule
+
+    def log_path_for_schedule(self, schedule_name):
+        schedule = self.get_schedule_by_name(schedule_name)
+        if not schedule:
+            raise DagsterInvariantViolationError(
+                'You have attempted to get the logs for schedule {name}, but it is not '
+                'running'.format(name=schedule_name)
+            )
+
+        return _log_file_path(self._artifacts_dir, schedule)
+
+    def wipe(self):
+        self._storage.wipe()
+
+
+class _ScheduledRunChildProcessCommand(ChildProcessCommand):
+    '''Executes a scheduled run in a child process, and yields whether it succeeded.'''
+
+    def __init__(self, handle, solid_subset, environment_dict, run_config, instance_ref):
+        self.handle = handle
+        self.solid_subset = solid_subset
+        self.environment_dict = environment_dict
+        self.run_config = run_config
+        self.instance_ref = instance_ref
+
+    def execute(self):
+        pipeline = self.handle.build_pipeline_definition()
+        if self.solid_subset:
+            pipeline = pipeline.build_sub_pipeline(self.solid_subset)
+
+        instance = DagsterInstance.from_ref(self.instance_ref)
+        try:
+            result = execute_pipeline(
+                pipeline,
+                self.environment_dict,
+                run_config=self.run_config,
+                instance=instance,
+                raise_on_error=False,
+            )
+            yield result.success
+        finally:
+            # Make sure any buffered events are written before this process exits
+            instance.flush_event_logs(self.run_config.run_id)
+
+
+class _RunLauncher(object):
+    '''Waits on the runs submitted to it from a fixed number of worker threads, so that at most
+    that many runs execute at once. Runs submitted while every worker is busy wait for one to free
+    up.
+
+    The threads only launch and wait on the runs, which each execute in a child process: runs
+    capture the output of their steps by redirecting the stdout and stderr of their process, so runs
+    sharing a process would capture each other's output.
+    '''
+
+    def __init__(self, max_concurrent_runs):
+        self._queue = queue.Queue()
+        self._workers = [
+            threading.Thread(target=self._work, name='dagster-scheduler-daemon-{}'.format(i))
+            for i in range(max_concurrent_runs)
+        ]
+        for worker in self._workers:
+            worker.daemon = True
+            worker.start()
+
+    def _work(self):
+        while True:
+            fn = self._queue.get()
+            if fn is None:
+                return
+            fn()
+
+    def submit(self, fn):
+        self._queue.put(fn)
+
+    def join(self):
+        '''Waits for every submitted run to finish, then stops the workers.'''
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+
+
+class SchedulerDaemon(object):
+    '''Launches the runs of the running schedules of a repository from one long-lived process.
+
+    The repository is loaded once, and every tick evaluates the cron schedules of all the schedules
+    that are RUNNING in the schedule storage. The runs of the schedules that are due each execute
+    in a child process loading the pipeline through the handle, with at most max_concurrent_runs
+    runs executing at once.
+
+    Args:
+        instance (DagsterInstance): The instance to execute runs against. Must not be ephemeral, as
+            runs execute against it from other processes.
+        handle (ExecutionTargetHandle): The handle of the repository the schedules belong to.
+        scheduler_handle (SchedulerHandle): The schedule definitions of the repository.
+        artifacts_dir (str): The directory schedules are stored in.
+        max_concurrent_runs (Optional[int]): The most runs to execute at once.
+        print_fn (Optional[Callable[[str], None]]): Called with a line for each run that is
+            launched, blocked or fails.
+    '''
+
+    def __init__(
+        self,
+        instance,
+        handle,
+        scheduler_handle,
+        artifacts_dir,
+        max_concurrent_runs=DEFAULT_MAX_CONCURRENT_RUNS,
+        print_fn=None,
+    ):
+        _check_croniter_available()
+
+        self._instance = check.inst_param(instance, 'instance', DagsterInstance)
+        self._instance_ref = self._instance.get_ref()
+        self._handle = check.inst_param(handle, 'handle', ExecutionTargetHandle)
+        self._repository = handle.build_repository_definition()
+        check.inst_param(scheduler_handle, 'scheduler_handle', SchedulerHandle)
+        self._artifacts_dir = check.str_param(artifacts_dir, 'artifacts_dir')
+        self._max_concurrent_runs = check.int_param(max_concurrent_runs, 'max_concurrent_runs')
+        check.invariant(self._max_concurrent_runs > 0, 'max_concurrent_runs must be positive')
+        self._print_fn = check.opt_callable_param(print_fn, 'print_fn', lambda _: None)
+
+        self._scheduler_handle = scheduler_handle
+        self._schedule_storage = FilesystemScheduleStorage(
+            self._artifacts_dir, repository_name=self._repository.name
+        )
+
+        # The next time each running schedule is due, by schedule id and cron schedule so that a
+        # changed cron schedule starts over
+        self._next_tick_times = {}
+        self._last_tick_time = time.time()
+        self._launcher = None
+
+    def _running_schedules(self):
+        # The storage picks up schedules started and stopped by other processes
+        return self._schedule_storage.all_schedules(status=ScheduleStatus.RUNNING)
+
+    def tick(self, now=None):
+        '''Launches the runs of the running schedules that have been due since the last tick.
+
+        A schedule that has been due more than once since the last tick is only launched once.
+
+        Args:
+            now (Optional[float]): The time of the tick. Defaults to the current time.
+
+        Returns:
+            List[Schedule]: The schedules that were launched.
+        '''
+        now = time.time() if now is None else check.float_param(now, 'now')
+
+        launched = []
+        next_tick_times = {}
+        for schedule in self._running_schedules():
+            key = (schedule.schedule_id, schedule.cron_schedule)
+            next_tick_time = self._next_tick_times.get(key)
+            if next_tick_time is None:
+                # Schedules seen for the first time are due from the last tick on, so that a
+                # schedule started just before a tick is not skipped until the next one
+                next_tick_time = _next_tick_time(schedule.cron_schedule, self._last_tick_time)
+
+            if next_tick_time <= now:
+                self._launch(schedule)
+                launched.append(schedule)
+                next_tick_time = _next_tick_time(schedule.cron_schedule, now)
+
+            next_tick_times[key] = next_tick_time
+
+        # Forget schedules that were stopped, so they start over when they are started again
+        self._next_tick_times = next_tick_times
+        self._last_tick_time = now
+        return launched
+
+    def _launch(self, schedule):
+        if self._launcher is None:
+            self._launcher = _RunLauncher(self._max_concurrent_runs)
+        self._launcher.submit(lambda: self._execute_schedule(schedule))
+
+    def run(self, stop_event=None):
+        '''Ticks at the start of every minute until stop_event is set, then waits for the runs that
+        were launched to finish.
+
+        Args:
+            stop_event (Optional[threading.Event]): Stops the daemon when set. The daemon runs
+                until interrupted if not provided.
+        '''
+        stop_event = stop_event or threading.Event()
+
+        try:
+            while not stop_event.is_set():
+                # Cron schedules are at most once a minute, so ticking on each minute is enough
+                stop_event.wait(60 - time.time() % 60)
+                if not stop_event.is_set():
+                    self.tick()
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        '''Waits for the runs that were launched to finish.'''
+        if self._launcher is not None:
+            self._launcher.join()
+            self._launcher = None
+
+    def _log(self, schedule, message):
+        line = '{time} - {schedule_name} - {message}'.format(
+            time=datetime.now().isoformat(), schedule_name=schedule.name, message=message
+        )
+        self._print_fn(line)
+        with io.open(_log_file_path(self._artifacts_dir, schedule), 'a', encoding='utf-8') as f:
+            f.write(six.text_type(line + '\n'))
+
+    def _execute_schedule(self, schedule):
+        check.inst_param(schedule, 'schedule', Schedule)
+
+        try:
+            schedule_def = self._scheduler_handle.get_schedule_def_by_name(schedule.name)
+            if not schedule_def:
+                self._log(
+                    schedule,
+                    'Schedule is not defined in repository {name} as loaded when the daemon '
+                    'started. Restart the daemon to pick up new schedules.'.format(
+                        name=self._repository.name
+                    ),
+                )
+                return
+
+            if schedule_def.should_execute() != True:
+                self._log(schedule, 'Did not run because the should_execute did not return True')
+                return
+
+            execution_params = schedule_def.execution_params
+            tags = {
+                tag['key']: tag['value']
+                for tag in execution_params['executionMetadata']['tags'] or []
+            }
+            for tag_key in [SCHEDULE_ID_TAG, SCHEDULE_NAME_TAG]:
+                check.invariant(
+                    tag_key not in tags,
+                    'Tag {key} tag is already defined in executionMetadata.tags'.format(
+                        key=tag_key
+                    ),
+                )
+            tags[SCHEDULE_ID_TAG] = schedule.schedule_id
+            tags[SCHEDULE_NAME_TAG] = schedule.name
+
+            selector = execution_params['selector']
+            run_id = make_new_run_id()
+            command = _ScheduledRunChildProcessCommand(
+                self._handle.with_pipeline_name(selector['name']),
+                selector.get('solidSubset'),
+                execution_params['environmentConfigData'],
+                RunConfig(run_id=run_id, mode=execution_params['mode'], tags=tags),
+                self._instance_ref,
+            )
+
+            self._log(schedule, 'Launching run {run_id}'.format(run_id=run_id))
+            success = False
+            for event in execute_child_process_command(command):
+                if event is not None:
+                    success = event
+
+            self._log(
+                schedule,
+                'Run {run_id} {outcome}'.format(
+                    run_id=run_id, outcome='succeeded' if success else 'failed'
+                ),
+            )
+        except Exception:  # pylint: disable=broad-except
+            self._log(schedule, 'Failed to launch run:\n' + traceback.format_exc())
@@ -68,6 +68,9 @@ class SchedulerHandle(object):
         self._Scheduler = scheduler_type
         self._artifacts_dir = artifacts_dir
         self._schedule_defs = schedule_defs
+        self._schedule_defs_by_name = {
+            schedule_def.name: schedule_def for schedule_def in schedule_defs
+        }
 
         self._schedule_storage = FilesystemScheduleStorage(
             artifacts_dir, repository_name=repository_name
@@ -147,9 +150,7 @@ class SchedulerHandle(object):
         return self._schedule_defs
 
     def get_schedule_def_by_name(self, name):
-        return next(
-            schedule_def for schedule_def in self._schedule_defs if schedule_def.name == name
-        )
+        return self._schedule_defs_by_name.get(name)
 
     def get_scheduler(self):
         return self._Scheduler(self._artifacts_dir, self._schedule_storage)
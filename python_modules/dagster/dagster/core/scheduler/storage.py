@@ -2,8 +2,10 @@ import abc
 import io
 import os
 import shutil
+import time
+import uuid
 import warnings
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 
 import six
 
@@ -55,31 +57,65 @@ class ScheduleStorage(six.with_metaclass(abc.ABCMeta)):
         '''
 
 
+# Moves a file into place over an existing one in a single step, so readers never see it missing
+_replace_file = getattr(os, 'replace', os.rename)
+
+# How recently before a scan the schedules directory must have changed for the scan to be
+# distrusted. Filesystems with coarse mtimes can give a change made just after a scan the same
+# mtime as a change made just before it.
+_RACY_MTIME_WINDOW = 2
+
+
 class FilesystemScheduleStorage(ScheduleStorage):
+    '''Stores each schedule as a JSON file in a directory per repository.
+
+    Schedules are kept in memory, indexed by name and status, and only files that changed since
+    they were last read are read again. Changes made by other processes are noticed from the
+    modification time of the schedules directory, which every write changes by moving the new
+    schedule file into place.
+    '''
+
     def __init__(self, base_dir, repository_name=None):
         self._base_dir = check.str_param(base_dir, 'base_dir')
-        self._schedules = OrderedDict()
         self._repository_name = repository_name
-        self._load_schedules()
+        self._init_index()
+        self._refresh()
+
+    def _init_index(self):
+        self._schedules = OrderedDict()
+        self._schedules_by_status = defaultdict(OrderedDict)
+        # The stat of each schedule file when it was last read, and the schedule it held
+        self._file_stats = {}
+        self._file_schedules = {}
+        self._dir_mtime = None
+        self._scanned_at = None
+
+    @property
+    def _schedules_dir(self):
+        return os.path.join(self._base_dir, self._repository_name)
 
     def all_schedules(self, status=None):
         status = check.opt_inst_param(status, 'status', ScheduleStatus)
+        self._refresh()
 
         if status:
-            return [s for s in self._schedules.values() if s.status == status]
+            return list(self._schedules_by_status[status].values())
 
-        return [s for s in self._schedules.values()]
+        return list(self._schedules.values())
 
     def get_schedule_by_name(self, schedule_name):
+        self._refresh()
         return self._schedules.get(schedule_name)
 
     def add_schedule(self, schedule):
         check.inst_param(schedule, 'schedule', Schedule)
-        self._schedules[schedule.name] = schedule
+        self._refresh()
         self._write_schedule_to_file(schedule)
+        self._index_schedule(schedule)
 
     def update_schedule(self, schedule):
         check.inst_param(schedule, 'schedule', Schedule)
+        self._refresh()
         if schedule.name not in self._schedules:
             raise DagsterInvariantViolationError(
                 'Schedule {name} is not present in storage'.format(name=schedule.name)
@@ -89,50 +125,110 @@ class FilesystemScheduleStorage(ScheduleStorage):
 
     def delete_schedule(self, schedule):
         check.inst_param(schedule, 'schedule', Schedule)
-        self._schedules.pop(schedule.name)
+        self._refresh()
+        self._unindex_schedule(self._schedules[schedule.name])
         self._delete_schedule_file(schedule)
 
     def wipe(self):
         shutil.rmtree(self._base_dir)
+        self._init_index()
+
+    def _index_schedule(self, schedule):
+        existing = self._schedules.get(schedule.name)
+        if existing:
+            self._unindex_schedule(existing)
+
+        self._schedules[schedule.name] = schedule
+        self._schedules_by_status[schedule.status][schedule.name] = schedule
+
+    def _unindex_schedule(self, schedule):
+        self._schedules.pop(schedule.name, None)
+        self._schedules_by_status[schedule.status].pop(schedule.name, None)
+
+    def _schedule_file_name(self, schedule):
+        return '{}_{}.json'.format(schedule.name, schedule.schedule_id)
 
     def _write_schedule_to_file(self, schedule):
-        metadata_file = os.path.join(
-            self._base_dir,
-            self._repository_name,
-            '{}_{}.json'.format(schedule.name, schedule.schedule_id),
-        )
-        with io.open(metadata_file, 'w', encoding='utf-8') as f:
-            f.write(six.text_type(serialize_dagster_namedtuple(schedule)))
+        file_name = self._schedule_file_name(schedule)
+        metadata_file = os.path.join(self._schedules_dir, file_name)
+        temp_file = '{}.{}.tmp'.format(metadata_file, uuid.uuid4().hex)
+
+        try:
+            with io.open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(six.text_type(serialize_dagster_namedtuple(schedule)))
+            _replace_file(temp_file, metadata_file)
+        finally:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+
+        self._file_stats[file_name] = _file_stat(metadata_file)
+        self._file_schedules[file_name] = schedule
 
         return metadata_file
 
     def _delete_schedule_file(self, schedule):
-        metadata_file = os.path.join(
-            self._base_dir,
-            self._repository_name,
-            '{}_{}.json'.format(schedule.name, schedule.schedule_id),
-        )
+        file_name = self._schedule_file_name(schedule)
+        os.remove(os.path.join(self._schedules_dir, file_name))
+        self._file_stats.pop(file_name, None)
+        self._file_schedules.pop(file_name, None)
+
+    def _refresh(self):
+        '''Brings the index up to date with the schedule files, if the schedules directory has
+        changed since it was last scanned.'''
+        schedules_dir = self._schedules_dir
+        utils.mkdir_p(schedules_dir)
 
-        os.remove(metadata_file)
+        dir_mtime = os.stat(schedules_dir).st_mtime
+        if dir_mtime == self._dir_mtime and self._scanned_at - self._dir_mtime > _RACY_MTIME_WINDOW:
+            return
 
-    def _load_schedules(self):
-        schedules_dir = os.path.join(self._base_dir, self._repository_name)
-        utils.mkdir_p(schedules_dir)
+        self._scanned_at = time.time()
+        self._dir_mtime = dir_mtime
+
+        file_schedules = OrderedDict()
+        file_stats = {}
+        for file_name in sorted(os.listdir(schedules_dir)):
+            if not file_name.endswith('.json'):
+                continue
 
-        for file in os.listdir(schedules_dir):
-            if not file.endswith('.json'):
+            file_path = os.path.join(schedules_dir, file_name)
+            try:
+                file_stat = _file_stat(file_path)
+            except OSError:
+                # Deleted since the directory was listed
                 continue
-            file_path = os.path.join(schedules_dir, file)
-            with open(file_path) as data:
-                try:
-                    schedule = deserialize_json_to_dagster_namedtuple(data.read())
-                    self._schedules[schedule.name] = schedule
-
-                except Exception as ex:  # pylint: disable=broad-except
-                    warnings.warn(
-                        'Could not parse dagster schedule from {file_name} in {dir_name}. '
-                        '{ex}: {msg}'.format(
-                            file_name=file, dir_name=self._base_dir, ex=type(ex).__name__, msg=ex
-                        )
+
+            if self._file_stats.get(file_name) == file_stat:
+                schedule = self._file_schedules[file_name]
+            else:
+                schedule = self._read_schedule_file(file_path, file_name)
+
+            file_stats[file_name] = file_stat
+            if schedule:
+                file_schedules[file_name] = schedule
+
+        self._file_stats = file_stats
+        self._file_schedules = file_schedules
+
+        self._schedules = OrderedDict()
+        self._schedules_by_status = defaultdict(OrderedDict)
+        for schedule in file_schedules.values():
+            self._index_schedule(schedule)
+
+    def _read_schedule_file(self, file_path, file_name):
+        with open(file_path) as data:
+            try:
+                return deserialize_json_to_dagster_namedtuple(data.read())
+            except Exception as ex:  # pylint: disable=broad-except
+                warnings.warn(
+                    'Could not parse dagster schedule from {file_name} in {dir_name}. '
+                    '{ex}: {msg}'.format(
+                        file_name=file_name, dir_name=self._base_dir, ex=type(ex).__name__, msg=ex
                     )
-                    continue
+                )
+                return None
+
+
+def _file_stat(file_path):
+    file_stat = os.stat(file_path)
+    return (file_stat.st_ino, file_stat.st_size, file_stat.st_mtime)
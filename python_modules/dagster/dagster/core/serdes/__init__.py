@@ -23,16 +23,105 @@ import yaml
 
 from dagster import check, seven
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 _WHITELISTED_TUPLE_MAP = {}
 _WHITELISTED_ENUM_MAP = {}
 
+_PACKERS = {}
+'''Functions packing values of each type, keyed by exact type. Whitelisted namedtuples and Enums
+get a packer compiled when they are whitelisted.'''
+
+_TUPLE_UNPACKERS = {}
+'''Functions unpacking the dicts that whitelisted namedtuples are packed into, keyed by class.'''
+
+_PRIMITIVE_TYPES = (str, six.text_type, float, bool, type(None)) + six.integer_types
+'''Types that pack and unpack to themselves. Matched exactly, so that Enums deriving from str or
+int are still packed as Enums.'''
+
+SERDES_ENCODINGS = ('json', 'msgpack')
+'''Encodings values can be serialized with. json is serialized to text and msgpack to bytes.'''
+
+
+def _compile_tuple_packer(klass):
+    klass_name = klass.__name__
+    fields = klass._fields
+
+    def _pack_tuple(val, enum_map, tuple_map):
+        check.invariant(
+            klass_name in tuple_map,
+            'Can only serialize whitelisted namedtuples, recieved {}'.format(klass_name),
+        )
+        packed = {key: _pack_value(value, enum_map, tuple_map) for key, value in zip(fields, val)}
+        packed['__class__'] = klass_name
+        return packed
+
+    return _pack_tuple
+
+
+def _compile_enum_packer(klass):
+    klass_name = klass.__name__
+    member_strs = {member: str(member) for member in klass}
+
+    def _pack_enum(val, enum_map, _tuple_map):
+        check.invariant(
+            klass_name in enum_map,
+            'Can only serialize whitelisted Enums, recieved {}'.format(klass_name),
+        )
+        return {'__enum__': member_strs[val]}
+
+    return _pack_enum
+
+
+def _compile_tuple_unpacker(klass):
+    # Naively implements backwards compatibility by filtering arguments that aren't present in
+    # the constructor. If a property is present in the serialized object, but doesn't exist in
+    # the version of the class loaded into memory, that property will be completely ignored.
+    args_for_class = seven.get_args(klass)
+    if args_for_class:
+        args_for_class = frozenset(args_for_class)
+
+        def _unpack_tuple(val, enum_map, tuple_map):
+            return klass(
+                **{
+                    key: _unpack_value(value, enum_map, tuple_map)
+                    for key, value in val.items()
+                    if key in args_for_class
+                }
+            )
+
+    else:
+
+        def _unpack_tuple(val, enum_map, tuple_map):
+            return klass(
+                **{
+                    key: _unpack_value(value, enum_map, tuple_map)
+                    for key, value in val.items()
+                    if key != '__class__'
+                }
+            )
+
+    return _unpack_tuple
+
+
+def _get_tuple_unpacker(klass):
+    if klass not in _TUPLE_UNPACKERS:
+        _TUPLE_UNPACKERS[klass] = _compile_tuple_unpacker(klass)
+    return _TUPLE_UNPACKERS[klass]
+
 
 def _whitelist_for_serdes(enum_map, tuple_map):
     def __whitelist_for_serdes(klass):
         if issubclass(klass, Enum):
             enum_map[klass.__name__] = klass
+            _PACKERS[klass] = _compile_enum_packer(klass)
         elif issubclass(klass, tuple):
             tuple_map[klass.__name__] = klass
+            _PACKERS[klass] = _compile_tuple_packer(klass)
+            _TUPLE_UNPACKERS[klass] = _compile_tuple_unpacker(klass)
         else:
             check.failed('Can not whitelist class {klass} for serdes'.format(klass=klass))
         return klass
@@ -50,20 +139,39 @@ def pack_value(val):
     return _pack_value(val, enum_map=_WHITELISTED_ENUM_MAP, tuple_map=_WHITELISTED_TUPLE_MAP)
 
 
+def _pack_primitive(val, _enum_map, _tuple_map):
+    return val
+
+
+def _pack_list(val, enum_map, tuple_map):
+    return [_pack_value(i, enum_map, tuple_map) for i in val]
+
+
+def _pack_dict(val, enum_map, tuple_map):
+    return {key: _pack_value(value, enum_map, tuple_map) for key, value in val.items()}
+
+
+for _primitive_type in _PRIMITIVE_TYPES:
+    _PACKERS[_primitive_type] = _pack_primitive
+_PACKERS[list] = _pack_list
+_PACKERS[dict] = _pack_dict
+
+
 def _pack_value(val, enum_map, tuple_map):
+    packer = _PACKERS.get(type(val))
+    if packer is not None:
+        return packer(val, enum_map, tuple_map)
+
+    # Subclasses of the builtin containers, and classes that were never whitelisted
     if isinstance(val, list):
-        return [_pack_value(i, enum_map, tuple_map) for i in val]
+        return _pack_list(val, enum_map, tuple_map)
     if isinstance(val, tuple):
         klass_name = val.__class__.__name__
         check.invariant(
             klass_name in tuple_map,
             'Can only serialize whitelisted namedtuples, recieved {}'.format(klass_name),
         )
-        base_dict = {
-            key: _pack_value(value, enum_map, tuple_map) for key, value in val._asdict().items()
-        }
-        base_dict['__class__'] = klass_name
-        return base_dict
+        return _compile_tuple_packer(val.__class__)(val, enum_map, tuple_map)
     if isinstance(val, Enum):
         klass_name = val.__class__.__name__
         check.invariant(
@@ -72,7 +180,7 @@ def _pack_value(val, enum_map, tuple_map):
         )
         return {'__enum__': str(val)}
     if isinstance(val, dict):
-        return {key: _pack_value(value, enum_map, tuple_map) for key, value in val.items()}
+        return _pack_dict(val, enum_map, tuple_map)
 
     return val
 
@@ -92,25 +200,18 @@ def unpack_value(val):
 
 
 def _unpack_value(val, enum_map, tuple_map):
+    if type(val) in _PRIMITIVE_TYPES:
+        return val
     if isinstance(val, list):
         return [_unpack_value(i, enum_map, tuple_map) for i in val]
-    if isinstance(val, dict) and val.get('__class__'):
-        klass_name = val.pop('__class__')
-        klass = tuple_map[klass_name]
-        val = {key: _unpack_value(value, enum_map, tuple_map) for key, value in val.items()}
-
-        # Naively implements backwards compatibility by filtering arguments that aren't present in
-        # the constructor. If a property is present in the serialized object, but doesn't exist in
-        # the version of the class loaded into memory, that property will be completely ignored.
-        args_for_class = seven.get_args(klass)
-        filtered_val = (
-            {k: v for k, v in val.items() if k in args_for_class} if args_for_class else val
-        )
-        return klass(**filtered_val)
-    if isinstance(val, dict) and val.get('__enum__'):
-        name, member = val['__enum__'].split('.')
-        return getattr(enum_map[name], member)
     if isinstance(val, dict):
+        klass_name = val.get('__class__')
+        if klass_name:
+            return _get_tuple_unpacker(tuple_map[klass_name])(val, enum_map, tuple_map)
+        enum_str = val.get('__enum__')
+        if enum_str:
+            name, member = enum_str.split('.')
+            return enum_map[name][member]
         return {key: _unpack_value(value, enum_map, tuple_map) for key, value in val.items()}
 
     return val
@@ -126,6 +227,67 @@ def _deserialize_json_to_dagster_namedtuple(json_str, enum_map, tuple_map):
     return _unpack_value(seven.json.loads(json_str), enum_map=enum_map, tuple_map=tuple_map)
 
 
+def is_msgpack_available():
+    return msgpack is not None
+
+
+def _check_msgpack_available():
+    check.invariant(
+        is_msgpack_available(),
+        'The msgpack package is required for binary serialization. Install it with '
+        '`pip install dagster[msgpack]`.',
+    )
+
+
+def serialize_dagster_namedtuple_to_msgpack(nt):
+    '''Compact binary alternative to serialize_dagster_namedtuple. Requires msgpack.'''
+    _check_msgpack_available()
+    return msgpack.packb(
+        _pack_value(nt, enum_map=_WHITELISTED_ENUM_MAP, tuple_map=_WHITELISTED_TUPLE_MAP),
+        use_bin_type=True,
+    )
+
+
+def deserialize_msgpack_to_dagster_namedtuple(data):
+    '''Inverse of serialize_dagster_namedtuple_to_msgpack. Malformed input raises a ValueError.'''
+    _check_msgpack_available()
+    return _unpack_value(
+        msgpack.unpackb(data, raw=False, strict_map_key=False),
+        enum_map=_WHITELISTED_ENUM_MAP,
+        tuple_map=_WHITELISTED_TUPLE_MAP,
+    )
+
+
+def check_encoding_param(encoding, param_name):
+    '''Checks that encoding is one of SERDES_ENCODINGS that can be used here, defaulting to json.'''
+    encoding = check.opt_str_param(encoding, param_name, 'json')
+    check.param_invariant(
+        encoding in SERDES_ENCODINGS,
+        param_name,
+        'Must be one of {encodings}'.format(encodings=', '.join(SERDES_ENCODINGS)),
+    )
+    check.invariant(
+        encoding != 'msgpack' or is_msgpack_available(),
+        'The msgpack encoding requires the msgpack package.',
+    )
+    return encoding
+
+
+def serialize_dagster_namedtuple_with_encoding(nt, encoding):
+    '''Serializes nt to text with the json encoding, or to bytes with the msgpack encoding.'''
+    if encoding == 'msgpack':
+        return serialize_dagster_namedtuple_to_msgpack(nt)
+    return serialize_dagster_namedtuple(nt)
+
+
+def deserialize_dagster_namedtuple(value):
+    '''Inverse of serialize_dagster_namedtuple_with_encoding. Text is read as json and bytes as
+    msgpack, so stores may mix both encodings.'''
+    if isinstance(value, six.text_type):
+        return deserialize_json_to_dagster_namedtuple(value)
+    return deserialize_msgpack_to_dagster_namedtuple(bytes(value))
+
+
 @whitelist_for_serdes
 class ConfigurableClassData(
     namedtuple('_ConfigurableClassData', 'module_name class_name config_yaml')
@@ -1,6 +1,7 @@
 import glob
 import os
 import sqlite3
+import threading
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict
 from contextlib import contextmanager
@@ -16,14 +17,20 @@ from dagster.core.definitions.environment_configs import SystemNamedDict
 from dagster.core.errors import DagsterError
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventRecord
-from dagster.core.execution.stats import build_stats_from_events
+from dagster.core.execution.stats import (
+    build_empty_stats,
+    build_stats_from_events,
+    update_stats_from_event,
+)
+from dagster.core.log_manager import coerce_valid_log_level
 from dagster.core.serdes import (
     ConfigurableClass,
     ConfigurableClassData,
-    deserialize_json_to_dagster_namedtuple,
-    serialize_dagster_namedtuple,
+    check_encoding_param,
+    deserialize_dagster_namedtuple,
+    serialize_dagster_namedtuple_with_encoding,
 )
-from dagster.core.types import Field, String
+from dagster.core.types import Field, Float, Int, String
 from dagster.utils import mkdir_p
 
 from .pipeline_run import PipelineRunStatsSnapshot, PipelineRunStatus
@@ -39,6 +46,79 @@ class EventLogSequence(pyrsistent.CheckedPVector):
     __type__ = EventRecord
 
 
+STATS_EVENT_TYPES = [
+    DagsterEventType.PIPELINE_START,
+    DagsterEventType.PIPELINE_SUCCESS,
+    DagsterEventType.PIPELINE_FAILURE,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_MATERIALIZATION,
+    DagsterEventType.STEP_EXPECTATION_RESULT,
+]
+'''The event types consumed by build_stats_from_events.'''
+
+
+def event_step_key(event):
+    check.inst_param(event, 'event', EventRecord)
+    if event.step_key is not None:
+        return event.step_key
+    if event.is_dagster_event:
+        return event.dagster_event.step_key
+    return None
+
+
+def event_type_value(event):
+    check.inst_param(event, 'event', EventRecord)
+    return event.dagster_event.event_type_value if event.is_dagster_event else None
+
+
+def _check_log_filter_params(cursor, step_keys, event_types, levels):
+    check.int_param(cursor, 'cursor')
+    check.invariant(
+        cursor >= -1, 'Don\'t know what to do with negative cursor {cursor}'.format(cursor=cursor)
+    )
+    step_keys = check.opt_nullable_list_param(step_keys, 'step_keys', of_type=str)
+    event_types = check.opt_nullable_list_param(
+        event_types, 'event_types', of_type=DagsterEventType
+    )
+    levels = check.opt_nullable_list_param(levels, 'levels')
+
+    return (
+        set(step_keys) if step_keys is not None else None,
+        set(event_type.value for event_type in event_types) if event_types is not None else None,
+        set(coerce_valid_log_level(level) for level in levels) if levels is not None else None,
+    )
+
+
+def _event_matches_filter(event, step_keys, event_type_values, levels):
+    if step_keys is not None and event_step_key(event) not in step_keys:
+        return False
+    if event_type_values is not None and event_type_value(event) not in event_type_values:
+        return False
+    if levels is not None and event.level not in levels:
+        return False
+    return True
+
+
+def _check_log_window_params(before_cursor, limit, from_end):
+    check.opt_int_param(before_cursor, 'before_cursor')
+    check.opt_int_param(limit, 'limit')
+    check.bool_param(from_end, 'from_end')
+    check.invariant(
+        limit is None or limit >= 0,
+        'Don\'t know what to do with negative limit {limit}'.format(limit=limit),
+    )
+    return before_cursor, limit
+
+
+def _limit_window(window, limit, from_end):
+    if limit is None:
+        return window
+    if from_end:
+        return window[max(len(window) - limit, 0) :] if limit else []
+    return window[:limit]
+
+
 class EventLogStorage(six.with_metaclass(ABCMeta)):
     @abstractmethod
     def get_logs_for_run(self, run_id, cursor=-1):
@@ -50,10 +130,106 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
                 i.e., if cursor is -1, all logs will be returned. (default: -1)
         '''
 
+    def get_filtered_logs_for_run(
+        self, run_id, cursor=-1, step_keys=None, event_types=None, levels=None
+    ):
+        '''Get the logs corresponding to a run that match all of the given filters.
+
+        The default implementation filters the result of get_logs_for_run in memory; storages that
+        index these fields should override it to filter in the storage layer.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[int]): Only logs at a zero-indexed position greater than cursor in
+                the full log of the run will be returned. (default: -1)
+            step_keys (Optional[List[str]]): Only return logs for these steps.
+            event_types (Optional[List[DagsterEventType]]): Only return dagster events of these
+                types.
+            levels (Optional[List[Union[str, int]]]): Only return logs at these levels.
+        '''
+        step_keys, event_type_values, levels = _check_log_filter_params(
+            cursor, step_keys, event_types, levels
+        )
+
+        return [
+            event
+            for event in self.get_logs_for_run(run_id, cursor)
+            if _event_matches_filter(event, step_keys, event_type_values, levels)
+        ]
+
+    def get_logs_window_for_run(
+        self,
+        run_id,
+        after_cursor=-1,
+        before_cursor=None,
+        limit=None,
+        from_end=False,
+        step_keys=None,
+        event_types=None,
+        levels=None,
+    ):
+        '''Get a window of the logs corresponding to a run, along with their cursors.
+
+        The default implementation windows the result of get_filtered_logs_for_run in memory;
+        storages that can query a range of logs should override it.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            after_cursor (Optional[int]): Only logs at a zero-indexed position greater than
+                after_cursor will be returned. (default: -1)
+            before_cursor (Optional[int]): Only logs at a zero-indexed position less than
+                before_cursor will be returned.
+            limit (Optional[int]): The maximum number of logs to return.
+            from_end (Optional[bool]): If True, the last limit matching logs are returned rather
+                than the first. (default: False)
+            step_keys, event_types, levels: As for get_filtered_logs_for_run.
+
+        Returns:
+            List[Tuple[int, EventRecord]]: The cursors and logs in the window, in order.
+        '''
+        before_cursor, limit = _check_log_window_params(before_cursor, limit, from_end)
+        step_keys, event_type_values, levels = _check_log_filter_params(
+            after_cursor, step_keys, event_types, levels
+        )
+
+        window = [
+            (cursor, event)
+            for cursor, event in enumerate(self.get_logs_for_run(run_id))
+            if cursor > after_cursor
+            and (before_cursor is None or cursor < before_cursor)
+            and _event_matches_filter(event, step_keys, event_type_values, levels)
+        ]
+        return _limit_window(window, limit, from_end)
+
+    def get_logs_count_for_run(self, run_id, step_keys=None, event_types=None, levels=None):
+        '''Get the number of logs corresponding to a run that match all of the given filters.'''
+        return len(
+            self.get_filtered_logs_for_run(
+                run_id, step_keys=step_keys, event_types=event_types, levels=levels
+            )
+        )
+
     def get_stats_for_run(self, run_id):
         '''Get a summary of events that have ocurred in a run.'''
 
-        return build_stats_from_events(run_id, self.get_logs_for_run(run_id))
+        return build_stats_from_events(
+            run_id, self.get_filtered_logs_for_run(run_id, event_types=STATS_EVENT_TYPES)
+        )
+
+    def get_stats_for_runs(self, run_ids):
+        '''Get summaries of the events that have ocurred in each of a list of runs.
+
+        Storages that can read the stats of many runs at once, e.g. in a single query, should
+        override this to do so.
+
+        Args:
+            run_ids (List[str]): The ids of the runs for which to fetch stats.
+
+        Returns:
+            Dict[str, PipelineRunStatsSnapshot]: The stats of each run, keyed by run id.
+        '''
+        check.list_param(run_ids, 'run_ids', of_type=str)
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
 
     @abstractmethod
     def store_event(self, event):
@@ -64,6 +240,16 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
             event (EventRecord): The event to store.
         '''
 
+    def flush(self, run_id=None):
+        '''Write any events buffered in memory through to the underlying storage, and release any
+        resources held to write them.
+
+        Storages that write every event synchronously do not need to override this.
+
+        Args:
+            run_id (Optional[str]): Only flush events for this run. Flushes all runs if None.
+        '''
+
     @abstractmethod
     def delete_events(self, run_id):
         '''Remove events for a given run id'''
@@ -76,16 +262,51 @@ class EventLogStorage(six.with_metaclass(ABCMeta)):
 class WatchableEventLogStorage(EventLogStorage):
     @abstractmethod
     def watch(self, run_id, start_cursor, callback):
-        '''Call this method to start watching.'''
+        '''Call this method to start watching.
+
+        Returns a handler, which can be passed to end_watch to stop watching.'''
 
     @abstractmethod
     def end_watch(self, run_id, handler):
         '''Call this method to stop watching.'''
 
 
+class _InMemoryEventLogIndex(object):
+    '''Positions of the events of a single run, keyed by the fields logs can be filtered on.'''
+
+    def __init__(self):
+        self._step_keys = defaultdict(list)
+        self._event_types = defaultdict(list)
+        self._levels = defaultdict(list)
+
+    def add(self, position, event):
+        self._step_keys[event_step_key(event)].append(position)
+        self._event_types[event_type_value(event)].append(position)
+        self._levels[event.level].append(position)
+
+    def positions(self, step_keys, event_type_values, levels):
+        '''Returns the sorted positions matching all of the non-None filters.'''
+        matching = None
+        for index, values in [
+            (self._step_keys, step_keys),
+            (self._event_types, event_type_values),
+            (self._levels, levels),
+        ]:
+            if values is None:
+                continue
+            positions = set()
+            for value in values:
+                positions.update(index.get(value, []))
+            matching = positions if matching is None else matching & positions
+
+        return sorted(matching)
+
+
 class InMemoryEventLogStorage(EventLogStorage):
     def __init__(self):
         self._logs = defaultdict(EventLogSequence)
+        self._indexes = defaultdict(_InMemoryEventLogIndex)
+        self._stats = {}
         self._lock = defaultdict(gevent.lock.Semaphore)
 
     def get_logs_for_run(self, run_id, cursor=-1):
@@ -100,19 +321,102 @@ class InMemoryEventLogStorage(EventLogStorage):
         with self._lock[run_id]:
             return self._logs[run_id][cursor:]
 
+    def get_filtered_logs_for_run(
+        self, run_id, cursor=-1, step_keys=None, event_types=None, levels=None
+    ):
+        check.str_param(run_id, 'run_id')
+        step_keys, event_type_values, levels = _check_log_filter_params(
+            cursor, step_keys, event_types, levels
+        )
+
+        if step_keys is None and event_type_values is None and levels is None:
+            return list(self.get_logs_for_run(run_id, cursor))
+
+        with self._lock[run_id]:
+            logs = self._logs[run_id]
+            positions = self._indexes[run_id].positions(step_keys, event_type_values, levels)
+            return [logs[position] for position in positions if position > cursor]
+
+    def get_logs_window_for_run(
+        self,
+        run_id,
+        after_cursor=-1,
+        before_cursor=None,
+        limit=None,
+        from_end=False,
+        step_keys=None,
+        event_types=None,
+        levels=None,
+    ):
+        check.str_param(run_id, 'run_id')
+        before_cursor, limit = _check_log_window_params(before_cursor, limit, from_end)
+        step_keys, event_type_values, levels = _check_log_filter_params(
+            after_cursor, step_keys, event_types, levels
+        )
+
+        with self._lock[run_id]:
+            logs = self._logs[run_id]
+            end = len(logs) if before_cursor is None else max(min(before_cursor, len(logs)), 0)
+
+            if step_keys is None and event_type_values is None and levels is None:
+                start = after_cursor + 1
+                if limit is not None and from_end:
+                    start = max(start, end - limit)
+                elif limit is not None:
+                    end = min(end, start + limit)
+                positions = range(start, end)
+            else:
+                positions = _limit_window(
+                    [
+                        position
+                        for position in self._indexes[run_id].positions(
+                            step_keys, event_type_values, levels
+                        )
+                        if after_cursor < position < end
+                    ],
+                    limit,
+                    from_end,
+                )
+
+            return [(position, logs[position]) for position in positions]
+
+    def get_logs_count_for_run(self, run_id, step_keys=None, event_types=None, levels=None):
+        check.str_param(run_id, 'run_id')
+        step_keys, event_type_values, levels = _check_log_filter_params(
+            -1, step_keys, event_types, levels
+        )
+
+        with self._lock[run_id]:
+            if step_keys is None and event_type_values is None and levels is None:
+                return len(self._logs[run_id])
+            return len(self._indexes[run_id].positions(step_keys, event_type_values, levels))
+
+    def get_stats_for_run(self, run_id):
+        check.str_param(run_id, 'run_id')
+        stats = self._stats.get(run_id)
+        return stats if stats is not None else build_empty_stats(run_id)
+
     def store_event(self, event):
         check.inst_param(event, 'event', EventRecord)
         run_id = event.run_id
         with self._lock[run_id]:
+            self._indexes[run_id].add(len(self._logs[run_id]), event)
             self._logs[run_id] = self._logs[run_id].append(event)
+            self._stats[run_id] = update_stats_from_event(
+                self._stats.get(run_id) or build_empty_stats(run_id), event
+            )
 
     def delete_events(self, run_id):
         with self._lock[run_id]:
             del self._logs[run_id]
+            self._indexes.pop(run_id, None)
+            self._stats.pop(run_id, None)
         del self._lock[run_id]
 
     def wipe(self):
         self._logs = defaultdict(EventLogSequence)
+        self._indexes = defaultdict(_InMemoryEventLogIndex)
+        self._stats = {}
         self._lock = defaultdict(gevent.lock.Semaphore)
 
 
@@ -121,32 +425,177 @@ CREATE TABLE IF NOT EXISTS event_logs (
     row_id INTEGER PRIMARY KEY AUTOINCREMENT,
     event TEXT NOT NULL,
     dagster_event_type TEXT,
-    timestamp TEXT
+    timestamp TEXT,
+    step_key TEXT,
+    level INTEGER
 )
 '''
 
+CREATE_EVENT_LOG_INDEXES_SQL = [
+    'CREATE INDEX IF NOT EXISTS idx_event_logs_step_key ON event_logs (step_key)',
+    'CREATE INDEX IF NOT EXISTS idx_event_logs_dagster_event_type ON event_logs (dagster_event_type)',
+    'CREATE INDEX IF NOT EXISTS idx_event_logs_level ON event_logs (level)',
+]
+
 FETCH_EVENTS_SQL = '''
 SELECT event FROM event_logs WHERE row_id > ? ORDER BY row_id ASC
 '''
 
+# Only the stats event types are counted, so the rows are found through the event type index
 FETCH_STATS_SQL = '''
-SELECT dagster_event_type, COUNT(1), MAX(timestamp) FROM event_logs GROUP BY dagster_event_type
-'''
+SELECT dagster_event_type, COUNT(1), MAX(timestamp) FROM event_logs
+WHERE dagster_event_type IN ({placeholders}) GROUP BY dagster_event_type
+'''.format(
+    placeholders=', '.join('?' for _ in STATS_EVENT_TYPES)
+)
 
 INSERT_EVENT_SQL = '''
-INSERT INTO event_logs (event, dagster_event_type, timestamp) VALUES (?, ?, ?)
+INSERT INTO event_logs (event, dagster_event_type, timestamp, step_key, level)
+VALUES (?, ?, ?, ?, ?)
 '''
 
+# Event log databases written before step_key and level were tracked lack these columns
+EVENT_LOG_FILTER_COLUMNS = [('step_key', 'TEXT'), ('level', 'INTEGER')]
+
+DEFAULT_FLUSH_INTERVAL = 1.0
+'''The maximum number of seconds a buffered event waits before being written -- default 1s.'''
+
+TERMINAL_PIPELINE_EVENT_TYPES = (
+    DagsterEventType.PIPELINE_SUCCESS.value,
+    DagsterEventType.PIPELINE_FAILURE.value,
+    DagsterEventType.PIPELINE_INIT_FAILURE.value,
+)
+
+
+def _serialize_event(event, encoding):
+    # json rows are stored as text and msgpack rows as blobs
+    value = serialize_dagster_namedtuple_with_encoding(event, encoding)
+    return value if encoding == 'json' else sqlite3.Binary(value)
+
+
+def _event_row(event, encoding):
+    return (
+        _serialize_event(event, encoding),
+        event_type_value(event),
+        event.timestamp,
+        event_step_key(event),
+        event.level,
+    )
+
+
+def _build_filter_clauses(step_keys, event_type_values, levels):
+    clauses = []
+    params = []
+    for column, values in [
+        ('step_key', step_keys),
+        ('dagster_event_type', event_type_values),
+        ('level', levels),
+    ]:
+        if values is None:
+            continue
+        values = sorted(values)
+        clauses.append(
+            '{column} IN ({placeholders})'.format(
+                column=column, placeholders=', '.join('?' for _ in values)
+            )
+        )
+        params.extend(values)
+
+    return clauses, params
+
+
+def _build_filtered_events_sql(step_keys, event_type_values, levels):
+    clauses, params = _build_filter_clauses(step_keys, event_type_values, levels)
+
+    sql = 'SELECT event FROM event_logs WHERE {clauses} ORDER BY row_id ASC'.format(
+        clauses=' AND '.join(['row_id > ?'] + clauses)
+    )
+    return sql, params
+
+
+def _build_events_window_sql(
+    after_cursor, before_cursor, limit, from_end, step_keys, event_type_values, levels
+):
+    # row_ids are one-based, cursors are zero-based
+    clauses, params = _build_filter_clauses(step_keys, event_type_values, levels)
+    clauses.insert(0, 'row_id > ?')
+    params.insert(0, after_cursor + 1)
+    if before_cursor is not None:
+        clauses.insert(1, 'row_id < ?')
+        params.insert(1, before_cursor + 1)
+
+    # Windows from the end are read in descending order so that the limit applies to the last
+    # matching rows -- they're put back in order by the caller
+    sql = 'SELECT row_id, event FROM event_logs WHERE {clauses} ORDER BY row_id {order}'.format(
+        clauses=' AND '.join(clauses), order='DESC' if from_end else 'ASC'
+    )
+    if limit is not None:
+        sql += ' LIMIT ?'
+        params.append(limit)
+
+    return sql, params
+
+
+def _build_events_count_sql(step_keys, event_type_values, levels):
+    clauses, params = _build_filter_clauses(step_keys, event_type_values, levels)
+
+    sql = 'SELECT COUNT(1) FROM event_logs'
+    if clauses:
+        sql += ' WHERE {clauses}'.format(clauses=' AND '.join(clauses))
+    return sql, params
+
 
 class SqliteEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
-    def __init__(self, base_dir, inst_data=None):
+    def __init__(
+        self, base_dir, inst_data=None, buffer_size=None, flush_interval=None, encoding=None
+    ):
         '''Note that idempotent initialization of the SQLite database is done on a per-run_id
-        basis in the body of store_event, since each run is stored in a separate database.'''
+        basis in the body of store_event, since each run is stored in a separate database.
+
+        By default every event is written in its own transaction. If buffer_size is set, events
+        are instead queued in memory and written in a single transaction over a per-run
+        connection once buffer_size events have accumulated, once the oldest queued event is
+        flush_interval seconds old, or when the run emits a terminal pipeline event -- whichever
+        comes first. The connection is kept open until the run is flushed or emits a terminal
+        pipeline event.
+
+        Args:
+            base_dir (str): The directory in which to store the per-run event log databases.
+            buffer_size (Optional[int]): The maximum number of events to queue in memory per run
+                before writing them out. (default: None, events are written through)
+            flush_interval (Optional[float]): The maximum number of seconds a queued event may
+                wait before being written out. Only used if buffer_size is set. (default: 1.0)
+            encoding (Optional[str]): How to serialize stored events, either 'json' or the more
+                compact binary 'msgpack', which requires the msgpack package. Databases may mix
+                both. (default: 'json')
+        '''
         self._base_dir = check.str_param(base_dir, 'base_dir')
         mkdir_p(self._base_dir)
 
+        self._buffer_size = check.opt_int_param(buffer_size, 'buffer_size')
+        check.param_invariant(
+            self._buffer_size is None or self._buffer_size > 0,
+            'buffer_size',
+            'Must be a positive integer',
+        )
+        self._flush_interval = float(
+            check.opt_inst_param(
+                flush_interval, 'flush_interval', (int, float), DEFAULT_FLUSH_INTERVAL
+            )
+        )
+
+        self._encoding = check_encoding_param(encoding, 'encoding')
+
         self._known_run_ids = set([])
-        self._watchers = {}
+        self._upgraded_run_ids = set([])
+        self._buffer_lock = threading.RLock()
+        self._buffers = defaultdict(list)
+        self._flush_timers = {}
+        self._conns = {}
+
+        # The watch of each handler, keyed by the run it watches
+        self._watchers_lock = threading.Lock()
+        self._watchers = defaultdict(dict)
         self._obs = Observer()
         self._obs.start()
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
@@ -157,12 +606,24 @@ class SqliteEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
 
     @classmethod
     def config_type(cls):
-        return SystemNamedDict('SqliteEventLogStorageConfig', {'base_dir': Field(String)})
+        return SystemNamedDict(
+            'SqliteEventLogStorageConfig',
+            {
+                'base_dir': Field(String),
+                'buffer_size': Field(Int, is_optional=True),
+                'flush_interval': Field(Float, is_optional=True),
+                'encoding': Field(String, is_optional=True),
+            },
+        )
 
     @staticmethod
     def from_config_value(inst_data, config_value, **kwargs):
         return SqliteEventLogStorage(inst_data=inst_data, **dict(config_value, **kwargs))
 
+    @property
+    def is_buffered(self):
+        return self._buffer_size is not None
+
     @contextmanager
     def _connect(self, run_id):
         try:
@@ -171,6 +632,56 @@ class SqliteEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
         finally:
             conn.close()
 
+    def _init_db(self, conn):
+        conn.cursor().execute(CREATE_EVENT_LOG_SQL)
+        conn.cursor().execute('PRAGMA journal_mode=WAL;')
+        self._upgrade_db(conn)
+
+    def _upgrade_db(self, conn):
+        '''Adds and backfills the filter columns and their indexes on databases created before
+        they existed.'''
+        columns = set(row[1] for row in conn.cursor().execute('PRAGMA table_info(event_logs)'))
+        missing = [
+            (name, sql_type) for name, sql_type in EVENT_LOG_FILTER_COLUMNS if name not in columns
+        ]
+
+        if missing:
+            with conn:
+                for name, sql_type in missing:
+                    conn.cursor().execute(
+                        'ALTER TABLE event_logs ADD COLUMN {name} {sql_type}'.format(
+                            name=name, sql_type=sql_type
+                        )
+                    )
+                rows = conn.cursor().execute('SELECT row_id, event FROM event_logs').fetchall()
+                conn.cursor().executemany(
+                    'UPDATE event_logs SET step_key = ?, level = ? WHERE row_id = ?',
+                    [
+                        (event_step_key(event), event.level, row_id)
+                        for row_id, event in (
+                            (row_id, deserialize_dagster_namedtuple(value))
+                            for row_id, value in rows
+                        )
+                    ],
+                )
+
+        for index_sql in CREATE_EVENT_LOG_INDEXES_SQL:
+            conn.cursor().execute(index_sql)
+
+    def _buffered_conn(self, run_id):
+        # Buffered writes reuse a single connection per run; it may be used from the flush timer
+        # thread, so all access goes through self._buffer_lock.
+        if run_id not in self._conns:
+            conn = sqlite3.connect(self.filepath_for_run_id(run_id), check_same_thread=False)
+            self._init_db(conn)
+            self._conns[run_id] = conn
+        return self._conns[run_id]
+
+    def _close_buffered_conn(self, run_id):
+        conn = self._conns.pop(run_id, None)
+        if conn is not None:
+            conn.close()
+
     def filepath_for_run_id(self, run_id):
         check.str_param(run_id, 'run_id')
         return os.path.join(self._base_dir, '{run_id}.db'.format(run_id=run_id))
@@ -178,20 +689,77 @@ class SqliteEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
     def store_event(self, event):
         check.inst_param(event, 'event', EventRecord)
         run_id = event.run_id
-        if not run_id in self._known_run_ids:
-            with self._connect(run_id) as conn:
-                conn.cursor().execute(CREATE_EVENT_LOG_SQL)
-                conn.cursor().execute('PRAGMA journal_mode=WAL;')
-                self._known_run_ids.add(run_id)
+
+        if self.is_buffered:
+            self._store_event_buffered(event)
+            return
+
         with self._connect(run_id) as conn:
-            dagster_event_type = None
-            if event.is_dagster_event:
-                dagster_event_type = event.dagster_event.event_type_value
+            if not run_id in self._known_run_ids:
+                self._init_db(conn)
+                self._known_run_ids.add(run_id)
 
-            conn.cursor().execute(
-                INSERT_EVENT_SQL,
-                (serialize_dagster_namedtuple(event), dagster_event_type, event.timestamp),
+            conn.cursor().execute(INSERT_EVENT_SQL, _event_row(event, self._encoding))
+
+    def _store_event_buffered(self, event):
+        run_id = event.run_id
+        is_terminal = (
+            event.is_dagster_event
+            and event.dagster_event.event_type_value in TERMINAL_PIPELINE_EVENT_TYPES
+        )
+
+        with self._buffer_lock:
+            self._buffers[run_id].append(_event_row(event, self._encoding))
+
+            if is_terminal:
+                # Watchers must see the end of the run promptly, and nothing else is expected
+                # for it, so write everything out and release the connection.
+                self._flush_run(run_id)
+                self._close_buffered_conn(run_id)
+            elif len(self._buffers[run_id]) >= self._buffer_size:
+                self._flush_run(run_id)
+            elif run_id not in self._flush_timers:
+                timer = threading.Timer(self._flush_interval, self.flush, args=(run_id,))
+                # Don't keep the process alive just to flush; executions flush when they finish
+                timer.daemon = True
+                self._flush_timers[run_id] = timer
+                timer.start()
+
+    def _flush_run(self, run_id):
+        timer = self._flush_timers.pop(run_id, None)
+        if timer is not None:
+            timer.cancel()
+
+        rows = self._buffers.pop(run_id, None)
+        if not rows:
+            return
+
+        conn = self._buffered_conn(run_id)
+        with conn:
+            conn.executemany(INSERT_EVENT_SQL, rows)
+
+    def flush(self, run_id=None):
+        check.opt_str_param(run_id, 'run_id')
+
+        with self._buffer_lock:
+            run_ids = (
+                [run_id]
+                if run_id is not None
+                else list(set(self._buffers.keys()) | set(self._conns.keys()))
             )
+            for buffered_run_id in run_ids:
+                self._flush_run(buffered_run_id)
+                # Processes that execute only some of the steps of a run never see its terminal
+                # event, so don't hold on to the connection past a flush
+                self._close_buffered_conn(buffered_run_id)
+
+    def _discard_buffered(self, run_id):
+        with self._buffer_lock:
+            timer = self._flush_timers.pop(run_id, None)
+            if timer is not None:
+                timer.cancel()
+            self._buffers.pop(run_id, None)
+            self._close_buffered_conn(run_id)
 
     def get_logs_for_run(self, run_id, cursor=-1):
         check.str_param(run_id, 'run_id')
@@ -201,38 +769,95 @@ class SqliteEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
             'Don\'t know what to do with negative cursor {cursor}'.format(cursor=cursor),
         )
 
-        events = []
+        cursor += 1  # adjust from 0 based offset to 1
+        return self._fetch_events(run_id, FETCH_EVENTS_SQL, (str(cursor),))
+
+    def get_filtered_logs_for_run(
+        self, run_id, cursor=-1, step_keys=None, event_types=None, levels=None
+    ):
+        check.str_param(run_id, 'run_id')
+        step_keys, event_type_values, levels = _check_log_filter_params(
+            cursor, step_keys, event_types, levels
+        )
+
+        sql, params = _build_filtered_events_sql(step_keys, event_type_values, levels)
+        return self._fetch_events(run_id, sql, [cursor + 1] + params, upgrade=True)
+
+    def get_logs_window_for_run(
+        self,
+        run_id,
+        after_cursor=-1,
+        before_cursor=None,
+        limit=None,
+        from_end=False,
+        step_keys=None,
+        event_types=None,
+        levels=None,
+    ):
+        check.str_param(run_id, 'run_id')
+        before_cursor, limit = _check_log_window_params(before_cursor, limit, from_end)
+        step_keys, event_type_values, levels = _check_log_filter_params(
+            after_cursor, step_keys, event_types, levels
+        )
+
+        sql, params = _build_events_window_sql(
+            after_cursor, before_cursor, limit, from_end, step_keys, event_type_values, levels
+        )
+        results = self._query(run_id, sql, params, upgrade=True)
+
+        window = [(row_id - 1, self._deserialize(run_id, value)) for row_id, value in results]
+        return list(reversed(window)) if from_end else window
+
+    def get_logs_count_for_run(self, run_id, step_keys=None, event_types=None, levels=None):
+        check.str_param(run_id, 'run_id')
+        step_keys, event_type_values, levels = _check_log_filter_params(
+            -1, step_keys, event_types, levels
+        )
+
+        sql, params = _build_events_count_sql(step_keys, event_type_values, levels)
+        results = self._query(run_id, sql, params, upgrade=True)
+        return results[0][0] if results else 0
+
+    def _fetch_events(self, run_id, sql, params, upgrade=False):
+        return [
+            self._deserialize(run_id, value)
+            for (value,) in self._query(run_id, sql, params, upgrade=upgrade)
+        ]
+
+    def _query(self, run_id, sql, params, upgrade=False):
+        self.flush(run_id)
+
         if not os.path.exists(self.filepath_for_run_id(run_id)):
-            return events
+            return []
 
-        cursor += 1  # adjust from 0 based offset to 1
         try:
             with self._connect(run_id) as conn:
-                results = conn.cursor().execute(FETCH_EVENTS_SQL, (str(cursor),)).fetchall()
-        except sqlite3.Error as err:
+                if upgrade and run_id not in self._upgraded_run_ids:
+                    self._upgrade_db(conn)
+                    self._upgraded_run_ids.add(run_id)
+                return conn.cursor().execute(sql, params).fetchall()
+        except (sqlite3.Error, ValueError, check.CheckError) as err:
             six.raise_from(EventLogInvalidForRun(run_id=run_id), err)
 
+    def _deserialize(self, run_id, value):
         try:
-            for (json_str,) in results:
-                events.append(
-                    check.inst_param(
-                        deserialize_json_to_dagster_namedtuple(json_str), 'event', EventRecord
-                    )
-                )
-        except (seven.JSONDecodeError, check.CheckError) as err:
+            return check.inst_param(deserialize_dagster_namedtuple(value), 'event', EventRecord)
+        # Decode errors for both encodings are ValueErrors, e.g. seven.JSONDecodeError
+        except (ValueError, check.CheckError) as err:
             six.raise_from(EventLogInvalidForRun(run_id=run_id), err)
 
-        return events
-
     def get_stats_for_run(self, run_id):
+        self.flush(run_id)
+
         if not os.path.exists(self.filepath_for_run_id(run_id)):
             return None
 
-        try:
-            with self._connect(run_id) as conn:
-                results = conn.cursor().execute(FETCH_STATS_SQL).fetchall()
-        except sqlite3.Error as err:
-            six.raise_from(EventLogInvalidForRun(run_id=run_id), err)
+        results = self._query(
+            run_id,
+            FETCH_STATS_SQL,
+            [event_type.value for event_type in STATS_EVENT_TYPES],
+            upgrade=True,
+        )
 
         try:
             counts = {}
@@ -260,10 +885,16 @@ class SqliteEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
             six.raise_from(EventLogInvalidForRun(run_id=run_id), err)
 
     def wipe(self):
+        with self._buffer_lock:
+            for run_id in set(self._buffers.keys()) | set(self._conns.keys()):
+                self._discard_buffered(run_id)
+
         for filename in glob.glob(os.path.join(self._base_dir, '*.db')):
             os.unlink(filename)
 
     def delete_events(self, run_id):
+        self._discard_buffered(run_id)
+
         path = self.filepath_for_run_id(run_id)
         if os.path.exists(path):
             os.unlink(path)
@@ -274,11 +905,25 @@ class SqliteEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
 
     def watch(self, run_id, start_cursor, callback):
         watchdog = EventLogStorageWatchdog(self, run_id, callback, start_cursor)
-        self._watchers[run_id] = self._obs.schedule(watchdog, self._base_dir, True)
+        with self._watchers_lock:
+            self._watchers[run_id][watchdog] = self._obs.schedule(watchdog, self._base_dir, True)
+        return watchdog
 
     def end_watch(self, run_id, handler):
-        self._obs.remove_handler_for_watch(handler, self._watchers[run_id])
-        del self._watchers[run_id]
+        # All runs share the watch on the base directory, so only the handler is removed. It may
+        # already have been removed if the run finished while it was being watched.
+        with self._watchers_lock:
+            if handler not in self._watchers.get(run_id, {}):
+                return
+
+            watch = self._watchers[run_id].pop(handler)
+            if not self._watchers[run_id]:
+                del self._watchers[run_id]
+
+        try:
+            self._obs.remove_handler_for_watch(handler, watch)
+        except KeyError:
+            pass
 
 
 class EventLogStorageWatchdog(PatternMatchingEventHandler):
@@ -289,10 +934,33 @@ class EventLogStorageWatchdog(PatternMatchingEventHandler):
         self._run_id = check.str_param(run_id, 'run_id')
         self._cb = check.callable_param(callback, 'callback')
         self._log_path = event_log_storage.filepath_for_run_id(run_id)
+        # In WAL mode, writes over a connection that stays open (as with buffered writes) only
+        # touch the write-ahead log until it is checkpointed, so watch it as well
+        self._wal_path = self._log_path + '-wal'
+        self._watched_paths = [self._log_path, self._wal_path]
+        # The size and mtime of the write-ahead log when the log was last read, and whether that
+        # read found any new events
+        self._wal_signature = None
+        self._caught_up = False
         self._cursor = start_cursor
-        super(EventLogStorageWatchdog, self).__init__(patterns=[self._log_path], **kwargs)
+        super(EventLogStorageWatchdog, self).__init__(patterns=self._watched_paths, **kwargs)
+
+    def _get_wal_signature(self):
+        try:
+            stat = os.stat(self._wal_path)
+        except OSError:
+            return None
+
+        # Reading the log creates an empty write-ahead log, and removes it again when the reading
+        # connection is the last one open, which would otherwise set off another read. Only
+        # writers append frames to it, changing its size or mtime.
+        return (stat.st_size, stat.st_mtime) if stat.st_size else None
 
     def _process_log(self):
+        # The log is gone if the run was deleted while it was being watched
+        if not os.path.exists(self._log_path):
+            return 0
+
         events = self._event_log_storage.get_logs_for_run(self._run_id, self._cursor)
         self._cursor += len(events)
         for event in events:
@@ -301,10 +969,28 @@ class EventLogStorageWatchdog(PatternMatchingEventHandler):
             if status == PipelineRunStatus.SUCCESS or status == PipelineRunStatus.FAILURE:
                 self._event_log_storage.end_watch(self._run_id, self)
 
+        return len(events)
+
+    def _on_change(self, event):
+        check.invariant(event.src_path in self._watched_paths)
+
+        signature = self._get_wal_signature()
+        if (
+            event.src_path == self._wal_path
+            and self._caught_up
+            and signature == self._wal_signature
+        ):
+            # Reading the log touches the write-ahead log, so skip the events it sets off until a
+            # writer changes it
+            return
+
+        # Take the signature before reading, so that events written during the read are picked up
+        # by the next change to the write-ahead log
+        self._wal_signature = signature
+        self._caught_up = self._process_log() == 0
+
     def on_created(self, event):
-        check.invariant(event.src_path == self._log_path)
-        self._process_log()
+        self._on_change(event)
 
     def on_modified(self, event):
-        check.invariant(event.src_path == self._log_path)
-        self._process_log()
+        self._on_change(event)
@@ -4,6 +4,7 @@ import six
 
 from dagster import check
 from dagster.core.execution.context.system import SystemPipelineExecutionContext
+from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.instance import DagsterInstance
 from dagster.core.types.runtime import RuntimeType, resolve_to_runtime_type
 
@@ -53,6 +54,24 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
             key, serialization_strategy=runtime_type.serialization_strategy
         )
 
+    def open_write(self, context, paths):
+        '''Streams an object into the intermediate store. Returns a context manager yielding a
+        writable binary file-like object.'''
+        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.list_param(paths, 'paths', of_type=str)
+        check.param_invariant(len(paths) > 0, 'paths')
+        key = self.object_store.key_for_paths([self.root] + paths)
+        return self.object_store.open_write(key)
+
+    def open_read(self, context, paths, byte_range=None):
+        '''Streams an object, or the (start, end) byte_range of it, out of the intermediate store.
+        Returns a context manager yielding a readable binary file-like object.'''
+        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.list_param(paths, 'paths', of_type=str)
+        check.param_invariant(len(paths) > 0, 'paths')
+        key = self.object_store.key_for_paths([self.root] + paths)
+        return self.object_store.open_read(key, byte_range=byte_range)
+
     def has_object(self, context, paths):
         check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
         check.list_param(paths, 'paths', of_type=str)
@@ -60,6 +79,16 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
         key = self.object_store.key_for_paths([self.root] + paths)
         return self.object_store.has_object(key)
 
+    def has_objects(self, context, paths_list):
+        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.list_param(paths_list, 'paths_list', of_type=list)
+        keys = []
+        for paths in paths_list:
+            check.list_param(paths, 'paths', of_type=str)
+            check.param_invariant(len(paths) > 0, 'paths')
+            keys.append(self.object_store.key_for_paths([self.root] + paths))
+        return self.object_store.has_objects(keys)
+
     def rm_object(self, context, paths):
         check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
         check.list_param(paths, 'paths', of_type=str)
@@ -116,6 +145,19 @@ class IntermediateStore(six.with_metaclass(ABCMeta)):
             context=context, paths=self.paths_for_intermediate(step_key, output_name)
         )
 
+    def has_intermediates(self, context, step_output_handles):
+        '''Checks which of several intermediates exist, in a single call to the object store.
+
+        Returns a list of booleans in the same order as step_output_handles.'''
+        check.list_param(step_output_handles, 'step_output_handles', of_type=StepOutputHandle)
+        return self.has_objects(
+            context=context,
+            paths_list=[
+                self.paths_for_intermediate(handle.step_key, handle.output_name)
+                for handle in step_output_handles
+            ],
+        )
+
     def rm_intermediate(self, context, step_key, output_name='result'):
         return self.rm_object(
             context=context, paths=self.paths_for_intermediate(step_key, output_name)
@@ -31,6 +31,25 @@ class IntermediatesManager(six.with_metaclass(ABCMeta)):  # pylint: disable=no-i
     def is_persistent(self):
         pass
 
+    def release_intermediate(self, context, step_output_handle):
+        '''Called once every step consuming an intermediate in the current execution has completed.
+
+        Managers may drop the value to free up resources. Persistent intermediates are kept by
+        default, as they remain available to inspect and to re-execute steps from.'''
+
+    def has_intermediates(self, context, step_output_handles):
+        '''Checks which of several intermediates exist, returning a list of booleans in the same
+        order as step_output_handles. Managers backed by remote storage should override this to
+        check all of the intermediates at once.'''
+        check.list_param(step_output_handles, 'step_output_handles', of_type=StepOutputHandle)
+        return [self.has_intermediate(context, handle) for handle in step_output_handles]
+
+    def record_intermediate(self, context, step_output_handle):
+        '''Called when an intermediate has been set by a step executing in another process.
+
+        Managers may remember it so that checking for the intermediate later in the execution
+        doesn't need to hit storage.'''
+
     def all_inputs_covered(self, context, step):
         return len(self.uncovered_inputs(context, step)) == 0
 
@@ -38,18 +57,68 @@ class IntermediatesManager(six.with_metaclass(ABCMeta)):  # pylint: disable=no-i
         from dagster.core.execution.plan.objects import ExecutionStep
 
         check.inst_param(step, 'step', ExecutionStep)
-        uncovered_inputs = []
-        for step_input in step.step_inputs:
-            for source_handle in step_input.source_handles:
-                if not self.has_intermediate(context, source_handle):
-                    uncovered_inputs.append(source_handle)
-        return uncovered_inputs
+        source_handles = [
+            source_handle
+            for step_input in step.step_inputs
+            for source_handle in step_input.source_handles
+        ]
+        return [
+            source_handle
+            for source_handle, covered in zip(
+                source_handles, self.has_intermediates(context, source_handles)
+            )
+            if not covered
+        ]
+
+
+class IntermediatesReferenceCounter(object):
+    '''Tracks the steps of an execution plan yet to consume each intermediate, and releases an
+    intermediate from the intermediates manager once its last consumer has completed.
+
+    Intermediates with no consumers among the steps being executed, like the final outputs of a
+    pipeline, are never released.'''
+
+    def __init__(self, intermediates_manager, execution_plan, step_keys_to_execute=None):
+        self._intermediates_manager = check.inst_param(
+            intermediates_manager, 'intermediates_manager', IntermediatesManager
+        )
+        self._consumer_counts = execution_plan.get_consumer_counts(step_keys_to_execute)
+
+    def step_completed(self, context, step):
+        '''Call once a step has succeeded, failed or been skipped.'''
+        from dagster.core.execution.plan.objects import ExecutionStep
+
+        check.inst_param(step, 'step', ExecutionStep)
+
+        for source_handle in set(
+            source_handle
+            for step_input in step.step_inputs
+            for source_handle in step_input.source_handles
+        ):
+            if source_handle not in self._consumer_counts:
+                continue
+
+            self._consumer_counts[source_handle] -= 1
+            if self._consumer_counts[source_handle] == 0:
+                del self._consumer_counts[source_handle]
+                self._intermediates_manager.release_intermediate(context, source_handle)
 
 
 class InMemoryIntermediatesManager(IntermediatesManager):
-    def __init__(self):
+    '''Keeps intermediates in memory.
+
+    Args:
+        release_intermediates (Optional[bool]): Drop intermediates once every step consuming them
+            has executed, bounding memory usage to the intermediates still needed. Released
+            intermediates are no longer available once execution has completed. (default: False)
+    '''
+
+    def __init__(self, release_intermediates=False):
 
         self.values = {}
+        self.release_intermediates = check.bool_param(
+            release_intermediates, 'release_intermediates'
+        )
 
     # Note:
     # For the in-memory manager context and runtime are currently optional
@@ -75,9 +144,20 @@ class InMemoryIntermediatesManager(IntermediatesManager):
         check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
         return step_output_handle in self.values
 
+    def has_intermediates(self, context, step_output_handles):
+        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.list_param(step_output_handles, 'step_output_handles', of_type=StepOutputHandle)
+        return [handle in self.values for handle in step_output_handles]
+
     def copy_intermediate_from_prev_run(self, context, previous_run_id, step_output_handle):
         check.failed('not implemented in in memory')
 
+    def release_intermediate(self, context, step_output_handle):
+        check.opt_inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+        if self.release_intermediates:
+            self.values.pop(step_output_handle, None)
+
     @property
     def is_persistent(self):
         return False
@@ -88,6 +168,10 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
         self._intermediate_store = check.inst_param(
             intermediate_store, 'intermediate_store', IntermediateStore
         )
+        # Intermediates known to exist because they were set or copied in this execution, or
+        # because the intermediate store was already checked for them. Intermediates aren't removed
+        # while a run is executing, so these never need to be checked for again.
+        self._known_intermediates = set()
 
     def _get_paths(self, step_output_handle):
         return ['intermediates', step_output_handle.step_key, step_output_handle.output_name]
@@ -113,23 +197,55 @@ class IntermediateStoreIntermediatesManager(IntermediatesManager):
                 % (step_output_handle.step_key, step_output_handle.output_name)
             )
 
-        return self._intermediate_store.set_value(
+        res = self._intermediate_store.set_value(
             obj=value,
             context=context,
             runtime_type=runtime_type,
             paths=self._get_paths(step_output_handle),
         )
+        self._known_intermediates.add(step_output_handle)
+        return res
 
     def has_intermediate(self, context, step_output_handle):
         check.inst_param(context, 'context', SystemPipelineExecutionContext)
         check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
 
-        return self._intermediate_store.has_object(context, self._get_paths(step_output_handle))
+        if step_output_handle in self._known_intermediates:
+            return True
+
+        if self._intermediate_store.has_object(context, self._get_paths(step_output_handle)):
+            self._known_intermediates.add(step_output_handle)
+            return True
+
+        return False
+
+    def has_intermediates(self, context, step_output_handles):
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.list_param(step_output_handles, 'step_output_handles', of_type=StepOutputHandle)
+
+        unknown_handles = list(set(step_output_handles).difference(self._known_intermediates))
+        if unknown_handles:
+            for handle, exists in zip(
+                unknown_handles,
+                self._intermediate_store.has_intermediates(context, unknown_handles),
+            ):
+                if exists:
+                    self._known_intermediates.add(handle)
+
+        return [handle in self._known_intermediates for handle in step_output_handles]
+
+    def record_intermediate(self, context, step_output_handle):
+        check.inst_param(context, 'context', SystemPipelineExecutionContext)
+        check.inst_param(step_output_handle, 'step_output_handle', StepOutputHandle)
+
+        self._known_intermediates.add(step_output_handle)
 
     def copy_intermediate_from_prev_run(self, context, previous_run_id, step_output_handle):
-        return self._intermediate_store.copy_object_from_prev_run(
+        res = self._intermediate_store.copy_object_from_prev_run(
             context, previous_run_id, self._get_paths(step_output_handle)
         )
+        self._known_intermediates.add(step_output_handle)
+        return res
 
     @property
     def is_persistent(self):
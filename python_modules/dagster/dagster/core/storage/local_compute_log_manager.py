@@ -2,6 +2,7 @@ import os
 from collections import defaultdict
 
 from watchdog.events import PatternMatchingEventHandler
+from watchdog.observers import Observer
 from watchdog.observers.polling import PollingObserver
 
 from dagster import check
@@ -94,12 +95,30 @@ class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
 
 
 class LocalComputeLogSubscriptionManager(object):
+    '''Notifies subscriptions when the compute logs of a step change.
+
+    Compute log directories are watched with the native filesystem observer of the platform
+    (inotify on Linux, FSEvents on macOS, ReadDirectoryChangesW on Windows), which delivers changes
+    as they happen and costs nothing while the logs are idle. Directories the native observer
+    cannot watch, e.g. once the inotify watch limit is reached, are polled instead.
+    '''
+
     def __init__(self, manager):
         self._manager = manager
         self._subscriptions = defaultdict(list)
         self._watchers = {}
-        self._observer = PollingObserver(WATCHDOG_POLLING_TIMEOUT)
+        self._observer = Observer()
         self._observer.start()
+        self._polling_observer = None
+
+    def _schedule(self, handler, directory):
+        try:
+            return self._observer, self._observer.schedule(handler, directory)
+        except OSError:
+            if self._polling_observer is None:
+                self._polling_observer = PollingObserver(WATCHDOG_POLLING_TIMEOUT)
+                self._polling_observer.start()
+            return self._polling_observer, self._polling_observer.schedule(handler, directory)
 
     def _key(self, run_id, step_key):
         return '{}:{}'.format(run_id, step_key)
@@ -130,7 +149,7 @@ class LocalComputeLogSubscriptionManager(object):
         )
 
         ensure_dir(directory)
-        self._watchers[key] = self._observer.schedule(
+        self._watchers[key] = self._schedule(
             LocalComputeLogFilesystemEventHandler(
                 self, run_id, step_key, update_paths, complete_paths
             ),
@@ -145,8 +164,8 @@ class LocalComputeLogSubscriptionManager(object):
     def unwatch(self, run_id, step_key, handler):
         key = self._key(run_id, step_key)
         if key in self._watchers:
-            self._observer.remove_handler_for_watch(handler, self._watchers[key])
-        del self._watchers[key]
+            observer, watch = self._watchers.pop(key)
+            observer.remove_handler_for_watch(handler, watch)
 
 
 class LocalComputeLogFilesystemEventHandler(PatternMatchingEventHandler):
@@ -1,7 +1,10 @@
+import io
 import logging
 import os
 import shutil
+import uuid
 from abc import ABCMeta, abstractmethod
+from contextlib import contextmanager
 
 import six
 
@@ -37,12 +40,39 @@ class ObjectStore(six.with_metaclass(ABCMeta)):
         Should return an ObjectStoreOperation with op==ObjectStoreOperationType.GET_OBJECT
         on success.'''
 
+    def open_write(self, key):
+        '''Implement this method to stream an object into the object store.
+
+        Should return a context manager yielding a writable binary file-like object. The object
+        should only be visible under key once the context manager has exited without an error.'''
+        check.not_implemented(
+            'Streaming writes are not supported by the {name} object store'.format(name=self.name)
+        )
+
+    def open_read(self, key, byte_range=None):
+        '''Implement this method to stream an object, or a byte range of it, out of the object store.
+
+        Should return a context manager yielding a readable binary file-like object. byte_range is
+        an optional (start, end) tuple of offsets, where end is exclusive and may be None to read
+        to the end of the object.'''
+        check.not_implemented(
+            'Streaming reads are not supported by the {name} object store'.format(name=self.name)
+        )
+
     @abstractmethod
     def has_object(self, key):
         '''Implement this method to check if an object exists in the object store.
         
         Should return a boolean.'''
 
+    def has_objects(self, keys):
+        '''Checks which of several keys exist in the object store.
+
+        Returns a list of booleans in the same order as keys. Object stores for which each
+        existence check is a round trip should override this to check all the keys at once.'''
+        check.list_param(keys, 'keys', of_type=str)
+        return [self.has_object(key) for key in keys]
+
     @abstractmethod
     def rm_object(self, key):
         '''Implement this method to remove an object from the object store.
@@ -68,6 +98,43 @@ class ObjectStore(six.with_metaclass(ABCMeta)):
         return self.sep.join(path_fragments)
 
 
+def check_byte_range(byte_range):
+    '''Checks an optional (start, end) byte range, returning it as a tuple with a start of 0 if
+    byte_range is None.'''
+    if byte_range is None:
+        return (0, None)
+
+    check.tuple_param(byte_range, 'byte_range')
+    check.param_invariant(len(byte_range) == 2, 'byte_range', 'Must be a (start, end) tuple')
+    start, end = byte_range
+    check.int_param(start, 'start')
+    check.opt_int_param(end, 'end')
+    check.param_invariant(start >= 0, 'byte_range', 'start must not be negative')
+    check.param_invariant(end is None or end > start, 'byte_range', 'end must be after start')
+    return (start, end)
+
+
+class _LimitedReader(io.RawIOBase):
+    '''Reads at most limit bytes from a binary file-like object.'''
+
+    def __init__(self, file_obj, limit):
+        super(_LimitedReader, self).__init__()
+        self._file_obj = file_obj
+        self._remaining = limit
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self._remaining <= 0:
+            return 0
+
+        data = self._file_obj.read(min(len(b), self._remaining))
+        b[: len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+
 DEFAULT_SERIALIZATION_STRATEGY = PickleSerializationStrategy()
 
 
@@ -114,12 +181,60 @@ class FilesystemObjectStore(ObjectStore):  # pylint: disable=no-init
             object_store_name=self.name,
         )
 
+    @contextmanager
+    def open_write(self, key):
+        check.str_param(key, 'key')
+        check.param_invariant(len(key) > 0, 'key')
+
+        # Ensure path exists
+        mkdir_p(os.path.dirname(key))
+
+        # Write next to the destination and move the file into place once done, so that a partially
+        # written object is never visible under key
+        temp_key = '{key}.{suffix}.tmp'.format(key=key, suffix=uuid.uuid4().hex)
+        try:
+            with open(temp_key, 'wb') as write_obj:
+                yield write_obj
+
+            if os.path.exists(key):
+                logging.warning('Removing existing path {path}'.format(path=key))
+                os.unlink(key)
+            os.rename(temp_key, key)
+        finally:
+            if os.path.exists(temp_key):
+                os.unlink(temp_key)
+
+    @contextmanager
+    def open_read(self, key, byte_range=None):
+        check.str_param(key, 'key')
+        check.param_invariant(len(key) > 0, 'key')
+        start, end = check_byte_range(byte_range)
+
+        with open(key, 'rb') as read_obj:
+            if start:
+                read_obj.seek(start)
+
+            if end is None:
+                yield read_obj
+            else:
+                yield io.BufferedReader(_LimitedReader(read_obj, end - start))
+
     def has_object(self, key):
         check.str_param(key, 'key')
         check.param_invariant(len(key) > 0, 'key')
 
         return os.path.exists(key)
 
+    def has_objects(self, keys):
+        check.list_param(keys, 'keys', of_type=str)
+
+        # List each directory once instead of stat-ing every key
+        dir_contents = {}
+        for dirname in set(os.path.dirname(key) for key in keys):
+            dir_contents[dirname] = set(os.listdir(dirname)) if os.path.isdir(dirname) else set()
+
+        return [os.path.basename(key) in dir_contents[os.path.dirname(key)] for key in keys]
+
     def rm_object(self, key):
         check.str_param(key, 'key')
         check.param_invariant(len(key) > 0, 'key')
@@ -46,6 +46,25 @@ class PipelineRunStatsSnapshot(
         )
 
 
+class PipelineRunSummary(namedtuple('_PipelineRunSummary', 'run_id pipeline_name status')):
+    '''The fields of a run that run storages can list without loading the whole run.'''
+
+    def __new__(cls, run_id, pipeline_name, status):
+        return super(PipelineRunSummary, cls).__new__(
+            cls,
+            run_id=check.str_param(run_id, 'run_id'),
+            pipeline_name=check.str_param(pipeline_name, 'pipeline_name'),
+            status=check.inst_param(status, 'status', PipelineRunStatus),
+        )
+
+    @staticmethod
+    def from_run(pipeline_run):
+        check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
+        return PipelineRunSummary(
+            pipeline_run.run_id, pipeline_run.pipeline_name, pipeline_run.status
+        )
+
+
 @whitelist_for_serdes
 class PipelineRun(
     namedtuple(
@@ -126,3 +145,40 @@ class PipelineRun(
     @property
     def can_cancel(self):
         return self.status == PipelineRunStatus.STARTED
+
+
+@whitelist_for_serdes
+class PipelineRunsFilter(
+    namedtuple('_PipelineRunsFilter', 'run_id pipeline status tags created_after created_before')
+):
+    '''Selects the runs matching every one of the criteria that are set.
+
+    Args:
+        run_id (Optional[str]): Only select the run with this id.
+        pipeline (Optional[str]): Only select runs of this pipeline.
+        status (Optional[PipelineRunStatus]): Only select runs with this status.
+        tags (Optional[Dict[str, str]]): Only select runs that have all of these tags.
+        created_after (Optional[float]): Only select runs added to the run storage after this unix
+            timestamp.
+        created_before (Optional[float]): Only select runs added to the run storage before this
+            unix timestamp.
+    '''
+
+    def __new__(
+        cls,
+        run_id=None,
+        pipeline=None,
+        status=None,
+        tags=None,
+        created_after=None,
+        created_before=None,
+    ):
+        return super(PipelineRunsFilter, cls).__new__(
+            cls,
+            run_id=check.opt_str_param(run_id, 'run_id'),
+            pipeline=check.opt_str_param(pipeline, 'pipeline'),
+            status=check.opt_inst_param(status, 'status', PipelineRunStatus),
+            tags=check.opt_dict_param(tags, 'tags', key_type=str, value_type=str),
+            created_after=check.opt_float_param(created_after, 'created_after'),
+            created_before=check.opt_float_param(created_before, 'created_before'),
+        )
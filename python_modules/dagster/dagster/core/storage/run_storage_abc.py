@@ -2,6 +2,10 @@ from abc import ABCMeta, abstractmethod
 
 import six
 
+from dagster import check
+
+from .pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunSummary, PipelineRunsFilter
+
 
 class RunStorage(six.with_metaclass(ABCMeta)):
     @abstractmethod
@@ -12,6 +16,20 @@ class RunStorage(six.with_metaclass(ABCMeta)):
             pipeline_run (PipelineRun): The run to add. If this is not a PipelineRun,
         '''
 
+    def add_runs(self, pipeline_runs):
+        '''Add many runs to storage at once.
+
+        Storages that can write a batch of runs together should override this.
+
+        Args:
+            pipeline_runs (List[PipelineRun]): The runs to add.
+
+        Returns:
+            List[PipelineRun]
+        '''
+        check.list_param(pipeline_runs, 'pipeline_runs', of_type=PipelineRun)
+        return [self.add_run(pipeline_run) for pipeline_run in pipeline_runs]
+
     @abstractmethod
     def handle_run_event(self, run_id, event):
         '''Update run storage in accordance to a pipeline run related DagsterEvent
@@ -21,6 +39,14 @@ class RunStorage(six.with_metaclass(ABCMeta)):
 
         '''
 
+    @abstractmethod
+    def update_run_statuses(self, run_statuses):
+        '''Set the status of many runs at once. Runs that are not in the storage are skipped.
+
+        Args:
+            run_statuses (Dict[str, PipelineRunStatus]): The new status of each run, by run_id.
+        '''
+
     @abstractmethod
     def all_runs(self, cursor=None, limit=None):
         '''Return all the runs present in the storage.
@@ -30,6 +56,20 @@ class RunStorage(six.with_metaclass(ABCMeta)):
         '''
 
     @abstractmethod
+    def get_runs(self, filters=None, cursor=None, limit=None):
+        '''Return the runs present in the storage that match all of the given filters, most recent
+        first.
+
+        Args:
+            filters (Optional[PipelineRunsFilter]): The criteria runs must match. Defaults to
+                matching every run.
+            cursor (Optional[str]): Starting cursor (run_id) of range of runs
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+
+        Returns:
+            List[PipelineRun]
+        '''
+
     def get_runs_with_pipeline_name(self, pipeline_name, cursor=None, limit=None):
         '''Return all the runs present in the storage for a given pipeline.
 
@@ -40,8 +80,9 @@ class RunStorage(six.with_metaclass(ABCMeta)):
         Returns:
             List[PipelineRun]
         '''
+        check.str_param(pipeline_name, 'pipeline_name')
+        return self.get_runs(PipelineRunsFilter(pipeline=pipeline_name), cursor, limit)
 
-    @abstractmethod
     def get_runs_with_matching_tag(self, key, value, cursor=None, limit=None):
         '''Return all the runs present in the storage that have a tag with key, value
 
@@ -54,8 +95,10 @@ class RunStorage(six.with_metaclass(ABCMeta)):
         Returns:
             List[PipelineRun]
         '''
+        check.str_param(key, 'key')
+        check.str_param(value, 'value')
+        return self.get_runs(PipelineRunsFilter(tags={key: value}), cursor, limit)
 
-    @abstractmethod
     def get_runs_with_status(self, run_status, cursor=None, limit=None):
         '''Run all the runs matching a particular status
 
@@ -67,6 +110,43 @@ class RunStorage(six.with_metaclass(ABCMeta)):
         Returns:
             List[PipelineRun]:
         '''
+        check.inst_param(run_status, 'run_status', PipelineRunStatus)
+        return self.get_runs(PipelineRunsFilter(status=run_status), cursor, limit)
+
+    def get_run_summaries(self, pipeline_name=None, status=None, cursor=None, limit=None):
+        '''Return summaries of the runs present in the storage, most recent first.
+
+        Storages that keep the summary fields apart from the rest of the run should override this
+        to list runs without loading them in full.
+
+        Args:
+            pipeline_name (Optional[str]): Only list the runs of this pipeline.
+            status (Optional[PipelineRunStatus]): Only list runs with this status.
+            cursor (Optional[str]): Starting cursor (run_id) of range of runs
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+
+        Returns:
+            List[PipelineRunSummary]
+        '''
+        check.opt_str_param(pipeline_name, 'pipeline_name')
+        check.opt_inst_param(status, 'status', PipelineRunStatus)
+        check.opt_str_param(cursor, 'cursor')
+        check.opt_int_param(limit, 'limit')
+
+        summaries = [
+            PipelineRunSummary.from_run(run)
+            for run in self.all_runs()
+            if (pipeline_name is None or run.pipeline_name == pipeline_name)
+            and (status is None or run.status == status)
+        ]
+
+        if cursor:
+            run_ids = [summary.run_id for summary in summaries]
+            if cursor not in run_ids:
+                return []
+            summaries = summaries[run_ids.index(cursor) + 1 :]
+
+        return summaries[:limit] if limit else summaries
 
     @abstractmethod
     def get_run_by_id(self, run_id):
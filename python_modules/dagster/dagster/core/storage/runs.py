@@ -1,3 +1,4 @@
+import time
 from abc import abstractmethod
 from collections import OrderedDict, defaultdict
 from datetime import datetime
@@ -6,15 +7,37 @@ import sqlalchemy as db
 
 from dagster import check
 from dagster.core.events import DagsterEvent, DagsterEventType
-from dagster.core.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+from dagster.core.serdes import (
+    deserialize_dagster_namedtuple,
+    serialize_dagster_namedtuple_with_encoding,
+)
 
-from .pipeline_run import PipelineRun, PipelineRunStatus
+from .pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunSummary, PipelineRunsFilter
 from .run_storage_abc import RunStorage
 
+# The status a run moves to on each of the pipeline events that change it
+RUN_STATUS_BY_EVENT_TYPE = {
+    DagsterEventType.PIPELINE_START: PipelineRunStatus.STARTED,
+    DagsterEventType.PIPELINE_SUCCESS: PipelineRunStatus.SUCCESS,
+    DagsterEventType.PIPELINE_FAILURE: PipelineRunStatus.FAILURE,
+}
+
 
 class InMemoryRunStorage(RunStorage):
     def __init__(self):
+        self._init_runs()
+
+    def _init_runs(self):
         self._runs = OrderedDict()
+        # The position of each run in the order runs were added and when each was added, so that
+        # cursors and time ranges are looked up instead of scanned for
+        self._run_positions = {}
+        self._next_run_position = 0
+        self._create_timestamps = {}
+        # The ids of the runs with each pipeline name, status and tag
+        self._run_ids_by_pipeline_name = defaultdict(set)
+        self._run_ids_by_status = defaultdict(set)
+        self._run_ids_by_tag = defaultdict(set)
 
     def add_run(self, pipeline_run):
         check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
@@ -23,42 +46,98 @@ class InMemoryRunStorage(RunStorage):
             'Can not add same run twice for run_id {run_id}'.format(run_id=pipeline_run.run_id),
         )
 
-        self._runs[pipeline_run.run_id] = pipeline_run
+        run_id = pipeline_run.run_id
+        self._runs[run_id] = pipeline_run
+        self._run_positions[run_id] = self._next_run_position
+        self._next_run_position += 1
+        self._create_timestamps[run_id] = time.time()
+        self._run_ids_by_pipeline_name[pipeline_run.pipeline_name].add(run_id)
+        self._run_ids_by_status[pipeline_run.status].add(run_id)
+        for tag in pipeline_run.tags.items():
+            self._run_ids_by_tag[tag].add(run_id)
+
         return pipeline_run
 
+    def _set_run_status(self, run_id, status):
+        run = self._runs[run_id]
+        self._run_ids_by_status[run.status].discard(run_id)
+        self._run_ids_by_status[status].add(run_id)
+        self._runs[run_id] = run.run_with_status(status)
+
     def handle_run_event(self, run_id, event):
         check.str_param(run_id, 'run_id')
         check.inst_param(event, 'event', DagsterEvent)
-        run = self._runs[run_id]
 
-        if event.event_type == DagsterEventType.PIPELINE_START:
-            self._runs[run_id] = run.run_with_status(PipelineRunStatus.STARTED)
-        elif event.event_type == DagsterEventType.PIPELINE_SUCCESS:
-            self._runs[run_id] = run.run_with_status(PipelineRunStatus.SUCCESS)
-        elif event.event_type == DagsterEventType.PIPELINE_FAILURE:
-            self._runs[run_id] = self._runs[run_id].run_with_status(PipelineRunStatus.FAILURE)
+        if event.event_type in RUN_STATUS_BY_EVENT_TYPE:
+            self._set_run_status(run_id, RUN_STATUS_BY_EVENT_TYPE[event.event_type])
+
+    def update_run_statuses(self, run_statuses):
+        check.dict_param(run_statuses, 'run_statuses', key_type=str, value_type=PipelineRunStatus)
+
+        for run_id, status in run_statuses.items():
+            if run_id in self._runs:
+                self._set_run_status(run_id, status)
 
     def all_runs(self, cursor=None, limit=None):
         return self._slice(list(self._runs.values())[::-1], cursor, limit)
 
-    def get_runs_with_pipeline_name(self, pipeline_name, cursor=None, limit=None):
-        check.str_param(pipeline_name, 'pipeline_name')
-        return self._slice(
-            [r for r in self.all_runs() if r.pipeline_name == pipeline_name], cursor, limit
+    def get_runs(self, filters=None, cursor=None, limit=None):
+        filters = check.opt_inst_param(
+            filters, 'filters', PipelineRunsFilter, default=PipelineRunsFilter()
         )
+        check.opt_str_param(cursor, 'cursor')
+        check.opt_int_param(limit, 'limit')
+
+        # Start from the smallest of the indexed sets of runs the filters select, and check the
+        # runs in it against the remaining filters
+        candidate_sets = []
+        if filters.run_id:
+            candidate_sets.append({filters.run_id} if filters.run_id in self._runs else set())
+        if filters.pipeline:
+            candidate_sets.append(self._run_ids_by_pipeline_name.get(filters.pipeline, set()))
+        if filters.status:
+            candidate_sets.append(self._run_ids_by_status.get(filters.status, set()))
+        for tag in filters.tags.items():
+            candidate_sets.append(self._run_ids_by_tag.get(tag, set()))
+
+        if candidate_sets:
+            candidate_sets.sort(key=len)
+            run_ids = set(candidate_sets[0]).intersection(*candidate_sets[1:])
+        else:
+            run_ids = set(self._runs)
 
-    def get_runs_with_matching_tag(self, key, value, cursor=None, limit=None):
-        check.str_param(key, 'key')
-        check.str_param(value, 'value')
-        return self._slice([r for r in self.all_runs() if r.tags.get(key) == value], cursor, limit)
+        if cursor:
+            if cursor not in self._run_positions:
+                return []
+            cursor_position = self._run_positions[cursor]
+            run_ids = [
+                run_id for run_id in run_ids if self._run_positions[run_id] < cursor_position
+            ]
+
+        if filters.created_after is not None:
+            run_ids = [
+                run_id
+                for run_id in run_ids
+                if self._create_timestamps[run_id] > filters.created_after
+            ]
+        if filters.created_before is not None:
+            run_ids = [
+                run_id
+                for run_id in run_ids
+                if self._create_timestamps[run_id] < filters.created_before
+            ]
+
+        run_ids = sorted(run_ids, key=lambda run_id: self._run_positions[run_id], reverse=True)
+        if limit:
+            run_ids = run_ids[:limit]
+
+        return [self._runs[run_id] for run_id in run_ids]
 
     def _slice(self, runs, cursor, limit):
         if cursor:
-            try:
-                index = next(i for i, run in enumerate(runs) if run.run_id == cursor)
-            except StopIteration:
+            if cursor not in self._run_positions:
                 return []
-            start = index + 1
+            start = next(i for i, run in enumerate(runs) if run.run_id == cursor) + 1
         else:
             start = 0
 
@@ -75,29 +154,28 @@ class InMemoryRunStorage(RunStorage):
 
     def get_run_tags(self):
         result = defaultdict(set)
-        for r in self.all_runs():
-            for k, v in r.tags:
+        for (k, v), run_ids in self._run_ids_by_tag.items():
+            if run_ids:
                 result[k].add(v)
 
         return result.items()
 
-    def get_runs_with_status(self, run_status, cursor=None, limit=None):
-        check.inst_param(run_status, 'run_status', PipelineRunStatus)
-        matching_runs = list(
-            filter(lambda run: run.status == run_status, reversed(self._runs.values()))
-        )
-        return self._slice(matching_runs, cursor=cursor, limit=limit)
-
     def has_run(self, run_id):
         check.str_param(run_id, 'run_id')
         return run_id in self._runs
 
     def delete_run(self, run_id):
         check.str_param(run_id, 'run_id')
-        del self._runs[run_id]
+        run = self._runs.pop(run_id)
+        del self._run_positions[run_id]
+        del self._create_timestamps[run_id]
+        self._run_ids_by_pipeline_name[run.pipeline_name].discard(run_id)
+        self._run_ids_by_status[run.status].discard(run_id)
+        for tag in run.tags.items():
+            self._run_ids_by_tag[tag].discard(run_id)
 
     def wipe(self):
-        self._runs = OrderedDict()
+        self._init_runs()
 
 
 RunStorageSQLMetadata = db.MetaData()
@@ -122,81 +200,148 @@ RunTagsTable = db.Table(
     db.Column('value', db.String),
 )
 
+# Runs are listed newest first, i.e. by descending id, so the filtered listings are served by
+# these indexes without sorting
+db.Index('idx_runs_pipeline_name_id', RunsTable.c.pipeline_name, RunsTable.c.id)
+db.Index('idx_runs_status_id', RunsTable.c.status, RunsTable.c.id)
+db.Index(
+    'idx_run_tags_key_value_run_id', RunTagsTable.c.key, RunTagsTable.c.value, RunTagsTable.c.run_id
+)
+
+RUN_SUMMARY_COLUMNS = [RunsTable.c.run_id, RunsTable.c.pipeline_name, RunsTable.c.status]
+
+# Runs are read from their body and status columns, as status updates only write the latter
+RUN_COLUMNS = [RunsTable.c.run_body, RunsTable.c.status]
+
+# Keeps the run ids bound in a single status update under SQLite's limit on query parameters
+STATUS_UPDATE_BATCH_SIZE = 500
+
 create_engine = db.create_engine  # exported
 
 
+def _row_to_run(row):
+    run_body, status = row
+    run = deserialize_dagster_namedtuple(run_body)
+    if run.status.value != status:
+        run = run.run_with_status(PipelineRunStatus(status))
+    return run
+
+
+def create_run_storage_tables(engine):
+    '''Creates the run storage tables, and any of their indexes that are missing because the
+    tables were created before the indexes were added.'''
+    RunStorageSQLMetadata.create_all(engine)
+
+    inspector = db.inspect(engine)
+    for table in RunStorageSQLMetadata.sorted_tables:
+        existing_index_names = set(index['name'] for index in inspector.get_indexes(table.name))
+        for index in table.indexes:
+            if index.name not in existing_index_names:
+                index.create(engine)
+
+
 class SQLRunStorage(RunStorage):  # pylint: disable=no-init
     @abstractmethod
     def connect(self):
-        ''' context manager yielding a connection '''
+        '''context manager yielding a connection'''
+
+    @property
+    def encoding(self):
+        '''The encoding run bodies are serialized with, one of dagster.core.serdes.SERDES_ENCODINGS.
+        Runs stored with any encoding can be read back.'''
+        return 'json'
 
     def add_run(self, pipeline_run):
         check.inst_param(pipeline_run, 'pipeline_run', PipelineRun)
-
-        conn = self.connect()
-        runs_insert = RunsTable.insert().values(  # pylint: disable=no-value-for-parameter
-            run_id=pipeline_run.run_id,
-            pipeline_name=pipeline_run.pipeline_name,
-            status=pipeline_run.status.value,
-            run_body=serialize_dagster_namedtuple(pipeline_run),
-        )
-        conn.execute(runs_insert)
-        if pipeline_run.tags and len(pipeline_run.tags) > 0:
-            conn.execute(
-                RunTagsTable.insert(),  # pylint: disable=no-value-for-parameter
-                [
-                    dict(run_id=pipeline_run.run_id, key=k, value=v)
-                    for k, v in pipeline_run.tags.items()
-                ],
+        return self.add_runs([pipeline_run])[0]
+
+    def add_runs(self, pipeline_runs):
+        check.list_param(pipeline_runs, 'pipeline_runs', of_type=PipelineRun)
+        if not pipeline_runs:
+            return []
+
+        # Set here rather than by the database so that every database stores it in UTC
+        create_timestamp = datetime.utcnow()
+        run_rows = [
+            dict(
+                run_id=pipeline_run.run_id,
+                pipeline_name=pipeline_run.pipeline_name,
+                status=pipeline_run.status.value,
+                run_body=serialize_dagster_namedtuple_with_encoding(pipeline_run, self.encoding),
+                create_timestamp=create_timestamp,
             )
-
-        return pipeline_run
+            for pipeline_run in pipeline_runs
+        ]
+        tag_rows = [
+            dict(run_id=pipeline_run.run_id, key=k, value=v)
+            for pipeline_run in pipeline_runs
+            for k, v in pipeline_run.tags.items()
+        ]
+
+        with self.connect() as conn:
+            with conn.begin():
+                conn.execute(RunsTable.insert(), run_rows)  # pylint: disable=no-value-for-parameter
+                if tag_rows:
+                    conn.execute(
+                        RunTagsTable.insert(), tag_rows  # pylint: disable=no-value-for-parameter
+                    )
+
+        return pipeline_runs
 
     def handle_run_event(self, run_id, event):
         check.str_param(run_id, 'run_id')
         check.inst_param(event, 'event', DagsterEvent)
 
-        lookup = {
-            DagsterEventType.PIPELINE_START: PipelineRunStatus.STARTED,
-            DagsterEventType.PIPELINE_SUCCESS: PipelineRunStatus.SUCCESS,
-            DagsterEventType.PIPELINE_FAILURE: PipelineRunStatus.FAILURE,
-        }
-
-        if event.event_type not in lookup:
-            return
-
-        run = self.get_run_by_id(run_id)
-        if not run:
-            # TODO log?
-            return
-
-        new_pipeline_status = lookup[event.event_type]
-
-        self.connect().execute(
-            RunsTable.update()  # pylint: disable=no-value-for-parameter
-            .where(RunsTable.c.run_id == run_id)
-            .values(
-                status=new_pipeline_status.value,
-                run_body=serialize_dagster_namedtuple(run.run_with_status(new_pipeline_status)),
-                update_timestamp=datetime.now(),
-            )
-        )
+        if event.event_type in RUN_STATUS_BY_EVENT_TYPE:
+            self.update_run_statuses({run_id: RUN_STATUS_BY_EVENT_TYPE[event.event_type]})
+
+    def update_run_statuses(self, run_statuses):
+        '''Sets the status column of each run alone. The status in the stored run_body is left as
+        it was when the run was added, and the column is applied over it when runs are read.'''
+        check.dict_param(run_statuses, 'run_statuses', key_type=str, value_type=PipelineRunStatus)
+
+        run_ids_by_status = defaultdict(list)
+        for run_id, status in run_statuses.items():
+            run_ids_by_status[status].append(run_id)
+
+        update_timestamp = datetime.now()
+        with self.connect() as conn:
+            with conn.begin():
+                for status, run_ids in run_ids_by_status.items():
+                    for i in range(0, len(run_ids), STATUS_UPDATE_BATCH_SIZE):
+                        conn.execute(
+                            RunsTable.update()  # pylint: disable=no-value-for-parameter
+                            .where(
+                                RunsTable.c.run_id.in_(run_ids[i : i + STATUS_UPDATE_BATCH_SIZE])
+                            )
+                            .values(status=status.value, update_timestamp=update_timestamp)
+                        )
 
     def _rows_to_runs(self, rows):
-        return list(map(lambda r: deserialize_json_to_dagster_namedtuple(r[0]), rows))
+        return list(map(_row_to_run, rows))
 
-    def _build_query(self, query, cursor, limit):
-        ''' Helper function to deal with cursor/limit pagination args '''
+    def _execute_paginated_query(self, query, cursor, limit):
+        '''Runs a query over runs, most recent first, starting after the run with id cursor.
+
+        Pages are found by keyset on the primary key: the id of the cursor run is looked up once
+        and bounds the query, so every page is a range scan on the listing indexes however deep
+        into the runs it is.
+        '''
+        conn = self.connect()
 
         if cursor:
-            cursor_query = db.select([RunsTable.c.id]).where(RunsTable.c.run_id == cursor)
-            query = query.where(RunsTable.c.id < cursor_query)
+            cursor_id = conn.execute(
+                db.select([RunsTable.c.id]).where(RunsTable.c.run_id == cursor)
+            ).scalar()
+            if cursor_id is None:
+                return []
+            query = query.where(RunsTable.c.id < cursor_id)
 
+        query = query.order_by(RunsTable.c.id.desc())
         if limit:
             query = query.limit(limit)
 
-        query = query.order_by(RunsTable.c.id.desc())
-        return query
+        return conn.execute(query).fetchall()
 
     def all_runs(self, cursor=None, limit=None):
         '''Return all the runs present in the storage.
@@ -204,45 +349,57 @@ class SQLRunStorage(RunStorage):  # pylint: disable=no-init
         Returns:
             List[PipelineRun]: Tuples of run_id, pipeline_run.
         '''
-        query = self._build_query(db.select([RunsTable.c.run_body]), cursor, limit)
-        rows = self.connect().execute(query).fetchall()
-        return self._rows_to_runs(rows)
-
-    def get_runs_with_pipeline_name(self, pipeline_name, cursor=None, limit=None):
-        '''Return all the runs present in the storage for a given pipeline.
+        query = db.select(RUN_COLUMNS)
+        return self._rows_to_runs(self._execute_paginated_query(query, cursor, limit))
 
-        Args:
-            pipeline_name (str): The pipeline to index on
+    def get_runs(self, filters=None, cursor=None, limit=None):
+        filters = check.opt_inst_param(
+            filters, 'filters', PipelineRunsFilter, default=PipelineRunsFilter()
+        )
 
-        Returns:
-            List[PipelineRun]: Tuples of run_id, pipeline_run.
-        '''
-        check.str_param(pipeline_name, 'pipeline_name')
+        query = db.select(RUN_COLUMNS)
+        if filters.run_id:
+            query = query.where(RunsTable.c.run_id == filters.run_id)
+        if filters.pipeline:
+            query = query.where(RunsTable.c.pipeline_name == filters.pipeline)
+        if filters.status:
+            query = query.where(RunsTable.c.status == filters.status.value)
+        for key, value in filters.tags.items():
+            # Each tag is looked up on the (key, value, run_id) index alone
+            query = query.where(
+                RunsTable.c.run_id.in_(
+                    db.select([RunTagsTable.c.run_id]).where(
+                        db.and_(RunTagsTable.c.key == key, RunTagsTable.c.value == value)
+                    )
+                )
+            )
+        if filters.created_after is not None:
+            query = query.where(
+                RunsTable.c.create_timestamp > datetime.utcfromtimestamp(filters.created_after)
+            )
+        if filters.created_before is not None:
+            query = query.where(
+                RunsTable.c.create_timestamp < datetime.utcfromtimestamp(filters.created_before)
+            )
 
-        base_query = db.select([RunsTable.c.run_body]).where(
-            RunsTable.c.pipeline_name == pipeline_name
-        )
-        query = self._build_query(base_query, cursor, limit)
-        rows = self.connect().execute(query).fetchall()
-        return self._rows_to_runs(rows)
+        return self._rows_to_runs(self._execute_paginated_query(query, cursor, limit))
 
-    def get_runs_with_matching_tag(self, key, value, cursor=None, limit=None):
-        base_query = (
-            db.select([RunsTable.c.run_body])
-            .select_from(RunsTable.join(RunTagsTable))
-            .where(db.and_(RunTagsTable.c.key == key, RunTagsTable.c.value == value))
-        )
-        query = self._build_query(base_query, cursor, limit)
-        rows = self.connect().execute(query).fetchall()
-        return self._rows_to_runs(rows)
+    def get_run_summaries(self, pipeline_name=None, status=None, cursor=None, limit=None):
+        check.opt_str_param(pipeline_name, 'pipeline_name')
+        check.opt_inst_param(status, 'status', PipelineRunStatus)
 
-    def get_runs_with_status(self, run_status, cursor=None, limit=None):
-        check.inst_param(run_status, 'run_status', PipelineRunStatus)
+        query = db.select(RUN_SUMMARY_COLUMNS)
+        if pipeline_name is not None:
+            query = query.where(RunsTable.c.pipeline_name == pipeline_name)
+        if status is not None:
+            query = query.where(RunsTable.c.status == status.value)
 
-        base_query = db.select([RunsTable.c.run_body]).where(RunsTable.c.status == run_status.value)
-        query = self._build_query(base_query, cursor, limit)
-        rows = self.connect().execute(query).fetchall()
-        return self._rows_to_runs(rows)
+        return [
+            PipelineRunSummary(run_id, run_pipeline_name, PipelineRunStatus(run_status))
+            for run_id, run_pipeline_name, run_status in self._execute_paginated_query(
+                query, cursor, limit
+            )
+        ]
 
     def get_run_by_id(self, run_id):
         '''Get a run by its id.
@@ -255,13 +412,18 @@ class SQLRunStorage(RunStorage):  # pylint: disable=no-init
         '''
         check.str_param(run_id, 'run_id')
 
-        query = db.select([RunsTable.c.run_body]).where(RunsTable.c.run_id == run_id)
+        query = db.select(RUN_COLUMNS).where(RunsTable.c.run_id == run_id)
         rows = self.connect().execute(query).fetchall()
-        return deserialize_json_to_dagster_namedtuple(rows[0][0]) if len(rows) else None
+        return _row_to_run(rows[0]) if len(rows) else None
 
     def get_run_tags(self):
         result = dict()
-        query = db.select([RunTagsTable.c.key, RunTagsTable.c.value]).distinct(RunTagsTable.c.value)
+        # Read straight off the (key, value, run_id) index
+        query = (
+            db.select([RunTagsTable.c.key, RunTagsTable.c.value])
+            .distinct()
+            .order_by(RunTagsTable.c.key, RunTagsTable.c.value)
+        )
         rows = self.connect().execute(query).fetchall()
         for r in rows:
             if r[0] not in result:
@@ -2,17 +2,25 @@ import os
 
 from dagster import check
 from dagster.core.definitions.environment_configs import SystemNamedDict
-from dagster.core.serdes import ConfigurableClass, ConfigurableClassData
-from dagster.core.storage.runs import RunStorageSQLMetadata, SQLRunStorage, create_engine
+from dagster.core.serdes import ConfigurableClass, ConfigurableClassData, check_encoding_param
+from dagster.core.storage.runs import SQLRunStorage, create_engine, create_run_storage_tables
 from dagster.core.types import Field, String
 from dagster.utils import mkdir_p
 
 
 class SqliteRunStorage(SQLRunStorage, ConfigurableClass):
-    def __init__(self, conn_string, inst_data=None):
+    def __init__(self, conn_string, inst_data=None, encoding=None):
+        '''
+        Args:
+            conn_string (str): The SQLAlchemy connection string of the database.
+            encoding (Optional[str]): How to serialize stored runs, either 'json' or the more
+                compact binary 'msgpack', which requires the msgpack package. Databases may mix
+                both. (default: 'json')
+        '''
         check.str_param(conn_string, 'conn_string')
         self.engine = create_engine(conn_string)
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
+        self._encoding = check_encoding_param(encoding, 'encoding')
 
     @property
     def inst_data(self):
@@ -20,20 +28,27 @@ class SqliteRunStorage(SQLRunStorage, ConfigurableClass):
 
     @classmethod
     def config_type(cls):
-        return SystemNamedDict('SqliteRunStorageConfig', {'base_dir': Field(String)})
+        return SystemNamedDict(
+            'SqliteRunStorageConfig',
+            {'base_dir': Field(String), 'encoding': Field(String, is_optional=True)},
+        )
 
     @staticmethod
     def from_config_value(inst_data, config_value, **kwargs):
         return SqliteRunStorage.from_local(inst_data=inst_data, **dict(config_value, **kwargs))
 
     @staticmethod
-    def from_local(base_dir, inst_data=None):
+    def from_local(base_dir, inst_data=None, encoding=None):
         check.str_param(base_dir, 'base_dir')
         mkdir_p(base_dir)
         conn_string = 'sqlite:///{}'.format(os.path.join(base_dir, 'runs.db'))
         engine = create_engine(conn_string)
-        RunStorageSQLMetadata.create_all(engine)
-        return SqliteRunStorage(conn_string, inst_data)
+        create_run_storage_tables(engine)
+        return SqliteRunStorage(conn_string, inst_data, encoding)
+
+    @property
+    def encoding(self):
+        return self._encoding
 
     def connect(self):
         return self.engine.connect()
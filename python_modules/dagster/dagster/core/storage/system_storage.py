@@ -1,4 +1,4 @@
-from dagster import Field, String
+from dagster import Bool, Field, String
 from dagster.core.definitions.system_storage import SystemStorageData, system_storage
 
 from .file_manager import LocalFileManager
@@ -11,14 +11,32 @@ from .intermediates_manager import (
 
 def create_mem_system_storage_data(init_context):
     return SystemStorageData(
-        intermediates_manager=InMemoryIntermediatesManager(),
+        intermediates_manager=InMemoryIntermediatesManager(
+            release_intermediates=init_context.system_storage_config.get(
+                'release_intermediates', False
+            )
+        ),
         file_manager=LocalFileManager.for_instance(
             init_context.instance, init_context.run_config.run_id
         ),
     )
 
 
-@system_storage(name='in_memory', is_persistent=False)
+@system_storage(
+    name='in_memory',
+    is_persistent=False,
+    config={
+        'release_intermediates': Field(
+            Bool,
+            is_optional=True,
+            default_value=False,
+            description='Drop each intermediate from memory once all of the steps consuming it '
+            'have executed. Only outputs that no step consumes remain available once the '
+            'pipeline has completed, so this is off by default: the outputs of every solid are '
+            'otherwise readable from the result of an in-memory execution.',
+        )
+    },
+)
 def mem_system_storage(init_context):
     return create_mem_system_storage_data(init_context)
 
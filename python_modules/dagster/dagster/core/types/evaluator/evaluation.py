@@ -1,4 +1,5 @@
 import traceback
+import weakref
 
 import six
 
@@ -36,16 +37,29 @@ from .traversal_context import TraversalContext
 
 
 def evaluate_config(config_type, config_value, pipeline=None, run_config=None, seen_handles=None):
+    check.inst_param(config_type, 'config_type', ConfigType)
+    check.opt_inst_param(pipeline, 'pipeline', PipelineDefinition)
+    seen_handles = check.opt_list_param(seen_handles, 'seen_handles')
+
+    # Valid config is evaluated by the compiled evaluator of the type. Only config it can't
+    # evaluate goes through the traversal, which reports the errors in it
+    try:
+        return EvaluateValueResult.for_value(
+            _get_compiled_evaluator(config_type)(config_value, pipeline, seen_handles)
+        )
+    except _CannotEvaluate:
+        pass
+
     return _evaluate_config(
         TraversalContext(
-            config_type=check.inst_param(config_type, 'config_type', ConfigType),
+            config_type=config_type,
             config_value=config_value,
             stack=EvaluationStack(config_type=config_type, entries=[]),
-            pipeline=check.opt_inst_param(pipeline, 'pipeline', PipelineDefinition),
+            pipeline=pipeline,
             run_config=check.opt_inst_param(
                 run_config, 'run_config', RunConfig, default=RunConfig()
             ),
-            seen_handles=check.opt_list_param(seen_handles, 'seen_handles'),
+            seen_handles=seen_handles,
         )
     )
 
@@ -333,3 +347,184 @@ def evaluate_list_config(context):
             errors += result.errors
 
     return EvaluateValueResult(success, values, errors)
+
+
+## Compiled evaluators
+#
+# The traversal above builds a TraversalContext and an evaluation stack entry for every value it
+# visits, so that it can report where in the config an error is. Compiled evaluators evaluate valid
+# config without either: each config type is compiled once into a function of
+# (config_value, pipeline, seen_handles) that calls the compiled evaluators of its inner and field
+# types, and returns the same value the traversal would. They raise _CannotEvaluate on anything
+# else, including invalid config and composite solids with config mappings, and evaluate_config
+# then falls back to the traversal.
+#
+# Compiled evaluators are cached weakly by config type, so they must not hold a strong reference to
+# the type they were compiled from, or the type would never be collected.
+
+
+class _CannotEvaluate(Exception):
+    pass
+
+
+_compiled_evaluators = weakref.WeakKeyDictionary()
+
+
+def _get_compiled_evaluator(config_type):
+    evaluator = _compiled_evaluators.get(config_type)
+    if evaluator is None:
+        evaluator = _compile_evaluator(config_type)
+        _compiled_evaluators[config_type] = evaluator
+    return evaluator
+
+
+def _compile_evaluator(config_type):
+    if config_type.is_scalar:
+        return _compile_scalar_evaluator(config_type)
+    elif config_type.is_any:
+        return lambda config_value, _pipeline, _seen_handles: config_value
+    elif config_type.is_selector:
+        return _compile_selector_evaluator(config_type)
+    elif config_type.is_composite:
+        return _compile_composite_evaluator(config_type)
+    elif config_type.is_list:
+        return _compile_list_evaluator(config_type)
+    elif config_type.is_nullable:
+        return _compile_nullable_evaluator(config_type)
+    elif config_type.is_enum:
+        return _compile_enum_evaluator(config_type)
+
+    return _cannot_evaluate
+
+
+def _cannot_evaluate(_config_value, _pipeline, _seen_handles):
+    raise _CannotEvaluate()
+
+
+def _compile_scalar_evaluator(config_type):
+    # Scalar types may override is_config_scalar_valid, so it is looked up through a weak reference
+    config_type_ref = weakref.ref(config_type)
+
+    def _evaluate(config_value, _pipeline, _seen_handles):
+        scalar_type = config_type_ref()
+        if scalar_type is None or not scalar_type.is_config_scalar_valid(config_value):
+            raise _CannotEvaluate()
+        return config_value
+
+    return _evaluate
+
+
+def _compile_enum_evaluator(config_type):
+    python_values = {ev.config_value: ev.python_value for ev in config_type.enum_values}
+
+    def _evaluate(config_value, _pipeline, _seen_handles):
+        if not isinstance(config_value, six.string_types) or config_value not in python_values:
+            raise _CannotEvaluate()
+        return python_values[config_value]
+
+    return _evaluate
+
+
+def _compile_nullable_evaluator(config_type):
+    evaluate_inner = _get_compiled_evaluator(config_type.inner_type)
+
+    def _evaluate(config_value, pipeline, seen_handles):
+        if config_value is None:
+            return None
+        return evaluate_inner(config_value, pipeline, seen_handles)
+
+    return _evaluate
+
+
+def _compile_list_evaluator(config_type):
+    evaluate_inner = _get_compiled_evaluator(config_type.inner_type)
+
+    def _evaluate(config_value, pipeline, seen_handles):
+        if not isinstance(config_value, list):
+            raise _CannotEvaluate()
+        return [evaluate_inner(item, pipeline, seen_handles) for item in config_value]
+
+    return _evaluate
+
+
+def _compile_selector_evaluator(config_type):
+    fields = config_type.fields
+    field_evaluators = {
+        name: _get_compiled_evaluator(field_def.config_type) for name, field_def in fields.items()
+    }
+
+    def _evaluate(config_value, pipeline, seen_handles):
+        if config_value:
+            if not isinstance(config_value, dict) or len(config_value) > 1:
+                raise _CannotEvaluate()
+            field_name, incoming_field_value = ensure_single_item(config_value)
+            if field_name not in field_evaluators:
+                raise _CannotEvaluate()
+        else:
+            if len(fields) > 1:
+                raise _CannotEvaluate()
+            field_name, field_def = ensure_single_item(fields)
+            if not field_def.is_optional:
+                raise _CannotEvaluate()
+            incoming_field_value = field_def.default_value if field_def.default_provided else None
+
+        return {
+            field_name: field_evaluators[field_name](incoming_field_value, pipeline, seen_handles)
+        }
+
+    return _evaluate
+
+
+def _compile_composite_evaluator(config_type):
+    fields = [
+        (
+            name,
+            field_def,
+            field_def.is_optional,
+            field_def.default_provided,
+            _get_compiled_evaluator(field_def.config_type),
+        )
+        for name, field_def in config_type.fields.items()
+    ]
+    field_names = set(config_type.fields.keys())
+    is_permissive = config_type.is_permissive_composite
+    handle = config_type.handle if is_solid_container_config(config_type) else None
+
+    def _evaluate(config_value, pipeline, seen_handles):
+        if config_value is None:
+            config_value = {}
+        elif not isinstance(config_value, dict):
+            raise _CannotEvaluate()
+
+        if handle and handle not in seen_handles and _has_config_mapping(pipeline, handle):
+            raise _CannotEvaluate()
+
+        output_config_value = {}
+        for key in config_value:
+            if key not in field_names:
+                if not is_permissive or not isinstance(key, str):
+                    raise _CannotEvaluate()
+                output_config_value[key] = config_value[key]
+
+        for name, field_def, is_optional, default_provided, evaluate_field in fields:
+            if name in config_value:
+                output_config_value[name] = evaluate_field(
+                    config_value[name], pipeline, seen_handles
+                )
+            elif not is_optional:
+                raise _CannotEvaluate()
+            elif default_provided:
+                output_config_value[name] = field_def.default_value
+
+        return output_config_value
+
+    return _evaluate
+
+
+def _has_config_mapping(pipeline, handle):
+    if pipeline is None:
+        # Leave it to the traversal to fail the same way it always has
+        raise _CannotEvaluate()
+
+    solid_def = pipeline.get_solid(handle).definition
+    return isinstance(solid_def, CompositeSolidDefinition) and solid_def.has_config_mapping
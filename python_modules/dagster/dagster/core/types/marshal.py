@@ -50,3 +50,32 @@ class PickleSerializationStrategy(SerializationStrategy):  # pylint: disable=no-
 
     def deserialize(self, read_file_obj):
         return pickle.load(read_file_obj)
+
+
+class NumpySerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Serializes numpy arrays in the .npy format.
+
+    Arrays read back from a file are memory-mapped read-only, so consumers only page in the parts
+    of the array they touch instead of copying the whole buffer into memory. Arrays of Python
+    objects can't be stored in this format. Requires numpy.
+    '''
+
+    def __init__(self, name='npy'):
+        super(NumpySerializationStrategy, self).__init__(name)
+
+    def serialize(self, value, write_file_obj):
+        import numpy as np
+
+        np.save(write_file_obj, value, allow_pickle=False)
+
+    def deserialize(self, read_file_obj):
+        import numpy as np
+
+        return np.load(read_file_obj, allow_pickle=False)
+
+    def deserialize_from_file(self, read_path):
+        import numpy as np
+
+        check.str_param(read_path, 'read_path')
+
+        return np.load(read_path, mmap_mode='r', allow_pickle=False)
@@ -1,5 +1,7 @@
+import random
 import typing
 from functools import partial
+from itertools import repeat
 
 import six
 
@@ -14,6 +16,7 @@ from .config_schema import InputHydrationConfig, OutputMaterializationConfig
 from .dagster_type import check_dagster_type_param
 from .field_utils import Dict
 from .marshal import PickleSerializationStrategy, SerializationStrategy
+from .type_check_policy import TypeCheckMode, TypeCheckPolicy
 from .typing_api import (
     is_closed_python_dict_type,
     is_closed_python_set_type,
@@ -99,6 +102,22 @@ class RuntimeType(object):
     def type_check(self, value):
         pass
 
+    def type_check_with_policy(self, value, policy):
+        '''Type checks value as the TypeCheckPolicy policy directs. Types that hold values of other
+        types apply the policy to them, and all other types check the value in full.
+        '''
+        return self.type_check(value)
+
+    @property
+    def has_vectorized_type_check(self):
+        return False
+
+    def vectorized_type_check(self, values):
+        '''Returns whether every value in the list values passes the type check of this type,
+        checking them all at once. Only called when has_vectorized_type_check is True.
+        '''
+        check.not_implemented('{name} has no vectorized type check'.format(name=self.name))
+
     @property
     def is_any(self):
         return False
@@ -135,8 +154,18 @@ class BuiltinScalarRuntimeType(RuntimeType):
     def is_scalar(self):
         return True
 
+    @property
+    def has_vectorized_type_check(self):
+        return True
+
+    def vectorized_type_check(self, values):
+        # isinstance is mapped over the values in C, without a type check call per value
+        return all(map(isinstance, values, repeat(self.python_types)))
+
 
 class Int(BuiltinScalarRuntimeType):
+    python_types = six.integer_types
+
     def __init__(self):
         super(Int, self).__init__(
             input_hydration_config=BuiltinSchemas.INT_INPUT,
@@ -164,6 +193,8 @@ def _throw_if_not_string(value):
 
 
 class String(BuiltinScalarRuntimeType):
+    python_types = six.string_types
+
     def __init__(self):
         super(String, self).__init__(
             input_hydration_config=BuiltinSchemas.STRING_INPUT,
@@ -175,6 +206,8 @@ class String(BuiltinScalarRuntimeType):
 
 
 class Path(BuiltinScalarRuntimeType):
+    python_types = six.string_types
+
     def __init__(self):
         super(Path, self).__init__(
             input_hydration_config=BuiltinSchemas.PATH_INPUT,
@@ -186,6 +219,8 @@ class Path(BuiltinScalarRuntimeType):
 
 
 class Float(BuiltinScalarRuntimeType):
+    python_types = float
+
     def __init__(self):
         super(Float, self).__init__(
             input_hydration_config=BuiltinSchemas.FLOAT_INPUT,
@@ -200,6 +235,8 @@ class Float(BuiltinScalarRuntimeType):
 
 
 class Bool(BuiltinScalarRuntimeType):
+    python_types = bool
+
     def __init__(self):
         super(Bool, self).__init__(
             input_hydration_config=BuiltinSchemas.BOOL_INPUT,
@@ -428,6 +465,9 @@ class NullableType(RuntimeType):
     def type_check(self, value):
         return None if value is None else self.inner_type.type_check(value)
 
+    def type_check_with_policy(self, value, policy):
+        return None if value is None else self.inner_type.type_check_with_policy(value, policy)
+
     @property
     def is_nullable(self):
         return True
@@ -470,13 +510,26 @@ class ListType(RuntimeType):
         return '[' + self.inner_type.display_name + ']'
 
     def type_check(self, value):
+        return self.type_check_with_policy(value, TypeCheckPolicy.full())
+
+    def type_check_with_policy(self, value, policy):
         from dagster.core.definitions.events import Failure
 
+        check.inst_param(policy, 'policy', TypeCheckPolicy)
+
         if not isinstance(value, list):
             raise Failure('Value must be a list, got {value}'.format(value=value))
 
-        for item in value:
-            self.inner_type.type_check(item)
+        items = value
+        if policy.mode == TypeCheckMode.SAMPLED and len(value) > policy.sample_size:
+            items = random.sample(value, policy.sample_size)
+        elif policy.mode == TypeCheckMode.VECTORIZED and self.inner_type.has_vectorized_type_check:
+            if self.inner_type.vectorized_type_check(value):
+                return
+            # Check the items one by one to fail on the first bad one, as a full check does
+
+        for item in items:
+            self.inner_type.type_check_with_policy(item, policy)
 
     @property
     def is_list(self):
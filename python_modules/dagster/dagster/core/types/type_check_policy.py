@@ -0,0 +1,46 @@
+from collections import namedtuple
+from enum import Enum
+
+from dagster import check
+
+DEFAULT_TYPE_CHECK_SAMPLE_SIZE = 1000
+
+
+class TypeCheckMode(Enum):
+    FULL = 'FULL'
+    SAMPLED = 'SAMPLED'
+    VECTORIZED = 'VECTORIZED'
+
+
+class TypeCheckPolicy(namedtuple('_TypeCheckPolicy', 'mode sample_size')):
+    '''How thoroughly the values passed between steps are type checked.
+
+    The policy applies to the elements of lists. With FULL, every element is type checked. With
+    SAMPLED, lists longer than sample_size have sample_size randomly chosen elements type checked.
+    With VECTORIZED, the elements are type checked all at once by the vectorized type check of the
+    element type where it has one (the builtin scalars do), and every element is type checked
+    otherwise.
+
+    Args:
+        mode (Optional[TypeCheckMode]): Defaults to TypeCheckMode.FULL.
+        sample_size (Optional[int]): The number of elements SAMPLED checks. Defaults to 1000.
+    '''
+
+    def __new__(cls, mode=TypeCheckMode.FULL, sample_size=DEFAULT_TYPE_CHECK_SAMPLE_SIZE):
+        sample_size = check.int_param(sample_size, 'sample_size')
+        check.param_invariant(sample_size > 0, 'sample_size', 'sample_size must be positive')
+        return super(TypeCheckPolicy, cls).__new__(
+            cls, mode=check.inst_param(mode, 'mode', TypeCheckMode), sample_size=sample_size
+        )
+
+    @staticmethod
+    def full():
+        return TypeCheckPolicy(TypeCheckMode.FULL)
+
+    @staticmethod
+    def sampled(sample_size=DEFAULT_TYPE_CHECK_SAMPLE_SIZE):
+        return TypeCheckPolicy(TypeCheckMode.SAMPLED, sample_size)
+
+    @staticmethod
+    def vectorized():
+        return TypeCheckPolicy(TypeCheckMode.VECTORIZED)
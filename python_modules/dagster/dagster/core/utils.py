@@ -1,10 +1,44 @@
 import uuid
+from collections import defaultdict
 
 import toposort as toposort_
 
 
 def toposort(data):
-    return [sorted(list(level)) for level in toposort_.toposort(data)]
+    '''Sorts the items of data, a dict of each item to the set of items it depends on, into
+    levels. Each level is a sorted list of the items whose dependencies are all in earlier levels.
+
+    Gives the same levels as the toposort package, but in time linear in the size of data rather
+    than in the number of levels times the number of items.
+    '''
+    dependency_counts = {}
+    dependents = defaultdict(list)
+    for item, item_deps in data.items():
+        dependency_counts[item] = 0
+        for dep in item_deps:
+            if dep != item:
+                dependency_counts[item] += 1
+                dependency_counts.setdefault(dep, 0)
+                dependents[dep].append(item)
+
+    levels = []
+    level = sorted(item for item, count in dependency_counts.items() if count == 0)
+    while level:
+        levels.append(level)
+        next_level = []
+        for item in level:
+            for dependent in dependents[item]:
+                dependency_counts[dependent] -= 1
+                if dependency_counts[dependent] == 0:
+                    next_level.append(dependent)
+        level = sorted(next_level)
+
+    if sum(len(level) for level in levels) != len(dependency_counts):
+        raise toposort_.CircularDependencyError(
+            {item: set(data.get(item, [])) for item, count in dependency_counts.items() if count}
+        )
+
+    return levels
 
 
 def toposort_flatten(data):
@@ -0,0 +1,85 @@
+'''Benchmark for validating the environment config of a wide pipeline.
+
+Builds a pipeline of NUM_SOLIDS configured solids, then times validating a config for every solid
+with EnvironmentConfig.build, as create_execution_plan does, both when the environment schema of
+the pipeline has to be built (the first validation) and when it was already built.
+
+Usage:
+
+    python -m dagster_tests.benchmarks.bench_environment_schema --num-solids 500
+'''
+import argparse
+import time
+
+from dagster import Field, Int, PipelineDefinition, String, solid
+from dagster.core.definitions.environment_schema import build_environment_schema
+from dagster.core.system_config.objects import EnvironmentConfig
+
+
+def _pipeline(num_solids):
+    def _solid(i):
+        @solid(
+            name='solid_{i}'.format(i=i),
+            config={
+                'value': Field(Int),
+                'label': Field(String, is_optional=True, default_value=''),
+            },
+        )
+        def _configured(context):
+            return context.solid_config['value']
+
+        return _configured
+
+    return PipelineDefinition(
+        name='bench_pipeline', solid_defs=[_solid(i) for i in range(num_solids)]
+    )
+
+
+def _environment_dict(num_solids):
+    return {
+        'solids': {'solid_{i}'.format(i=i): {'config': {'value': i}} for i in range(num_solids)}
+    }
+
+
+def time_call(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        fn()
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark validating environment config')
+    parser.add_argument('--num-solids', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    environment_dict = _environment_dict(args.num_solids)
+
+    def _validate_cold():
+        pipeline_def = _pipeline(args.num_solids)
+        start = time.time()
+        EnvironmentConfig.build(pipeline_def, environment_dict)
+        return time.time() - start
+
+    cold = min(_validate_cold() for _ in range(args.repeat))
+
+    pipeline_def = _pipeline(args.num_solids)
+    EnvironmentConfig.build(pipeline_def, environment_dict)
+    warm = time_call(lambda: EnvironmentConfig.build(pipeline_def, environment_dict), args.repeat)
+    schema = time_call(
+        lambda: build_environment_schema(pipeline_def, pipeline_def.get_default_mode_name()),
+        args.repeat,
+    )
+
+    print('{num} solids:'.format(num=args.num_solids))
+    print('  build environment schema: {elapsed:.1f}ms'.format(elapsed=schema * 1000))
+    print('  validate config, first time: {elapsed:.1f}ms'.format(elapsed=cold * 1000))
+    print('  validate config, schema built: {elapsed:.1f}ms'.format(elapsed=warm * 1000))
+
+
+if __name__ == '__main__':
+    main()
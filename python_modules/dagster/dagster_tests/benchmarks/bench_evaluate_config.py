@@ -0,0 +1,101 @@
+'''Benchmark for evaluating a large environment config.
+
+Builds a pipeline of NUM_SOLIDS solids, each configured with a dict holding a list of LIST_SIZE
+ints, then times evaluate_config on a valid environment config for it, both with the compiled
+evaluators and with the traversal that reports errors.
+
+Usage:
+
+    python -m dagster_tests.benchmarks.bench_evaluate_config --num-solids 2000 --list-size 50
+'''
+import argparse
+import time
+
+from dagster import Field, Int, List, PipelineDefinition, String, solid
+from dagster.core.definitions.environment_schema import create_environment_type
+from dagster.core.execution.config import RunConfig
+from dagster.core.types.evaluator.evaluation import _evaluate_config, evaluate_config
+from dagster.core.types.evaluator.stack import EvaluationStack
+from dagster.core.types.evaluator.traversal_context import TraversalContext
+
+
+def _pipeline(num_solids):
+    def _solid(i):
+        @solid(
+            name='solid_{i}'.format(i=i),
+            config={
+                'values': Field(List[Int]),
+                'label': Field(String, is_optional=True, default_value=''),
+            },
+        )
+        def _configured(context):
+            return context.solid_config['values']
+
+        return _configured
+
+    return PipelineDefinition(
+        name='bench_pipeline', solid_defs=[_solid(i) for i in range(num_solids)]
+    )
+
+
+def _traverse(environment_type, environment_dict, pipeline_def):
+    return _evaluate_config(
+        TraversalContext(
+            config_type=environment_type,
+            config_value=environment_dict,
+            stack=EvaluationStack(config_type=environment_type, entries=[]),
+            pipeline=pipeline_def,
+            run_config=RunConfig(),
+            seen_handles=[],
+        )
+    )
+
+
+def time_call(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        result = fn()
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark evaluating environment config')
+    parser.add_argument('--num-solids', type=int, default=2000)
+    parser.add_argument('--list-size', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    pipeline_def = _pipeline(args.num_solids)
+    environment_type = create_environment_type(pipeline_def)
+    environment_dict = {
+        'solids': {
+            'solid_{i}'.format(i=i): {'config': {'values': list(range(args.list_size))}}
+            for i in range(args.num_solids)
+        }
+    }
+
+    compiled, compiled_result = time_call(
+        lambda: evaluate_config(environment_type, environment_dict, pipeline_def), args.repeat
+    )
+    traversal, traversal_result = time_call(
+        lambda: _traverse(environment_type, environment_dict, pipeline_def), args.repeat
+    )
+    assert compiled_result.success and traversal_result.success
+    assert compiled_result.value == traversal_result.value
+
+    print(
+        '{num} solids with lists of {size} ints: compiled {compiled:.1f}ms, '
+        'traversal {traversal:.1f}ms'.format(
+            num=args.num_solids,
+            size=args.list_size,
+            compiled=compiled * 1000,
+            traversal=traversal * 1000,
+        )
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+'''Benchmark for SqliteEventLogStorage write throughput.
+
+Stores a stream of event records for a single run through the write-through (default) and the
+buffered configurations of SqliteEventLogStorage and reports events/sec for each.
+
+Usage:
+
+    python -m dagster_tests.benchmarks.bench_event_log --num-events 100000
+'''
+import argparse
+import time
+import uuid
+
+from dagster import seven
+from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster.core.events.log import DagsterEventRecord
+from dagster.core.storage.event_log import SqliteEventLogStorage
+
+
+def _event_records(run_id, num_events):
+    for i in range(num_events):
+        yield DagsterEventRecord(
+            None,
+            'Benchmark message {i}'.format(i=i),
+            'debug',
+            '',
+            run_id,
+            time.time(),
+            dagster_event=DagsterEvent(
+                DagsterEventType.ENGINE_EVENT.value,
+                'benchmark',
+                event_specific_data=EngineEventData.in_process(999),
+            ),
+        )
+
+
+def time_store_events(storage, num_events):
+    run_id = str(uuid.uuid4())
+    records = list(_event_records(run_id, num_events))
+
+    start = time.time()
+    for record in records:
+        storage.store_event(record)
+    storage.flush(run_id)
+    elapsed = time.time() - start
+
+    assert len(storage.get_logs_for_run(run_id)) == num_events
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark SqliteEventLogStorage.store_event')
+    parser.add_argument('--num-events', type=int, default=100000)
+    parser.add_argument('--buffer-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    configs = [
+        ('write-through', {}),
+        ('buffered (buffer_size={})'.format(args.buffer_size), {'buffer_size': args.buffer_size}),
+    ]
+
+    for name, kwargs in configs:
+        with seven.TemporaryDirectory() as tmpdir_path:
+            storage = SqliteEventLogStorage(tmpdir_path, **kwargs)
+            elapsed = time_store_events(storage, args.num_events)
+            print(
+                '{name}: {num} events in {elapsed:.2f}s ({rate:.0f} events/sec)'.format(
+                    name=name, num=args.num_events, elapsed=elapsed, rate=args.num_events / elapsed
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+'''Benchmark for building and walking large execution plans.
+
+Builds a pipeline of NUM_STEPS solids, either as a single chain or as layers of WIDTH solids that
+each depend on a solid of the layer before, then times building its execution plan, the
+topological sorts the engines ask the plan for, and sorting the dependencies of the plan with the
+toposort package, as plans used to every time they were asked for a topological sort.
+
+Usage:
+
+    python -m dagster_tests.benchmarks.bench_execution_plan --num-steps 10000 --width 100
+'''
+import argparse
+import time
+
+import toposort as toposort_
+
+from dagster import DependencyDefinition, InputDefinition, PipelineDefinition, lambda_solid
+from dagster.core.definitions.dependency import SolidInvocation
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.system_config.objects import EnvironmentConfig
+
+
+@lambda_solid
+def start():
+    return 1
+
+
+@lambda_solid(input_defs=[InputDefinition('num')])
+def increment(num):
+    return num + 1
+
+
+def _pipeline(num_steps, width):
+    # The first layer starts from a constant, and every other solid increments the solid WIDTH
+    # solids before it
+    solid_names = ['solid_{i}'.format(i=i) for i in range(num_steps)]
+    dependencies = {SolidInvocation('start', name): {} for name in solid_names[:width]}
+    for i in range(width, num_steps):
+        dependencies[SolidInvocation('increment', solid_names[i])] = {
+            'num': DependencyDefinition(solid_names[i - width])
+        }
+
+    return PipelineDefinition(
+        name='bench_pipeline', solid_defs=[start, increment], dependencies=dependencies
+    )
+
+
+def time_call(fn):
+    start_time = time.time()
+    result = fn()
+    return time.time() - start_time, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark building large execution plans')
+    parser.add_argument('--num-steps', type=int, default=10000)
+    parser.add_argument('--width', type=int, default=100)
+    args = parser.parse_args()
+
+    for name, width in [('chain', 1), ('layers of {}'.format(args.width), args.width)]:
+        pipeline_def = _pipeline(args.num_steps, width)
+        environment_config = EnvironmentConfig.build(pipeline_def)
+
+        create_elapsed, plan = time_call(lambda: create_execution_plan(pipeline_def))
+        build_elapsed, _ = time_call(
+            lambda: ExecutionPlan.build(
+                pipeline_def, environment_config, pipeline_def.get_default_mode()
+            )
+        )
+        levels_elapsed, levels = time_call(plan.topological_step_levels)
+        steps_elapsed, _ = time_call(plan.topological_steps)
+        toposort_elapsed, toposort_levels = time_call(
+            lambda: [sorted(level) for level in toposort_.toposort(plan.deps)]
+        )
+        assert [[step.key for step in level] for level in levels] == toposort_levels
+
+        print(
+            '{name}, {num} steps: create_execution_plan {create:.2f}s, ExecutionPlan.build '
+            '{build:.2f}s, topological_step_levels {levels:.4f}s, topological_steps '
+            '{steps:.4f}s, toposort package {toposort:.2f}s'.format(
+                name=name,
+                num=len(plan.steps),
+                create=create_elapsed,
+                build=build_elapsed,
+                levels=levels_elapsed,
+                steps=steps_elapsed,
+                toposort=toposort_elapsed,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
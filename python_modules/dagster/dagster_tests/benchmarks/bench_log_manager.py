@@ -0,0 +1,71 @@
+'''Microbenchmark for context.log.debug calls in a pipeline run.
+
+Executes a solid making NUM_CALLS context.log.debug calls on an ephemeral instance, with the loggers
+every run has: the default console logger, and the logger storing the messages of the run in the
+instance. The instance stores every message, so the debug messages are always prepared and stored;
+with the console logger at DEBUG, they are also printed. Console output is discarded.
+
+Usage:
+
+    python -m dagster_tests.benchmarks.bench_log_manager --num-calls 100000
+'''
+import argparse
+import os
+import sys
+import time
+
+from dagster import execute_pipeline, pipeline, solid
+from dagster.core.instance import DagsterInstance
+
+
+def time_debug_calls(log_level, num_calls):
+    timings = {}
+
+    @solid
+    def log_rows(context):
+        start = time.time()
+        for i in range(num_calls):
+            context.log.debug('Processed row', row=i)
+        timings['elapsed'] = time.time() - start
+
+    @pipeline
+    def bench_pipeline():
+        log_rows()  # pylint: disable=no-value-for-parameter
+
+    stderr = sys.stderr
+    # The console logger writes to the sys.stderr of when the run starts
+    with open(os.devnull, 'w') as devnull:
+        sys.stderr = devnull
+        try:
+            result = execute_pipeline(
+                bench_pipeline,
+                {'loggers': {'console': {'config': {'log_level': log_level}}}},
+                instance=DagsterInstance.ephemeral(),
+            )
+        finally:
+            sys.stderr = stderr
+
+    assert result.success
+    return timings['elapsed']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark context.log.debug calls')
+    parser.add_argument('--num-calls', type=int, default=100000)
+    args = parser.parse_args()
+
+    for log_level in ['INFO', 'DEBUG']:
+        elapsed = time_debug_calls(log_level, args.num_calls)
+        print(
+            'console at {log_level}: {num_calls} debug calls in {elapsed:.2f}s '
+            '({per_call:.2f}us per call)'.format(
+                log_level=log_level,
+                num_calls=args.num_calls,
+                elapsed=elapsed,
+                per_call=elapsed / args.num_calls * 1e6,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
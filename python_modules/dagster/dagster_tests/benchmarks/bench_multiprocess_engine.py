@@ -0,0 +1,153 @@
+'''Benchmark for MultiprocessEngine scheduling on a DAG with skewed step durations.
+
+The pipeline is made of NUM_CHAINS independent chains of DEPTH steps. In each topological level a
+single step is slow, and the slow step moves to the next chain from one level to the next. A
+scheduler that waits for a whole level to finish before starting the next takes about
+DEPTH * slow seconds, while a scheduler starting steps as soon as their upstream step completes
+only has to wait for one slow step per chain.
+
+Reports the makespan of the multiprocess engine next to a level-by-level scheduler built on the
+same step executor.
+
+Usage:
+
+    python -m dagster_tests.benchmarks.bench_multiprocess_engine --slow 5.0 --fast 0.1
+'''
+import argparse
+import os
+import time
+
+from dagster import (
+    DependencyDefinition,
+    ExecutionTargetHandle,
+    Field,
+    Float,
+    InputDefinition,
+    ModeDefinition,
+    Nothing,
+    OutputDefinition,
+    PipelineDefinition,
+    SolidInvocation,
+    check,
+    execute_pipeline,
+    executor,
+    solid,
+)
+from dagster.core.definitions.executor import default_executors
+from dagster.core.engine.engine_base import IEngine
+from dagster.core.engine.engine_multiprocess import _ProcessPerStepExecutor
+from dagster.core.execution.config import MultiprocessExecutorConfig
+from dagster.core.instance import DagsterInstance
+
+NUM_CHAINS = 4
+DEPTH = 4
+
+
+def _solid_name(chain, level):
+    return 'chain_{chain}_step_{level}'.format(chain=chain, level=level)
+
+
+class LevelBarrierEngine(IEngine):  # pylint: disable=no-init
+    '''Executes the steps of a topological level out of process, waiting for the whole level to
+    complete before starting the next one.'''
+
+    @staticmethod
+    def execute(pipeline_context, execution_plan, step_keys_to_execute=None):
+        step_executor = _ProcessPerStepExecutor(pipeline_context.executor_config.max_concurrent)
+        for step_level in execution_plan.topological_step_levels():
+            pending = [pipeline_context.for_step(step) for step in step_level]
+            while pending or not step_executor.is_idle:
+                while pending and step_executor.has_capacity:
+                    step_executor.launch(pending.pop(0))
+                for _step_key, step_event in step_executor.poll():
+                    if step_event is not None:
+                        yield step_event
+
+
+class LevelBarrierExecutorConfig(MultiprocessExecutorConfig):
+    def get_engine(self):
+        return LevelBarrierEngine
+
+
+@executor(name='level_barrier', config={'max_concurrent': Field(int)})
+def level_barrier_executor(init_context):
+    handle, _ = ExecutionTargetHandle.get_handle(init_context.pipeline_def)
+    return LevelBarrierExecutorConfig(
+        handle=handle, max_concurrent=init_context.executor_config['max_concurrent']
+    )
+
+
+@solid(
+    config={'seconds': Field(Float)},
+    input_defs=[InputDefinition('after', Nothing)],
+    output_defs=[OutputDefinition(Nothing)],
+)
+def sleep_solid(context):
+    time.sleep(context.solid_config['seconds'])
+
+
+def define_skewed_pipeline():
+    dependencies = {}
+    for chain in range(NUM_CHAINS):
+        for level in range(DEPTH):
+            dependencies[SolidInvocation('sleep_solid', alias=_solid_name(chain, level))] = (
+                {'after': DependencyDefinition(_solid_name(chain, level - 1))} if level else {}
+            )
+
+    return PipelineDefinition(
+        name='skewed_pipeline',
+        solid_defs=[sleep_solid],
+        dependencies=dependencies,
+        mode_defs=[ModeDefinition(executor_defs=default_executors + [level_barrier_executor])],
+    )
+
+
+def time_execution(executor_name, slow, fast):
+    pipeline = ExecutionTargetHandle.for_pipeline_python_file(
+        os.path.abspath(__file__), 'define_skewed_pipeline'
+    ).build_pipeline_definition()
+
+    solids_config = {
+        _solid_name(chain, level): {
+            'config': {'seconds': slow if chain == level % NUM_CHAINS else fast}
+        }
+        for chain in range(NUM_CHAINS)
+        for level in range(DEPTH)
+    }
+
+    start = time.time()
+    result = execute_pipeline(
+        pipeline,
+        environment_dict={
+            'solids': solids_config,
+            'storage': {'filesystem': {}},
+            'execution': {executor_name: {'config': {'max_concurrent': NUM_CHAINS}}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    elapsed = time.time() - start
+
+    check.invariant(result.success, 'Benchmark pipeline failed')
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark MultiprocessEngine scheduling')
+    parser.add_argument('--slow', type=float, default=5.0)
+    parser.add_argument('--fast', type=float, default=0.1)
+    args = parser.parse_args()
+
+    for name, executor_name in [
+        ('level barrier', 'level_barrier'),
+        ('dependency driven', 'multiprocess'),
+    ]:
+        elapsed = time_execution(executor_name, args.slow, args.fast)
+        print(
+            '{name}: {num} steps in {elapsed:.2f}s'.format(
+                name=name, num=NUM_CHAINS * DEPTH, elapsed=elapsed
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+'''Benchmark for listing runs from SqliteRunStorage.
+
+Fills a run storage with NUM_RUNS runs spread over a handful of pipelines, statuses and tags, then
+times listing the most recent 100 runs through each of the listing APIs, both from the top and from
+a cursor halfway down. Pass --without-indexes to drop the listing indexes and compare.
+
+Usage:
+
+    python -m dagster_tests.benchmarks.bench_run_storage --num-runs 1000000
+'''
+import argparse
+import time
+import uuid
+
+import sqlalchemy as db
+
+from dagster import seven
+from dagster.core.definitions.pipeline import ExecutionSelector
+from dagster.core.serdes import serialize_dagster_namedtuple
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
+from dagster.core.storage.runs import RunStorageSQLMetadata, RunTagsTable, RunsTable
+from dagster.core.storage.sqlite_run_storage import SqliteRunStorage
+
+NUM_PIPELINES = 10
+NUM_TAG_VALUES = 100
+STATUSES = [PipelineRunStatus.SUCCESS, PipelineRunStatus.FAILURE, PipelineRunStatus.STARTED]
+TAG_KEY = 'bench/batch'
+BATCH_SIZE = 10000
+PAGE_SIZE = 100
+
+
+def _run_rows(num_runs):
+    # Serializing a million runs would dominate filling the storage, so a run body is serialized
+    # once per combination of pipeline, status and tag, and only the run id is swapped out
+    template_run_id = str(uuid.uuid4())
+    templates = {}
+
+    for i in range(num_runs):
+        pipeline_name = 'pipeline_{i}'.format(i=i % NUM_PIPELINES)
+        status = STATUSES[i % len(STATUSES)]
+        tags = {TAG_KEY: str(i % NUM_TAG_VALUES)}
+
+        key = (pipeline_name, status, tags[TAG_KEY])
+        if key not in templates:
+            templates[key] = serialize_dagster_namedtuple(
+                PipelineRun(
+                    pipeline_name=pipeline_name,
+                    run_id=template_run_id,
+                    environment_dict=None,
+                    mode='default',
+                    selector=ExecutionSelector(pipeline_name),
+                    reexecution_config=None,
+                    step_keys_to_execute=None,
+                    tags=tags,
+                    status=status,
+                )
+            )
+
+        run_id = str(uuid.uuid4())
+        yield (
+            dict(
+                run_id=run_id,
+                pipeline_name=pipeline_name,
+                status=status.value,
+                run_body=templates[key].replace(template_run_id, run_id),
+            ),
+            dict(run_id=run_id, key=TAG_KEY, value=tags[TAG_KEY]),
+        )
+
+
+def fill_storage(storage, num_runs):
+    conn = storage.connect()
+    run_rows, tag_rows = [], []
+
+    def _insert():
+        with conn.begin():
+            conn.execute(RunsTable.insert(), run_rows)  # pylint: disable=no-value-for-parameter
+            conn.execute(RunTagsTable.insert(), tag_rows)  # pylint: disable=no-value-for-parameter
+
+    for run_row, tag_row in _run_rows(num_runs):
+        run_rows.append(run_row)
+        tag_rows.append(tag_row)
+        if len(run_rows) == BATCH_SIZE:
+            _insert()
+            run_rows, tag_rows = [], []
+
+    if run_rows:
+        _insert()
+
+
+def drop_listing_indexes(storage):
+    for table in RunStorageSQLMetadata.sorted_tables:
+        for index in table.indexes:
+            index.drop(storage.engine)
+
+
+def time_call(fn, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        result = fn()
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark listing runs from SqliteRunStorage')
+    parser.add_argument('--num-runs', type=int, default=1000000)
+    parser.add_argument('--without-indexes', action='store_true')
+    args = parser.parse_args()
+
+    with seven.TemporaryDirectory() as tempdir:
+        storage = SqliteRunStorage.from_local(tempdir)
+
+        start = time.time()
+        fill_storage(storage, args.num_runs)
+        print(
+            'Stored {num_runs} runs in {elapsed:.1f}s'.format(
+                num_runs=args.num_runs, elapsed=time.time() - start
+            )
+        )
+
+        if args.without_indexes:
+            drop_listing_indexes(storage)
+
+        middle_run_id = (
+            storage.connect()
+            .execute(db.select([RunsTable.c.run_id]).where(RunsTable.c.id == args.num_runs // 2))
+            .scalar()
+        )
+
+        cases = [
+            ('all_runs', lambda cursor: storage.all_runs(cursor=cursor, limit=PAGE_SIZE)),
+            (
+                'get_runs_with_pipeline_name',
+                lambda cursor: storage.get_runs_with_pipeline_name(
+                    'pipeline_0', cursor=cursor, limit=PAGE_SIZE
+                ),
+            ),
+            (
+                'get_runs_with_status',
+                lambda cursor: storage.get_runs_with_status(
+                    PipelineRunStatus.FAILURE, cursor=cursor, limit=PAGE_SIZE
+                ),
+            ),
+            (
+                'get_runs_with_matching_tag',
+                lambda cursor: storage.get_runs_with_matching_tag(
+                    TAG_KEY, '0', cursor=cursor, limit=PAGE_SIZE
+                ),
+            ),
+            (
+                'get_run_summaries',
+                lambda cursor: storage.get_run_summaries(cursor=cursor, limit=PAGE_SIZE),
+            ),
+            (
+                'get_run_summaries(pipeline_name)',
+                lambda cursor: storage.get_run_summaries(
+                    pipeline_name='pipeline_0', cursor=cursor, limit=PAGE_SIZE
+                ),
+            ),
+        ]
+
+        for name, list_runs in cases:
+            for position, cursor in [('latest', None), ('from middle', middle_run_id)]:
+                elapsed, runs = time_call(lambda fn=list_runs, cursor=cursor: fn(cursor))
+                assert len(runs) == PAGE_SIZE
+                print(
+                    '{name} ({position}): {elapsed:.2f}ms'.format(
+                        name=name, position=position, elapsed=elapsed * 1000
+                    )
+                )
+
+        elapsed, tags = time_call(storage.get_run_tags, repeat=1)
+        assert len(dict(tags)[TAG_KEY]) == NUM_TAG_VALUES
+        print('get_run_tags: {elapsed:.2f}ms'.format(elapsed=elapsed * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+'''Benchmark for creating runs in, and moving runs through statuses in, SqliteRunStorage.
+
+Creates NUM_RUNS tagged runs one add_run at a time and with a single add_runs, then moves every run
+to STARTED and on to SUCCESS one handle_run_event at a time and with a single update_run_statuses
+per transition, and reports runs/sec for each.
+
+Usage:
+
+    python -m dagster_tests.benchmarks.bench_run_storage_writes --num-runs 10000
+'''
+import argparse
+import time
+import uuid
+
+from dagster import seven
+from dagster.core.definitions.pipeline import ExecutionSelector
+from dagster.core.events import DagsterEvent, DagsterEventType
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
+from dagster.core.storage.sqlite_run_storage import SqliteRunStorage
+
+
+def _runs(num_runs):
+    return [
+        PipelineRun(
+            pipeline_name='bench_pipeline',
+            run_id=str(uuid.uuid4()),
+            environment_dict=None,
+            mode='default',
+            selector=ExecutionSelector('bench_pipeline'),
+            reexecution_config=None,
+            step_keys_to_execute=None,
+            tags={'bench/batch': str(i % 100), 'bench/partition': str(i)},
+            status=PipelineRunStatus.NOT_STARTED,
+        )
+        for i in range(num_runs)
+    ]
+
+
+def _add_one_at_a_time(storage, runs):
+    for run in runs:
+        storage.add_run(run)
+
+
+def _add_in_batch(storage, runs):
+    storage.add_runs(runs)
+
+
+def _transition_one_at_a_time(storage, runs):
+    for event_type in [DagsterEventType.PIPELINE_START, DagsterEventType.PIPELINE_SUCCESS]:
+        event = DagsterEvent(event_type.value, 'bench_pipeline')
+        for run in runs:
+            storage.handle_run_event(run.run_id, event)
+
+
+def _transition_in_batch(storage, runs):
+    for status in [PipelineRunStatus.STARTED, PipelineRunStatus.SUCCESS]:
+        storage.update_run_statuses({run.run_id: status for run in runs})
+
+
+def time_writes(add_fn, transition_fn, num_runs):
+    runs = _runs(num_runs)
+
+    with seven.TemporaryDirectory() as tempdir:
+        storage = SqliteRunStorage.from_local(tempdir)
+
+        start = time.time()
+        add_fn(storage, runs)
+        add_elapsed = time.time() - start
+
+        start = time.time()
+        transition_fn(storage, runs)
+        transition_elapsed = time.time() - start
+
+        assert len(storage.get_runs_with_status(PipelineRunStatus.SUCCESS)) == num_runs
+
+    return add_elapsed, transition_elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark writing runs to SqliteRunStorage')
+    parser.add_argument('--num-runs', type=int, default=10000)
+    args = parser.parse_args()
+
+    cases = [
+        ('one at a time', _add_one_at_a_time, _transition_one_at_a_time),
+        ('batched', _add_in_batch, _transition_in_batch),
+    ]
+
+    for name, add_fn, transition_fn in cases:
+        add_elapsed, transition_elapsed = time_writes(add_fn, transition_fn, args.num_runs)
+        print(
+            '{name}: created {num} runs in {add:.2f}s ({add_rate:.0f} runs/sec), '
+            'moved them through 2 statuses in {transition:.2f}s '
+            '({transition_rate:.0f} runs/sec)'.format(
+                name=name,
+                num=args.num_runs,
+                add=add_elapsed,
+                add_rate=args.num_runs / add_elapsed,
+                transition=transition_elapsed,
+                transition_rate=2 * args.num_runs / transition_elapsed,
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
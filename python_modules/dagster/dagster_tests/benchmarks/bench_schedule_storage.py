@@ -0,0 +1,91 @@
+'''Benchmark for reading schedules from FilesystemScheduleStorage.
+
+Stores NUM_SCHEDULES schedules, then times loading them into a new storage, and the reads that
+`dagster schedule list`, dagit and the scheduler daemon make against a storage that is already
+loaded: listing all schedules, listing the running ones, looking each one up by name, and listing
+them again after another process has started one of them.
+
+Usage:
+
+    python -m dagster_tests.benchmarks.bench_schedule_storage --num-schedules 1000
+'''
+import argparse
+import time
+import uuid
+
+from dagster import seven
+from dagster.core.definitions.schedule import ScheduleDefinitionData
+from dagster.core.scheduler import Schedule, ScheduleStatus
+from dagster.core.scheduler.storage import FilesystemScheduleStorage
+
+REPOSITORY_NAME = 'bench_repository'
+
+
+def time_call(fn, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        result = fn()
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark reading FilesystemScheduleStorage')
+    parser.add_argument('--num-schedules', type=int, default=1000)
+    args = parser.parse_args()
+
+    with seven.TemporaryDirectory() as tempdir:
+        writer = FilesystemScheduleStorage(tempdir, repository_name=REPOSITORY_NAME)
+        names = ['schedule_{i}'.format(i=i) for i in range(args.num_schedules)]
+        for i, name in enumerate(names):
+            writer.add_schedule(
+                Schedule(
+                    str(uuid.uuid4()),
+                    ScheduleDefinitionData(name=name, cron_schedule='* * * * *'),
+                    ScheduleStatus.RUNNING if i % 2 else ScheduleStatus.STOPPED,
+                )
+            )
+
+        def _load():
+            return FilesystemScheduleStorage(tempdir, repository_name=REPOSITORY_NAME)
+
+        elapsed, storage = time_call(_load)
+        print(
+            'load {num} schedules: {elapsed:.2f}ms'.format(num=len(names), elapsed=elapsed * 1000)
+        )
+
+        # Let the schedules directory age past the window in which its mtime is distrusted
+        time.sleep(3)
+
+        cases = [
+            ('all_schedules', storage.all_schedules),
+            (
+                'all_schedules(RUNNING)',
+                lambda: storage.all_schedules(status=ScheduleStatus.RUNNING),
+            ),
+            (
+                'get_schedule_by_name x {num}'.format(num=len(names)),
+                lambda: [storage.get_schedule_by_name(name) for name in names],
+            ),
+        ]
+        for name, fn in cases:
+            elapsed, _ = time_call(fn)
+            print('{name}: {elapsed:.2f}ms'.format(name=name, elapsed=elapsed * 1000))
+
+        stopped = writer.get_schedule_by_name(names[0])
+        writer.update_schedule(stopped.with_status(ScheduleStatus.RUNNING))
+        elapsed, running = time_call(
+            lambda: storage.all_schedules(status=ScheduleStatus.RUNNING), repeat=1
+        )
+        assert len(running) == len(names) // 2 + 1
+        print(
+            'all_schedules(RUNNING) after an update by another writer: {elapsed:.2f}ms'.format(
+                elapsed=elapsed * 1000
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
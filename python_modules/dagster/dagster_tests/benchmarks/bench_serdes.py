@@ -0,0 +1,136 @@
+'''Benchmark for dagster.core.serdes over realistic EventRecord and PipelineRun payloads.
+
+Reports round trips/sec for the json and (if installed) msgpack encodings, alongside the
+previous recursive implementation, which called _asdict() on every namedtuple and inspected the
+constructor signature on every unpack.
+
+Usage:
+
+    python -m dagster_tests.benchmarks.bench_serdes --iterations 20000
+'''
+import argparse
+import time
+from enum import Enum
+
+from dagster import seven
+from dagster.core.events import DagsterEvent, DagsterEventType
+from dagster.core.events.log import DagsterEventRecord
+from dagster.core.execution.plan.objects import StepSuccessData
+from dagster.core.serdes import (
+    _WHITELISTED_ENUM_MAP,
+    _WHITELISTED_TUPLE_MAP,
+    deserialize_json_to_dagster_namedtuple,
+    deserialize_msgpack_to_dagster_namedtuple,
+    is_msgpack_available,
+    serialize_dagster_namedtuple,
+    serialize_dagster_namedtuple_to_msgpack,
+)
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
+
+
+def _legacy_pack_value(val):
+    if isinstance(val, list):
+        return [_legacy_pack_value(i) for i in val]
+    if isinstance(val, tuple):
+        base_dict = {key: _legacy_pack_value(value) for key, value in val._asdict().items()}
+        base_dict['__class__'] = val.__class__.__name__
+        return base_dict
+    if isinstance(val, Enum):
+        return {'__enum__': str(val)}
+    if isinstance(val, dict):
+        return {key: _legacy_pack_value(value) for key, value in val.items()}
+    return val
+
+
+def _legacy_unpack_value(val):
+    if isinstance(val, list):
+        return [_legacy_unpack_value(i) for i in val]
+    if isinstance(val, dict) and val.get('__class__'):
+        klass = _WHITELISTED_TUPLE_MAP[val.pop('__class__')]
+        val = {key: _legacy_unpack_value(value) for key, value in val.items()}
+        args_for_class = seven.get_args(klass)
+        return klass(**{k: v for k, v in val.items() if k in args_for_class})
+    if isinstance(val, dict) and val.get('__enum__'):
+        name, member = val['__enum__'].split('.')
+        return getattr(_WHITELISTED_ENUM_MAP[name], member)
+    if isinstance(val, dict):
+        return {key: _legacy_unpack_value(value) for key, value in val.items()}
+    return val
+
+
+def _payloads():
+    event_record = DagsterEventRecord(
+        None,
+        'Finished execution of step "solid_a.compute" in 12ms.',
+        'debug',
+        'Finished execution of step "solid_a.compute" in 12ms.',
+        'fa9c5a3a-0bb5-4e7b-8bb1-7d3d43d6c5c3',
+        time.time(),
+        step_key='solid_a.compute',
+        pipeline_name='benchmark_pipeline',
+        dagster_event=DagsterEvent(
+            DagsterEventType.STEP_SUCCESS.value,
+            'benchmark_pipeline',
+            step_key='solid_a.compute',
+            event_specific_data=StepSuccessData(duration_ms=12.0),
+        ),
+    )
+    pipeline_run = PipelineRun.create_empty_run(
+        'benchmark_pipeline',
+        'fa9c5a3a-0bb5-4e7b-8bb1-7d3d43d6c5c3',
+        environment_dict={
+            'solids': {
+                'solid_{i}'.format(i=i): {'config': {'path': '/tmp/{i}.csv'.format(i=i)}}
+                for i in range(20)
+            },
+            'storage': {'filesystem': {}},
+        },
+    ).run_with_status(PipelineRunStatus.STARTED)
+    return [('EventRecord', event_record), ('PipelineRun', pipeline_run)]
+
+
+def _time_roundtrips(serialize, deserialize, payload, iterations):
+    start = time.time()
+    for _ in range(iterations):
+        deserialize(serialize(payload))
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark dagster serdes round trips')
+    parser.add_argument('--iterations', type=int, default=20000)
+    args = parser.parse_args()
+
+    codecs = [
+        (
+            'legacy json',
+            lambda val: seven.json.dumps(_legacy_pack_value(val)),
+            lambda data: _legacy_unpack_value(seven.json.loads(data)),
+        ),
+        ('json', serialize_dagster_namedtuple, deserialize_json_to_dagster_namedtuple),
+    ]
+    if is_msgpack_available():
+        codecs.append(
+            (
+                'msgpack',
+                serialize_dagster_namedtuple_to_msgpack,
+                deserialize_msgpack_to_dagster_namedtuple,
+            )
+        )
+
+    for payload_name, payload in _payloads():
+        for codec_name, serialize, deserialize in codecs:
+            assert deserialize(serialize(payload)) == payload
+            elapsed = _time_roundtrips(serialize, deserialize, payload, args.iterations)
+            print(
+                '{payload} / {codec}: {rate:.0f} round trips/sec, {size} bytes'.format(
+                    payload=payload_name,
+                    codec=codec_name,
+                    rate=args.iterations / elapsed,
+                    size=len(serialize(payload)),
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -12,7 +12,10 @@ snapshots['test_basic_solids_config 1'] = {
         },
         'multiprocess': {
             'config': {
-                'max_concurrent': 0
+                'max_concurrent': 0,
+                'max_steps_per_worker': 0,
+                'max_worker_memory_growth_mb': 0,
+                'worker_pool': True
             }
         }
     },
@@ -43,6 +46,9 @@ snapshots['test_basic_solids_config 1'] = {
             }
         },
         'in_memory': {
+            'config': {
+                'release_intermediates': True
+            }
         }
     }
 }
@@ -63,7 +69,10 @@ snapshots['test_two_modes 2'] = {
         },
         'multiprocess': {
             'config': {
-                'max_concurrent': 0
+                'max_concurrent': 0,
+                'max_steps_per_worker': 0,
+                'max_worker_memory_growth_mb': 0,
+                'worker_pool': True
             }
         }
     },
@@ -94,6 +103,9 @@ snapshots['test_two_modes 2'] = {
             }
         },
         'in_memory': {
+            'config': {
+                'release_intermediates': True
+            }
         }
     }
 }
@@ -114,7 +126,10 @@ snapshots['test_two_modes 4'] = {
         },
         'multiprocess': {
             'config': {
-                'max_concurrent': 0
+                'max_concurrent': 0,
+                'max_steps_per_worker': 0,
+                'max_worker_memory_growth_mb': 0,
+                'worker_pool': True
             }
         }
     },
@@ -145,6 +160,9 @@ snapshots['test_two_modes 4'] = {
             }
         },
         'in_memory': {
+            'config': {
+                'release_intermediates': True
+            }
         }
     }
 }
@@ -1,6 +1,7 @@
 from __future__ import print_function
 
 import os
+import threading
 
 import mock
 import pytest
@@ -30,6 +31,7 @@ from dagster.cli.pipeline import (
 )
 from dagster.cli.run import run_list_command, run_wipe_command
 from dagster.cli.schedule import (
+    execute_daemon_command,
     schedule_list_command,
     schedule_restart_command,
     schedule_start_command,
@@ -815,3 +817,31 @@ def test_multiproc_invalid():
     )
     # which is invalid for multiproc
     assert 'DagsterUnmetExecutorRequirementsError' in add_result.output
+
+
+def test_schedules_daemon():
+    with seven.TemporaryDirectory() as temp_dir:
+        with mock.patch.dict(os.environ, {"DAGSTER_HOME": temp_dir}):
+            output = []
+            stop_event = threading.Event()
+            stop_event.set()
+
+            execute_daemon_command(
+                1,
+                {'repository_yaml': script_relative_path('repository_file.yaml')},
+                output.append,
+                stop_event=stop_event,
+            )
+
+            # The test repository's scheduler is not the DaemonScheduler
+            assert 'is not the DaemonScheduler' in output[0]
+            assert output[1] == 'Running schedules for repository bar. Press Ctrl+C to stop.'
+
+
+def test_schedules_daemon_bad_concurrency():
+    with seven.TemporaryDirectory() as temp_dir:
+        with mock.patch.dict(os.environ, {"DAGSTER_HOME": temp_dir}):
+            with pytest.raises(UsageError, match='--max-concurrent-runs must be at least 1'):
+                execute_daemon_command(
+                    0, {'repository_yaml': script_relative_path('repository_file.yaml')}, no_print
+                )
@@ -5,10 +5,13 @@ import pytest
 
 from dagster.core.engine.child_process_executor import (
     ChildProcessCommand,
+    ChildProcessCommandMultiplexer,
     ChildProcessCrashException,
     ChildProcessDoneEvent,
     ChildProcessException,
     ChildProcessStartEvent,
+    ChildProcessWorkerCommand,
+    ChildProcessWorkerPool,
     execute_child_process_command,
 )
 
@@ -42,6 +45,25 @@ class LongRunningCommand(ChildProcessCommand):  # pylint: disable=no-init
         yield 1
 
 
+class TimestampCommand(ChildProcessCommand):
+    def __init__(self, sleep):
+        self.sleep = sleep
+
+    def execute(self):
+        time.sleep(self.sleep)
+        yield time.time()
+        time.sleep(self.sleep)
+
+
+class PidWorkerCommand(ChildProcessWorkerCommand):  # pylint: disable=no-init
+    def execute(self, task):
+        if task == 'crash':
+            os._exit(1)  # pylint: disable=protected-access
+        if task == 'error':
+            raise AnError('Oh noes!')
+        yield (task, os.getpid())
+
+
 def test_basic_child_process_command():
     events = list(
         filter(lambda x: x, execute_child_process_command(DoubleAStringChildProcessCommand('aa')))
@@ -76,9 +98,86 @@ def test_child_process_uncaught_exception():
 
 
 def test_child_process_crashy_process():
-    with pytest.raises(ChildProcessCrashException):
+    with pytest.raises(ChildProcessCrashException) as excinfo:
         list(execute_child_process_command(CrashyCommand()))
 
+    assert excinfo.value.exit_code == 1
+
+
+def test_child_process_command_multiplexer_latency():
+    multiplexer = ChildProcessCommandMultiplexer()
+    for i in range(8):
+        multiplexer.start(i, TimestampCommand(0.5 + i * 0.01))
+
+    latencies = []
+    completed = set()
+    while multiplexer.num_running:
+        for key, event in multiplexer.poll():
+            if event is None:
+                completed.add(key)
+            else:
+                latencies.append(time.time() - event)
+    multiplexer.join()
+
+    assert completed == set(range(8))
+    assert len(latencies) == 8
+    # events don't wait behind a polling interval per child process
+    assert max(latencies) < 0.05
+
+
+def test_child_process_command_multiplexer_idle_parent():
+    start_times = os.times()
+    multiplexer = ChildProcessCommandMultiplexer()
+    for i in range(4):
+        multiplexer.start(i, LongRunningCommand())
+
+    events = []
+    while multiplexer.num_running:
+        events.extend(event for _, event in multiplexer.poll() if event is not None)
+    multiplexer.join()
+    end_times = os.times()
+
+    assert events == [1, 1, 1, 1]
+    # user + system time spent by the parent while its children sleep
+    assert (end_times[0] - start_times[0]) + (end_times[1] - start_times[1]) < 0.5
+
+
+def test_child_process_worker_pool_reuses_workers():
+    with ChildProcessWorkerPool(PidWorkerCommand(), 2) as pool:
+        events = list(pool.execute(['a', 'b', 'c', 'd']))
+        events += list(pool.execute(['e', 'f']))
+
+    assert sorted(task for task, _ in events) == ['a', 'b', 'c', 'd', 'e', 'f']
+    pids = set(pid for _, pid in events)
+    assert len(pids) <= 2
+    assert os.getpid() not in pids
+
+
+def test_child_process_worker_pool_recycles_workers():
+    with ChildProcessWorkerPool(PidWorkerCommand(), 1, max_tasks_per_worker=2) as pool:
+        events = list(pool.execute(['a', 'b', 'c', 'd']))
+
+    assert [task for task, _ in events] == ['a', 'b', 'c', 'd']
+    assert events[0][1] == events[1][1]
+    assert events[2][1] == events[3][1]
+    assert events[0][1] != events[2][1]
+
+
+def test_child_process_worker_pool_uncaught_exception():
+    with pytest.raises(ChildProcessException) as excinfo:
+        with ChildProcessWorkerPool(PidWorkerCommand(), 1) as pool:
+            list(pool.execute(['a', 'error']))
+
+    assert 'AnError' in str(excinfo.value)
+
+
+def test_child_process_worker_pool_crashy_process():
+    with pytest.raises(ChildProcessCrashException) as excinfo:
+        with ChildProcessWorkerPool(PidWorkerCommand(), 1) as pool:
+            list(pool.execute(['crash']))
+
+    assert excinfo.value.exit_code == 1
+
 
 @pytest.mark.skip('too long')
 def test_long_running_command():
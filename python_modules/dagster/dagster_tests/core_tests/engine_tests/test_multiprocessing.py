@@ -1,3 +1,7 @@
+import time
+
+import pytest
+
 from dagster import (
     DependencyDefinition,
     ExecutionTargetHandle,
@@ -40,6 +44,50 @@ def test_diamond_multi_execution():
     assert len(set(pids_by_solid.values())) == len(pipeline.solids)
 
 
+def test_diamond_multi_execution_worker_pool():
+    pipeline = ExecutionTargetHandle.for_pipeline_python_file(
+        __file__, 'define_diamond_pipeline'
+    ).build_pipeline_definition()
+    result = execute_pipeline(
+        pipeline,
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'max_concurrent': 2, 'worker_pool': True}}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+    assert result.result_for_solid('adder').output_value() == 11
+
+    pids = set(compute_event(result, solid.name).logging_tags['pid'] for solid in pipeline.solids)
+    # steps share at most max_concurrent warm worker processes
+    assert len(pids) <= 2
+
+
+def test_diamond_multi_execution_worker_pool_recycle():
+    pipeline = ExecutionTargetHandle.for_pipeline_python_file(
+        __file__, 'define_diamond_pipeline'
+    ).build_pipeline_definition()
+    result = execute_pipeline(
+        pipeline,
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {
+                'multiprocess': {
+                    'config': {'max_concurrent': 1, 'worker_pool': True, 'max_steps_per_worker': 1}
+                }
+            },
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+    assert result.result_for_solid('adder').output_value() == 11
+
+    pids = set(compute_event(result, solid.name).logging_tags['pid'] for solid in pipeline.solids)
+    # every step got a fresh worker
+    assert len(pids) == len(pipeline.solids)
+
+
 def define_diamond_pipeline():
     @lambda_solid
     def return_two():
@@ -94,6 +142,18 @@ def test_error_pipeline_multiprocess():
     assert not result.success
 
 
+def test_error_pipeline_multiprocess_worker_pool():
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_fn(define_error_pipeline).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'worker_pool': True}}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert not result.success
+
+
 def test_mem_storage_error_pipeline_multiprocess():
     result = execute_pipeline(
         ExecutionTargetHandle.for_pipeline_fn(define_diamond_pipeline).build_pipeline_definition(),
@@ -116,3 +176,118 @@ def test_invalid_instance():
     assert not result.success
     assert len(result.event_list) == 1
     assert result.event_list[0].is_failure
+
+
+def define_skewed_pipeline():
+    @lambda_solid
+    def slow():
+        time.sleep(4)
+        return 1
+
+    @lambda_solid
+    def fast_one():
+        return 1
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def fast_two(num):
+        return num + 1
+
+    @lambda_solid(input_defs=[InputDefinition('left'), InputDefinition('right')])
+    def join(left, right):
+        return left + right
+
+    return PipelineDefinition(
+        name='skewed_pipeline',
+        solid_defs=[slow, fast_one, fast_two, join],
+        dependencies={
+            'fast_two': {'num': DependencyDefinition('fast_one')},
+            'join': {
+                'left': DependencyDefinition('slow'),
+                'right': DependencyDefinition('fast_two'),
+            },
+        },
+    )
+
+
+def test_steps_start_when_dependencies_complete():
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_python_file(
+            __file__, 'define_skewed_pipeline'
+        ).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'max_concurrent': 2}}},
+        },
+        instance=DagsterInstance.local_temp(),
+    )
+    assert result.success
+    assert result.result_for_solid('join').output_value() == 3
+
+    success_order = [
+        event.step_key for event in result.event_list if event.event_type_value == 'STEP_SUCCESS'
+    ]
+    # fast_two does not wait for slow, which is in the same topological level as fast_one
+    assert success_order.index('fast_two.compute') < success_order.index('slow.compute')
+    assert success_order[-1] == 'join.compute'
+
+
+def define_failing_diamond_pipeline():
+    @lambda_solid
+    def return_two():
+        return 2
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def throw_error(num):
+        raise Exception('bad programmer {num}'.format(num=num))
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def mult_three(num):
+        return num * 3
+
+    @lambda_solid(input_defs=[InputDefinition('left'), InputDefinition('right')])
+    def adder(left, right):
+        return left + right
+
+    @lambda_solid(input_defs=[InputDefinition('num')])
+    def add_one(num):
+        return num + 1
+
+    return PipelineDefinition(
+        name='failing_diamond_pipeline',
+        solid_defs=[return_two, throw_error, mult_three, adder, add_one],
+        dependencies={
+            'throw_error': {'num': DependencyDefinition('return_two')},
+            'mult_three': {'num': DependencyDefinition('return_two')},
+            'adder': {
+                'left': DependencyDefinition('throw_error'),
+                'right': DependencyDefinition('mult_three'),
+            },
+            'add_one': {'num': DependencyDefinition('adder')},
+        },
+    )
+
+
+@pytest.mark.parametrize('worker_pool', [False, True])
+def test_failed_step_skips_downstream_multiprocess(worker_pool):
+    result = execute_pipeline(
+        ExecutionTargetHandle.for_pipeline_python_file(
+            __file__, 'define_failing_diamond_pipeline'
+        ).build_pipeline_definition(),
+        environment_dict={
+            'storage': {'filesystem': {}},
+            'execution': {'multiprocess': {'config': {'worker_pool': worker_pool}}},
+        },
+        instance=DagsterInstance.local_temp(),
+        raise_on_error=False,
+    )
+    assert not result.success
+
+    events_by_step = {}
+    for event in result.event_list:
+        if event.is_step_event:
+            events_by_step.setdefault(event.step_key, set()).add(event.event_type_value)
+
+    assert 'STEP_SUCCESS' in events_by_step['mult_three.compute']
+    assert 'STEP_FAILURE' in events_by_step['throw_error.compute']
+    assert events_by_step['adder.compute'] == {'STEP_SKIPPED'}
+    assert events_by_step['add_one.compute'] == {'STEP_SKIPPED'}
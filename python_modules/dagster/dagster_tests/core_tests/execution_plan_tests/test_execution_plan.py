@@ -2,6 +2,7 @@ import pytest
 
 from dagster.core.errors import DagsterInvalidConfigError
 from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.objects import StepOutputHandle
 
 from ..engine_tests.test_multiprocessing import define_diamond_pipeline
 
@@ -23,3 +24,59 @@ def test_create_execution_plan_with_bad_inputs():
         create_execution_plan(
             define_diamond_pipeline(), {'solids': {'add_three': {'inputs': {'num': 3}}}}
         )
+
+
+def test_consumer_counts():
+    plan = create_execution_plan(define_diamond_pipeline())
+
+    assert plan.get_consumer_counts() == {
+        StepOutputHandle('return_two.compute'): 2,
+        StepOutputHandle('add_three.compute'): 1,
+        StepOutputHandle('mult_three.compute'): 1,
+    }
+
+    assert plan.get_consumer_counts(['add_three.compute', 'adder.compute']) == {
+        StepOutputHandle('return_two.compute'): 1,
+        StepOutputHandle('add_three.compute'): 1,
+        StepOutputHandle('mult_three.compute'): 1,
+    }
+
+
+def test_topological_steps():
+    plan = create_execution_plan(define_diamond_pipeline())
+
+    assert [step.key for step in plan.topological_steps()] == [
+        'return_two.compute',
+        'add_three.compute',
+        'mult_three.compute',
+        'adder.compute',
+    ]
+
+
+def test_consumer_indexes():
+    plan = create_execution_plan(define_diamond_pipeline())
+
+    assert plan.get_step_consumers('return_two.compute') == (
+        'add_three.compute',
+        'mult_three.compute',
+    )
+    assert plan.get_step_consumers('add_three.compute') == ('adder.compute',)
+    assert plan.get_step_consumers('adder.compute') == ()
+
+    assert plan.get_output_consumers(StepOutputHandle('return_two.compute')) == (
+        ('add_three.compute', 'num'),
+        ('mult_three.compute', 'num'),
+    )
+    assert plan.get_output_consumers(StepOutputHandle('mult_three.compute')) == (
+        ('adder.compute', 'right'),
+    )
+    assert plan.get_output_consumers(StepOutputHandle('adder.compute')) == ()
+
+
+def test_critical_path_lengths():
+    plan = create_execution_plan(define_diamond_pipeline())
+
+    assert plan.get_critical_path_length('return_two.compute') == 3
+    assert plan.get_critical_path_length('add_three.compute') == 2
+    assert plan.get_critical_path_length('mult_three.compute') == 2
+    assert plan.get_critical_path_length('adder.compute') == 1
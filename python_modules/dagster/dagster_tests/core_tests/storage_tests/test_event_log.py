@@ -1,10 +1,16 @@
+import logging
 import time
+from contextlib import contextmanager
 
 import pytest
 
 from dagster import seven
+from dagster.check import CheckError
 from dagster.core.events import DagsterEvent, DagsterEventType, EngineEventData
-from dagster.core.events.log import DagsterEventRecord
+from dagster.core.events.log import DagsterEventRecord, LogMessageRecord
+from dagster.core.execution.plan.objects import StepFailureData, StepSuccessData
+from dagster.core.execution.stats import build_empty_stats, build_stats_from_events
+from dagster.core.serdes import is_msgpack_available, serialize_dagster_namedtuple
 from dagster.core.storage.event_log import (
     CREATE_EVENT_LOG_SQL,
     INSERT_EVENT_SQL,
@@ -111,14 +117,395 @@ def test_filesystem_event_log_storage_run_corrupted_bad_data():
         storage = SqliteEventLogStorage(tmpdir_path)
         with storage._connect('foo') as conn:  # pylint: disable=protected-access
             conn.cursor().execute(CREATE_EVENT_LOG_SQL)
-            conn.cursor().execute(INSERT_EVENT_SQL, ('{bar}', None, None))
+            conn.cursor().execute(INSERT_EVENT_SQL, ('{bar}', None, None, None, None))
         with pytest.raises(EventLogInvalidForRun) as exc:
             storage.get_logs_for_run('foo')
         assert exc.value.run_id == 'foo'
 
         with storage._connect('bar') as conn:  # pylint: disable=protected-access
             conn.cursor().execute(CREATE_EVENT_LOG_SQL)
-            conn.cursor().execute(INSERT_EVENT_SQL, ('3', None, None))
+            conn.cursor().execute(INSERT_EVENT_SQL, ('3', None, None, None, None))
         with pytest.raises(EventLogInvalidForRun) as exc:
             storage.get_logs_for_run('bar')
         assert exc.value.run_id == 'bar'
+
+
+def _engine_event_record(run_id, event_type=DagsterEventType.ENGINE_EVENT):
+    return DagsterEventRecord(
+        None,
+        'Message2',
+        'debug',
+        '',
+        run_id,
+        time.time(),
+        dagster_event=DagsterEvent(
+            event_type.value, 'nonce', event_specific_data=EngineEventData.in_process(999)
+        ),
+    )
+
+
+def test_buffered_event_log_storage_flushes_on_buffer_size():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path, buffer_size=3, flush_interval=60.0)
+        reader = SqliteEventLogStorage(tmpdir_path)
+
+        storage.store_event(_engine_event_record('foo'))
+        storage.store_event(_engine_event_record('foo'))
+        assert len(reader.get_logs_for_run('foo')) == 0
+
+        storage.store_event(_engine_event_record('foo'))
+        assert len(reader.get_logs_for_run('foo')) == 3
+
+
+def test_buffered_event_log_storage_reads_own_writes():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path, buffer_size=100, flush_interval=60.0)
+        storage.store_event(_engine_event_record('foo'))
+        assert len(storage.get_logs_for_run('foo')) == 1
+        storage.store_event(_engine_event_record('foo'))
+        assert len(storage.get_logs_for_run('foo', cursor=0)) == 1
+
+
+def test_buffered_event_log_storage_flushes_on_pipeline_end():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path, buffer_size=100, flush_interval=60.0)
+        reader = SqliteEventLogStorage(tmpdir_path)
+
+        storage.store_event(_engine_event_record('foo'))
+        storage.store_event(_engine_event_record('foo', DagsterEventType.PIPELINE_SUCCESS))
+        assert len(reader.get_logs_for_run('foo')) == 2
+        assert 'foo' not in storage._conns  # pylint: disable=protected-access
+
+
+def test_buffered_event_log_storage_flushes_on_interval():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path, buffer_size=100, flush_interval=0.05)
+        reader = SqliteEventLogStorage(tmpdir_path)
+
+        storage.store_event(_engine_event_record('foo'))
+        # A pending flush doesn't keep the process alive
+        assert storage._flush_timers['foo'].daemon  # pylint: disable=protected-access
+        time.sleep(0.5)
+        assert len(reader.get_logs_for_run('foo')) == 1
+
+
+def test_buffered_event_log_storage_flush_releases_connection():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path, buffer_size=1, flush_interval=60.0)
+        reader = SqliteEventLogStorage(tmpdir_path)
+
+        # Processes executing some steps of a run never see its terminal event
+        storage.store_event(_engine_event_record('foo'))
+        assert 'foo' in storage._conns  # pylint: disable=protected-access
+
+        storage.flush('foo')
+        assert 'foo' not in storage._conns  # pylint: disable=protected-access
+
+        storage.store_event(_engine_event_record('foo'))
+        storage.store_event(_engine_event_record('bar'))
+        storage.flush()
+        assert storage._conns == {}  # pylint: disable=protected-access
+        assert len(reader.get_logs_for_run('foo')) == 2
+        assert len(reader.get_logs_for_run('bar')) == 1
+
+
+def _watch_and_count_reads(storage, run_id):
+    reads = []
+    get_logs_for_run = storage.get_logs_for_run
+
+    def _counting_get_logs_for_run(*args, **kwargs):
+        reads.append(1)
+        return get_logs_for_run(*args, **kwargs)
+
+    storage.get_logs_for_run = _counting_get_logs_for_run
+    events = []
+    storage.watch(run_id, -1, events.append)
+    return reads, events
+
+
+@pytest.mark.parametrize('buffer_size', [None, 100])
+def test_filesystem_event_log_storage_watch_reads_are_bounded(buffer_size):
+    with seven.TemporaryDirectory() as tmpdir_path:
+        writer = SqliteEventLogStorage(tmpdir_path, buffer_size=buffer_size, flush_interval=60.0)
+        writer.store_event(_engine_event_record('foo'))
+        writer.flush()
+
+        watcher = SqliteEventLogStorage(tmpdir_path)
+        reads, events = _watch_and_count_reads(watcher, 'foo')
+        # The observer starts watching the directory in the background
+        time.sleep(0.5)
+
+        writer.store_event(_engine_event_record('foo'))
+        writer.flush()
+        time.sleep(2)
+
+        assert len(events) == 2
+        # Reading the log must not set off the watch again
+        assert len(reads) <= 20
+
+
+def test_filesystem_event_log_storage_end_watch():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path)
+        handlers = [storage.watch('foo', -1, lambda _event: None) for _ in range(2)]
+        bar_handler = storage.watch('bar', -1, lambda _event: None)
+
+        storage.end_watch('foo', handlers[0])
+        assert list(storage._watchers['foo']) == [handlers[1]]  # pylint: disable=protected-access
+
+        # Handlers may be removed more than once, e.g. after the run they watch has finished
+        storage.end_watch('foo', handlers[0])
+        storage.end_watch('foo', handlers[1])
+        storage.end_watch('foo', handlers[1])
+        storage.end_watch('bar', bar_handler)
+        assert storage._watchers == {}  # pylint: disable=protected-access
+
+
+def test_buffered_event_log_storage_delete_and_wipe():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path, buffer_size=100, flush_interval=60.0)
+        storage.store_event(_engine_event_record('foo'))
+        storage.store_event(_engine_event_record('bar'))
+        storage.delete_events('foo')
+        assert len(storage.get_logs_for_run('foo')) == 0
+        assert len(storage.get_logs_for_run('bar')) == 1
+
+        storage.store_event(_engine_event_record('bar'))
+        storage.wipe()
+        assert len(storage.get_logs_for_run('bar')) == 0
+
+
+@contextmanager
+def _in_memory_storage():
+    yield InMemoryEventLogStorage()
+
+
+@contextmanager
+def _sqlite_storage():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        yield SqliteEventLogStorage(tmpdir_path)
+
+
+def _step_event_record(run_id, step_key, event_type, level=logging.DEBUG):
+    event_specific_data = None
+    if event_type == DagsterEventType.STEP_SUCCESS:
+        event_specific_data = StepSuccessData(duration_ms=1.0)
+    elif event_type == DagsterEventType.STEP_FAILURE:
+        event_specific_data = StepFailureData(error=None, user_failure_data=None)
+
+    return DagsterEventRecord(
+        None,
+        'Message',
+        level,
+        '',
+        run_id,
+        time.time(),
+        step_key=step_key,
+        dagster_event=DagsterEvent(
+            event_type.value, 'nonce', step_key=step_key, event_specific_data=event_specific_data
+        ),
+    )
+
+
+def _store_filter_fixture_events(storage):
+    storage.store_event(_step_event_record('foo', None, DagsterEventType.PIPELINE_START))
+    storage.store_event(_step_event_record('foo', 'a.compute', DagsterEventType.STEP_START))
+    storage.store_event(
+        LogMessageRecord(
+            None, 'Message', logging.INFO, '', 'foo', time.time(), step_key='a.compute'
+        )
+    )
+    storage.store_event(
+        _step_event_record('foo', 'a.compute', DagsterEventType.STEP_SUCCESS, logging.INFO)
+    )
+    storage.store_event(_step_event_record('foo', 'b.compute', DagsterEventType.STEP_START))
+    storage.store_event(
+        _step_event_record('foo', 'b.compute', DagsterEventType.STEP_FAILURE, logging.ERROR)
+    )
+    storage.store_event(
+        _step_event_record('foo', None, DagsterEventType.PIPELINE_FAILURE, logging.ERROR)
+    )
+
+
+@pytest.mark.parametrize('storage_context', [_in_memory_storage, _sqlite_storage])
+def test_event_log_storage_filtered_logs(storage_context):
+    with storage_context() as storage:
+        _store_filter_fixture_events(storage)
+
+        assert len(storage.get_filtered_logs_for_run('foo')) == 7
+
+        step_a_logs = storage.get_filtered_logs_for_run('foo', step_keys=['a.compute'])
+        assert len(step_a_logs) == 3
+        assert all(event.step_key == 'a.compute' for event in step_a_logs)
+
+        failures = storage.get_filtered_logs_for_run(
+            'foo', event_types=[DagsterEventType.STEP_FAILURE]
+        )
+        assert [event.dagster_event.event_type for event in failures] == [
+            DagsterEventType.STEP_FAILURE
+        ]
+
+        assert len(storage.get_filtered_logs_for_run('foo', levels=['ERROR'])) == 2
+        assert len(storage.get_filtered_logs_for_run('foo', levels=[logging.INFO])) == 2
+
+        step_a_info = storage.get_filtered_logs_for_run(
+            'foo', step_keys=['a.compute'], levels=[logging.INFO]
+        )
+        assert len(step_a_info) == 2
+        assert not step_a_info[0].is_dagster_event
+
+        starts = storage.get_filtered_logs_for_run(
+            'foo', cursor=2, event_types=[DagsterEventType.STEP_START]
+        )
+        assert [event.step_key for event in starts] == ['b.compute']
+
+        assert storage.get_filtered_logs_for_run('foo', step_keys=['c.compute']) == []
+        assert storage.get_filtered_logs_for_run('bar', step_keys=['a.compute']) == []
+
+        stats = storage.get_stats_for_run('foo')
+        assert stats.steps_succeeded == 1
+        assert stats.steps_failed == 1
+
+
+@pytest.mark.parametrize('storage_context', [_in_memory_storage, _sqlite_storage])
+def test_event_log_storage_logs_window(storage_context):
+    def _cursors(window):
+        return [cursor for cursor, _ in window]
+
+    with storage_context() as storage:
+        _store_filter_fixture_events(storage)
+
+        window = storage.get_logs_window_for_run('foo')
+        assert _cursors(window) == list(range(7))
+        assert [event for _, event in window] == list(storage.get_logs_for_run('foo'))
+
+        assert _cursors(storage.get_logs_window_for_run('foo', limit=3)) == [0, 1, 2]
+        assert _cursors(storage.get_logs_window_for_run('foo', after_cursor=2, limit=3)) == [
+            3,
+            4,
+            5,
+        ]
+        assert _cursors(storage.get_logs_window_for_run('foo', limit=2, from_end=True)) == [5, 6]
+        assert _cursors(
+            storage.get_logs_window_for_run('foo', before_cursor=5, limit=2, from_end=True)
+        ) == [3, 4]
+        assert _cursors(
+            storage.get_logs_window_for_run('foo', after_cursor=0, before_cursor=3)
+        ) == [1, 2]
+        assert storage.get_logs_window_for_run('foo', limit=0) == []
+        assert storage.get_logs_window_for_run('foo', after_cursor=6) == []
+
+        assert _cursors(
+            storage.get_logs_window_for_run('foo', step_keys=['a.compute'], limit=2)
+        ) == [1, 2]
+        assert _cursors(
+            storage.get_logs_window_for_run('foo', step_keys=['a.compute'], limit=2, from_end=True)
+        ) == [2, 3]
+        assert _cursors(
+            storage.get_logs_window_for_run('foo', step_keys=['a.compute'], limit=4, from_end=True)
+        ) == [1, 2, 3]
+        assert _cursors(
+            storage.get_logs_window_for_run('foo', before_cursor=6, levels=['ERROR'])
+        ) == [5]
+
+        assert storage.get_logs_count_for_run('foo') == 7
+        assert storage.get_logs_count_for_run('foo', step_keys=['a.compute']) == 3
+        assert storage.get_logs_count_for_run('foo', levels=[logging.ERROR]) == 2
+        assert storage.get_logs_count_for_run('bar') == 0
+        assert storage.get_logs_window_for_run('bar', limit=5, from_end=True) == []
+
+
+@pytest.mark.parametrize('storage_context', [_in_memory_storage, _sqlite_storage])
+def test_event_log_storage_stats_for_runs(storage_context):
+    with storage_context() as storage:
+        _store_filter_fixture_events(storage)
+        storage.store_event(_step_event_record('bar', None, DagsterEventType.PIPELINE_START))
+        storage.store_event(_step_event_record('bar', 'a.compute', DagsterEventType.STEP_SUCCESS))
+
+        stats = storage.get_stats_for_runs(['foo', 'bar'])
+        assert set(stats.keys()) == {'foo', 'bar'}
+        for run_id in ['foo', 'bar']:
+            assert stats[run_id] == storage.get_stats_for_run(run_id)
+
+        assert (stats['foo'].steps_succeeded, stats['foo'].steps_failed) == (1, 1)
+        assert stats['foo'].start_time
+        assert stats['foo'].end_time
+        assert (stats['bar'].steps_succeeded, stats['bar'].steps_failed) == (1, 0)
+        assert stats['bar'].start_time
+        assert not stats['bar'].end_time
+
+        storage.delete_events('bar')
+        assert storage.get_stats_for_runs(['foo']) == {'foo': stats['foo']}
+
+
+def test_in_memory_event_log_storage_stats_are_incremental():
+    storage = InMemoryEventLogStorage()
+    assert storage.get_stats_for_run('foo') == build_empty_stats('foo')
+
+    _store_filter_fixture_events(storage)
+    stats = build_stats_from_events('foo', list(storage.get_logs_for_run('foo')))
+    # Reading stats doesn't go back over the events of the run
+    storage.get_logs_for_run = None
+    storage.get_filtered_logs_for_run = None
+    assert storage.get_stats_for_run('foo') == stats
+    assert (stats.steps_succeeded, stats.steps_failed) == (1, 1)
+
+    storage.delete_events('foo')
+    assert storage.get_stats_for_run('foo') == build_empty_stats('foo')
+
+
+def test_filesystem_event_log_storage_filtered_logs_upgrades_legacy_db():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path)
+        with storage._connect('foo') as conn:  # pylint: disable=protected-access
+            conn.cursor().execute(
+                '''CREATE TABLE event_logs (
+                    row_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    event TEXT NOT NULL,
+                    dagster_event_type TEXT,
+                    timestamp TEXT
+                )'''
+            )
+            for event in [
+                _step_event_record('foo', 'a.compute', DagsterEventType.STEP_START),
+                _step_event_record('foo', 'b.compute', DagsterEventType.STEP_START),
+            ]:
+                conn.cursor().execute(
+                    'INSERT INTO event_logs (event, dagster_event_type, timestamp) VALUES (?, ?, ?)',
+                    (
+                        serialize_dagster_namedtuple(event),
+                        event.dagster_event.event_type_value,
+                        event.timestamp,
+                    ),
+                )
+
+        assert len(storage.get_logs_for_run('foo')) == 2
+        step_b_logs = storage.get_filtered_logs_for_run('foo', step_keys=['b.compute'])
+        assert [event.step_key for event in step_b_logs] == ['b.compute']
+
+
+@pytest.mark.skipif(not is_msgpack_available(), reason='msgpack is not installed')
+def test_filesystem_event_log_storage_msgpack_encoding():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        json_storage = SqliteEventLogStorage(tmpdir_path)
+        msgpack_storage = SqliteEventLogStorage(tmpdir_path, encoding='msgpack')
+
+        json_storage.store_event(
+            _step_event_record('foo', 'a.compute', DagsterEventType.STEP_START)
+        )
+        msgpack_storage.store_event(
+            _step_event_record('foo', 'b.compute', DagsterEventType.STEP_START)
+        )
+
+        for storage in [json_storage, msgpack_storage]:
+            assert [event.step_key for event in storage.get_logs_for_run('foo')] == [
+                'a.compute',
+                'b.compute',
+            ]
+            assert len(storage.get_filtered_logs_for_run('foo', step_keys=['b.compute'])) == 1
+
+
+def test_filesystem_event_log_storage_bad_encoding():
+    with seven.TemporaryDirectory() as tmpdir_path:
+        with pytest.raises(CheckError):
+            SqliteEventLogStorage(tmpdir_path, encoding='xml')
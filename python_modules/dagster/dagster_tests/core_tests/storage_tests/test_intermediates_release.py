@@ -0,0 +1,125 @@
+import pytest
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    PipelineDefinition,
+    SolidInvocation,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.objects import StepOutputHandle
+from dagster.core.storage.intermediates_manager import (
+    InMemoryIntermediatesManager,
+    IntermediatesReferenceCounter,
+)
+
+from ..engine_tests.test_multiprocessing import define_diamond_pipeline
+
+BLOB_SIZE = 4 * 1024 * 1024
+FAN_OUT = 10
+
+
+def test_reference_counter_releases_after_last_consumer():
+    plan = create_execution_plan(define_diamond_pipeline())
+    manager = InMemoryIntermediatesManager(release_intermediates=True)
+    counter = IntermediatesReferenceCounter(manager, plan)
+
+    for step in plan.topological_steps():
+        manager.set_intermediate(None, None, StepOutputHandle(step.key), 1)
+
+    counter.step_completed(None, plan.get_step_by_key('add_three.compute'))
+    assert manager.has_intermediate(None, StepOutputHandle('return_two.compute'))
+
+    counter.step_completed(None, plan.get_step_by_key('mult_three.compute'))
+    assert not manager.has_intermediate(None, StepOutputHandle('return_two.compute'))
+    assert manager.has_intermediate(None, StepOutputHandle('add_three.compute'))
+
+    counter.step_completed(None, plan.get_step_by_key('adder.compute'))
+    assert not manager.has_intermediate(None, StepOutputHandle('add_three.compute'))
+    assert not manager.has_intermediate(None, StepOutputHandle('mult_three.compute'))
+    # nothing consumes the final output
+    assert manager.has_intermediate(None, StepOutputHandle('adder.compute'))
+
+
+def test_reference_counter_keeps_intermediates_by_default():
+    plan = create_execution_plan(define_diamond_pipeline())
+    manager = InMemoryIntermediatesManager()
+    counter = IntermediatesReferenceCounter(manager, plan)
+
+    manager.set_intermediate(None, None, StepOutputHandle('add_three.compute'), 1)
+    manager.set_intermediate(None, None, StepOutputHandle('mult_three.compute'), 1)
+    counter.step_completed(None, plan.get_step_by_key('adder.compute'))
+
+    assert manager.has_intermediate(None, StepOutputHandle('add_three.compute'))
+    assert manager.has_intermediate(None, StepOutputHandle('mult_three.compute'))
+
+
+def test_in_memory_storage_keeps_consumed_outputs_by_default():
+    result = execute_pipeline(define_diamond_pipeline())
+    assert result.success
+    # return_two is consumed by add_three and mult_three, and is still available once they ran
+    assert result.result_for_solid('return_two').output_value() == 2
+
+
+def define_wide_fan_out_pipeline():
+    @lambda_solid
+    def emit_blob():
+        return b'0' * BLOB_SIZE
+
+    @lambda_solid(input_defs=[InputDefinition('blob')])
+    def transform_blob(blob):
+        return bytes(bytearray(len(blob)))
+
+    @lambda_solid(input_defs=[InputDefinition('blob')])
+    def measure_blob(blob):
+        return len(blob)
+
+    dependencies = {SolidInvocation('emit_blob'): {}}
+    for i in range(FAN_OUT):
+        first = 'transform_{i}'.format(i=i)
+        second = 'transform_again_{i}'.format(i=i)
+        dependencies[SolidInvocation('transform_blob', alias=first)] = {
+            'blob': DependencyDefinition('emit_blob')
+        }
+        dependencies[SolidInvocation('transform_blob', alias=second)] = {
+            'blob': DependencyDefinition(first)
+        }
+        dependencies[SolidInvocation('measure_blob', alias='measure_{i}'.format(i=i))] = {
+            'blob': DependencyDefinition(second)
+        }
+
+    return PipelineDefinition(
+        name='wide_fan_out',
+        solid_defs=[emit_blob, transform_blob, measure_blob],
+        dependencies=dependencies,
+    )
+
+
+def _peak_traced_memory(environment_dict):
+    tracemalloc = pytest.importorskip('tracemalloc')
+
+    tracemalloc.start()
+    try:
+        result = execute_pipeline(define_wide_fan_out_pipeline(), environment_dict=environment_dict)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert result.success
+    for i in range(FAN_OUT):
+        assert result.result_for_solid('measure_{i}'.format(i=i)).output_value() == BLOB_SIZE
+    return peak
+
+
+def test_release_intermediates_memory_high_water_mark():
+    retained_peak = _peak_traced_memory({})
+    released_peak = _peak_traced_memory(
+        {'storage': {'in_memory': {'config': {'release_intermediates': True}}}}
+    )
+
+    # Without releasing, all 2 * FAN_OUT + 1 blobs are alive at the end of the run. Releasing
+    # them keeps at most one level of blobs plus the one being created alive.
+    assert retained_peak > 2 * FAN_OUT * BLOB_SIZE
+    assert released_peak < (FAN_OUT + 3) * BLOB_SIZE
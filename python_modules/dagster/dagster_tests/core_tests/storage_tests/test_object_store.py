@@ -0,0 +1,75 @@
+import os
+import uuid
+
+import pytest
+
+from dagster import check
+from dagster.core.storage.object_store import FilesystemObjectStore
+from dagster.core.types.marshal import PickleSerializationStrategy
+from dagster.seven import get_system_temp_directory
+
+
+def _key():
+    return os.path.join(get_system_temp_directory(), 'object_store_tests', str(uuid.uuid4()), 'obj')
+
+
+def test_file_system_object_store_open_write_open_read():
+    object_store = FilesystemObjectStore()
+    key = _key()
+
+    with object_store.open_write(key) as write_obj:
+        write_obj.write(b'0123')
+        write_obj.write(b'456789')
+
+    with object_store.open_read(key) as read_obj:
+        assert read_obj.read() == b'0123456789'
+
+    with object_store.open_read(key, byte_range=(2, 5)) as read_obj:
+        assert read_obj.read() == b'234'
+
+    with object_store.open_read(key, byte_range=(7, None)) as read_obj:
+        assert read_obj.read() == b'789'
+
+    with object_store.open_read(key, byte_range=(8, 100)) as read_obj:
+        assert read_obj.read() == b'89'
+
+    with pytest.raises(check.ParameterCheckError):
+        with object_store.open_read(key, byte_range=(5, 5)):
+            pass
+
+    object_store.rm_object(key)
+
+
+def test_file_system_object_store_open_write_failure():
+    object_store = FilesystemObjectStore()
+    key = _key()
+
+    with object_store.open_write(key) as write_obj:
+        write_obj.write(b'original')
+
+    with pytest.raises(ValueError):
+        with object_store.open_write(key) as write_obj:
+            write_obj.write(b'partial')
+            raise ValueError()
+
+    # the partially written object is discarded
+    with object_store.open_read(key) as read_obj:
+        assert read_obj.read() == b'original'
+    assert os.listdir(os.path.dirname(key)) == ['obj']
+
+    object_store.rm_object(key)
+
+
+def test_file_system_object_store_stream_serialization():
+    object_store = FilesystemObjectStore()
+    serialization_strategy = PickleSerializationStrategy()
+    key = _key()
+
+    with object_store.open_write(key) as write_obj:
+        serialization_strategy.serialize({'foo': [1, 2, 3]}, write_obj)
+
+    assert object_store.get_object(key, serialization_strategy).obj == {'foo': [1, 2, 3]}
+    with object_store.open_read(key) as read_obj:
+        assert serialization_strategy.deserialize(read_obj) == {'foo': [1, 2, 3]}
+
+    object_store.rm_object(key)
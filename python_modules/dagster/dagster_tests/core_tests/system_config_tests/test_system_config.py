@@ -107,6 +107,25 @@ def test_all_types_provided():
     assert 'Pipeline.Mode.SomeMode.Resources.SomeResource' in type_names
 
 
+def test_environment_schema_built_once_per_mode():
+    pipeline_def = PipelineDefinition(
+        name='pipeline',
+        solid_defs=[],
+        mode_defs=[ModeDefinition(name='mode_one'), ModeDefinition(name='mode_two')],
+    )
+
+    schema_one = create_environment_schema(pipeline_def, 'mode_one')
+    assert create_environment_schema(pipeline_def, 'mode_one') is schema_one
+    assert create_environment_schema(pipeline_def) is schema_one
+    assert pipeline_def.get_environment_schema('mode_one') is schema_one
+    assert create_environment_type(pipeline_def, 'mode_one') is schema_one.environment_type
+
+    schema_two = create_environment_schema(pipeline_def, 'mode_two')
+    assert schema_two is not schema_one
+    assert schema_two.environment_type.name == 'Pipeline.Mode.ModeTwo.Environment'
+    assert create_environment_schema(pipeline_def, 'mode_two') is schema_two
+
+
 def test_provided_default_on_resources_config():
     @solid(name='some_solid', input_defs=[], output_defs=[])
     def some_solid(_):
@@ -752,7 +771,7 @@ def test_storage_in_memory_config():
 
     config_value = throwing_evaluate_config_value(env_type, {'storage': {'in_memory': {}}})
 
-    assert config_value['storage'] == {'in_memory': {}}
+    assert config_value['storage'] == {'in_memory': {'config': {'release_intermediates': False}}}
 
 
 def test_directly_init_environment_config():
@@ -4,8 +4,10 @@ import uuid
 import pytest
 
 from dagster import Bool, List, Optional, String, check
+from dagster.core.execution.plan.objects import StepOutputHandle
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.intermediate_store import FilesystemIntermediateStore
+from dagster.core.storage.intermediates_manager import IntermediateStoreIntermediatesManager
 from dagster.core.storage.type_storage import TypeStoragePlugin, TypeStoragePluginRegistry
 from dagster.core.types.marshal import SerializationStrategy
 from dagster.core.types.runtime import Bool as RuntimeBool
@@ -66,6 +68,99 @@ def test_file_system_intermediate_store():
         assert intermediate_store.rm_object(context, ['dslkfhjsdflkjfs']) is None
 
 
+def test_file_system_intermediate_store_streaming():
+    run_id = str(uuid.uuid4())
+    instance = DagsterInstance.ephemeral()
+    intermediate_store = FilesystemIntermediateStore.for_instance(instance, run_id=run_id)
+
+    with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+        with intermediate_store.open_write(context, ['streamed']) as write_obj:
+            LowercaseString().serialization_strategy.serialize('foo', write_obj)
+
+        assert intermediate_store.has_object(context, ['streamed'])
+        assert intermediate_store.get_object(context, LowercaseString(), ['streamed']).obj == 'foo'
+        with intermediate_store.open_read(context, ['streamed'], byte_range=(1, 3)) as read_obj:
+            assert read_obj.read() == b'OO'
+
+
+def test_file_system_intermediate_store_has_intermediates():
+    run_id = str(uuid.uuid4())
+    instance = DagsterInstance.ephemeral()
+    intermediate_store = FilesystemIntermediateStore.for_instance(instance, run_id=run_id)
+
+    with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+        intermediate_store.set_object(
+            True, context, RuntimeBool.inst(), ['intermediates', 'foo.compute', 'result']
+        )
+        intermediate_store.set_object(
+            False, context, RuntimeBool.inst(), ['intermediates', 'bar.compute', 'other']
+        )
+
+        assert intermediate_store.has_intermediates(
+            context,
+            [
+                StepOutputHandle('foo.compute'),
+                StepOutputHandle('foo.compute', 'other'),
+                StepOutputHandle('bar.compute', 'other'),
+                StepOutputHandle('baz.compute'),
+            ],
+        ) == [True, False, True, False]
+        assert intermediate_store.has_intermediates(context, []) == []
+
+
+class CountingFilesystemIntermediateStore(FilesystemIntermediateStore):
+    def __init__(self, *args, **kwargs):
+        super(CountingFilesystemIntermediateStore, self).__init__(*args, **kwargs)
+        self.num_checks = 0
+
+    def has_object(self, context, paths):
+        self.num_checks += 1
+        return super(CountingFilesystemIntermediateStore, self).has_object(context, paths)
+
+    def has_objects(self, context, paths_list):
+        self.num_checks += 1
+        return super(CountingFilesystemIntermediateStore, self).has_objects(context, paths_list)
+
+
+def test_intermediates_manager_caches_coverage():
+    run_id = str(uuid.uuid4())
+    instance = DagsterInstance.ephemeral()
+    intermediate_store = CountingFilesystemIntermediateStore(
+        root_for_run_id=instance.intermediates_directory, run_id=run_id
+    )
+    intermediates_manager = IntermediateStoreIntermediatesManager(intermediate_store)
+
+    written = StepOutputHandle('written.compute')
+    recorded = StepOutputHandle('recorded.compute')
+    stored = StepOutputHandle('stored.compute')
+    missing = StepOutputHandle('missing.compute')
+
+    with yield_empty_pipeline_context(run_id=run_id, instance=instance) as context:
+        intermediates_manager.set_intermediate(context, RuntimeBool.inst(), written, True)
+        intermediates_manager.record_intermediate(context, recorded)
+        intermediate_store.set_object(
+            True, context, RuntimeBool.inst(), ['intermediates', 'stored.compute', 'result']
+        )
+        intermediate_store.num_checks = 0
+
+        # outputs written in this run never hit storage
+        assert intermediates_manager.has_intermediate(context, written)
+        assert intermediates_manager.has_intermediates(context, [written, recorded]) == [True, True]
+        assert intermediate_store.num_checks == 0
+
+        # everything else is checked for in a single call
+        assert intermediates_manager.has_intermediates(
+            context, [written, stored, missing, recorded]
+        ) == [True, True, False, True]
+        assert intermediate_store.num_checks == 1
+
+        # and only missing intermediates are checked for again
+        assert intermediates_manager.has_intermediate(context, stored)
+        assert intermediate_store.num_checks == 1
+        assert not intermediates_manager.has_intermediate(context, missing)
+        assert intermediate_store.num_checks == 2
+
+
 def test_file_system_intermediate_store_composite_types():
     run_id = str(uuid.uuid4())
     instance = DagsterInstance.ephemeral()
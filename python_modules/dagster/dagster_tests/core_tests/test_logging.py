@@ -5,11 +5,20 @@ from contextlib import contextmanager
 
 import pytest
 
-from dagster import ModeDefinition, check, execute_solid, pipeline, solid
+from dagster import (
+    DagsterEventType,
+    ModeDefinition,
+    check,
+    execute_pipeline,
+    execute_solid,
+    pipeline,
+    solid,
+)
 from dagster.core.definitions import SolidHandle
 from dagster.core.events import DagsterEvent
 from dagster.core.execution.context.logger import InitLoggerContext
 from dagster.core.execution.plan.objects import StepFailureData
+from dagster.core.instance import DagsterInstance
 from dagster.core.log_manager import DagsterLogManager
 from dagster.loggers import colored_console_logger, json_console_logger
 from dagster.utils.error import SerializableErrorInfo
@@ -198,3 +207,89 @@ def test_json_console_logger(capsys):
                 found_msg = True
 
     assert found_msg
+
+
+class _CapturingHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super(_CapturingHandler, self).__init__(level)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class _CountingLogManager(DagsterLogManager):
+    num_prepared = 0
+
+    def _prepare_message(self, orig_message, message_props):
+        _CountingLogManager.num_prepared += 1
+        return super(_CountingLogManager, self)._prepare_message(orig_message, message_props)
+
+
+def test_logging_below_logger_level_skips_message():
+    handler = _CapturingHandler()
+    logger = logging.Logger('test', level=logging.INFO)
+    logger.addHandler(handler)
+
+    _CountingLogManager.num_prepared = 0
+    dl = _CountingLogManager('123', {}, [logger])
+    dl.debug('test')
+    assert _CountingLogManager.num_prepared == 0
+    assert handler.records == []
+
+    dl.info('test')
+    assert _CountingLogManager.num_prepared == 1
+    assert [record.msg for record in handler.records] == ['system - 123 - test']
+
+
+def test_logging_below_handler_levels_skips_message():
+    debug_handler = _CapturingHandler()
+    warning_handler = _CapturingHandler(level=logging.WARNING)
+    debug_logger = logging.Logger('debug', level=logging.DEBUG)
+    debug_logger.addHandler(debug_handler)
+    warning_logger = logging.Logger('warning', level=logging.DEBUG)
+    warning_logger.addHandler(warning_handler)
+
+    _CountingLogManager.num_prepared = 0
+    dl = _CountingLogManager('123', {}, [warning_logger])
+    dl.info('test')
+    assert _CountingLogManager.num_prepared == 0
+
+    dl = _CountingLogManager('123', {}, [warning_logger, debug_logger])
+    dl.info('test')
+    assert _CountingLogManager.num_prepared == 1
+    assert len(debug_handler.records) == 1
+    assert warning_handler.records == []
+
+    dl.warning('test')
+    assert _CountingLogManager.num_prepared == 2
+    assert len(debug_handler.records) == 2
+    assert len(warning_handler.records) == 1
+
+
+def test_pipeline_logging_below_console_level_is_stored():
+    @solid
+    def chatty(context):
+        for i in range(10):
+            context.log.debug('Processed row {i}'.format(i=i))
+        context.log.info('Processed all rows')
+
+    @pipeline
+    def chatty_pipeline():
+        chatty()  # pylint: disable=no-value-for-parameter
+
+    instance = DagsterInstance.ephemeral()
+    result = execute_pipeline(
+        chatty_pipeline,
+        {'loggers': {'console': {'config': {'log_level': 'INFO'}}}},
+        instance=instance,
+    )
+    assert result.success
+
+    # The instance stores the messages of the run whatever the levels of its other loggers
+    logs = instance.all_logs(result.run_id)
+    assert len([log for log in logs if log.user_message.startswith('Processed row')]) == 10
+    assert [log for log in logs if log.user_message == 'Processed all rows']
+    assert DagsterEventType.STEP_SUCCESS in [
+        log.dagster_event.event_type for log in logs if log.is_dagster_event
+    ]
@@ -1,3 +1,6 @@
+import pytest
+import toposort as toposort_
+
 import dagster.check as check
 from dagster import (
     DependencyDefinition,
@@ -35,6 +38,7 @@ from dagster.core.utility_solids import (
     define_stub_solid,
     input_set,
 )
+from dagster.core.utils import toposort
 from dagster.utils.test import execute_solid_within_pipeline
 
 # protected members
@@ -164,6 +168,16 @@ def test_diamond_toposort():
     ]
 
 
+def test_toposort():
+    data = {'a': set(), 'b': {'a'}, 'c': {'a', 'c'}, 'd': {'b', 'c', 'e'}, 'f': {'d', 'a'}}
+    assert toposort(data) == [['a', 'e'], ['b', 'c'], ['d'], ['f']]
+    assert toposort(data) == [sorted(level) for level in toposort_.toposort(data)]
+    assert toposort({}) == []
+
+    with pytest.raises(toposort_.CircularDependencyError):
+        toposort({'a': {'b'}, 'b': {'c'}, 'c': {'a'}, 'd': set()})
+
+
 def compute_called(name):
     return {name: 'compute_called'}
 
@@ -1,12 +1,21 @@
+import os
+import time
 import uuid
 from contextlib import contextmanager
 
 import pytest
+import sqlalchemy as db
 
-from dagster import PipelineDefinition, seven
+from dagster import PipelineDefinition, check, seven
 from dagster.core.instance import DagsterInstance
-from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
-from dagster.core.storage.runs import InMemoryRunStorage
+from dagster.core.serdes import is_msgpack_available
+from dagster.core.storage.pipeline_run import (
+    PipelineRun,
+    PipelineRunStatus,
+    PipelineRunSummary,
+    PipelineRunsFilter,
+)
+from dagster.core.storage.runs import InMemoryRunStorage, RunStorageSQLMetadata, create_engine
 from dagster.core.storage.sqlite_run_storage import SqliteRunStorage
 
 
@@ -253,3 +262,254 @@ def test_delete(run_storage_factory_cm_fn):
         assert len(storage.all_runs()) == 1
         storage.delete_run(run_id)
         assert list(storage.all_runs()) == []
+
+
+@run_storage_test
+def test_run_summaries(run_storage_factory_cm_fn):
+    with run_storage_factory_cm_fn() as storage:
+        one, two, three, four = [str(uuid.uuid4()) for _ in range(4)]
+        storage.add_run(build_run(run_id=one, pipeline_name='some_pipeline'))
+        storage.add_run(
+            build_run(
+                run_id=two, pipeline_name='some_other_pipeline', status=PipelineRunStatus.STARTED
+            )
+        )
+        storage.add_run(
+            build_run(run_id=three, pipeline_name='some_pipeline', status=PipelineRunStatus.STARTED)
+        )
+        storage.add_run(build_run(run_id=four, pipeline_name='some_pipeline'))
+
+        summaries = storage.get_run_summaries()
+        assert summaries == [PipelineRunSummary.from_run(run) for run in storage.all_runs()]
+        assert [summary.run_id for summary in summaries] == [four, three, two, one]
+        assert summaries[1] == PipelineRunSummary(three, 'some_pipeline', PipelineRunStatus.STARTED)
+
+        assert [
+            summary.run_id for summary in storage.get_run_summaries(pipeline_name='some_pipeline')
+        ] == [four, three, one]
+        assert [
+            summary.run_id
+            for summary in storage.get_run_summaries(status=PipelineRunStatus.STARTED)
+        ] == [three, two]
+        assert [
+            summary.run_id
+            for summary in storage.get_run_summaries(
+                pipeline_name='some_pipeline', status=PipelineRunStatus.STARTED
+            )
+        ] == [three]
+
+        assert [
+            summary.run_id
+            for summary in storage.get_run_summaries(
+                pipeline_name='some_pipeline', cursor=four, limit=1
+            )
+        ] == [three]
+        assert [summary.run_id for summary in storage.get_run_summaries(cursor=two)] == [one]
+        assert storage.get_run_summaries(cursor=str(uuid.uuid4())) == []
+
+
+@run_storage_test
+def test_run_tags(run_storage_factory_cm_fn):
+    with run_storage_factory_cm_fn() as storage:
+        storage.add_run(
+            build_run(
+                run_id=str(uuid.uuid4()),
+                pipeline_name='some_pipeline',
+                tags={'mytag': 'hello', 'othertag': 'hello'},
+            )
+        )
+        storage.add_run(
+            build_run(
+                run_id=str(uuid.uuid4()), pipeline_name='some_pipeline', tags={'mytag': 'hello'}
+            )
+        )
+        storage.add_run(
+            build_run(
+                run_id=str(uuid.uuid4()), pipeline_name='some_pipeline', tags={'mytag': 'goodbye'}
+            )
+        )
+
+        tags = {key: sorted(values) for key, values in storage.get_run_tags()}
+        assert tags == {'mytag': ['goodbye', 'hello'], 'othertag': ['hello']}
+
+
+@run_storage_test
+def test_get_runs_with_filters(run_storage_factory_cm_fn):
+    with run_storage_factory_cm_fn() as storage:
+        one, two, three, four = [str(uuid.uuid4()) for _ in range(4)]
+        before = time.time()
+        storage.add_run(
+            build_run(
+                run_id=one,
+                pipeline_name='some_pipeline',
+                tags={'env': 'prod', 'team': 'data'},
+                status=PipelineRunStatus.FAILURE,
+            )
+        )
+        time.sleep(0.01)
+        middle = time.time()
+        time.sleep(0.01)
+        storage.add_run(
+            build_run(
+                run_id=two,
+                pipeline_name='some_pipeline',
+                tags={'env': 'dev'},
+                status=PipelineRunStatus.FAILURE,
+            )
+        )
+        storage.add_run(
+            build_run(
+                run_id=three,
+                pipeline_name='some_other_pipeline',
+                tags={'env': 'prod'},
+                status=PipelineRunStatus.FAILURE,
+            )
+        )
+        storage.add_run(
+            build_run(
+                run_id=four,
+                pipeline_name='some_pipeline',
+                tags={'env': 'prod'},
+                status=PipelineRunStatus.FAILURE,
+            )
+        )
+        after = time.time()
+
+        def _run_ids(filters=None, cursor=None, limit=None):
+            return [run.run_id for run in storage.get_runs(filters, cursor=cursor, limit=limit)]
+
+        assert _run_ids() == [four, three, two, one]
+        assert _run_ids(PipelineRunsFilter()) == [four, three, two, one]
+        assert _run_ids(
+            PipelineRunsFilter(
+                pipeline='some_pipeline', status=PipelineRunStatus.FAILURE, tags={'env': 'prod'}
+            )
+        ) == [four, one]
+        assert _run_ids(PipelineRunsFilter(tags={'env': 'prod', 'team': 'data'})) == [one]
+        assert _run_ids(PipelineRunsFilter(tags={'env': 'staging'})) == []
+        assert _run_ids(PipelineRunsFilter(run_id=three, tags={'env': 'prod'})) == [three]
+        assert _run_ids(PipelineRunsFilter(run_id=three, pipeline='some_pipeline')) == []
+        assert _run_ids(PipelineRunsFilter(status=PipelineRunStatus.SUCCESS)) == []
+
+        assert _run_ids(PipelineRunsFilter(created_after=middle)) == [four, three, two]
+        assert _run_ids(PipelineRunsFilter(created_before=middle)) == [one]
+        assert _run_ids(
+            PipelineRunsFilter(pipeline='some_pipeline', created_after=before, created_before=after)
+        ) == [four, two, one]
+
+        prod_runs = PipelineRunsFilter(pipeline='some_pipeline', tags={'env': 'prod'})
+        assert _run_ids(prod_runs, limit=1) == [four]
+        assert _run_ids(prod_runs, cursor=four) == [one]
+        # The cursor need not match the filters itself
+        assert _run_ids(prod_runs, cursor=two) == [one]
+        assert _run_ids(prod_runs, cursor=str(uuid.uuid4())) == []
+
+        storage.delete_run(one)
+        assert _run_ids(prod_runs) == [four]
+        assert _run_ids(PipelineRunsFilter(tags={'team': 'data'})) == []
+
+
+@run_storage_test
+def test_add_runs(run_storage_factory_cm_fn):
+    with run_storage_factory_cm_fn() as storage:
+        runs = [
+            build_run(run_id=str(uuid.uuid4()), pipeline_name='some_pipeline', tags={'batch': '1'}),
+            build_run(run_id=str(uuid.uuid4()), pipeline_name='some_pipeline'),
+            build_run(run_id=str(uuid.uuid4()), pipeline_name='some_other_pipeline'),
+        ]
+        assert storage.add_runs(runs) == runs
+        assert storage.add_runs([]) == []
+
+        assert storage.all_runs() == runs[::-1]
+        assert storage.get_runs_with_matching_tag('batch', '1') == [runs[0]]
+        assert storage.get_run_by_id(runs[1].run_id) == runs[1]
+
+
+@run_storage_test
+def test_update_run_statuses(run_storage_factory_cm_fn):
+    with run_storage_factory_cm_fn() as storage:
+        one, two, three = [str(uuid.uuid4()) for _ in range(3)]
+        storage.add_runs(
+            [
+                build_run(run_id=one, pipeline_name='some_pipeline'),
+                build_run(run_id=two, pipeline_name='some_pipeline'),
+                build_run(run_id=three, pipeline_name='some_pipeline'),
+            ]
+        )
+
+        storage.update_run_statuses(
+            {
+                one: PipelineRunStatus.STARTED,
+                two: PipelineRunStatus.FAILURE,
+                str(uuid.uuid4()): PipelineRunStatus.SUCCESS,
+            }
+        )
+
+        assert storage.get_run_by_id(one).status == PipelineRunStatus.STARTED
+        assert storage.get_run_by_id(two).status == PipelineRunStatus.FAILURE
+        assert storage.get_run_by_id(three).status == PipelineRunStatus.NOT_STARTED
+        assert [run.status for run in storage.all_runs()] == [
+            PipelineRunStatus.NOT_STARTED,
+            PipelineRunStatus.FAILURE,
+            PipelineRunStatus.STARTED,
+        ]
+        assert [run.run_id for run in storage.get_runs_with_status(PipelineRunStatus.STARTED)] == [
+            one
+        ]
+        assert [summary.status for summary in storage.get_run_summaries()] == [
+            PipelineRunStatus.NOT_STARTED,
+            PipelineRunStatus.FAILURE,
+            PipelineRunStatus.STARTED,
+        ]
+
+
+def test_sqlite_run_storage_adds_missing_indexes():
+    with seven.TemporaryDirectory() as tempdir:
+        # Tables created before the listing indexes were added
+        engine = create_engine('sqlite:///{}'.format(os.path.join(tempdir, 'runs.db')))
+        for table in RunStorageSQLMetadata.sorted_tables:
+            table.create(engine)
+            for index in table.indexes:
+                index.drop(engine)
+        assert not db.inspect(engine).get_indexes('runs')
+
+        storage = SqliteRunStorage.from_local(tempdir)
+        run_id = str(uuid.uuid4())
+        storage.add_run(build_run(run_id=run_id, pipeline_name='some_pipeline'))
+        assert [summary.run_id for summary in storage.get_run_summaries()] == [run_id]
+
+        index_names = set(index['name'] for index in db.inspect(engine).get_indexes('runs'))
+        assert {'idx_runs_pipeline_name_id', 'idx_runs_status_id'} <= index_names
+        assert [index['name'] for index in db.inspect(engine).get_indexes('run_tags')] == [
+            'idx_run_tags_key_value_run_id'
+        ]
+
+        # Creating the storage again leaves the indexes be
+        SqliteRunStorage.from_local(tempdir)
+
+
+@pytest.mark.skipif(not is_msgpack_available(), reason='msgpack is not installed')
+def test_sqlite_run_storage_msgpack_encoding():
+    with seven.TemporaryDirectory() as tempdir:
+        json_storage = SqliteRunStorage.from_local(tempdir)
+        msgpack_storage = SqliteRunStorage.from_local(tempdir, encoding='msgpack')
+
+        json_run_id = str(uuid.uuid4())
+        msgpack_run_id = str(uuid.uuid4())
+        json_storage.add_run(build_run(run_id=json_run_id, pipeline_name='some_pipeline'))
+        msgpack_storage.add_run(
+            build_run(run_id=msgpack_run_id, pipeline_name='some_pipeline', tags={'foo': 'bar'})
+        )
+        msgpack_storage.update_run_statuses({msgpack_run_id: PipelineRunStatus.SUCCESS})
+
+        for storage in [json_storage, msgpack_storage]:
+            assert [run.run_id for run in storage.all_runs()] == [msgpack_run_id, json_run_id]
+            msgpack_run = storage.get_run_by_id(msgpack_run_id)
+            assert msgpack_run.tags == {'foo': 'bar'}
+            assert msgpack_run.status == PipelineRunStatus.SUCCESS
+
+
+def test_sqlite_run_storage_bad_encoding():
+    with seven.TemporaryDirectory() as tempdir:
+        with pytest.raises(check.CheckError):
+            SqliteRunStorage.from_local(tempdir, encoding='xml')
@@ -0,0 +1,91 @@
+import os
+import uuid
+
+import mock
+
+from dagster import seven
+from dagster.core.definitions.schedule import ScheduleDefinitionData
+from dagster.core.scheduler import Schedule, ScheduleStatus
+from dagster.core.scheduler.storage import FilesystemScheduleStorage
+
+
+def build_schedule(name, status=ScheduleStatus.STOPPED):
+    return Schedule(
+        str(uuid.uuid4()), ScheduleDefinitionData(name=name, cron_schedule='* * * * *'), status
+    )
+
+
+def test_filesystem_schedule_storage():
+    with seven.TemporaryDirectory() as temp_dir:
+        storage = FilesystemScheduleStorage(temp_dir, repository_name='repo')
+        assert storage.all_schedules() == []
+
+        one = build_schedule('one')
+        two = build_schedule('two', ScheduleStatus.RUNNING)
+        storage.add_schedule(one)
+        storage.add_schedule(two)
+
+        assert storage.get_schedule_by_name('one') == one
+        assert storage.get_schedule_by_name('three') is None
+        assert storage.all_schedules() == [one, two]
+        assert storage.all_schedules(ScheduleStatus.RUNNING) == [two]
+        assert storage.all_schedules(ScheduleStatus.STOPPED) == [one]
+
+        started_one = one.with_status(ScheduleStatus.RUNNING)
+        storage.update_schedule(started_one)
+        assert storage.all_schedules(ScheduleStatus.RUNNING) == [started_one, two]
+        assert storage.all_schedules(ScheduleStatus.STOPPED) == []
+
+        storage.delete_schedule(two)
+        assert storage.all_schedules() == [started_one]
+        assert storage.all_schedules(ScheduleStatus.RUNNING) == [started_one]
+
+        # Only the schedule files are left behind by writes
+        assert os.listdir(os.path.join(temp_dir, 'repo')) == [
+            'one_{id}.json'.format(id=one.schedule_id)
+        ]
+
+        storage.wipe()
+        assert storage.all_schedules() == []
+
+
+def test_filesystem_schedule_storage_sees_other_writers():
+    with seven.TemporaryDirectory() as temp_dir:
+        storage = FilesystemScheduleStorage(temp_dir, repository_name='repo')
+        other_storage = FilesystemScheduleStorage(temp_dir, repository_name='repo')
+
+        one = build_schedule('one')
+        two = build_schedule('two')
+        other_storage.add_schedule(one)
+        other_storage.add_schedule(two)
+        assert storage.all_schedules() == [one, two]
+
+        started_two = two.with_status(ScheduleStatus.RUNNING)
+        other_storage.update_schedule(started_two)
+        assert storage.all_schedules(ScheduleStatus.RUNNING) == [started_two]
+
+        other_storage.delete_schedule(one)
+        assert storage.get_schedule_by_name('one') is None
+        assert storage.all_schedules() == [started_two]
+
+
+def test_filesystem_schedule_storage_only_reads_changed_files():
+    with seven.TemporaryDirectory() as temp_dir:
+        other_storage = FilesystemScheduleStorage(temp_dir, repository_name='repo')
+        for i in range(10):
+            other_storage.add_schedule(build_schedule('schedule_{i}'.format(i=i)))
+
+        storage = FilesystemScheduleStorage(temp_dir, repository_name='repo')
+        assert len(storage.all_schedules()) == 10
+
+        with mock.patch.object(
+            storage, '_read_schedule_file', wraps=storage._read_schedule_file
+        ) as read_schedule_file:
+            assert len(storage.all_schedules()) == 10
+            assert read_schedule_file.call_count == 0
+
+            schedule = other_storage.get_schedule_by_name('schedule_3')
+            other_storage.update_schedule(schedule.with_status(ScheduleStatus.RUNNING))
+
+            assert [s.name for s in storage.all_schedules(ScheduleStatus.RUNNING)] == ['schedule_3']
+            assert read_schedule_file.call_count == 1
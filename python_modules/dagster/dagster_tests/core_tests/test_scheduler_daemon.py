@@ -0,0 +1,203 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+
+from dagster import (
+    ExecutionTargetHandle,
+    RepositoryDefinition,
+    ScheduleDefinition,
+    pipeline,
+    seven,
+    solid,
+)
+from dagster.core.instance import DagsterInstance
+from dagster.core.scheduler import ScheduleStatus, SchedulerHandle
+from dagster.core.scheduler.daemon import DaemonScheduler, SchedulerDaemon
+from dagster.core.storage.pipeline_run import PipelineRunStatus
+
+
+@solid
+def do_something(context):
+    context.log.info('Executing in process {pid}'.format(pid=os.getpid()))
+    return 1
+
+
+@pipeline
+def scheduled_pipeline():
+    do_something()
+
+
+def define_repository():
+    return RepositoryDefinition(name='scheduled_repo', pipeline_defs=[scheduled_pipeline])
+
+
+def define_schedule_defs():
+    return [
+        ScheduleDefinition(
+            'every_minute',
+            cron_schedule='* * * * *',
+            pipeline_name='scheduled_pipeline',
+            tags=[{'key': 'team', 'value': 'data'}],
+        ),
+        ScheduleDefinition(
+            'new_year', cron_schedule='0 0 1 1 *', pipeline_name='scheduled_pipeline'
+        ),
+        ScheduleDefinition(
+            'blocked',
+            cron_schedule='* * * * *',
+            pipeline_name='scheduled_pipeline',
+            should_execute=lambda: False,
+        ),
+    ]
+
+
+def _runs_for_schedule(instance, schedule_name):
+    return instance.get_runs_with_matching_tag('dagster/schedule_name', schedule_name)
+
+
+def test_scheduler_daemon_tick():
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        repository = define_repository()
+        handle = ExecutionTargetHandle.for_repo_fn(define_repository)
+        artifacts_dir = instance.schedules_directory()
+
+        scheduler_handle = SchedulerHandle(
+            DaemonScheduler, define_schedule_defs(), artifacts_dir, repository.name
+        )
+        scheduler_handle.up(python_path=None, repository_path=None)
+        scheduler = scheduler_handle.get_scheduler()
+        for schedule in scheduler.all_schedules():
+            scheduler.start_schedule(schedule.name)
+
+        daemon = SchedulerDaemon(instance, handle, scheduler_handle, artifacts_dir)
+        next_minute = (time.time() // 60 + 1) * 60
+
+        # Nothing is due before the next minute
+        assert daemon.tick(now=next_minute - 1) == []
+
+        launched = daemon.tick(now=next_minute + 1)
+        assert sorted(schedule.name for schedule in launched) == ['blocked', 'every_minute']
+
+        # Ticking again within the minute launches nothing more
+        assert daemon.tick(now=next_minute + 30) == []
+        daemon.shutdown()
+
+        runs = _runs_for_schedule(instance, 'every_minute')
+        assert len(runs) == 1
+        assert runs[0].status == PipelineRunStatus.SUCCESS
+        assert runs[0].tags['team'] == 'data'
+        assert (
+            runs[0].tags['dagster/schedule_id']
+            == scheduler.get_schedule_by_name('every_minute').schedule_id
+        )
+
+        # Runs execute in child processes, rather than sharing the stdout and stderr of the daemon
+        messages = [log.user_message for log in instance.all_logs(runs[0].run_id)]
+        assert 'Executing in process {pid}'.format(pid=os.getpid()) not in messages
+        assert [message for message in messages if message.startswith('Executing in process')]
+
+        assert _runs_for_schedule(instance, 'blocked') == []
+        with open(scheduler.log_path_for_schedule('blocked')) as f:
+            assert 'should_execute did not return True' in f.read()
+
+        # A stopped schedule is no longer launched, even when it was due
+        scheduler.stop_schedule('blocked')
+        launched = daemon.tick(now=next_minute + 61)
+        assert [schedule.name for schedule in launched] == ['every_minute']
+        daemon.shutdown()
+
+        assert len(_runs_for_schedule(instance, 'every_minute')) == 2
+        assert scheduler.get_schedule_by_name('blocked').status == ScheduleStatus.STOPPED
+
+
+def test_scheduler_daemon_launches_missed_ticks_once():
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        repository = define_repository()
+        handle = ExecutionTargetHandle.for_repo_fn(define_repository)
+        artifacts_dir = instance.schedules_directory()
+
+        scheduler_handle = SchedulerHandle(
+            DaemonScheduler, define_schedule_defs(), artifacts_dir, repository.name
+        )
+        scheduler_handle.up(python_path=None, repository_path=None)
+        scheduler_handle.get_scheduler().start_schedule('every_minute')
+
+        daemon = SchedulerDaemon(
+            instance, handle, scheduler_handle, artifacts_dir, max_concurrent_runs=1
+        )
+        launched = daemon.tick(now=time.time() + 10 * 60)
+        assert [schedule.name for schedule in launched] == ['every_minute']
+        daemon.shutdown()
+
+        assert len(_runs_for_schedule(instance, 'every_minute')) == 1
+
+
+@contextmanager
+def _local_timezone(tz):
+    old_tz = os.environ.get('TZ')
+    os.environ['TZ'] = tz
+    time.tzset()
+    try:
+        yield
+    finally:
+        if old_tz is None:
+            del os.environ['TZ']
+        else:
+            os.environ['TZ'] = old_tz
+        time.tzset()
+
+
+@pytest.mark.skipif(not hasattr(time, 'tzset'), reason='Requires time.tzset')
+def test_scheduler_daemon_uses_local_time():
+    # Five hours behind UTC, without daylight saving time
+    with _local_timezone('Etc/GMT+5'), seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        repository = define_repository()
+        handle = ExecutionTargetHandle.for_repo_fn(define_repository)
+        artifacts_dir = instance.schedules_directory()
+
+        scheduler_handle = SchedulerHandle(
+            DaemonScheduler,
+            [
+                ScheduleDefinition(
+                    'nine_am', cron_schedule='0 9 * * *', pipeline_name='scheduled_pipeline'
+                )
+            ],
+            artifacts_dir,
+            repository.name,
+        )
+        scheduler_handle.up(python_path=None, repository_path=None)
+        scheduler_handle.get_scheduler().start_schedule('nine_am')
+
+        daemon = SchedulerDaemon(instance, handle, scheduler_handle, artifacts_dir)
+
+        # The next 09:00 in local time
+        nine_am = datetime.now().replace(hour=9, minute=0, second=0, microsecond=0)
+        if nine_am <= datetime.now():
+            nine_am += timedelta(days=1)
+        nine_am = time.mktime(nine_am.timetuple())
+
+        assert daemon.tick(now=nine_am - 1) == []
+        assert [schedule.name for schedule in daemon.tick(now=nine_am + 1)] == ['nine_am']
+        daemon.shutdown()
+
+
+def test_scheduler_daemon_run_stops():
+    with seven.TemporaryDirectory() as temp_dir:
+        instance = DagsterInstance.local_temp(temp_dir)
+        repository = define_repository()
+        handle = ExecutionTargetHandle.for_repo_fn(define_repository)
+        artifacts_dir = instance.schedules_directory()
+        scheduler_handle = SchedulerHandle(
+            DaemonScheduler, define_schedule_defs(), artifacts_dir, repository.name
+        )
+
+        stop_event = threading.Event()
+        stop_event.set()
+        SchedulerDaemon(instance, handle, scheduler_handle, artifacts_dir).run(stop_event)
@@ -1,16 +1,21 @@
 import sys
-from collections import namedtuple
+from collections import OrderedDict, namedtuple
 from enum import Enum
 
 import pytest
 
+from dagster.check import CheckError
 from dagster.core.serdes import (
     _deserialize_json_to_dagster_namedtuple,
     _pack_value,
     _serialize_dagster_namedtuple,
     _unpack_value,
     _whitelist_for_serdes,
+    deserialize_msgpack_to_dagster_namedtuple,
+    is_msgpack_available,
+    serialize_dagster_namedtuple_to_msgpack,
 )
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
 
 
 def test_forward_compat_serdes_new_field_with_default():
@@ -113,3 +118,67 @@ def test_backward_compat_serdes():
     assert deserialized.foo == quux.foo
     assert deserialized.bar == quux.bar
     assert not hasattr(deserialized, 'baz')
+
+
+def test_pack_value_enum_subclassing_primitive():
+    _TEST_TUPLE_MAP = {}
+    _TEST_ENUM_MAP = {}
+
+    @_whitelist_for_serdes(tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP)
+    class Grault(str, Enum):
+        FOO = 'foo'
+
+    packed = _pack_value(Grault.FOO, tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP)
+    assert packed == {'__enum__': 'Grault.FOO'}
+    assert _unpack_value(packed, tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP) is Grault.FOO
+
+
+def test_pack_value_not_whitelisted():
+    with pytest.raises(CheckError):
+        _pack_value(('foo', 'bar'), tuple_map={}, enum_map={})
+
+
+def test_pack_value_whitelisted_elsewhere():
+    _TEST_TUPLE_MAP = {}
+    _TEST_ENUM_MAP = {}
+
+    @_whitelist_for_serdes(tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP)
+    class Garply(namedtuple('_Garply', 'foo')):
+        pass
+
+    @_whitelist_for_serdes(tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP)
+    class Waldo(Enum):
+        FOO = 1
+
+    # The packers compiled when whitelisting still check the maps they are used with
+    with pytest.raises(CheckError):
+        _pack_value(Garply('bar'), tuple_map={}, enum_map=_TEST_ENUM_MAP)
+    with pytest.raises(CheckError):
+        _pack_value(Waldo.FOO, tuple_map=_TEST_TUPLE_MAP, enum_map={})
+
+
+def test_pack_value_container_subclasses():
+    _TEST_TUPLE_MAP = {}
+    _TEST_ENUM_MAP = {}
+
+    @_whitelist_for_serdes(tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP)
+    class Fred(namedtuple('_Fred', 'foo')):
+        pass
+
+    packed = _pack_value(
+        OrderedDict([('a', [Fred(1)])]), tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP
+    )
+    assert packed == {'a': [{'__class__': 'Fred', 'foo': 1}]}
+    assert _unpack_value(packed, tuple_map=_TEST_TUPLE_MAP, enum_map=_TEST_ENUM_MAP) == {
+        'a': [Fred(1)]
+    }
+
+
+@pytest.mark.skipif(not is_msgpack_available(), reason='msgpack is not installed')
+def test_msgpack_roundtrip():
+    run = PipelineRun.create_empty_run('foo', 'bar', environment_dict={'solids': {'baz': [1, 2]}})
+    run = run.run_with_status(PipelineRunStatus.SUCCESS)
+
+    serialized = serialize_dagster_namedtuple_to_msgpack(run)
+    assert isinstance(serialized, bytes)
+    assert deserialize_msgpack_to_dagster_namedtuple(serialized) == run
@@ -1,5 +1,6 @@
 import os
 import sys
+import time
 
 import pytest
 
@@ -7,6 +8,7 @@ from dagster import DagsterEventType, execute_pipeline, lambda_solid, pipeline
 from dagster.core.execution.compute_logs import should_disable_io_stream_redirect
 from dagster.core.instance import DagsterInstance
 from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.utils import touch_file
 
 
 @lambda_solid
@@ -76,3 +78,37 @@ def test_stdout_subscriptions():
     assert len(stderr) == 1
     assert stderr[0].cursor == len(stderr[0].data)
     assert stderr[0].cursor > 400
+
+
+def test_stdout_subscriptions_are_notified_of_live_output():
+    instance = DagsterInstance.local_temp()
+    manager = instance.compute_log_manager
+    run_id = 'live_run'
+    step_key = 'spew.compute'
+
+    stdout = []
+    completed = []
+    manager.observable(run_id, step_key, ComputeIOType.STDOUT).subscribe(
+        stdout.append, on_completed=lambda: completed.append(True)
+    )
+
+    def wait_for(condition, timeout=1.0):
+        # Well within the 2.5s it took to poll for changes
+        start = time.time()
+        while not condition() and time.time() - start < timeout:
+            time.sleep(0.01)
+        return condition()
+
+    with open(manager.get_local_path(run_id, step_key, ComputeIOType.STDOUT), 'a') as f:
+        f.write(HELLO_WORLD)
+        f.flush()
+        assert wait_for(lambda: stdout and stdout[-1].cursor == len(HELLO_WORLD))
+        assert ''.join(update.data or '' for update in stdout) == HELLO_WORLD
+
+        f.write(HELLO_WORLD)
+        f.flush()
+        assert wait_for(lambda: stdout[-1].cursor == 2 * len(HELLO_WORLD))
+        assert ''.join(update.data or '' for update in stdout) == HELLO_WORLD * 2
+
+    touch_file(manager.complete_artifact_path(run_id, step_key))
+    assert wait_for(lambda: completed)
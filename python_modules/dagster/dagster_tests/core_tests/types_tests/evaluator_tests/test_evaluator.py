@@ -1,5 +1,11 @@
-from dagster import Any, Bool, Dict, Field, Int, List, Optional, String
+import gc
+import weakref
+
+import mock
+
+from dagster import Any, Bool, Dict, Enum, EnumValue, Field, Int, List, Optional, String
 from dagster.core.types import Selector
+from dagster.core.types.config import ConfigScalar
 from dagster.core.types.evaluator import evaluate_config
 from dagster.core.types.evaluator.errors import DagsterEvaluationErrorReason
 from dagster.core.types.evaluator.evaluate_value_result import EvaluateValueResult
@@ -535,3 +541,53 @@ def test_any_with_default_value():
     result = eval_config_value_from_dagster_type(dict_with_any, None)
     assert result.success
     assert result.value == {'any_field': 'foo'}
+
+
+def test_valid_config_skips_traversal():
+    config_type = resolve_to_config_type(
+        Dict(
+            {
+                'int_list': Field(List[Int]),
+                'selector': Field(Selector({'a': Field(String), 'b': Field(Int)})),
+                'nullable': Field(Optional[Int], is_optional=True),
+                'defaulted': Field(String, is_optional=True, default_value='default'),
+            }
+        )
+    )
+    value = {'int_list': [1, 2], 'selector': {'b': 3}, 'nullable': None}
+    expected = dict(value, defaulted='default')
+
+    with mock.patch('dagster.core.types.evaluator.evaluation._evaluate_config') as traversal:
+        assert_success(evaluate_config(config_type, value), expected)
+        assert_success(evaluate_config(config_type, value), expected)
+        assert traversal.call_count == 0
+
+    # Invalid config still gets the errors of the traversal
+    result = evaluate_config(config_type, {'int_list': [1, 'two'], 'selector': {'b': 3}})
+    assert not result.success
+    assert len(result.errors) == 1
+    assert result.errors[0].reason == DagsterEvaluationErrorReason.RUNTIME_TYPE_MISMATCH
+    assert [entry.field_name for entry in result.errors[0].stack.entries[:1]] == ['int_list']
+    assert isinstance(result.errors[0].stack.entries[1], EvaluationStackListItemEntry)
+
+
+def test_compiled_evaluators_do_not_keep_config_types_alive():
+    class Even(ConfigScalar):
+        def __init__(self):
+            super(Even, self).__init__(key='Even', name='Even')
+
+        def is_config_scalar_valid(self, config_value):
+            return isinstance(config_value, int) and config_value % 2 == 0
+
+    even = Even()
+    assert_success(evaluate_config(even, 2), 2)
+    assert not evaluate_config(even, 3).success
+
+    color = Enum('Color', [EnumValue('RED', python_value=1)])()
+    assert_success(evaluate_config(color, 'RED'), 1)
+    assert not evaluate_config(color, 'BLUE').success
+
+    config_type_refs = [weakref.ref(even), weakref.ref(color)]
+    del even, color
+    gc.collect()
+    assert [config_type_ref() for config_type_ref in config_type_refs] == [None, None]
@@ -1,4 +1,8 @@
-from dagster.core.types.marshal import PickleSerializationStrategy
+from io import BytesIO
+
+import pytest
+
+from dagster.core.types.marshal import NumpySerializationStrategy, PickleSerializationStrategy
 from dagster.utils import safe_tempfile_path
 
 
@@ -7,3 +11,25 @@ def test_serialization_strategy():
     with safe_tempfile_path() as tempfile_path:
         serialization_strategy.serialize_to_file('foo', tempfile_path)
         assert serialization_strategy.deserialize_from_file(tempfile_path) == 'foo'
+
+
+def test_numpy_serialization_strategy():
+    np = pytest.importorskip('numpy')
+
+    serialization_strategy = NumpySerializationStrategy()
+    assert serialization_strategy.name == 'npy'
+
+    array = np.arange(12, dtype='float64').reshape(3, 4)
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(array, tempfile_path)
+        value = serialization_strategy.deserialize_from_file(tempfile_path)
+
+        assert isinstance(value, np.memmap)
+        assert not value.flags.writeable
+        assert np.array_equal(value, array)
+        del value
+
+    bytes_io = BytesIO()
+    serialization_strategy.serialize(array, bytes_io)
+    bytes_io.seek(0)
+    assert np.array_equal(serialization_strategy.deserialize(bytes_io), array)
@@ -1,14 +1,22 @@
 import typing
 
+import mock
 import pytest
 
 from dagster import (
     DagsterTypeCheckError,
+    Failure,
     InputDefinition,
+    Int,
+    List,
+    Optional,
     OutputDefinition,
+    RunConfig,
+    TypeCheckPolicy,
     execute_solid,
     lambda_solid,
 )
+from dagster.core.types.runtime import resolve_to_runtime_type
 
 
 def test_basic_list_output_pass():
@@ -151,3 +159,55 @@ def test_typing_list_of_list_of_int_input_fail():
 
     with pytest.raises(DagsterTypeCheckError):
         execute_solid(ingest_list, input_values={'alist': [[1, 2], [3, '4']]})
+
+
+def test_list_type_check_policies():
+    int_list = resolve_to_runtime_type(List[Int])
+    good = list(range(100))
+    bad = good + ['not an int']
+
+    for policy in [
+        TypeCheckPolicy.full(),
+        TypeCheckPolicy.sampled(10),
+        TypeCheckPolicy.vectorized(),
+    ]:
+        assert int_list.type_check_with_policy(good, policy) is None
+        with pytest.raises(Failure):
+            int_list.type_check_with_policy('not a list', policy)
+
+    with pytest.raises(Failure):
+        int_list.type_check_with_policy(bad, TypeCheckPolicy.full())
+    with pytest.raises(Failure):
+        int_list.type_check_with_policy(bad, TypeCheckPolicy.vectorized())
+    with pytest.raises(Failure):
+        int_list.type_check_with_policy([[1]], TypeCheckPolicy.vectorized())
+
+    # Short enough lists are checked in full
+    with pytest.raises(Failure):
+        int_list.type_check_with_policy(bad, TypeCheckPolicy.sampled(len(bad)))
+
+    # Larger lists only have a sample checked
+    with mock.patch('random.sample', return_value=good[:10]):
+        assert int_list.type_check_with_policy(bad, TypeCheckPolicy.sampled(10)) is None
+
+    nested = resolve_to_runtime_type(List[Optional[List[Int]]])
+    assert nested.type_check_with_policy([None, good], TypeCheckPolicy.vectorized()) is None
+    with pytest.raises(Failure):
+        nested.type_check_with_policy([None, bad], TypeCheckPolicy.vectorized())
+
+
+def test_type_check_policy_of_run():
+    @lambda_solid(output_def=OutputDefinition(List[Int]))
+    def emit_list():
+        return list(range(100)) + ['not an int']
+
+    with pytest.raises(DagsterTypeCheckError):
+        execute_solid(emit_list, run_config=RunConfig(type_check_policy=TypeCheckPolicy.full()))
+
+    with mock.patch('random.sample', return_value=list(range(10))):
+        assert (
+            execute_solid(
+                emit_list, run_config=RunConfig(type_check_policy=TypeCheckPolicy.sampled(10))
+            ).output_value()[-1]
+            == 'not an int'
+        )
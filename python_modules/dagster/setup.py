@@ -79,6 +79,8 @@ def _do_setup(name='dagster'):
         tests_require=['mock'],
         extras_require={
             'aws': ['boto3>=1.9.117'],
+            'msgpack': ['msgpack>=0.6.1'],
+            'scheduler': ['croniter>=0.3.30'],
             ':python_version>"3"': ['reloader>=0.6'],
             ':python_version<"3"': ['backports.tempfile'],
         },
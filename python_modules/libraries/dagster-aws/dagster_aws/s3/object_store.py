@@ -1,17 +1,349 @@
+import bisect
+import io
 import logging
-from io import BytesIO
+import os
+import posixpath
+import sys
+import threading
+from collections import deque
+from contextlib import contextmanager
 
 import boto3
+import six
+from botocore.exceptions import ClientError
+from six.moves import queue
 
 from dagster import check
 from dagster.core.definitions.events import ObjectStoreOperation, ObjectStoreOperationType
-from dagster.core.storage.object_store import ObjectStore
+from dagster.core.storage.object_store import ObjectStore, check_byte_range
 from dagster.core.types.marshal import SerializationStrategy
 
+# S3 requires every part of a multipart upload but the last to be at least 5MB
+MIN_PART_SIZE = 5 * 1024 * 1024
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+class S3ObjectWriter(io.RawIOBase):
+    '''A writable binary file-like object streaming its content to an S3 key.
+
+    Content is buffered until part_size bytes are available, which are then uploaded as a part of a
+    multipart upload by one of max_concurrency worker threads. Writes block while every worker is
+    busy and max_concurrency more parts are waiting, so no more than 2 * max_concurrency + 1 parts
+    are held in memory. Objects smaller than a single part are uploaded with a single request. The
+    object only appears in S3 once the writer is closed; call abort instead to discard what was
+    written.
+    '''
+
+    def __init__(
+        self, s3, bucket, key, part_size=DEFAULT_PART_SIZE, max_concurrency=DEFAULT_MAX_CONCURRENCY
+    ):
+        super(S3ObjectWriter, self).__init__()
+        self._s3 = s3
+        self._bucket = check.str_param(bucket, 'bucket')
+        self._key = check.str_param(key, 'key')
+        self._part_size = check.int_param(part_size, 'part_size')
+        check.param_invariant(part_size >= MIN_PART_SIZE, 'part_size')
+        self._max_concurrency = check.int_param(max_concurrency, 'max_concurrency')
+        check.param_invariant(max_concurrency > 0, 'max_concurrency')
+
+        self._buffer = bytearray()
+        self._position = 0
+        self._upload_id = None
+        self._num_parts = 0
+
+        # The ETag of each uploaded part by part number, filled in by the workers
+        self._etags = {}
+        self._parts_queue = None
+        self._workers = []
+        self._upload_error = None
+        self._discarding = False
+
+    def writable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def write(self, b):
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+
+        buffered = len(self._buffer)
+        self._buffer.extend(b)
+        written = len(self._buffer) - buffered
+        self._position += written
+
+        while len(self._buffer) >= self._part_size:
+            self._upload_part(bytes(self._buffer[: self._part_size]))
+            del self._buffer[: self._part_size]
+
+        return written
+
+    def _upload_part(self, data):
+        if self._upload_id is None:
+            self._upload_id = self._s3.create_multipart_upload(Bucket=self._bucket, Key=self._key)[
+                'UploadId'
+            ]
+            self._start_workers()
+
+        self._raise_upload_error()
+        self._num_parts += 1
+        self._parts_queue.put((self._num_parts, data))
+
+    def _start_workers(self):
+        self._parts_queue = queue.Queue(maxsize=self._max_concurrency)
+        self._workers = [
+            threading.Thread(target=self._work, name='dagster-s3-upload-{}'.format(i))
+            for i in range(self._max_concurrency)
+        ]
+        for worker in self._workers:
+            worker.daemon = True
+            worker.start()
+
+    def _work(self):
+        while True:
+            item = self._parts_queue.get()
+            if item is None:
+                return
+
+            # Keep taking parts off the queue after a failure so that writes don't block forever
+            if self._upload_error is not None or self._discarding:
+                continue
+
+            part_number, data = item
+            try:
+                response = self._s3.upload_part(
+                    Bucket=self._bucket,
+                    Key=self._key,
+                    UploadId=self._upload_id,
+                    PartNumber=part_number,
+                    Body=data,
+                )
+                self._etags[part_number] = response['ETag']
+            except Exception:  # pylint: disable=broad-except
+                self._upload_error = sys.exc_info()
+
+    def _join_workers(self):
+        '''Waits for the workers to upload the parts that were queued, then stops them.'''
+        for _ in self._workers:
+            self._parts_queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._workers = []
+
+    def _raise_upload_error(self):
+        if self._upload_error is not None:
+            six.reraise(*self._upload_error)
+
+    def close(self):
+        if self.closed:
+            return
+
+        try:
+            if self._upload_id is None:
+                self._s3.put_object(Bucket=self._bucket, Key=self._key, Body=bytes(self._buffer))
+            else:
+                if self._buffer:
+                    self._upload_part(bytes(self._buffer))
+                self._join_workers()
+                self._raise_upload_error()
+                self._s3.complete_multipart_upload(
+                    Bucket=self._bucket,
+                    Key=self._key,
+                    UploadId=self._upload_id,
+                    MultipartUpload={
+                        'Parts': [
+                            {'ETag': self._etags[part_number], 'PartNumber': part_number}
+                            for part_number in range(1, self._num_parts + 1)
+                        ]
+                    },
+                )
+                self._upload_id = None
+        finally:
+            # Discards the upload if it couldn't be completed
+            self.abort()
+
+    def abort(self):
+        '''Discards the content written so far, without creating the object.'''
+        # Parts still uploading when the upload is aborted could be left behind, so wait for them
+        self._discarding = True
+        self._join_workers()
+
+        if self._upload_id is not None:
+            upload_id, self._upload_id = self._upload_id, None
+            self._s3.abort_multipart_upload(Bucket=self._bucket, Key=self._key, UploadId=upload_id)
+
+        self._buffer = bytearray()
+        super(S3ObjectWriter, self).close()
+
+
+class _RangeDownload(threading.Thread):
+    '''Downloads a byte range of an S3 key in the background.'''
+
+    def __init__(self, download_fn):
+        super(_RangeDownload, self).__init__(name='dagster-s3-download')
+        self.daemon = True
+        self._download_fn = download_fn
+        self._data = None
+        self._error = None
+
+    def run(self):
+        try:
+            self._data = self._download_fn()
+        except Exception:  # pylint: disable=broad-except
+            self._error = sys.exc_info()
+
+    def result(self):
+        '''Waits for the download to finish, returning the bytes downloaded.'''
+        self.join()
+        if self._error is not None:
+            six.reraise(*self._error)
+        return self._data
+
+
+class S3ObjectReader(io.RawIOBase):
+    '''A seekable, readable binary file-like object downloading an S3 key with ranged GETs.
+
+    The key is downloaded in ranges of part_size bytes, up to max_concurrency of them concurrently
+    ahead of the position being read, so no more than max_concurrency + 1 ranges are held in
+    memory. The first range is downloaded when the reader is created, which tells the size of the
+    object. Seeking outside of the range being read starts downloading from the new position.
+    '''
+
+    def __init__(
+        self, s3, bucket, key, part_size=DEFAULT_PART_SIZE, max_concurrency=DEFAULT_MAX_CONCURRENCY
+    ):
+        super(S3ObjectReader, self).__init__()
+        self._s3 = s3
+        self._bucket = check.str_param(bucket, 'bucket')
+        self._key = check.str_param(key, 'key')
+        self._part_size = check.int_param(part_size, 'part_size')
+        check.param_invariant(part_size > 0, 'part_size')
+        self._max_concurrency = check.int_param(max_concurrency, 'max_concurrency')
+        check.param_invariant(max_concurrency > 0, 'max_concurrency')
+
+        self._size, data = self._get_range(0)
+        self._chunk = memoryview(data)
+        self._chunk_start = 0
+        self._position = 0
+        self._next_start = len(data)
+        # (start, _RangeDownload) for each range downloading ahead of the chunk, in order
+        self._downloads = deque()
+        self._schedule_downloads()
+
+    @property
+    def size(self):
+        return self._size
+
+    def _get_range(self, start):
+        '''Returns the size of the object, and the bytes of the range starting at start.'''
+        try:
+            response = self._s3.get_object(
+                Bucket=self._bucket,
+                Key=self._key,
+                Range='bytes={start}-{last}'.format(start=start, last=start + self._part_size - 1),
+            )
+        except ClientError as e:
+            # S3 refuses any range of an empty object
+            if start == 0 and e.response.get('Error', {}).get('Code') == 'InvalidRange':
+                return 0, b''
+            raise
+
+        size = int(response['ContentRange'].rsplit('/', 1)[1])
+        return size, response['Body'].read()
+
+    def _schedule_downloads(self):
+        while len(self._downloads) < self._max_concurrency and self._next_start < self._size:
+            start = self._next_start
+            download = _RangeDownload(lambda start=start: self._get_range(start)[1])
+            download.start()
+            self._downloads.append((start, download))
+            self._next_start += self._part_size
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError('Invalid whence ({whence})'.format(whence=whence))
+
+        if position < 0:
+            raise ValueError('Negative seek position {position}'.format(position=position))
+
+        self._position = position
+        if not self._chunk_start <= position <= self._chunk_start + len(self._chunk):
+            # Ranges already downloading are dropped, and finish in the background
+            self._chunk = memoryview(b'')
+            self._chunk_start = position
+            self._next_start = position
+            self._downloads = deque()
+            self._schedule_downloads()
+
+        return position
+
+    def readinto(self, b):
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+
+        while self._position >= self._chunk_start + len(self._chunk):
+            if not self._downloads:
+                return 0
+
+            self._chunk_start, download = self._downloads.popleft()
+            self._chunk = memoryview(download.result())
+            self._schedule_downloads()
+
+        offset = self._position - self._chunk_start
+        num_bytes = min(len(b), len(self._chunk) - offset)
+        b[:num_bytes] = self._chunk[offset : offset + num_bytes]
+        self._position += num_bytes
+        return num_bytes
+
+    def close(self):
+        self._chunk = memoryview(b'')
+        self._downloads = deque()
+        super(S3ObjectReader, self).close()
+
 
 class S3ObjectStore(ObjectStore):
-    def __init__(self, bucket, s3_session=None):
+    '''An object store on an S3 bucket.
+
+    Objects are written with multipart uploads and read with concurrent ranged GETs, in parts of
+    part_size bytes, max_concurrency parts at a time.
+
+    Args:
+        bucket (str): The bucket to store objects in.
+        s3_session (Optional[botocore.client.S3]): The S3 client to use.
+        part_size (Optional[int]): The size of the parts objects are uploaded and downloaded in.
+            Must be at least 5MB.
+        max_concurrency (Optional[int]): The most parts of an object to upload or download at once.
+    '''
+
+    def __init__(
+        self,
+        bucket,
+        s3_session=None,
+        part_size=DEFAULT_PART_SIZE,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+    ):
         self.bucket = check.str_param(bucket, 'bucket')
+        self.part_size = check.int_param(part_size, 'part_size')
+        check.param_invariant(part_size >= MIN_PART_SIZE, 'part_size')
+        self.max_concurrency = check.int_param(max_concurrency, 'max_concurrency')
+        check.param_invariant(max_concurrency > 0, 'max_concurrency')
         self.s3 = s3_session or boto3.client('s3')
         self.s3.head_bucket(Bucket=bucket)
         super(S3ObjectStore, self).__init__('s3', sep='/')
@@ -26,14 +358,9 @@ class S3ObjectStore(ObjectStore):
             serialization_strategy, 'serialization_strategy', SerializationStrategy
         )  # cannot be none here
 
-        if self.has_object(key):
-            logging.warning('Removing existing S3 key: {key}'.format(key=key))
-            self.rm_object(key)
-
-        with BytesIO() as bytes_io:
-            serialization_strategy.serialize(obj, bytes_io)
-            bytes_io.seek(0)
-            self.s3.put_object(Bucket=self.bucket, Key=key, Body=bytes_io)
+        # Completing the upload replaces any existing object, so there is no need to remove it first
+        with self.open_write(key) as write_obj:
+            serialization_strategy.serialize(obj, write_obj)
 
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.SET_OBJECT,
@@ -49,9 +376,14 @@ class S3ObjectStore(ObjectStore):
         check.param_invariant(len(key) > 0, 'key')
 
         # FIXME we need better error handling for object store
-        obj = serialization_strategy.deserialize(
-            BytesIO(self.s3.get_object(Bucket=self.bucket, Key=key)['Body'].read())
+        read_obj = io.BufferedReader(
+            S3ObjectReader(self.s3, self.bucket, key, self.part_size, self.max_concurrency)
         )
+        try:
+            obj = serialization_strategy.deserialize(read_obj)
+        finally:
+            read_obj.close()
+
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.GET_OBJECT,
             key=self.uri_for_key(key),
@@ -61,35 +393,94 @@ class S3ObjectStore(ObjectStore):
             object_store_name=self.name,
         )
 
-    def has_object(self, key):
+    @contextmanager
+    def open_write(self, key):
         check.str_param(key, 'key')
         check.param_invariant(len(key) > 0, 'key')
 
-        key_count = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key)['KeyCount']
-        return bool(key_count > 0)
+        writer = S3ObjectWriter(self.s3, self.bucket, key, self.part_size, self.max_concurrency)
+        try:
+            yield writer
+            writer.close()
+        finally:
+            # Don't leave a partial upload behind if writing failed
+            if not writer.closed:
+                writer.abort()
 
-    def rm_object(self, key):
+    @contextmanager
+    def open_read(self, key, byte_range=None):
         check.str_param(key, 'key')
         check.param_invariant(len(key) > 0, 'key')
+        start, end = check_byte_range(byte_range)
 
-        def delete_for_results(store, results):
-            store.s3.delete_objects(
-                Bucket=store.bucket,
-                Delete={'Objects': [{'Key': result['Key']} for result in results['Contents']]},
+        kwargs = {}
+        if byte_range is not None:
+            kwargs['Range'] = 'bytes={start}-{last}'.format(
+                start=start, last='' if end is None else end - 1
             )
 
-        if self.has_object(key):
-            results = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key)
-            delete_for_results(self, results)
+        body = self.s3.get_object(Bucket=self.bucket, Key=key, **kwargs)['Body']
+        try:
+            yield body
+        finally:
+            body.close()
+
+    def has_object(self, key):
+        check.str_param(key, 'key')
+        check.param_invariant(len(key) > 0, 'key')
+
+        key_count = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key, MaxKeys=1)['KeyCount']
+        return bool(key_count > 0)
+
+    def has_objects(self, keys):
+        check.list_param(keys, 'keys', of_type=str)
+        if not keys:
+            return []
+
+        # List every key under the longest prefix shared by keys once, rather than making one
+        # request per key. A prefix shorter than the directory of a key, e.g. the directory of a
+        # whole run, may hold far more keys than were asked about, so check those one by one.
+        prefix = os.path.commonprefix(keys)
+        if any(len(prefix) < len(posixpath.dirname(key)) for key in keys):
+            return [self.has_object(key) for key in keys]
 
-            continuation = results['IsTruncated']
-            while continuation:
-                continuation_token = results['NextContinuationToken']
-                results = self.s3.list_objects_v2(
-                    Bucket=self.bucket, Prefix=key, ContinuationToken=continuation_token
+        listed_keys = sorted(self._list_keys(prefix))
+
+        def _has_key(key):
+            # Like has_object, a key exists if any listed key starts with it
+            index = bisect.bisect_left(listed_keys, key)
+            return index < len(listed_keys) and listed_keys[index].startswith(key)
+
+        return [_has_key(key) for key in keys]
+
+    def _list_keys(self, prefix):
+        kwargs = {}
+        while True:
+            results = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=prefix, **kwargs)
+            for result in results.get('Contents', []):
+                yield result['Key']
+
+            if not results['IsTruncated']:
+                break
+            kwargs['ContinuationToken'] = results['NextContinuationToken']
+
+    def rm_object(self, key):
+        check.str_param(key, 'key')
+        check.param_invariant(len(key) > 0, 'key')
+
+        # List and delete the keys page by page, without checking whether any exist first
+        kwargs = {}
+        while True:
+            results = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=key, **kwargs)
+            if results.get('Contents'):
+                self.s3.delete_objects(
+                    Bucket=self.bucket,
+                    Delete={'Objects': [{'Key': result['Key']} for result in results['Contents']]},
                 )
-                delete_for_results(self, results)
-                continuation = results['IsTruncated']
+
+            if not results['IsTruncated']:
+                break
+            kwargs['ContinuationToken'] = results['NextContinuationToken']
 
         return ObjectStoreOperation(
             op=ObjectStoreOperationType.RM_OBJECT,
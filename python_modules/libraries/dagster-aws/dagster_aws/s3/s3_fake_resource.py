@@ -15,6 +15,7 @@ class S3FakeSession:
     def __init__(self, buckets=None):
         self.buckets = defaultdict(dict, buckets) if buckets else defaultdict(dict)
         self.mock_extras = mock.MagicMock()
+        self.multipart_uploads = {}
 
     def head_bucket(self, Bucket, *args, **kwargs):  # pylint: disable=unused-argument
         self.mock_extras.head_bucket(*args, **kwargs)
@@ -25,23 +26,70 @@ class S3FakeSession:
 
     def list_objects_v2(self, Bucket, Prefix, *args, **kwargs):
         self.mock_extras.list_objects_v2(*args, **kwargs)
-        key = self.buckets.get(Bucket, {}).get(Prefix)
-        if key:
-            return {'KeyCount': 1, 'Contents': [{'Key': key}], 'IsTruncated': False}
-        else:
-            return {'KeyCount': 0, 'Contents': [], 'IsTruncated': False}
+        max_keys = kwargs.get('MaxKeys', 1000)
+        start = int(kwargs.get('ContinuationToken', 0))
+
+        keys = sorted(key for key in self.buckets.get(Bucket, {}) if key.startswith(Prefix))
+        page = keys[start : start + max_keys]
+        is_truncated = start + max_keys < len(keys)
+
+        results = {
+            'KeyCount': len(page),
+            'Contents': [{'Key': key} for key in page],
+            'IsTruncated': is_truncated,
+        }
+        if is_truncated:
+            results['NextContinuationToken'] = str(start + max_keys)
+        return results
 
     def put_object(self, Bucket, Key, Body, *args, **kwargs):
         self.mock_extras.put_object(*args, **kwargs)
-        self.buckets[Bucket][Key] = Body.read()
+        self.buckets[Bucket][Key] = Body if isinstance(Body, bytes) else Body.read()
 
     def get_object(self, Bucket, Key, *args, **kwargs):
         if not self._has_object(Bucket, Key):
             raise ClientError({}, None)
 
         self.mock_extras.get_object(*args, **kwargs)
+        if 'Range' in kwargs:
+            first, last = kwargs['Range'][len('bytes=') :].split('-')
+            data = self.buckets[Bucket][Key]
+            if int(first) >= len(data):
+                raise ClientError({'Error': {'Code': 'InvalidRange'}}, 'GetObject')
+
+            last = min(int(last), len(data) - 1) if last else len(data) - 1
+            return {
+                'Body': io.BytesIO(data[int(first) : last + 1]),
+                'ContentRange': 'bytes {first}-{last}/{size}'.format(
+                    first=first, last=last, size=len(data)
+                ),
+            }
+
         return {'Body': self._get_byte_stream(Bucket, Key)}
 
+    def create_multipart_upload(self, Bucket, Key, *args, **kwargs):
+        self.mock_extras.create_multipart_upload(*args, **kwargs)
+        upload_id = str(len(self.multipart_uploads))
+        self.multipart_uploads[upload_id] = (Bucket, Key, {})
+        return {'UploadId': upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body, *args, **kwargs):
+        self.mock_extras.upload_part(*args, **kwargs)
+        parts = self.multipart_uploads[UploadId][2]
+        parts[PartNumber] = Body if isinstance(Body, bytes) else Body.read()
+        return {'ETag': str(PartNumber)}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload, *args, **kwargs):
+        self.mock_extras.complete_multipart_upload(*args, **kwargs)
+        _, _, parts = self.multipart_uploads.pop(UploadId)
+        self.buckets[Bucket][Key] = b''.join(
+            parts[part['PartNumber']] for part in MultipartUpload['Parts']
+        )
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId, *args, **kwargs):
+        self.mock_extras.abort_multipart_upload(*args, **kwargs)
+        del self.multipart_uploads[UploadId]
+
     def upload_fileobj(self, fileobj, bucket, key, *args, **kwargs):
         self.mock_extras.upload_fileobj(*args, **kwargs)
         self.buckets[bucket][key] = fileobj.read()
@@ -0,0 +1,238 @@
+import io
+import threading
+
+import pytest
+from dagster_aws.s3.object_store import MIN_PART_SIZE, S3ObjectReader, S3ObjectStore
+from dagster_aws.s3.s3_fake_resource import S3FakeSession
+
+from dagster.core.types.marshal import PickleSerializationStrategy
+
+
+def test_s3_object_store_has_objects():
+    s3_session = S3FakeSession(
+        {
+            'some-bucket': {
+                'dagster/storage/run/intermediates/foo.compute/result': b'foo',
+                'dagster/storage/run/intermediates/bar.compute/result': b'bar',
+                'dagster/storage/other_run/intermediates/baz.compute/result': b'baz',
+            }
+        }
+    )
+    object_store = S3ObjectStore('some-bucket', s3_session=s3_session)
+
+    keys = [
+        'dagster/storage/run/intermediates/foo.compute/result',
+        'dagster/storage/run/intermediates/foo.compute/other',
+        'dagster/storage/run/intermediates/foo.compute/resul',
+    ]
+    assert object_store.has_objects(keys) == [object_store.has_object(key) for key in keys]
+
+    # Keys in a single directory are listed at once
+    s3_session.mock_extras.reset_mock()
+    assert object_store.has_objects(keys) == [True, False, True]
+    assert s3_session.mock_extras.list_objects_v2.call_count == 1
+
+    # Keys in different directories are checked one by one, rather than listing the run
+    keys = [
+        'dagster/storage/run/intermediates/foo.compute/result',
+        'dagster/storage/run/intermediates/bar.compute/result',
+        'dagster/storage/run/intermediates/baz.compute/result',
+    ]
+    s3_session.mock_extras.reset_mock()
+    assert object_store.has_objects(keys) == [True, True, False]
+    assert s3_session.mock_extras.list_objects_v2.call_count == 3
+    for call in s3_session.mock_extras.list_objects_v2.call_args_list:
+        assert call[1] == {'MaxKeys': 1}
+
+    assert object_store.has_objects([]) == []
+
+
+def test_s3_object_store_has_objects_paginated():
+    s3_session = S3FakeSession(
+        {'some-bucket': {'prefix/{i:04d}'.format(i=i): b'' for i in range(2500)}}
+    )
+    object_store = S3ObjectStore('some-bucket', s3_session=s3_session)
+
+    keys = ['prefix/0000', 'prefix/1999', 'prefix/2499', 'prefix/2500']
+    assert object_store.has_objects(keys) == [True, True, True, False]
+    assert s3_session.mock_extras.list_objects_v2.call_count == 3
+
+
+def test_s3_object_store_open_write_single_request():
+    s3_session = S3FakeSession()
+    object_store = S3ObjectStore('some-bucket', s3_session=s3_session)
+
+    with object_store.open_write('some/key') as write_obj:
+        write_obj.write(b'0123')
+        write_obj.write(b'456789')
+        assert write_obj.tell() == 10
+
+    assert s3_session.buckets['some-bucket']['some/key'] == b'0123456789'
+    assert s3_session.mock_extras.put_object.call_count == 1
+    assert s3_session.mock_extras.create_multipart_upload.call_count == 0
+
+    with object_store.open_read('some/key') as read_obj:
+        assert read_obj.read() == b'0123456789'
+
+    with object_store.open_read('some/key', byte_range=(2, 5)) as read_obj:
+        assert read_obj.read() == b'234'
+
+    with object_store.open_read('some/key', byte_range=(7, None)) as read_obj:
+        assert read_obj.read() == b'789'
+
+
+def test_s3_object_store_open_write_multipart():
+    s3_session = S3FakeSession()
+    object_store = S3ObjectStore('some-bucket', s3_session=s3_session)
+
+    chunk = b'x' * (1024 * 1024)
+    with object_store.open_write('some/key') as write_obj:
+        for _ in range(20):
+            write_obj.write(chunk)
+
+    assert s3_session.buckets['some-bucket']['some/key'] == chunk * 20
+    assert s3_session.mock_extras.put_object.call_count == 0
+    # 8MB parts
+    assert s3_session.mock_extras.upload_part.call_count == 3
+    assert s3_session.mock_extras.complete_multipart_upload.call_count == 1
+    assert not s3_session.multipart_uploads
+
+
+def test_s3_object_store_open_write_failure():
+    s3_session = S3FakeSession()
+    object_store = S3ObjectStore('some-bucket', s3_session=s3_session)
+
+    with pytest.raises(ValueError):
+        with object_store.open_write('some/key') as write_obj:
+            write_obj.write(b'x' * (10 * 1024 * 1024))
+            raise ValueError()
+
+    assert 'some/key' not in s3_session.buckets['some-bucket']
+    assert s3_session.mock_extras.abort_multipart_upload.call_count == 1
+    assert not s3_session.multipart_uploads
+
+
+def test_s3_object_store_set_object_streams():
+    s3_session = S3FakeSession()
+    object_store = S3ObjectStore('some-bucket', s3_session=s3_session)
+
+    serialization_strategy = PickleSerializationStrategy()
+    object_store.set_object('some/key', list(range(1000)), serialization_strategy)
+    assert object_store.get_object('some/key', serialization_strategy).obj == list(range(1000))
+
+
+class SlowFirstPartS3FakeSession(S3FakeSession):
+    '''Holds the upload of the first part until every other part has been uploaded.'''
+
+    def __init__(self, num_parts):
+        super(SlowFirstPartS3FakeSession, self).__init__()
+        self.num_parts = num_parts
+        self.other_parts_uploaded = threading.Event()
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body, *args, **kwargs):
+        if PartNumber == 1:
+            assert self.other_parts_uploaded.wait(10)
+
+        response = super(SlowFirstPartS3FakeSession, self).upload_part(
+            Bucket, Key, UploadId, PartNumber, Body, *args, **kwargs
+        )
+        if len(self.multipart_uploads[UploadId][2]) == self.num_parts - 1:
+            self.other_parts_uploaded.set()
+        return response
+
+
+def test_s3_object_store_open_write_uploads_parts_concurrently():
+    s3_session = SlowFirstPartS3FakeSession(num_parts=3)
+    object_store = S3ObjectStore(
+        'some-bucket', s3_session=s3_session, part_size=MIN_PART_SIZE, max_concurrency=3
+    )
+
+    data = b''.join(bytes(bytearray([i])) * MIN_PART_SIZE for i in range(3))
+    with object_store.open_write('some/key') as write_obj:
+        write_obj.write(data)
+
+    # The parts are assembled in order even though the first one finished uploading last
+    assert s3_session.buckets['some-bucket']['some/key'] == data
+    assert s3_session.mock_extras.upload_part.call_count == 3
+    assert not s3_session.multipart_uploads
+
+
+class FailingPartS3FakeSession(S3FakeSession):
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body, *args, **kwargs):
+        if PartNumber == 2:
+            raise IOError('Upload failed')
+
+        return super(FailingPartS3FakeSession, self).upload_part(
+            Bucket, Key, UploadId, PartNumber, Body, *args, **kwargs
+        )
+
+
+def test_s3_object_store_open_write_part_failure():
+    s3_session = FailingPartS3FakeSession()
+    object_store = S3ObjectStore('some-bucket', s3_session=s3_session, part_size=MIN_PART_SIZE)
+
+    with pytest.raises(IOError):
+        with object_store.open_write('some/key') as write_obj:
+            write_obj.write(b'x' * (3 * MIN_PART_SIZE))
+
+    assert 'some/key' not in s3_session.buckets['some-bucket']
+    assert s3_session.mock_extras.complete_multipart_upload.call_count == 0
+    assert s3_session.mock_extras.abort_multipart_upload.call_count == 1
+    assert not s3_session.multipart_uploads
+
+
+def test_s3_object_store_set_object_overwrites_without_checking():
+    s3_session = S3FakeSession({'some-bucket': {'some/key': b'old'}})
+    object_store = S3ObjectStore('some-bucket', s3_session=s3_session)
+
+    serialization_strategy = PickleSerializationStrategy()
+    object_store.set_object('some/key', 'new', serialization_strategy)
+
+    assert s3_session.mock_extras.list_objects_v2.call_count == 0
+    assert object_store.get_object('some/key', serialization_strategy).obj == 'new'
+
+
+def test_s3_object_store_get_object_ranged():
+    s3_session = S3FakeSession()
+    object_store = S3ObjectStore(
+        'some-bucket', s3_session=s3_session, part_size=MIN_PART_SIZE, max_concurrency=2
+    )
+
+    serialization_strategy = PickleSerializationStrategy()
+    obj = bytes(bytearray(range(256))) * (48 * 1024)
+    object_store.set_object('some/key', obj, serialization_strategy)
+    size = len(s3_session.buckets['some-bucket']['some/key'])
+    assert size > 2 * MIN_PART_SIZE
+
+    s3_session.mock_extras.reset_mock()
+    assert object_store.get_object('some/key', serialization_strategy).obj == obj
+    # One ranged GET per part
+    assert s3_session.mock_extras.get_object.call_count == -(-size // MIN_PART_SIZE)
+    assert s3_session.mock_extras.head_object.call_count == 0
+
+    # Small objects are read with a single request
+    object_store.set_object('other/key', 'foo', serialization_strategy)
+    s3_session.mock_extras.reset_mock()
+    assert object_store.get_object('other/key', serialization_strategy).obj == 'foo'
+    assert s3_session.mock_extras.get_object.call_count == 1
+
+
+def test_s3_object_reader():
+    data = bytes(bytearray(range(256))) * 100
+    s3_session = S3FakeSession({'some-bucket': {'some/key': data, 'empty/key': b''}})
+
+    with io.BufferedReader(
+        S3ObjectReader(s3_session, 'some-bucket', 'some/key', part_size=1000, max_concurrency=3)
+    ) as read_obj:
+        assert read_obj.read(10) == data[:10]
+        assert read_obj.seek(-300, io.SEEK_END) == len(data) - 300
+        assert read_obj.read() == data[-300:]
+        assert read_obj.seek(5) == 5
+        assert read_obj.read(2500) == data[5:2505]
+        assert read_obj.tell() == 2505
+        assert read_obj.read() == data[2505:]
+        assert read_obj.read() == b''
+
+    reader = S3ObjectReader(s3_session, 'some-bucket', 'empty/key')
+    assert reader.size == 0
+    assert reader.read() == b''
@@ -1,3 +1,13 @@
-from .data_frame import DataFrame
+from .data_frame import DataFrame, PandasColumn, create_dagster_pandas_dataframe_type
+from .serialization import (
+    DataFrameArrowSerializationStrategy,
+    DataFrameParquetSerializationStrategy,
+)
 
-__all__ = ['DataFrame']
+__all__ = [
+    'DataFrame',
+    'DataFrameArrowSerializationStrategy',
+    'DataFrameParquetSerializationStrategy',
+    'PandasColumn',
+    'create_dagster_pandas_dataframe_type',
+]
@@ -1,9 +1,12 @@
+from collections import namedtuple
+
 import pandas as pd
 
 from dagster import (
     DagsterInvariantViolationError,
     Dict,
     EventMetadataEntry,
+    Failure,
     Field,
     Materialization,
     Path,
@@ -11,6 +14,7 @@ from dagster import (
     TypeCheck,
     as_dagster_type,
     check,
+    define_python_dagster_type,
 )
 from dagster.core.types import NamedSelector, input_selector_schema, output_selector_schema
 
@@ -84,6 +88,14 @@ def dataframe_input_schema(_context, file_type, file_options):
         )
 
 
+def _dataframe_metadata_entries(value):
+    return [
+        EventMetadataEntry.text(str(len(value)), 'row_count', 'Number of rows in DataFrame'),
+        # string cast columns since they may be things like datetime
+        EventMetadataEntry.json({'columns': list(map(str, value.columns))}, 'metadata'),
+    ]
+
+
 DataFrame = as_dagster_type(
     pd.DataFrame,
     name='PandasDataFrame',
@@ -93,10 +105,142 @@ DataFrame = as_dagster_type(
     input_hydration_config=dataframe_input_schema,
     output_materialization_config=dataframe_output_schema,
     typecheck_metadata_fn=lambda value: TypeCheck(
-        metadata_entries=[
-            EventMetadataEntry.text(str(len(value)), 'row_count', 'Number of rows in DataFrame'),
-            # string cast columns since they may be things like datetime
-            EventMetadataEntry.json({'columns': list(map(str, value.columns))}, 'metadata'),
-        ]
+        metadata_entries=_dataframe_metadata_entries(value)
     ),
 )
+
+
+class PandasColumn(
+    namedtuple('_PandasColumn', 'name dtype non_nullable unique min_value max_value')
+):
+    '''A column that the DataFrames of a type created with create_dagster_pandas_dataframe_type
+    must have.
+
+    Args:
+        name (str): The name of the column.
+        dtype (Optional[Union[str, numpy.dtype]]): The dtype the column must have, e.g. 'int64'.
+        non_nullable (Optional[bool]): Whether the column must not have null values.
+        unique (Optional[bool]): Whether the values of the column must be unique.
+        min_value (Optional[Any]): The smallest value the column may have.
+        max_value (Optional[Any]): The largest value the column may have.
+    '''
+
+    def __new__(
+        cls, name, dtype=None, non_nullable=False, unique=False, min_value=None, max_value=None
+    ):
+        return super(PandasColumn, cls).__new__(
+            cls,
+            name=check.str_param(name, 'name'),
+            dtype=dtype,
+            non_nullable=check.bool_param(non_nullable, 'non_nullable'),
+            unique=check.bool_param(unique, 'unique'),
+            min_value=min_value,
+            max_value=max_value,
+        )
+
+    def violations(self, dataframe):
+        '''Returns a description of each way the column of dataframe breaks the constraints of this
+        column. Each constraint is checked with one vectorized operation over the whole column.
+        '''
+        if self.name not in dataframe.columns:
+            return ['Column "{name}" is missing.'.format(name=self.name)]
+
+        series = dataframe[self.name]
+        violations = []
+
+        if self.dtype is not None and series.dtype != self.dtype:
+            violations.append(
+                'Column "{name}" has dtype {actual}, expected {expected}.'.format(
+                    name=self.name, actual=series.dtype, expected=self.dtype
+                )
+            )
+            # The values of a column of another dtype may not be comparable with the bounds
+            check_bounds = False
+        else:
+            check_bounds = True
+
+        # Each mask is computed over the whole column at once
+        masks = []
+        if self.non_nullable:
+            masks.append(('null values', series.isnull()))
+        if self.unique:
+            masks.append(('duplicated values', series.duplicated()))
+        if check_bounds:
+            try:
+                if self.min_value is not None:
+                    masks.append(
+                        (
+                            'values below the minimum of {}'.format(self.min_value),
+                            series < self.min_value,
+                        )
+                    )
+                if self.max_value is not None:
+                    masks.append(
+                        (
+                            'values above the maximum of {}'.format(self.max_value),
+                            series > self.max_value,
+                        )
+                    )
+            except TypeError as e:
+                violations.append(
+                    'Column "{name}" can\'t be compared with its bounds: {error}'.format(
+                        name=self.name, error=e
+                    )
+                )
+
+        for description, mask in masks:
+            count = int(mask.sum())
+            if count:
+                violations.append(
+                    'Column "{name}" has {count} {description}.'.format(
+                        name=self.name, count=count, description=description
+                    )
+                )
+
+        return violations
+
+
+def create_dagster_pandas_dataframe_type(
+    name, columns, description=None, serialization_strategy=None
+):
+    '''Creates a dagster type for pandas DataFrames that must have the given columns.
+
+    The type checks each column with vectorized pandas operations over the whole column, so type
+    checking a large DataFrame costs a few passes over its columns in native code rather than a
+    Python call per value. It hydrates and materializes DataFrames like DataFrame.
+
+    Args:
+        name (str): The name of the dagster type.
+        columns (List[PandasColumn]): The columns the DataFrames must have. DataFrames may have
+            other columns too.
+        description (Optional[str]): A description of the dagster type.
+        serialization_strategy (Optional[SerializationStrategy]): How to serialize intermediate
+            DataFrames of the type, e.g. a DataFrameArrowSerializationStrategy, which also reads
+            back DataFrames that were pickled. (default: pickle, like DataFrame)
+    '''
+    check.str_param(name, 'name')
+    columns = check.list_param(columns, 'columns', of_type=PandasColumn)
+
+    def _type_check(value):
+        violations = [violation for column in columns for violation in column.violations(value)]
+        if violations:
+            raise Failure(
+                'DataFrame does not match the schema of {name}: {violations}'.format(
+                    name=name, violations=' '.join(violations)
+                ),
+                metadata_entries=[
+                    EventMetadataEntry.json({'violations': violations}, 'schema_violations')
+                ],
+            )
+
+        return TypeCheck(metadata_entries=_dataframe_metadata_entries(value))
+
+    return define_python_dagster_type(
+        pd.DataFrame,
+        name=name,
+        description=description,
+        input_hydration_config=dataframe_input_schema,
+        output_materialization_config=dataframe_output_schema,
+        serialization_strategy=serialization_strategy,
+        typecheck_metadata_fn=_type_check,
+    )
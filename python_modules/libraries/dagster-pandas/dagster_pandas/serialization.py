@@ -0,0 +1,104 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from dagster import check
+from dagster.core.types.marshal import PickleSerializationStrategy, SerializationStrategy
+
+ARROW_MAGIC = b'ARROW1'
+PARQUET_MAGIC = b'PAR1'
+
+_PICKLE_SERIALIZATION_STRATEGY = PickleSerializationStrategy()
+
+
+def _has_magic(read_file_obj, magic):
+    start = read_file_obj.tell()
+    has_magic = read_file_obj.read(len(magic)) == magic
+    read_file_obj.seek(start)
+    return has_magic
+
+
+def _has_magic_at_path(read_path, magic):
+    with open(read_path, 'rb') as read_obj:
+        return _has_magic(read_obj, magic)
+
+
+def _table_to_pandas(table):
+    # Releases the Arrow buffers of each column once it has been converted, so that a table read
+    # into memory isn't held alongside the whole DataFrame built from it
+    return table.to_pandas(self_destruct=True)
+
+
+class DataFrameArrowSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Serializes pandas DataFrames in the Arrow IPC file format (Feather V2).
+
+    Files are memory-mapped when read back, so the Arrow buffers aren't copied before they are
+    converted to a DataFrame, and other file-like objects are read from directly rather than
+    buffered whole. DataFrames that Arrow can't represent (e.g. object columns holding mixed types)
+    are pickled instead, and pickled DataFrames are read back too, so the strategy can be adopted
+    by a type whose intermediates were previously pickled.
+    '''
+
+    def __init__(self, name='arrow'):
+        super(DataFrameArrowSerializationStrategy, self).__init__(name)
+
+    def serialize(self, value, write_file_obj):
+        try:
+            table = pa.Table.from_pandas(value)
+        except (pa.ArrowException, TypeError, ValueError):
+            return _PICKLE_SERIALIZATION_STRATEGY.serialize(value, write_file_obj)
+
+        writer = pa.ipc.new_file(write_file_obj, table.schema)
+        try:
+            writer.write_table(table)
+        finally:
+            writer.close()
+
+    def deserialize(self, read_file_obj):
+        if not _has_magic(read_file_obj, ARROW_MAGIC):
+            return _PICKLE_SERIALIZATION_STRATEGY.deserialize(read_file_obj)
+
+        return _table_to_pandas(pa.ipc.open_file(read_file_obj).read_all())
+
+    def deserialize_from_file(self, read_path):
+        check.str_param(read_path, 'read_path')
+
+        if not _has_magic_at_path(read_path, ARROW_MAGIC):
+            return _PICKLE_SERIALIZATION_STRATEGY.deserialize_from_file(read_path)
+
+        with pa.memory_map(read_path, 'r') as source:
+            return _table_to_pandas(pa.ipc.open_file(source).read_all())
+
+
+class DataFrameParquetSerializationStrategy(SerializationStrategy):  # pylint: disable=no-init
+    '''Serializes pandas DataFrames in the Parquet format.
+
+    Parquet files are compressed and usually much smaller than Arrow files, at the cost of decoding
+    them on read. Files are memory-mapped when read back, and other file-like objects are read
+    from directly. DataFrames that can't be written as Parquet are pickled instead, and pickled
+    DataFrames are read back too.
+    '''
+
+    def __init__(self, name='parquet'):
+        super(DataFrameParquetSerializationStrategy, self).__init__(name)
+
+    def serialize(self, value, write_file_obj):
+        try:
+            table = pa.Table.from_pandas(value)
+        except (pa.ArrowException, TypeError, ValueError):
+            return _PICKLE_SERIALIZATION_STRATEGY.serialize(value, write_file_obj)
+
+        pq.write_table(table, write_file_obj)
+
+    def deserialize(self, read_file_obj):
+        if not _has_magic(read_file_obj, PARQUET_MAGIC):
+            return _PICKLE_SERIALIZATION_STRATEGY.deserialize(read_file_obj)
+
+        return _table_to_pandas(pq.read_table(read_file_obj))
+
+    def deserialize_from_file(self, read_path):
+        check.str_param(read_path, 'read_path')
+
+        if not _has_magic_at_path(read_path, PARQUET_MAGIC):
+            return _PICKLE_SERIALIZATION_STRATEGY.deserialize_from_file(read_path)
+
+        return _table_to_pandas(pq.read_table(read_path, memory_map=True))
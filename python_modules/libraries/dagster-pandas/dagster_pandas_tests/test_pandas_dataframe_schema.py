@@ -0,0 +1,107 @@
+import pandas as pd
+import pytest
+from dagster_pandas import PandasColumn, create_dagster_pandas_dataframe_type
+
+from dagster import (
+    DagsterTypeCheckError,
+    Failure,
+    InputDefinition,
+    execute_pipeline,
+    lambda_solid,
+    pipeline,
+)
+from dagster.core.types.runtime import resolve_to_runtime_type
+
+TripDataFrame = create_dagster_pandas_dataframe_type(
+    name='TripDataFrame',
+    columns=[
+        PandasColumn('trip_id', dtype='int64', non_nullable=True, unique=True),
+        PandasColumn('distance', dtype='float64', min_value=0.0, max_value=100.0),
+    ],
+)
+
+
+def test_dataframe_matching_schema_passes():
+    type_check = resolve_to_runtime_type(TripDataFrame).type_check(
+        pd.DataFrame(
+            {'trip_id': [1, 2, 3], 'distance': [0.5, 12.0, 99.0], 'other': ['a', 'b', 'c']}
+        )
+    )
+
+    assert type_check.metadata_entries[0].label == 'row_count'
+    assert type_check.metadata_entries[0].entry_data.text == '3'
+    assert type_check.metadata_entries[1].entry_data.data['columns'] == [
+        'trip_id',
+        'distance',
+        'other',
+    ]
+
+
+def test_dataframe_schema_violations():
+    runtime_type = resolve_to_runtime_type(TripDataFrame)
+
+    with pytest.raises(Failure) as exc_info:
+        runtime_type.type_check(
+            pd.DataFrame({'trip_id': [1, 1, 2, 3], 'distance': [-1.0, 5.0, 101.0, 102.0]})
+        )
+
+    assert exc_info.value.metadata_entries[0].entry_data.data['violations'] == [
+        'Column "trip_id" has 1 duplicated values.',
+        'Column "distance" has 1 values below the minimum of 0.0.',
+        'Column "distance" has 2 values above the maximum of 100.0.',
+    ]
+
+    with pytest.raises(Failure) as exc_info:
+        runtime_type.type_check(pd.DataFrame({'trip_id': [1.0, None]}))
+
+    assert exc_info.value.metadata_entries[0].entry_data.data['violations'] == [
+        'Column "trip_id" has dtype float64, expected int64.',
+        'Column "trip_id" has 1 null values.',
+        'Column "distance" is missing.',
+    ]
+
+    with pytest.raises(Failure):
+        runtime_type.type_check([1, 2, 3])
+
+
+def test_dataframe_schema_bounds_of_incomparable_columns():
+    runtime_type = resolve_to_runtime_type(TripDataFrame)
+
+    # The bounds aren't checked against a column of the wrong dtype
+    with pytest.raises(Failure) as exc_info:
+        runtime_type.type_check(pd.DataFrame({'trip_id': [1, 2], 'distance': ['far', 'near']}))
+
+    assert exc_info.value.metadata_entries[0].entry_data.data['violations'] == [
+        'Column "distance" has dtype {dtype}, expected float64.'.format(
+            dtype=pd.Series(['far', 'near']).dtype
+        )
+    ]
+
+    # Without a dtype, values that can't be compared with the bounds are a violation
+    untyped_runtime_type = resolve_to_runtime_type(
+        create_dagster_pandas_dataframe_type(
+            name='UntypedDistanceDataFrame', columns=[PandasColumn('distance', min_value=0.0)]
+        )
+    )
+    with pytest.raises(Failure) as exc_info:
+        untyped_runtime_type.type_check(pd.DataFrame({'distance': ['far', 'near']}))
+
+    (violation,) = exc_info.value.metadata_entries[0].entry_data.data['violations']
+    assert violation.startswith('Column "distance" can\'t be compared with its bounds')
+
+
+def test_dataframe_schema_type_in_pipeline():
+    @lambda_solid
+    def return_trips():
+        return pd.DataFrame({'trip_id': [1, 2], 'distance': [1.0, -2.0]})
+
+    @lambda_solid(input_defs=[InputDefinition('trips', TripDataFrame)])
+    def noop(trips):
+        return trips
+
+    @pipeline
+    def trips_pipeline():
+        noop(return_trips())
+
+    with pytest.raises(DagsterTypeCheckError):
+        execute_pipeline(trips_pipeline)
@@ -0,0 +1,124 @@
+from io import BytesIO
+
+import pandas as pd
+import pytest
+from dagster_pandas import (
+    DataFrame,
+    DataFrameArrowSerializationStrategy,
+    DataFrameParquetSerializationStrategy,
+    create_dagster_pandas_dataframe_type,
+)
+
+from dagster import (
+    DependencyDefinition,
+    InputDefinition,
+    OutputDefinition,
+    PipelineDefinition,
+    execute_pipeline,
+    lambda_solid,
+)
+from dagster.core.instance import DagsterInstance
+from dagster.core.types.marshal import PickleSerializationStrategy
+from dagster.core.types.runtime import resolve_to_runtime_type
+from dagster.utils import safe_tempfile_path
+
+SERIALIZATION_STRATEGIES = [
+    DataFrameArrowSerializationStrategy(),
+    DataFrameParquetSerializationStrategy(),
+]
+
+
+def _num_df():
+    return pd.DataFrame(
+        {'num1': [1, 3], 'num2': [2.0, 4.0], 'name': ['a', 'b']}, index=pd.Index([10, 20])
+    )
+
+
+@pytest.mark.parametrize(
+    'serialization_strategy', SERIALIZATION_STRATEGIES, ids=lambda strategy: strategy.name
+)
+def test_dataframe_serialization_strategy_file(serialization_strategy):
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(_num_df(), tempfile_path)
+        pd.testing.assert_frame_equal(
+            serialization_strategy.deserialize_from_file(tempfile_path), _num_df()
+        )
+
+
+@pytest.mark.parametrize(
+    'serialization_strategy', SERIALIZATION_STRATEGIES, ids=lambda strategy: strategy.name
+)
+def test_dataframe_serialization_strategy_bytes_io(serialization_strategy):
+    bytes_io = BytesIO()
+    serialization_strategy.serialize(_num_df(), bytes_io)
+    bytes_io.seek(0)
+    pd.testing.assert_frame_equal(serialization_strategy.deserialize(bytes_io), _num_df())
+
+
+@pytest.mark.parametrize(
+    'serialization_strategy', SERIALIZATION_STRATEGIES, ids=lambda strategy: strategy.name
+)
+def test_dataframe_serialization_strategy_falls_back_to_pickle(serialization_strategy):
+    # Arrow can't represent a column mixing ints and strings
+    mixed_df = pd.DataFrame({'mixed': [1, 'two', 3.0]})
+
+    with safe_tempfile_path() as tempfile_path:
+        serialization_strategy.serialize_to_file(mixed_df, tempfile_path)
+        pd.testing.assert_frame_equal(
+            serialization_strategy.deserialize_from_file(tempfile_path), mixed_df
+        )
+
+    bytes_io = BytesIO()
+    serialization_strategy.serialize(mixed_df, bytes_io)
+    bytes_io.seek(0)
+    pd.testing.assert_frame_equal(serialization_strategy.deserialize(bytes_io), mixed_df)
+
+
+@pytest.mark.parametrize(
+    'serialization_strategy', SERIALIZATION_STRATEGIES, ids=lambda strategy: strategy.name
+)
+def test_dataframe_serialization_strategy_reads_pickle(serialization_strategy):
+    # Intermediates written before a type adopted the strategy
+    with safe_tempfile_path() as tempfile_path:
+        PickleSerializationStrategy().serialize_to_file(_num_df(), tempfile_path)
+        pd.testing.assert_frame_equal(
+            serialization_strategy.deserialize_from_file(tempfile_path), _num_df()
+        )
+
+
+def test_dataframe_default_serialization_strategy():
+    assert isinstance(
+        resolve_to_runtime_type(DataFrame).serialization_strategy, PickleSerializationStrategy
+    )
+
+
+def test_dataframe_intermediates_filesystem_storage():
+    ArrowDataFrame = create_dagster_pandas_dataframe_type(
+        'ArrowDataFrame', [], serialization_strategy=DataFrameArrowSerializationStrategy()
+    )
+
+    @lambda_solid(output_def=OutputDefinition(ArrowDataFrame))
+    def produce_df():
+        return _num_df()
+
+    @lambda_solid(
+        input_defs=[InputDefinition('df', ArrowDataFrame)],
+        output_def=OutputDefinition(ArrowDataFrame),
+    )
+    def sum_df(df):
+        df['sum'] = df['num1'] + df['num2']
+        return df
+
+    pipeline = PipelineDefinition(
+        name='dataframe_intermediates_pipeline',
+        solid_defs=[produce_df, sum_df],
+        dependencies={'sum_df': {'df': DependencyDefinition('produce_df')}},
+    )
+
+    result = execute_pipeline(
+        pipeline,
+        environment_dict={'storage': {'filesystem': {}}},
+        instance=DagsterInstance.ephemeral(),
+    )
+    assert result.success
+    assert result.result_for_solid('sum_df').output_value()['sum'].tolist() == [3.0, 7.0]
@@ -10,6 +10,7 @@ from six.moves.queue import Empty
 from dagster import check
 from dagster.core.definitions.environment_configs import SystemNamedDict
 from dagster.core.events.log import EventRecord
+from dagster.core.execution.stats import build_empty_stats, update_stats_from_event
 from dagster.core.serdes import (
     ConfigurableClass,
     ConfigurableClassData,
@@ -17,6 +18,7 @@ from dagster.core.serdes import (
     serialize_dagster_namedtuple,
 )
 from dagster.core.storage.event_log import WatchableEventLogStorage
+from dagster.core.storage.pipeline_run import PipelineRunStatsSnapshot
 from dagster.core.types import Field, String
 
 from .pynotify import await_pg_notifications
@@ -29,14 +31,64 @@ CREATE TABLE IF NOT EXISTS event_log (
 )
 '''
 
-WIPE_EVENT_LOG_SQL = 'DELETE FROM event_log'
+CREATE_EVENT_LOG_RUN_ID_INDEX_SQL = (
+    'CREATE INDEX IF NOT EXISTS event_log_run_id_idx ON event_log (run_id, id)'
+)
+
+CREATE_RUN_STATS_SQL = '''
+CREATE TABLE IF NOT EXISTS run_stats (
+    run_id VARCHAR(255) PRIMARY KEY,
+    steps_succeeded INTEGER NOT NULL,
+    steps_failed INTEGER NOT NULL,
+    materializations INTEGER NOT NULL,
+    expectations INTEGER NOT NULL,
+    start_time DOUBLE PRECISION,
+    end_time DOUBLE PRECISION
+)
+'''
+
+WIPE_EVENT_LOG_SQL = 'DELETE FROM event_log; DELETE FROM run_stats'
 
-DELETE_EVENT_LOG_SQL = 'DELETE FROM event_log WHERE run_id = %s'
+DELETE_EVENT_LOG_SQL = '''
+DELETE FROM event_log WHERE run_id = %(run_id)s; DELETE FROM run_stats WHERE run_id = %(run_id)s
+'''
 
-DROP_EVENT_LOG_SQL = 'DROP TABLE IF EXISTS event_log'
+DROP_EVENT_LOG_SQL = 'DROP TABLE IF EXISTS event_log; DROP TABLE IF EXISTS run_stats'
 
 SELECT_EVENT_LOG_SQL = 'SELECT event_body FROM event_log WHERE id = %s'
 
+# The logs of a run from the zero-indexed position offset on. The id of the log at that position is
+# looked up on the index of the run's ids, so that the logs before it are never read.
+SELECT_EVENT_LOG_WINDOW_SQL = '''
+SELECT event_body FROM event_log
+WHERE run_id = %(run_id)s AND id >= (
+    SELECT id FROM event_log WHERE run_id = %(run_id)s ORDER BY id ASC OFFSET %(offset)s LIMIT 1
+)
+ORDER BY id ASC LIMIT %(limit)s
+'''
+
+SELECT_EVENT_LOG_COUNT_SQL = 'SELECT COUNT(*) FROM event_log WHERE run_id = %s'
+
+# Adds the stats of a single event to the stats of its run
+UPSERT_RUN_STATS_SQL = '''
+INSERT INTO run_stats (
+    run_id, steps_succeeded, steps_failed, materializations, expectations, start_time, end_time
+)
+VALUES (%s, %s, %s, %s, %s, %s, %s)
+ON CONFLICT (run_id) DO UPDATE SET
+    steps_succeeded = run_stats.steps_succeeded + EXCLUDED.steps_succeeded,
+    steps_failed = run_stats.steps_failed + EXCLUDED.steps_failed,
+    materializations = run_stats.materializations + EXCLUDED.materializations,
+    expectations = run_stats.expectations + EXCLUDED.expectations,
+    start_time = COALESCE(EXCLUDED.start_time, run_stats.start_time),
+    end_time = COALESCE(EXCLUDED.end_time, run_stats.end_time)
+'''
+
+SELECT_RUN_STATS_SQL = '''
+SELECT run_id, steps_succeeded, steps_failed, materializations, expectations, start_time, end_time
+FROM run_stats WHERE run_id = ANY(%s)
+'''
+
 CHANNEL_NAME = 'run_events'
 
 # Why? Because this is about as long as we expect a roundtrip to RDS to take.
@@ -49,6 +101,8 @@ class PostgresEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
         self._event_watcher = create_event_watcher(self.conn_string)
         conn = get_conn(self.conn_string)
         conn.cursor().execute(CREATE_EVENT_LOG_SQL)
+        conn.cursor().execute(CREATE_EVENT_LOG_RUN_ID_INDEX_SQL)
+        conn.cursor().execute(CREATE_RUN_STATS_SQL)
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
     @property
@@ -92,6 +146,80 @@ class PostgresEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
             rows = curs.fetchall()
             return list(map(lambda r: deserialize_json_to_dagster_namedtuple(r[0]), rows))
 
+    def get_logs_window_for_run(
+        self,
+        run_id,
+        after_cursor=-1,
+        before_cursor=None,
+        limit=None,
+        from_end=False,
+        step_keys=None,
+        event_types=None,
+        levels=None,
+    ):
+        if step_keys is not None or event_types is not None or levels is not None:
+            # The filters match the contents of the serialized events, so leave them to the default
+            return super(PostgresEventLogStorage, self).get_logs_window_for_run(
+                run_id,
+                after_cursor=after_cursor,
+                before_cursor=before_cursor,
+                limit=limit,
+                from_end=from_end,
+                step_keys=step_keys,
+                event_types=event_types,
+                levels=levels,
+            )
+
+        check.str_param(run_id, 'run_id')
+        check.int_param(after_cursor, 'after_cursor')
+        check.invariant(after_cursor >= -1, 'Cursor must be -1 or greater')
+        check.opt_int_param(before_cursor, 'before_cursor')
+        check.opt_int_param(limit, 'limit')
+        check.invariant(limit is None or limit >= 0, 'Limit must be 0 or greater')
+        check.bool_param(from_end, 'from_end')
+
+        # Cursors are the zero-indexed positions of the logs in the log of the run
+        start = after_cursor + 1
+        end = before_cursor
+        if limit is not None:
+            if from_end:
+                count = self.get_logs_count_for_run(run_id)
+                end = count if end is None else min(end, count)
+                start = max(start, end - limit)
+            else:
+                end = start + limit if end is None else min(end, start + limit)
+
+        if end is not None and end <= start:
+            return []
+
+        with get_conn(self.conn_string).cursor() as curs:
+            curs.execute(
+                SELECT_EVENT_LOG_WINDOW_SQL,
+                {
+                    'run_id': run_id,
+                    'offset': start,
+                    # A null limit is no limit
+                    'limit': None if end is None else end - start,
+                },
+            )
+            rows = curs.fetchall()
+
+        return [
+            (start + i, deserialize_json_to_dagster_namedtuple(row[0]))
+            for i, row in enumerate(rows)
+        ]
+
+    def get_logs_count_for_run(self, run_id, step_keys=None, event_types=None, levels=None):
+        if step_keys is not None or event_types is not None or levels is not None:
+            return super(PostgresEventLogStorage, self).get_logs_count_for_run(
+                run_id, step_keys=step_keys, event_types=event_types, levels=levels
+            )
+
+        check.str_param(run_id, 'run_id')
+        with get_conn(self.conn_string).cursor() as curs:
+            curs.execute(SELECT_EVENT_LOG_COUNT_SQL, (run_id,))
+            return curs.fetchone()[0]
+
     def store_event(self, event):
         '''Store an event corresponding to a pipeline run.
 
@@ -114,6 +242,30 @@ class PostgresEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
                 (res[0] + '_' + str(res[1]),),
             )
 
+            empty_stats = build_empty_stats(event.run_id)
+            stats = update_stats_from_event(empty_stats, event)
+            if stats != empty_stats:
+                curs.execute(UPSERT_RUN_STATS_SQL, tuple(stats))
+
+    def get_stats_for_run(self, run_id):
+        check.str_param(run_id, 'run_id')
+        return self.get_stats_for_runs([run_id])[run_id]
+
+    def get_stats_for_runs(self, run_ids):
+        check.list_param(run_ids, 'run_ids', of_type=str)
+
+        with get_conn(self.conn_string).cursor() as curs:
+            curs.execute(SELECT_RUN_STATS_SQL, (run_ids,))
+            rows = curs.fetchall()
+
+        stats = {row[0]: PipelineRunStatsSnapshot(*row) for row in rows}
+        for run_id in run_ids:
+            if run_id not in stats:
+                # Runs logged before stats were tracked, or with no stats events yet
+                stats[run_id] = super(PostgresEventLogStorage, self).get_stats_for_run(run_id)
+
+        return stats
+
     def wipe(self):
         '''Clear the log storage.'''
 
@@ -122,10 +274,12 @@ class PostgresEventLogStorage(WatchableEventLogStorage, ConfigurableClass):
 
     def delete_events(self, run_id):
         with get_conn(self.conn_string).cursor() as curs:
-            curs.execute(DELETE_EVENT_LOG_SQL, (run_id,))
+            curs.execute(DELETE_EVENT_LOG_SQL, {'run_id': run_id})
 
     def watch(self, run_id, start_cursor, callback):
         self._event_watcher.watch_run(run_id, start_cursor, callback)
+        # Handlers are unwatched by their callback
+        return callback
 
     def end_watch(self, run_id, handler):
         self._event_watcher.unwatch_run(run_id, handler)
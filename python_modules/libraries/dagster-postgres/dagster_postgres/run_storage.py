@@ -1,14 +1,19 @@
 from dagster import check
 from dagster.core.definitions.environment_configs import SystemNamedDict
 from dagster.core.serdes import ConfigurableClass, ConfigurableClassData
-from dagster.core.storage.runs import RunStorageSQLMetadata, SQLRunStorage, create_engine
+from dagster.core.storage.runs import (
+    RunStorageSQLMetadata,
+    SQLRunStorage,
+    create_engine,
+    create_run_storage_tables,
+)
 from dagster.core.types import Field, String
 
 
 class PostgresRunStorage(SQLRunStorage, ConfigurableClass):
     def __init__(self, postgres_url, inst_data=None):
         self.engine = create_engine(postgres_url)
-        RunStorageSQLMetadata.create_all(self.engine)
+        create_run_storage_tables(self.engine)
         self._inst_data = check.opt_inst_param(inst_data, 'inst_data', ConfigurableClassData)
 
     @property
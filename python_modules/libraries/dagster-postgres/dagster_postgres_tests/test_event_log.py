@@ -7,6 +7,7 @@ from dagster_postgres.utils import get_conn
 from dagster import ModeDefinition, RunConfig, execute_pipeline, pipeline, solid
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import DagsterEventRecord, construct_event_logger
+from dagster.core.execution.stats import build_stats_from_events
 from dagster.core.serdes import deserialize_json_to_dagster_namedtuple
 from dagster.loggers import colored_console_logger
 
@@ -175,6 +176,37 @@ def test_delete_postgres_event_log(conn_string):
     assert event_log_storage.get_logs_for_run(result.run_id) == []
 
 
+def test_postgres_run_stats(conn_string):
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    events_one, result_one = gather_events(_solids)
+    events_two, result_two = gather_events(_solids)
+
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    for event in events_one + events_two:
+        event_log_storage.store_event(event)
+
+    stats = event_log_storage.get_stats_for_runs([result_one.run_id, result_two.run_id])
+    assert stats[result_one.run_id] == build_stats_from_events(result_one.run_id, events_one)
+    assert stats[result_two.run_id] == build_stats_from_events(result_two.run_id, events_two)
+    assert stats[result_one.run_id].steps_succeeded == 1
+
+    assert event_log_storage.get_stats_for_run(result_one.run_id) == stats[result_one.run_id]
+
+    event_log_storage.delete_events(result_one.run_id)
+    assert event_log_storage.get_stats_for_run(result_one.run_id).steps_succeeded == 0
+    assert event_log_storage.get_stats_for_run(result_two.run_id).steps_succeeded == 1
+
+    event_log_storage.wipe()
+    assert event_log_storage.get_stats_for_run(result_two.run_id).steps_succeeded == 0
+
+
 def test_basic_get_logs_for_run_cursor(conn_string):
     event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
 
@@ -211,6 +243,71 @@ def test_basic_get_logs_for_run_cursor(conn_string):
     ]
 
 
+def test_get_logs_window_for_run(conn_string):
+    event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
+
+    @solid
+    def return_one(_):
+        return 1
+
+    def _solids():
+        return_one()
+
+    events_one, result_one = gather_events(_solids)
+    events_two, result_two = gather_events(_solids)
+
+    # Interleave the runs, so that the ids of the events of a run aren't contiguous
+    for event_one, event_two in zip(events_one, events_two):
+        event_log_storage.store_event(event_one)
+        event_log_storage.store_event(event_two)
+
+    def _cursors(window):
+        return [cursor for cursor, _ in window]
+
+    run_id = result_one.run_id
+    window = event_log_storage.get_logs_window_for_run(run_id)
+    assert _cursors(window) == list(range(7))
+    assert [event for _, event in window] == event_log_storage.get_logs_for_run(run_id)
+
+    assert event_types(
+        [event for _, event in event_log_storage.get_logs_window_for_run(run_id, limit=2)]
+    ) == [DagsterEventType.PIPELINE_START, DagsterEventType.ENGINE_EVENT]
+    assert _cursors(event_log_storage.get_logs_window_for_run(run_id, after_cursor=2, limit=3)) == [
+        3,
+        4,
+        5,
+    ]
+    assert _cursors(event_log_storage.get_logs_window_for_run(run_id, limit=2, from_end=True)) == [
+        5,
+        6,
+    ]
+    assert _cursors(
+        event_log_storage.get_logs_window_for_run(run_id, before_cursor=5, limit=2, from_end=True)
+    ) == [3, 4]
+    assert _cursors(
+        event_log_storage.get_logs_window_for_run(run_id, before_cursor=9, limit=10, from_end=True)
+    ) == list(range(7))
+    assert _cursors(
+        event_log_storage.get_logs_window_for_run(run_id, after_cursor=0, before_cursor=3)
+    ) == [1, 2]
+    assert event_log_storage.get_logs_window_for_run(run_id, limit=0) == []
+    assert event_log_storage.get_logs_window_for_run(run_id, after_cursor=6) == []
+    assert _cursors(
+        event_log_storage.get_logs_window_for_run(
+            run_id, event_types=[DagsterEventType.STEP_START, DagsterEventType.STEP_SUCCESS]
+        )
+    ) == [2, 4]
+
+    assert event_log_storage.get_logs_count_for_run(run_id) == 7
+    assert event_log_storage.get_logs_count_for_run(result_two.run_id) == 7
+    assert (
+        event_log_storage.get_logs_count_for_run(run_id, event_types=[DagsterEventType.STEP_START])
+        == 1
+    )
+    assert event_log_storage.get_logs_count_for_run('foo') == 0
+    assert event_log_storage.get_logs_window_for_run('foo', limit=5, from_end=True) == []
+
+
 def test_basic_get_logs_for_run_multiple_runs(conn_string):
     event_log_storage = PostgresEventLogStorage.create_clean_storage(conn_string)
 